@@ -0,0 +1,57 @@
+"""
+Сравнение поиска паттернов по каждой валюте отдельно (Analyzer.search_pattern, как в gen_results)
+с пакетным Analyzer.screen по матрице (валюты × свечи).
+Для каждого движка проверяется, что screen находит те же сигналы, что и search_pattern.
+
+Запуск из корня проекта:
+    python -m benchmarks.batch_screen --currencies 100 1000 --candles 168
+"""
+import argparse
+import sys
+
+import numpy as np
+
+import numpy_candles
+from benchmarks.candle_engines import measure
+from benchmarks.clear_data import synthetic_quotes
+from main import Analyzer
+
+
+def per_currency_signals(analyzer, row_historical_dict):
+    columns = [f"{names[1]}({names[0]})" for names in analyzer.candle_names.values()]
+    patterns = np.array(list(analyzer.candle_names), dtype=object)
+    signals = set()
+    for currency, data in row_historical_dict.items():
+        candle_patterns_sr = analyzer.search_pattern(data)
+        matrix = candle_patterns_sr[columns].to_numpy()
+        rows, cols = np.nonzero(matrix)
+        dates = candle_patterns_sr['date'].to_numpy()[rows]
+        signals.update(zip([currency] * len(rows), dates, patterns[cols], matrix[rows, cols]))
+    return signals
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--currencies', type=int, nargs='+', default=[100, 1000])
+    parser.add_argument('--candles', type=int, default=168)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    engines = ['numpy'] if numpy_candles.talib is None else ['talib', 'numpy']
+    print(f'{"engine":>7} {"currencies":>11} {"per currency, s":>16} {"screen, s":>10} {"signals":>8}')
+    for engine in engines:
+        analyzer = Analyzer(candle_engine=engine)
+        for currencies in args.currencies:
+            row_historical_dict = {f'C{seed:05}': synthetic_quotes(args.candles, seed) for seed in range(currencies)}
+            table = analyzer.screen_quotes(row_historical_dict)
+            if set(table.itertuples(index=False, name=None)) != per_currency_signals(analyzer, row_historical_dict):
+                sys.exit(f'{engine}: screen differs from search_pattern')
+
+            per_currency_time = measure(lambda: [analyzer.search_pattern(data)
+                                                 for data in row_historical_dict.values()], args.repeat)
+            screen_time = measure(lambda: analyzer.screen_quotes(row_historical_dict), args.repeat)
+            print(f'{engine:>7} {currencies:>11} {per_currency_time:>16.4f} {screen_time:>10.4f} {len(table):>8}')
+
+
+if __name__ == '__main__':
+    main()
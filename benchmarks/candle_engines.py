@@ -0,0 +1,78 @@
+"""
+Сравнение скорости движка паттернов на NumPy (numpy_candles) и TA-Lib на случайных рядах:
+случайное блуждание, цены на грубой сетке (много доджи и равных цен) и ряды с разрывами
+и длинными свечами. Совпадение результатов с TA-Lib бит в бит проверяет tests/test_numpy_candles.py.
+
+Запуск из корня проекта (нужен установленный TA-Lib):
+    python -m benchmarks.candle_engines --candles 1000 10000 --series 20
+"""
+import argparse
+import sys
+import time
+
+import numpy as np
+
+import exchange_data
+import numpy_candles
+
+REGIMES = ('walk', 'grid', 'gaps')
+
+
+def random_ohlc(candles, seed=0, regime='walk'):
+    rng = np.random.default_rng(seed)
+    if regime == 'walk':
+        close = 100 + np.cumsum(rng.normal(0, 1, candles))
+        open_ = np.r_[close[0], close[:-1]] + rng.normal(0, 0.5, candles)
+    elif regime == 'grid':
+        close = 100 + np.cumsum(rng.integers(-3, 4, candles)) * 0.25
+        open_ = np.r_[close[0], close[:-1]] + rng.integers(-2, 3, candles) * 0.25
+    else:
+        close = 100 + np.cumsum(rng.normal(0, 3, candles))
+        open_ = close + rng.choice([-1, 1], candles) * rng.exponential(2, candles) * rng.choice([0, 0.05, 1, 3],
+                                                                                                 candles)
+    shadows = [0, 0, 0.1, 0.5, 2]
+    high = np.maximum(open_, close) + np.abs(rng.normal(0, 1, candles)) * rng.choice(shadows, candles)
+    low = np.minimum(open_, close) - np.abs(rng.normal(0, 1, candles)) * rng.choice(shadows, candles)
+    if regime == 'grid':
+        high = np.maximum(np.round(high * 4) / 4, np.maximum(open_, close))
+        low = np.minimum(np.round(low * 4) / 4, np.minimum(open_, close))
+    return open_, high, low, close
+
+
+def measure(func, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--candles', type=int, nargs='+', default=[1000, 10000])
+    parser.add_argument('--series', type=int, default=20, help='number of series in the 2D batch run')
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    talib = numpy_candles.talib
+    if talib is None:
+        sys.exit('TA-Lib is not installed, nothing to compare with')
+    candle_names = list(exchange_data.get_candle_names())
+
+    def run_all(engine, quotes):
+        for candle in candle_names:
+            getattr(engine, candle)(*quotes)
+
+    print(f'{"candles":>8} {"series":>7} {"TA-Lib, s":>10} {"NumPy, s":>9} {"NumPy 2D, s":>12}')
+    for candles in args.candles:
+        batch = np.stack([np.stack(random_ohlc(candles, seed)) for seed in range(args.series)], axis=1)
+        talib_time = measure(lambda: [run_all(talib, batch[:, row]) for row in range(args.series)], args.repeat)
+        numpy_time = measure(lambda: [run_all(numpy_candles, batch[:, row]) for row in range(args.series)],
+                             args.repeat)
+        batch_time = measure(lambda: run_all(numpy_candles, batch), args.repeat)
+        print(f'{candles:>8} {args.series:>7} {talib_time:>10.4f} {numpy_time:>9.4f} {batch_time:>12.4f}')
+
+
+if __name__ == '__main__':
+    main()
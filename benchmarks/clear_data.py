@@ -0,0 +1,80 @@
+"""
+Сравнение векторизованного Analyzer.clear_data с прежней построчной реализацией
+на всех 61 паттернах и нескольких тысячах свечей.
+
+Запуск из корня проекта:
+    python -m benchmarks.clear_data --candles 2000 5000
+"""
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from main import Analyzer
+
+
+def synthetic_quotes(candles, seed=0):
+    rng = np.random.default_rng(seed)
+    close = 1 + np.cumsum(rng.normal(0, 0.01, candles))
+    open_ = np.r_[close[0], close[:-1]] + rng.normal(0, 0.002, candles)
+    high = np.maximum(open_, close) + np.abs(rng.normal(0, 0.005, candles))
+    low = np.minimum(open_, close) - np.abs(rng.normal(0, 0.005, candles))
+    dates = pd.date_range('2020-01-01', periods=candles, freq='H').strftime('%Y-%m-%d %H:%M:%S')
+    return {'quotes': [{'date': date, 'close': c, 'high': h, 'low': l, 'open': o}
+                       for date, c, h, l, o in zip(dates, close, high, low, open_)]}
+
+
+def legacy_clear_data(analyzer, candle_patterns_sr):
+    """Реализация clear_data до векторизации, оставлена как эталон."""
+    candle_patterns_sr = candle_patterns_sr.drop(['open', 'high', 'low', 'close'], axis=1)
+    columns = [f"{names[1]}({names[0]})" for names in analyzer.candle_names.values()]
+
+    for i in candle_patterns_sr.index:
+        for column in columns:
+            if candle_patterns_sr.loc[i, column] == -100:
+                candle_patterns_sr.loc[i, column] = analyzer.bearish
+            if candle_patterns_sr.loc[i, column] == 100:
+                candle_patterns_sr.loc[i, column] = analyzer.bullish
+
+    for index in range(len(candle_patterns_sr) - 1, -1, -1):
+        row = candle_patterns_sr.iloc[index].to_list()
+        if analyzer.bearish not in row and analyzer.bullish not in row:
+            candle_patterns_sr = candle_patterns_sr.drop(index)
+
+    for column in columns:
+        col = list(candle_patterns_sr[column])
+        if analyzer.bearish not in col and analyzer.bullish not in col:
+            candle_patterns_sr.pop(column)
+
+    return candle_patterns_sr
+
+
+def measure(func, repeat):
+    best = float('inf')
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--candles', type=int, nargs='+', default=[1000, 5000])
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    analyzer = Analyzer()
+    print(f'{"candles":>8} {"legacy, s":>12} {"vectorized, s":>14} {"speedup":>9}')
+    for candles in args.candles:
+        candle_patterns_sr = analyzer.search_pattern(synthetic_quotes(candles))
+        legacy_time, expected = measure(lambda: legacy_clear_data(analyzer, candle_patterns_sr), 1)
+        fast_time, actual = measure(lambda: analyzer.clear_data(candle_patterns_sr.copy()), args.repeat)
+        pd.testing.assert_frame_equal(actual, expected)
+        print(f'{candles:>8} {legacy_time:>12.4f} {fast_time:>14.4f} {legacy_time / fast_time:>8.0f}x')
+
+
+if __name__ == '__main__':
+    main()
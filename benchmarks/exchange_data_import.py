@@ -0,0 +1,88 @@
+"""
+Сравнение прежнего exchange_data (список пар и словарь паттернов литералами внутри функций,
+которые строятся заново при каждом вызове) с загрузкой справочника из exchange_data.json.
+
+Каждый вариант запускается в отдельном процессе из временного каталога: холодный импорт
+(без .pyc, модуль компилируется), тёплый импорт (с .pyc), первый вызов get_currency_pairs_names
+и get_candle_names и среднее время повторного вызова.
+
+Запуск из корня проекта:
+    python -m benchmarks.exchange_data_import --repeat 5
+"""
+import argparse
+import json
+import shutil
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+import exchange_data
+
+_probe = """
+import json, sys, time
+start = time.perf_counter()
+import exchange_data
+imported = time.perf_counter()
+exchange_data.get_currency_pairs_names(), exchange_data.get_candle_names()
+first_call = time.perf_counter()
+for _ in range(100):
+    exchange_data.get_currency_pairs_names(), exchange_data.get_candle_names()
+repeated = time.perf_counter()
+print(json.dumps({'import': imported - start, 'first_call': first_call - imported,
+                  'repeated_call': (repeated - first_call) / 100}))
+"""
+
+
+def legacy_module_source():
+    """Модуль в прежнем виде, собранный из тех же данных."""
+    candles = ',\n'.join(f'               {candle!r}: {list(names)!r}'
+                         for candle, names in exchange_data.get_candle_names().items())
+    pairs = ',\n'.join(f'        "{pair}"' for pair in exchange_data.get_currency_pairs_names())
+    return (f'def get_candle_names():\n    candle_name = {{{candles.lstrip()}}}\n\n    return candle_name\n\n\n'
+            f'def get_currency_pairs_names():\n    return [\n{pairs}\n    ]\n')
+
+
+def prepare(directory, variant):
+    if variant == 'legacy':
+        (directory / 'exchange_data.py').write_text(legacy_module_source(), encoding='utf-8')
+    else:
+        source = Path(exchange_data.__file__)
+        shutil.copy(source, directory / source.name)
+        shutil.copy(exchange_data._data_path, directory / exchange_data._data_path.name)
+
+
+def probe(directory, cold):
+    if cold:
+        shutil.rmtree(directory / '__pycache__', ignore_errors=True)
+    flags = ['-B'] if cold else []
+    output = subprocess.run([sys.executable, *flags, '-c', _probe], cwd=directory, check=True,
+                            capture_output=True, text=True).stdout
+    return json.loads(output)
+
+
+def measure(directory, cold, repeat):
+    results = [probe(directory, cold) for _ in range(repeat)]
+    return {key: min(result[key] for result in results) for key in results[0]}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    print(f'{"variant":>8} {"cold import, ms":>16} {"warm import, ms":>16} {"first call, ms":>15} '
+          f'{"next calls, us":>15}')
+    for variant in ('legacy', 'json'):
+        with tempfile.TemporaryDirectory() as directory:
+            directory = Path(directory)
+            prepare(directory, variant)
+            cold = measure(directory, True, args.repeat)
+            probe(directory, False)
+            warm = measure(directory, False, args.repeat)
+        print(f'{variant:>8} {cold["import"] * 1e3:>16.2f} {warm["import"] * 1e3:>16.2f} '
+              f'{warm["first_call"] * 1e3:>15.2f} {warm["repeated_call"] * 1e6:>15.2f}')
+
+
+if __name__ == '__main__':
+    main()
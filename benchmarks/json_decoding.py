@@ -0,0 +1,72 @@
+"""
+Сравнение декодирования ответов timeseries биржи:
+json + DataFrame - прежний путь (response.json() и DataFrame из списка словарей свечей),
+json + столбцы и orjson + столбцы - OhlcBatch.from_json со стандартным json и с orjson
+(orjson замеряется, только если установлен). Ответы - часовые свечи за history_days дней
+для каждой валюты из списка, как их возвращает биржа.
+
+Запуск из корня проекта:
+    python -m benchmarks.json_decoding --currencies 100 1000 --days 30
+"""
+import argparse
+import json
+import sys
+
+import numpy as np
+import pandas as pd
+
+import data_sources
+import exchange_data
+from benchmarks.candle_engines import measure
+from benchmarks.synthetic import synthetic_market
+from data_sources import OhlcBatch
+
+
+def payloads(currencies, candles):
+    market = synthetic_market(exchange_data.get_currency_pairs_names()[:currencies], candles)
+    return [json.dumps({'base_currency': currency[:3], 'quote_currency': currency[3:], 'endpoint': 'timeseries',
+                        **data}).encode() for currency, data in market.items()]
+
+
+def legacy_decode(content):
+    return pd.DataFrame(json.loads(content)['quotes'], columns=['date', 'close', 'high', 'low', 'open'])
+
+
+def decode_with(orjson, contents):
+    """OhlcBatch.from_json с указанным модулем orjson (None - стандартный json)."""
+    previous = data_sources.orjson
+    data_sources.orjson = orjson
+    try:
+        return [OhlcBatch.from_json(content) for content in contents]
+    finally:
+        data_sources.orjson = previous
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--currencies', type=int, nargs='+', default=[100, 1000])
+    parser.add_argument('--days', type=int, default=30)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    decoders = {'json + columns': None}
+    if data_sources.orjson is not None:
+        decoders['orjson + columns'] = data_sources.orjson
+    print(f'{"currencies":>11} {"MB":>6} {"json + DataFrame, s":>20} '
+          + ' '.join(f'{f"{name}, s":>19}' for name in decoders))
+    for currencies in args.currencies:
+        contents = payloads(currencies, args.days * 24)
+        expected = [legacy_decode(content) for content in contents]
+        for orjson in decoders.values():
+            for batch, frame in zip(decode_with(orjson, contents), expected):
+                if not np.array_equal(batch.ohlc(), frame[['open', 'high', 'low', 'close']].to_numpy().T):
+                    sys.exit('decoded candles differ')
+
+        legacy_time = measure(lambda: [legacy_decode(content) for content in contents], args.repeat)
+        times = [measure(lambda: decode_with(orjson, contents), args.repeat) for orjson in decoders.values()]
+        size = sum(map(len, contents)) / 2 ** 20
+        print(f'{currencies:>11} {size:>6.1f} {legacy_time:>20.4f} ' + ' '.join(f'{time:>19.4f}' for time in times))
+
+
+if __name__ == '__main__':
+    main()
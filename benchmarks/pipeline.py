@@ -0,0 +1,144 @@
+"""
+Бенчмарк этапов конвейера на синтетических свечах (см. benchmarks.synthetic):
+Analyzer.search_pattern, Analyzer.search_signals, Analyzer.clear_data, gen_results с каждым способом сохранения отчёта
+и run_for_ui целиком с загрузкой свечей из локальной имитации биржи (helpers.mock_tradermade).
+
+Результаты сохраняются в JSON вместе с коммитом и версиями библиотек, чтобы сравнивать их
+между коммитами: --compare печатает изменение относительно сохранённого ранее файла.
+
+Запуск из корня проекта:
+    python -m benchmarks.pipeline --currencies 20 --candles 720 --output before.json
+    python -m benchmarks.pipeline --currencies 20 --candles 720 --compare before.json
+"""
+import argparse
+import contextlib
+import datetime
+import json
+import os
+import platform
+import subprocess
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.candle_engines import measure
+from benchmarks.synthetic import synthetic_market
+from data_sources import as_batch
+from helpers.mock_tradermade import MockTraderMade
+from main import Analyzer, Interval, run_for_ui
+from metrics import Metrics
+from report_sinks import REPORT_SINKS, get_report_sink
+
+
+@contextlib.contextmanager
+def working_directory(path):
+    previous = os.getcwd()
+    os.chdir(path)
+    try:
+        yield
+    finally:
+        os.chdir(previous)
+
+
+def available_sinks():
+    sinks = []
+    for report_format in REPORT_SINKS:
+        try:
+            get_report_sink(report_format)
+        except ImportError:
+            continue
+        sinks.append(report_format)
+    return sinks
+
+
+def run_benchmarks(args):
+    market = synthetic_market(args.currencies, args.candles, volatility=args.volatility,
+                              gap_probability=args.gaps, doji_probability=args.doji)
+    analyzer = Analyzer(candle_engine=args.engine)
+    results = dict()
+    results['search_pattern'] = measure(lambda: [analyzer.search_pattern(data) for data in market.values()],
+                                        args.repeat)
+    batches = [as_batch(data) for data in market.values()]
+    results['search_signals'] = measure(lambda: [analyzer.search_signals(batch) for batch in batches], args.repeat)
+    search_results = [analyzer.search_pattern(data) for data in market.values()]
+    results['clear_data'] = measure(lambda: [analyzer.clear_data(frame) for frame in search_results], args.repeat)
+
+    with tempfile.TemporaryDirectory() as directory:
+        for report_format in available_sinks():
+            sink_analyzer = Analyzer(candle_engine=args.engine, report_sink=get_report_sink(report_format))
+            results[f'gen_results[{report_format}]'] = measure(
+                lambda: sink_analyzer.gen_results(market, Interval.hourly, path_to_result=f'{directory}/',
+                                                  simple_name_for_file=True), args.repeat)
+
+    metrics = Metrics()
+    with MockTraderMade(payloads=market) as exchange, tempfile.TemporaryDirectory() as directory:
+        # run_for_ui сохраняет отчёты в ./../reports/ относительно каталога интерфейса
+        (Path(directory) / 'interface').mkdir()
+        (Path(directory) / 'reports').mkdir()
+        config = {'currencies': list(market), 'api_keys': ['benchmark'], 'concurrency': args.concurrency,
+                  'exchange_url': exchange.url}
+        with working_directory(Path(directory) / 'interface'):
+            results['run_for_ui'] = measure(
+                lambda: run_for_ui(config, [Interval.hourly], analyzer.candle_names, report_format=args.report_format,
+                                   candle_engine=args.engine, metrics=metrics), args.repeat)
+    stages = {stage: summary['seconds'] for stage, summary in metrics.summary(Interval.hourly.name)['stages'].items()}
+    return results, stages
+
+
+def git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--currencies', type=int, default=20)
+    parser.add_argument('--candles', type=int, default=720)
+    parser.add_argument('--volatility', type=float, default=0.002)
+    parser.add_argument('--gaps', type=float, default=0.01, help='вероятность разрыва между свечами')
+    parser.add_argument('--doji', type=float, default=0.05, help='вероятность доджи')
+    parser.add_argument('--engine', default='talib')
+    parser.add_argument('--report-format', default='xlsx')
+    parser.add_argument('--concurrency', type=int, default=4)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--output', help='JSON файл для сохранения результатов')
+    parser.add_argument('--compare', help='JSON файл с результатами прошлого запуска')
+    args = parser.parse_args()
+
+    results, stages = run_benchmarks(args)
+    previous = dict()
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as file:
+            previous = json.load(file)['results']
+
+    print(f'{"benchmark":>24} {"time, s":>9} {"per currency, ms":>17} {"previous, s":>12} {"change":>8}')
+    for name, seconds in results.items():
+        line = f'{name:>24} {seconds:>9.4f} {seconds / args.currencies * 1e3:>17.2f}'
+        if name in previous:
+            line += f' {previous[name]:>12.4f} {seconds / previous[name] - 1:>+8.1%}'
+        print(line)
+    print('run_for_ui, время этапов последнего повтора, с:', ', '.join(f'{stage} {seconds:.4f}'
+                                                               for stage, seconds in stages.items()))
+
+    if args.output:
+        report = {
+            'commit': git_commit(),
+            'created': datetime.datetime.utcnow().isoformat(),
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'pandas': pd.__version__,
+            'parameters': vars(args),
+            'results': results,
+            'run_for_ui_stages': stages,
+        }
+        with open(args.output, 'w', encoding='utf-8') as file:
+            json.dump(report, file, indent=1)
+
+
+if __name__ == '__main__':
+    main()
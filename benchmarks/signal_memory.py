@@ -0,0 +1,74 @@
+"""
+Сравнение плотной матрицы сигналов (свечи × паттерны, int32), которую Analyzer хранил раньше,
+с разреженным результатом sparse_signals.SparseSignals: память на одну валюту, время поиска
+паттернов и построения таблицы отчёта. Отчёты из обоих представлений сверяются.
+
+Запуск из корня проекта:
+    python -m benchmarks.signal_memory --candles 1000 10000 100000
+"""
+import argparse
+import sys
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.candle_engines import measure
+from benchmarks.synthetic import synthetic_market
+from data_sources import as_batch
+from main import Analyzer
+
+
+def dense_signals(analyzer, batch):
+    """Прежний поиск: сигналы всех паттернов в заранее выделенной матрице."""
+    quotes = (batch.open, batch.high, batch.low, batch.close)
+    signals = np.empty((len(batch), len(analyzer.candle_names)), dtype=np.int32)
+    for index, candle in enumerate(analyzer.candle_names):
+        signals[:, index] = getattr(analyzer._engine, candle)(*quotes)
+    return signals
+
+
+def dense_report(analyzer, dates, signals):
+    """Прежний clear_signals по плотной матрице, оставлен как эталон."""
+    columns = np.array(analyzer._columns(), dtype=object)
+    bearish_mask = signals == -100
+    bullish_mask = signals == 100
+    found = bearish_mask | bullish_mask
+    rows = found.any(axis=1)
+    cols = found.any(axis=0)
+    labels = signals[rows][:, cols].astype(object)
+    labels[bearish_mask[rows][:, cols]] = analyzer.bearish
+    labels[bullish_mask[rows][:, cols]] = analyzer.bullish
+    cleaned = pd.DataFrame(labels, index=np.flatnonzero(rows), columns=columns[cols])
+    cleaned.insert(0, 'date', np.asarray(dates, dtype=object)[rows])
+    return cleaned
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--candles', type=int, nargs='+', default=[1000, 10000, 100000])
+    parser.add_argument('--engine', default='talib')
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    analyzer = Analyzer(candle_engine=args.engine)
+    print(f'{"candles":>8} {"signals":>8} {"dense, KB":>10} {"sparse, KB":>11} {"ratio":>7} '
+          f'{"dense search, s":>16} {"sparse search, s":>17} {"dense report, s":>16} {"sparse report, s":>17}')
+    for candles in args.candles:
+        batch = as_batch(synthetic_market(1, candles)['C00000'])
+        dense = dense_signals(analyzer, batch)
+        sparse = analyzer.search_signals(batch)
+        if not np.array_equal(sparse.to_dense(), dense) or \
+                not dense_report(analyzer, batch.dates, dense).equals(analyzer.clear_signals(sparse)):
+            sys.exit('reports differ')
+
+        dense_search = measure(lambda: dense_signals(analyzer, batch), args.repeat)
+        sparse_search = measure(lambda: analyzer.search_signals(batch), args.repeat)
+        dense_time = measure(lambda: dense_report(analyzer, batch.dates, dense), args.repeat)
+        sparse_time = measure(lambda: analyzer.clear_signals(sparse), args.repeat)
+        print(f'{candles:>8} {len(sparse):>8} {dense.nbytes / 1024:>10.1f} {sparse.nbytes / 1024:>11.1f} '
+              f'{dense.nbytes / max(sparse.nbytes, 1):>7.1f} {dense_search:>16.4f} {sparse_search:>17.4f} '
+              f'{dense_time:>16.4f} {sparse_time:>17.4f}')
+
+
+if __name__ == '__main__':
+    main()
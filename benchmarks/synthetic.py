@@ -0,0 +1,62 @@
+"""
+Генератор синтетических свечей OHLC для бенчмарков.
+Цена - случайное блуждание: логарифмическая доходность свечи распределена нормально
+с отклонением volatility, с вероятностью gap_probability свеча открывается с разрывом
+от закрытия предыдущей, с вероятностью doji_probability тело свечи почти нулевое (доджи).
+"""
+import numpy as np
+import pandas as pd
+
+_date_formats = {'H': '%Y-%m-%d %H:%M:%S', 'D': '%Y-%m-%d'}
+
+
+def synthetic_arrays(candles, seed=0, volatility=0.002, gap_probability=0.01, gap_size=0.005,
+                     doji_probability=0.05, wick=0.5, freq='H', start='2020-01-01', price=1.0):
+    """
+    :param candles: количество свечей
+    :param volatility: стандартное отклонение логарифмической доходности свечи
+    :param gap_probability: вероятность разрыва между закрытием свечи и открытием следующей
+    :param gap_size: стандартное отклонение разрыва
+    :param doji_probability: вероятность свечи с телом не больше 1% volatility
+    :param wick: размер теней относительно volatility
+    :param freq: H - часовые свечи, D - дневные
+    :return: (даты pandas.DatetimeIndex, open, high, low, close)
+    """
+    rng = np.random.default_rng(seed)
+    body = rng.normal(0, volatility, candles)
+    doji = rng.random(candles) < doji_probability
+    body[doji] *= 0.01
+    gaps = np.where(rng.random(candles) < gap_probability, rng.normal(0, gap_size, candles), 0.0)
+    gaps[:1] = 0.0
+    log_close = np.log(price) + np.cumsum(gaps + body)
+    close = np.exp(log_close)
+    open_ = np.exp(log_close - body)
+    high = np.maximum(open_, close) * np.exp(np.abs(rng.normal(0, volatility * wick, candles)))
+    low = np.minimum(open_, close) * np.exp(-np.abs(rng.normal(0, volatility * wick, candles)))
+    return pd.date_range(start, periods=candles, freq=freq), open_, high, low, close
+
+
+def to_records(dates, open_, high, low, close, freq='H') -> list:
+    """Свечи в формате records ответа биржи."""
+    return [{'date': date, 'close': c, 'high': h, 'low': l, 'open': o}
+            for date, c, h, l, o in zip(dates.strftime(_date_formats[freq]), close.tolist(), high.tolist(),
+                                        low.tolist(), open_.tolist())]
+
+
+def synthetic_ohlc(candles, seed=0, freq='H', **kwargs):
+    """
+    Свечи synthetic_arrays в формате ответа биржи
+    {'quotes': [{'date', 'close', 'high', 'low', 'open'}, ...]}.
+    """
+    return {'quotes': to_records(*synthetic_arrays(candles, seed=seed, freq=freq, **kwargs), freq=freq)}
+
+
+def synthetic_market(currencies, candles, seed=0, **kwargs) -> dict:
+    """
+    Свечи для currencies валют (число или список названий), у каждой валюты своё зерно.
+    Остальные параметры передаются в synthetic_ohlc.
+    """
+    if isinstance(currencies, int):
+        currencies = [f'C{index:05}' for index in range(currencies)]
+    return {currency: synthetic_ohlc(candles, seed=seed + index, **kwargs)
+            for index, currency in enumerate(currencies)}
@@ -0,0 +1,79 @@
+import logging
+import sqlite3
+import threading
+from itertools import repeat
+
+from data_sources import OhlcBatch
+
+
+class CandleStore:
+    """
+    Локальное хранилище свечей на SQLite.
+    Свечи хранятся отдельно для каждой пары валюта-интервал, ключом служит дата свечи
+    в том виде, в котором её вернула биржа. Повторное сохранение свечи с той же датой
+    перезаписывает её, поэтому последнюю (незакрытую) свечу можно безопасно докачивать.
+    """
+
+    _quote_columns = ('date', 'close', 'high', 'low', 'open')
+
+    def __init__(self, path, logger=logging.getLogger('candle_store')):
+        self._logger = logger
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(str(path), check_same_thread=False)
+        with self._connection:
+            self._connection.execute("""
+                CREATE TABLE IF NOT EXISTS candles (
+                    currency TEXT NOT NULL,
+                    interval TEXT NOT NULL,
+                    date TEXT NOT NULL,
+                    close REAL,
+                    high REAL,
+                    low REAL,
+                    open REAL,
+                    PRIMARY KEY (currency, interval, date)
+                ) WITHOUT ROWID
+            """)
+        self._logger.debug(f'Candle store {path} has opened')
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
+
+    def last_date(self, currency, interval_name):
+        with self._lock:
+            row = self._connection.execute(
+                'SELECT MAX(date) FROM candles WHERE currency = ? AND interval = ?',
+                (currency, interval_name)
+            ).fetchone()
+        return row[0]
+
+    def save(self, currency, interval_name, batch):
+        """:param batch: свечи, data_sources.OhlcBatch; NaN сохраняется как NULL"""
+        prices = [[None if value != value else value for value in column.tolist()]
+                  for column in (batch.close, batch.high, batch.low, batch.open)]
+        rows = list(zip(repeat(currency), repeat(interval_name), batch.dates.tolist(), *prices))
+        with self._lock, self._connection:
+            self._connection.executemany(
+                'INSERT OR REPLACE INTO candles (currency, interval, date, close, high, low, open) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?)',
+                rows
+            )
+        self._logger.debug(f'{len(rows)} candles of {interval_name}-{currency} have saved')
+
+    def load(self, currency, interval_name, start_date=None):
+        """
+        Возвращает свечи (data_sources.OhlcBatch), начиная с start_date включительно,
+        отсортированные по дате.
+        """
+        query = 'SELECT date, close, high, low, open FROM candles WHERE currency = ? AND interval = ?'
+        params = [currency, interval_name]
+        if start_date is not None:
+            query += ' AND date >= ?'
+            params.append(str(start_date))
+        with self._lock:
+            rows = self._connection.execute(query + ' ORDER BY date', params).fetchall()
+        if not rows:
+            return OhlcBatch([], [], [], [], [])
+        dates, close, high, low, open_ = zip(*rows)
+        return OhlcBatch(dates, open_, high, low, close)
@@ -0,0 +1,271 @@
+import datetime
+import json
+import logging
+import os
+import threading
+from operator import itemgetter
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from metrics import Metrics
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_ohlc_columns = ('open', 'high', 'low', 'close')
+_quote_getter = itemgetter('date', *_ohlc_columns)
+# Декодер ответов биржи: orjson, если установлен, иначе стандартный json
+JSON_DECODER = 'json' if orjson is None else 'orjson'
+
+
+class OhlcBatch:
+    """
+    Свечи одной валюты по столбцам: dates - даты в том виде, в котором их вернул источник,
+    open, high, low, close - непрерывные массивы float64 одинаковой длины.
+    """
+
+    def __init__(self, dates, open_, high, low, close):
+        self.dates = np.asarray(dates, dtype=object)
+        self.open = np.ascontiguousarray(open_, dtype=np.float64)
+        self.high = np.ascontiguousarray(high, dtype=np.float64)
+        self.low = np.ascontiguousarray(low, dtype=np.float64)
+        self.close = np.ascontiguousarray(close, dtype=np.float64)
+
+    @classmethod
+    def from_records(cls, quotes):
+        """Из свечей в формате records биржи, отсутствующие цены становятся NaN."""
+        if not quotes:
+            return cls([], [], [], [], [])
+        try:
+            # Столбцы собираются одним проходом по свечам
+            return cls(*zip(*map(_quote_getter, quotes)))
+        except (KeyError, TypeError):
+            return cls([quote.get('date') for quote in quotes],
+                       *([quote.get(column) for quote in quotes] for column in _ohlc_columns))
+
+    @classmethod
+    def from_json(cls, content):
+        """
+        Из тела ответа timeseries биржи (bytes или str) в формате records.
+        Тело декодируется orjson, если он установлен, иначе стандартным json,
+        свечи сразу раскладываются по столбцам.
+        :raises json.JSONDecodeError: тело не JSON
+        :raises ValueError: в ответе нет списка quotes
+        """
+        data = json.loads(content) if orjson is None else orjson.loads(content)
+        if not isinstance(data, dict) or not isinstance(data.get('quotes'), list):
+            raise ValueError('no quotes in response')
+        return cls.from_records(data['quotes'])
+
+    @classmethod
+    def from_frame(cls, frame):
+        return cls(frame['date'].astype(str).to_numpy(dtype=object),
+                   *(frame[column].to_numpy(dtype=np.float64) for column in _ohlc_columns))
+
+    def __len__(self):
+        return len(self.dates)
+
+    def ohlc(self) -> np.ndarray:
+        """Массив формы (4, свечи): open, high, low, close."""
+        return np.stack([self.open, self.high, self.low, self.close])
+
+    def frame(self) -> pd.DataFrame:
+        """DataFrame со столбцами date, close, high, low, open, как у Analyzer.search_pattern."""
+        return pd.DataFrame({'date': self.dates, 'close': self.close, 'high': self.high, 'low': self.low,
+                             'open': self.open})
+
+    def to_records(self) -> list:
+        return [{'date': date, 'close': close, 'high': high, 'low': low, 'open': open_}
+                for date, close, high, low, open_ in zip(self.dates.tolist(), self.close.tolist(),
+                                                          self.high.tolist(), self.low.tolist(),
+                                                          self.open.tolist())]
+
+
+def as_batch(data) -> OhlcBatch:
+    """Приводит данные валюты (OhlcBatch или ответ биржи {'quotes': [...]}) к OhlcBatch."""
+    if isinstance(data, OhlcBatch):
+        return data
+    return OhlcBatch.from_records(data['quotes'])
+
+
+class DataSource:
+    """
+    Базовый класс источника свечей.
+    get_data(interval, currencies=None, cancel_event=None) возвращает словарь валюта -> OhlcBatch
+    по валютам currencies (по умолчанию - по всем из конфигурации). Валюты, которые не удалось
+    загрузить, в словарь не попадают, а причина сохраняется в failures[interval.name][валюта]
+    в том же виде, что и у Exchange. capacity(interval) - сколько валют можно загрузить
+    в этом цикле, None - без ограничений. Объект можно использовать как контекстный менеджер.
+    """
+
+    def __init__(self, currencies, logger=logging.getLogger('data_source'), metrics=None):
+        self._logger = logger
+        self.currencies = currencies
+        self.metrics = metrics or Metrics()
+        self.failures = dict()
+        self._failures_lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        pass
+
+    def capacity(self, interval):
+        return None
+
+    def get_data(self, interval, currencies=None, cancel_event=None) -> dict:
+        with self._failures_lock:
+            self.failures[interval.name] = dict()
+        batches = dict()
+        for currency in self.currencies if currencies is None else currencies:
+            if cancel_event is not None and cancel_event.is_set():
+                break
+            with self.metrics.context(interval=interval.name, currency=currency), self.metrics.timer('fetch'):
+                try:
+                    batches[currency] = self._load(interval, currency)
+                except (OSError, ValueError, KeyError) as ex:
+                    self._logger.error(f'Не удалось загрузить {interval}-{currency}: {ex}')
+                    self.metrics.increment('fetch_failures')
+                    self._record_failure(interval, currency, ex)
+        self._logger.info(f'{interval}: загружено валют - {len(batches)}')
+        return batches
+
+    def _load(self, interval, currency) -> OhlcBatch:
+        raise NotImplementedError
+
+    def _record_failure(self, interval, currency, error):
+        with self._failures_lock:
+            self.failures.setdefault(interval.name, dict())[currency] = {
+                'kind': 'missing' if isinstance(error, FileNotFoundError) else 'invalid',
+                'error': str(error),
+                'attempts': 1,
+                'time': datetime.datetime.utcnow(),
+            }
+
+
+class TraderMadeSource(DataSource):
+    """
+    Свечи с биржи TraderMade через Exchange (ключи, повторы, хранилище свечей - см. Exchange).
+    Если указан record_dir, ответы сохраняются в файлы <валюта>_<интервал>.json,
+    которые потом можно воспроизвести при помощи ReplaySource.
+    """
+
+    def __init__(self, exchange, record_dir=None, logger=logging.getLogger('data_source')):
+        super().__init__(exchange.currencies, logger, exchange.metrics)
+        self.exchange = exchange
+        self.failures = exchange.failures
+        self.record_dir = Path(record_dir) if record_dir else None
+        if self.record_dir is not None:
+            self.record_dir.mkdir(parents=True, exist_ok=True)
+
+    def close(self):
+        self.exchange.close()
+
+    def capacity(self, interval):
+        if self.exchange.is_derived(interval):
+            return None
+        return self.exchange.key_pool.capacity()
+
+    def get_data(self, interval, currencies=None, cancel_event=None) -> dict:
+        batches = self.exchange.get_data(interval, currencies, cancel_event=cancel_event)
+        if self.record_dir is not None:
+            for currency, batch in batches.items():
+                self._record(self.record_dir / f'{currency}_{interval.name}.json', {'quotes': batch.to_records()})
+        return batches
+
+    def _record(self, path, data):
+        temp_path = path.with_name(f'{path.name}.tmp')
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as file:
+                json.dump(data, file)
+            os.replace(temp_path, path)
+        except OSError as ex:
+            self._logger.warning(f'Не удалось сохранить {path}: {ex}')
+
+
+class FileSource(DataSource):
+    """
+    Свечи из каталога файлов <валюта>_<интервал>.<extension> со столбцами date, open, high, low, close
+    (порядок столбцов и лишние столбцы не важны). Файл читается целиком, строки сортируются по дате.
+    """
+
+    extension = None
+
+    def __init__(self, currencies, directory, logger=logging.getLogger('data_source'), metrics=None):
+        super().__init__(currencies, logger, metrics)
+        self.directory = Path(directory)
+
+    def _load(self, interval, currency) -> OhlcBatch:
+        frame = self._read(self.directory / f'{currency}_{interval.name}.{self.extension}')
+        missing = [column for column in ('date', *_ohlc_columns) if column not in frame.columns]
+        if missing:
+            raise ValueError(f'{currency}_{interval.name}: missing columns {missing}')
+        return OhlcBatch.from_frame(frame.sort_values('date', kind='stable'))
+
+    def _read(self, path) -> pd.DataFrame:
+        raise NotImplementedError
+
+
+class CsvSource(FileSource):
+    extension = 'csv'
+
+    def _read(self, path):
+        return pd.read_csv(path, dtype={'date': str}, float_precision='round_trip')
+
+
+class ParquetSource(FileSource):
+    """Требует установленного pyarrow."""
+
+    extension = 'parquet'
+
+    def __init__(self, *args, **kwargs):
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError as ex:
+            raise ImportError('Для источника parquet установите pyarrow: pip install pyarrow') from ex
+        super().__init__(*args, **kwargs)
+
+    def _read(self, path):
+        return pd.read_parquet(path)
+
+
+class ReplaySource(FileSource):
+    """Воспроизводит ответы биржи, сохранённые TraderMadeSource в record_dir (<валюта>_<интервал>.json)."""
+
+    extension = 'json'
+
+    def _load(self, interval, currency) -> OhlcBatch:
+        with open(self.directory / f'{currency}_{interval.name}.json', 'rb') as file:
+            return OhlcBatch.from_json(file.read())
+
+
+DATA_SOURCES = {
+    'tradermade': TraderMadeSource,
+    'csv': CsvSource,
+    'parquet': ParquetSource,
+    'replay': ReplaySource,
+}
+
+
+def get_data_source(config, exchange=None, logger=logging.getLogger('data_source'), metrics=None) -> DataSource:
+    """
+    Создаёт источник по параметру data_source конфигурации.
+    Для tradermade нужен exchange (main.Exchange), ответы сохраняются в record_dir, если он задан;
+    для csv, parquet и replay файлы берутся из каталога data_dir.
+    """
+    name = config.get('data_source', 'tradermade')
+    if name not in DATA_SOURCES:
+        raise ValueError(f'{name} - unknown data source, expected one of {list(DATA_SOURCES)}')
+    if name == 'tradermade':
+        if exchange is None:
+            raise ValueError(f'{name} - exchange is required')
+        return TraderMadeSource(exchange, record_dir=config.get('record_dir'), logger=logger)
+    return DATA_SOURCES[name](config['currencies'], config.get('data_dir', 'data'), logger=logger, metrics=metrics)
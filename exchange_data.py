@@ -1,11201 +1,72 @@
+"""
+Справочник биржи: названия свечных паттернов и валютные пары.
+Данные хранятся в exchange_data.json и загружаются один раз при первом обращении.
+Валютные пары - все упорядоченные сочетания двух разных валют из списка currencies
+в порядке этого списка, поэтому в файле хранятся только сами валюты.
+Все функции возвращают одни и те же неизменяемые объекты.
+"""
+import functools
+import json
+from pathlib import Path
+from types import MappingProxyType
+
+_data_path = Path(__file__).with_name('exchange_data.json')
+
+
+@functools.lru_cache(maxsize=None)
+def _load_data() -> dict:
+    with open(_data_path, encoding='utf-8') as file:
+        return json.load(file)
+
+
+@functools.lru_cache(maxsize=None)
 def get_candle_names():
-    candle_name = {'CDL2CROWS': ['Two Crows', 'Две взлетевшие короны'],
-               'CDL3BLACKCROWS': ['Three Black Crows', 'Три чёрных вороны'],
-               'CDL3INSIDE': ['Three Inside Up/Down', 'Три внутри вверх/вниз'],
-               'CDL3LINESTRIKE': ['Three-Line Strike', 'Тройной удар'],
-               'CDL3OUTSIDE': ['Three Outside Up/Down', 'Три снаружи вверх/вниз'],
-               'CDL3STARSINSOUTH': ['Three Stars In The South', 'Три звезды на юге'],
-               'CDL3WHITESOLDIERS': ['Three Advancing White Soldiers', 'Три белых солдата'],
-               'CDLABANDONEDBABY': ['Abandoned Baby', 'Брошенный младенец'],
-               'CDLADVANCEBLOCK': ['Advance Block', 'Отбитое наступление'],
-               'CDLBELTHOLD': ['Belt-hold', 'Удержание пояса'],
-               'CDLBREAKAWAY': ['Breakaway', 'Промежуточный разрыв'],
-               'CDLCLOSINGMARUBOZU': ['Closing Marubozu', 'Закрытие Марубозу'],
-               'CDLCONCEALBABYSWALL': ['Concealing Baby Swallow', 'Прячущаяся ласточка'],
-               'CDLCOUNTERATTACK': ['Counterattack', 'Контратака'],
-               'CDLDARKCLOUDCOVER': ['Dark Cloud Cover', 'Покрытие темных облаков'],
-               'CDLDOJI': ['Doji', 'Доджи'],
-               'CDLDOJISTAR': ['Doji Star', 'Звезда Доджи'],
-               'CDLDRAGONFLYDOJI': ['Dragonfly Doji', 'Стрекоза Доджи'],
-               'CDLENGULFING': ['Engulfing Pattern', 'Поглощение'],
-               'CDLEVENINGDOJISTAR': ['Evening Doji Star', 'Вечерняя звезда доджи'],
-               'CDLEVENINGSTAR': ['Evening Star', 'Вечерняя звезда'],
-               'CDLGAPSIDESIDEWHITE': ['Up/Down-gap side-by-side white lines', 'Белые линии бок о бок с промежутками вверх/вниз'],
-               'CDLGRAVESTONEDOJI': ['Gravestone Doji', 'Надгробие Доджи'],
-               'CDLHAMMER': ['Hammer', 'Молот'],
-               'CDLHANGINGMAN': ['Hanging Man', 'Повешенный'],
-               'CDLHARAMI': ['Harami Pattern', 'Харами'],
-               'CDLHARAMICROSS': ['Harami Cross Pattern', 'Крест Харами'],
-               'CDLHIGHWAVE': ['High-Wave Candle', 'Высокая волна'],
-               'CDLHIKKAKE': ['Hikkake Pattern', 'Хиккаке'],
-               'CDLHIKKAKEMOD': ['Modified Hikkake Pattern', 'Модифицированный Хиккаке'],
-               'CDLHOMINGPIGEON': ['Homing Pigeon', 'Почтовый голубь'],
-               'CDLIDENTICAL3CROWS': ['Identical Three Crows', 'Три одинаковые вороны'],
-               'CDLINNECK': ['In-Neck Pattern', 'На линии шеи'],
-               'CDLINVERTEDHAMMER': ['Inverted Hammer', 'Перевернутый молот'],
-               'CDLKICKING': ['Kicking', 'Высокий прыжок'],
-               'CDLKICKINGBYLENGTH': ['Kicking-bull/bear determined by the longer marubozu',
-                                      'Высокий прыжок - бык/медведь определяется по длинному марубозу'],
-               'CDLLADDERBOTTOM': ['Ladder Bottom', 'Дно лестницы'],
-               'CDLLONGLEGGEDDOJI': ['Long Legged Doji', 'Длинноногий Доджи'],
-               'CDLLONGLINE': ['Long Line Candle', 'Свеча длинной линии'],
-               'CDLMARUBOZU': ['Marubozu', 'Марибозу'],
-               'CDLMATCHINGLOW': ['Matching Low', 'Совпадение по нижнему уровню'],
-               'CDLMATHOLD': ['Mat Hold', 'Подстилка'],
-               'CDLMORNINGDOJISTAR': ['Morning Doji Star', 'Утренняя звезда доджи'],
-               'CDLMORNINGSTAR': ['Morning Star', 'Утренняя звезда'],
-               'CDLONNECK': ['On-Neck Pattern', 'У линии шеи'],
-               'CDLPIERCING': ['Piercing Pattern', 'Просвет в облаках'],
-               'CDLRICKSHAWMAN': ['Rickshaw Man', 'Рикша'],
-               'CDLRISEFALL3METHODS': ['Rising/Falling Three Methods', 'Три метода восхождения/падения'],
-               'CDLSEPARATINGLINES': ['Separating Lines', 'Разделение'],
-               'CDLSHOOTINGSTAR': ['Shooting Star', 'Падающая звезда'],
-               'CDLSHORTLINE': ['Short Line Candle', 'Свеча короткой линии'],
-               'CDLSPINNINGTOP': ['Spinning Top', 'Волчок'],
-               'CDLSTALLEDPATTERN': ['Stalled Pattern', 'Торможение'],
-               'CDLSTICKSANDWICH': ['Stick Sandwich', 'Бутерброд'],
-               'CDLTAKURI': ['Takuri (Dragonfly Doji with very long lower shadow)',
-                             'Такури (Cтрекоза доджи с очень длинной нижней тенью)'],
-               'CDLTASUKIGAP': ['Tasuki Gap', 'Разрыв тасуки'],
-               'CDLTHRUSTING': ['Thrusting Pattern', 'Толчок'],
-               'CDLTRISTAR': ['Tristar Pattern', 'Три звезды'],
-               'CDLUNIQUE3RIVER': ['Unique 3 River', 'Особые три реки'],
-               'CDLUPSIDEGAP2CROWS': ['Upside Gap Two Crows', 'Две взлетевшие вороны'],
-               'CDLXSIDEGAP3METHODS': ['Upside/Downside Gap Three Methods', 'Восходящий/низходящий разрыв метода трех']}
+    """Словарь только для чтения: функция TA-Lib -> (название на английском, название на русском)."""
+    return MappingProxyType({candle: tuple(names) for candle, names in _load_data()['candles'].items()})
 
-    return candle_name
 
+@functools.lru_cache(maxsize=None)
+def get_currencies():
+    return tuple(_load_data()['currencies'])
 
+
+@functools.lru_cache(maxsize=None)
+def _pair_parts():
+    currencies = get_currencies()
+    return MappingProxyType({base + quote: (base, quote)
+                             for base in currencies for quote in currencies if base != quote})
+
+
+@functools.lru_cache(maxsize=None)
 def get_currency_pairs_names():
-    return [
-        "ALLADA",
-        "ALLAED",
-        "ALLARS",
-        "ALLATOM",
-        "ALLAUD",
-        "ALLAVAX",
-        "ALLAXS",
-        "ALLBCH",
-        "ALLBGN",
-        "ALLBHD",
-        "ALLBNB",
-        "ALLBRL",
-        "ALLBTC",
-        "ALLBTG",
-        "ALLBUSD",
-        "ALLCAD",
-        "ALLCHF",
-        "ALLCLP",
-        "ALLCNY",
-        "ALLCNH",
-        "ALLCOP",
-        "ALLCZK",
-        "ALLDAI",
-        "ALLDASH",
-        "ALLDKK",
-        "ALLDOGE",
-        "ALLDOT",
-        "ALLEGLD",
-        "ALLENJ",
-        "ALLEOS",
-        "ALLETC",
-        "ALLETH",
-        "ALLEUR",
-        "ALLFIL",
-        "ALLFLOW",
-        "ALLFTM",
-        "ALLFTT",
-        "ALLGALA",
-        "ALLGBP",
-        "ALLGHS",
-        "ALLHBAR",
-        "ALLHKD",
-        "ALLHNT",
-        "ALLHRK",
-        "ALLHUF",
-        "ALLICP",
-        "ALLIDR",
-        "ALLILS",
-        "ALLINR",
-        "ALLISK",
-        "ALLJPY",
-        "ALLKES",
-        "ALLKRW",
-        "ALLKWD",
-        "ALLLINK",
-        "ALLLRC",
-        "ALLLTC",
-        "ALLLUNA",
-        "ALLMAD",
-        "ALLMANA",
-        "ALLMATIC",
-        "ALLMUR",
-        "ALLMXN",
-        "ALLMYR",
-        "ALLNEAR",
-        "ALLNEO",
-        "ALLNGN",
-        "ALLNOK",
-        "ALLNZD",
-        "ALLOMR",
-        "ALLPEN",
-        "ALLPHP",
-        "ALLPLN",
-        "ALLQAR",
-        "ALLRON",
-        "ALLROSE",
-        "ALLRUB",
-        "ALLSAND",
-        "ALLSAR",
-        "ALLSEK",
-        "ALLSGD",
-        "ALLSHIB",
-        "ALLSOL",
-        "ALLTHB",
-        "ALLTHETA",
-        "ALLTRX",
-        "ALLTRY",
-        "ALLTWD",
-        "ALLUNI",
-        "ALLUSD",
-        "ALLUSDT",
-        "ALLUST",
-        "ALLVET",
-        "ALLVND",
-        "ALLXAG",
-        "ALLXAU",
-        "ALLXLM",
-        "ALLXMR",
-        "ALLXOF",
-        "ALLXPD",
-        "ALLXPT",
-        "ALLXRP",
-        "ALLXTZ",
-        "ALLZAR",
-        "ALLZWL",
-        "ADAALL",
-        "ADAAED",
-        "ADAARS",
-        "ADAATOM",
-        "ADAAUD",
-        "ADAAVAX",
-        "ADAAXS",
-        "ADABCH",
-        "ADABGN",
-        "ADABHD",
-        "ADABNB",
-        "ADABRL",
-        "ADABTC",
-        "ADABTG",
-        "ADABUSD",
-        "ADACAD",
-        "ADACHF",
-        "ADACLP",
-        "ADACNY",
-        "ADACNH",
-        "ADACOP",
-        "ADACZK",
-        "ADADAI",
-        "ADADASH",
-        "ADADKK",
-        "ADADOGE",
-        "ADADOT",
-        "ADAEGLD",
-        "ADAENJ",
-        "ADAEOS",
-        "ADAETC",
-        "ADAETH",
-        "ADAEUR",
-        "ADAFIL",
-        "ADAFLOW",
-        "ADAFTM",
-        "ADAFTT",
-        "ADAGALA",
-        "ADAGBP",
-        "ADAGHS",
-        "ADAHBAR",
-        "ADAHKD",
-        "ADAHNT",
-        "ADAHRK",
-        "ADAHUF",
-        "ADAICP",
-        "ADAIDR",
-        "ADAILS",
-        "ADAINR",
-        "ADAISK",
-        "ADAJPY",
-        "ADAKES",
-        "ADAKRW",
-        "ADAKWD",
-        "ADALINK",
-        "ADALRC",
-        "ADALTC",
-        "ADALUNA",
-        "ADAMAD",
-        "ADAMANA",
-        "ADAMATIC",
-        "ADAMUR",
-        "ADAMXN",
-        "ADAMYR",
-        "ADANEAR",
-        "ADANEO",
-        "ADANGN",
-        "ADANOK",
-        "ADANZD",
-        "ADAOMR",
-        "ADAPEN",
-        "ADAPHP",
-        "ADAPLN",
-        "ADAQAR",
-        "ADARON",
-        "ADAROSE",
-        "ADARUB",
-        "ADASAND",
-        "ADASAR",
-        "ADASEK",
-        "ADASGD",
-        "ADASHIB",
-        "ADASOL",
-        "ADATHB",
-        "ADATHETA",
-        "ADATRX",
-        "ADATRY",
-        "ADATWD",
-        "ADAUNI",
-        "ADAUSD",
-        "ADAUSDT",
-        "ADAUST",
-        "ADAVET",
-        "ADAVND",
-        "ADAXAG",
-        "ADAXAU",
-        "ADAXLM",
-        "ADAXMR",
-        "ADAXOF",
-        "ADAXPD",
-        "ADAXPT",
-        "ADAXRP",
-        "ADAXTZ",
-        "ADAZAR",
-        "ADAZWL",
-        "AEDALL",
-        "AEDADA",
-        "AEDARS",
-        "AEDATOM",
-        "AEDAUD",
-        "AEDAVAX",
-        "AEDAXS",
-        "AEDBCH",
-        "AEDBGN",
-        "AEDBHD",
-        "AEDBNB",
-        "AEDBRL",
-        "AEDBTC",
-        "AEDBTG",
-        "AEDBUSD",
-        "AEDCAD",
-        "AEDCHF",
-        "AEDCLP",
-        "AEDCNY",
-        "AEDCNH",
-        "AEDCOP",
-        "AEDCZK",
-        "AEDDAI",
-        "AEDDASH",
-        "AEDDKK",
-        "AEDDOGE",
-        "AEDDOT",
-        "AEDEGLD",
-        "AEDENJ",
-        "AEDEOS",
-        "AEDETC",
-        "AEDETH",
-        "AEDEUR",
-        "AEDFIL",
-        "AEDFLOW",
-        "AEDFTM",
-        "AEDFTT",
-        "AEDGALA",
-        "AEDGBP",
-        "AEDGHS",
-        "AEDHBAR",
-        "AEDHKD",
-        "AEDHNT",
-        "AEDHRK",
-        "AEDHUF",
-        "AEDICP",
-        "AEDIDR",
-        "AEDILS",
-        "AEDINR",
-        "AEDISK",
-        "AEDJPY",
-        "AEDKES",
-        "AEDKRW",
-        "AEDKWD",
-        "AEDLINK",
-        "AEDLRC",
-        "AEDLTC",
-        "AEDLUNA",
-        "AEDMAD",
-        "AEDMANA",
-        "AEDMATIC",
-        "AEDMUR",
-        "AEDMXN",
-        "AEDMYR",
-        "AEDNEAR",
-        "AEDNEO",
-        "AEDNGN",
-        "AEDNOK",
-        "AEDNZD",
-        "AEDOMR",
-        "AEDPEN",
-        "AEDPHP",
-        "AEDPLN",
-        "AEDQAR",
-        "AEDRON",
-        "AEDROSE",
-        "AEDRUB",
-        "AEDSAND",
-        "AEDSAR",
-        "AEDSEK",
-        "AEDSGD",
-        "AEDSHIB",
-        "AEDSOL",
-        "AEDTHB",
-        "AEDTHETA",
-        "AEDTRX",
-        "AEDTRY",
-        "AEDTWD",
-        "AEDUNI",
-        "AEDUSD",
-        "AEDUSDT",
-        "AEDUST",
-        "AEDVET",
-        "AEDVND",
-        "AEDXAG",
-        "AEDXAU",
-        "AEDXLM",
-        "AEDXMR",
-        "AEDXOF",
-        "AEDXPD",
-        "AEDXPT",
-        "AEDXRP",
-        "AEDXTZ",
-        "AEDZAR",
-        "AEDZWL",
-        "ARSALL",
-        "ARSADA",
-        "ARSAED",
-        "ARSATOM",
-        "ARSAUD",
-        "ARSAVAX",
-        "ARSAXS",
-        "ARSBCH",
-        "ARSBGN",
-        "ARSBHD",
-        "ARSBNB",
-        "ARSBRL",
-        "ARSBTC",
-        "ARSBTG",
-        "ARSBUSD",
-        "ARSCAD",
-        "ARSCHF",
-        "ARSCLP",
-        "ARSCNY",
-        "ARSCNH",
-        "ARSCOP",
-        "ARSCZK",
-        "ARSDAI",
-        "ARSDASH",
-        "ARSDKK",
-        "ARSDOGE",
-        "ARSDOT",
-        "ARSEGLD",
-        "ARSENJ",
-        "ARSEOS",
-        "ARSETC",
-        "ARSETH",
-        "ARSEUR",
-        "ARSFIL",
-        "ARSFLOW",
-        "ARSFTM",
-        "ARSFTT",
-        "ARSGALA",
-        "ARSGBP",
-        "ARSGHS",
-        "ARSHBAR",
-        "ARSHKD",
-        "ARSHNT",
-        "ARSHRK",
-        "ARSHUF",
-        "ARSICP",
-        "ARSIDR",
-        "ARSILS",
-        "ARSINR",
-        "ARSISK",
-        "ARSJPY",
-        "ARSKES",
-        "ARSKRW",
-        "ARSKWD",
-        "ARSLINK",
-        "ARSLRC",
-        "ARSLTC",
-        "ARSLUNA",
-        "ARSMAD",
-        "ARSMANA",
-        "ARSMATIC",
-        "ARSMUR",
-        "ARSMXN",
-        "ARSMYR",
-        "ARSNEAR",
-        "ARSNEO",
-        "ARSNGN",
-        "ARSNOK",
-        "ARSNZD",
-        "ARSOMR",
-        "ARSPEN",
-        "ARSPHP",
-        "ARSPLN",
-        "ARSQAR",
-        "ARSRON",
-        "ARSROSE",
-        "ARSRUB",
-        "ARSSAND",
-        "ARSSAR",
-        "ARSSEK",
-        "ARSSGD",
-        "ARSSHIB",
-        "ARSSOL",
-        "ARSTHB",
-        "ARSTHETA",
-        "ARSTRX",
-        "ARSTRY",
-        "ARSTWD",
-        "ARSUNI",
-        "ARSUSD",
-        "ARSUSDT",
-        "ARSUST",
-        "ARSVET",
-        "ARSVND",
-        "ARSXAG",
-        "ARSXAU",
-        "ARSXLM",
-        "ARSXMR",
-        "ARSXOF",
-        "ARSXPD",
-        "ARSXPT",
-        "ARSXRP",
-        "ARSXTZ",
-        "ARSZAR",
-        "ARSZWL",
-        "ATOMALL",
-        "ATOMADA",
-        "ATOMAED",
-        "ATOMARS",
-        "ATOMAUD",
-        "ATOMAVAX",
-        "ATOMAXS",
-        "ATOMBCH",
-        "ATOMBGN",
-        "ATOMBHD",
-        "ATOMBNB",
-        "ATOMBRL",
-        "ATOMBTC",
-        "ATOMBTG",
-        "ATOMBUSD",
-        "ATOMCAD",
-        "ATOMCHF",
-        "ATOMCLP",
-        "ATOMCNY",
-        "ATOMCNH",
-        "ATOMCOP",
-        "ATOMCZK",
-        "ATOMDAI",
-        "ATOMDASH",
-        "ATOMDKK",
-        "ATOMDOGE",
-        "ATOMDOT",
-        "ATOMEGLD",
-        "ATOMENJ",
-        "ATOMEOS",
-        "ATOMETC",
-        "ATOMETH",
-        "ATOMEUR",
-        "ATOMFIL",
-        "ATOMFLOW",
-        "ATOMFTM",
-        "ATOMFTT",
-        "ATOMGALA",
-        "ATOMGBP",
-        "ATOMGHS",
-        "ATOMHBAR",
-        "ATOMHKD",
-        "ATOMHNT",
-        "ATOMHRK",
-        "ATOMHUF",
-        "ATOMICP",
-        "ATOMIDR",
-        "ATOMILS",
-        "ATOMINR",
-        "ATOMISK",
-        "ATOMJPY",
-        "ATOMKES",
-        "ATOMKRW",
-        "ATOMKWD",
-        "ATOMLINK",
-        "ATOMLRC",
-        "ATOMLTC",
-        "ATOMLUNA",
-        "ATOMMAD",
-        "ATOMMANA",
-        "ATOMMATIC",
-        "ATOMMUR",
-        "ATOMMXN",
-        "ATOMMYR",
-        "ATOMNEAR",
-        "ATOMNEO",
-        "ATOMNGN",
-        "ATOMNOK",
-        "ATOMNZD",
-        "ATOMOMR",
-        "ATOMPEN",
-        "ATOMPHP",
-        "ATOMPLN",
-        "ATOMQAR",
-        "ATOMRON",
-        "ATOMROSE",
-        "ATOMRUB",
-        "ATOMSAND",
-        "ATOMSAR",
-        "ATOMSEK",
-        "ATOMSGD",
-        "ATOMSHIB",
-        "ATOMSOL",
-        "ATOMTHB",
-        "ATOMTHETA",
-        "ATOMTRX",
-        "ATOMTRY",
-        "ATOMTWD",
-        "ATOMUNI",
-        "ATOMUSD",
-        "ATOMUSDT",
-        "ATOMUST",
-        "ATOMVET",
-        "ATOMVND",
-        "ATOMXAG",
-        "ATOMXAU",
-        "ATOMXLM",
-        "ATOMXMR",
-        "ATOMXOF",
-        "ATOMXPD",
-        "ATOMXPT",
-        "ATOMXRP",
-        "ATOMXTZ",
-        "ATOMZAR",
-        "ATOMZWL",
-        "AUDALL",
-        "AUDADA",
-        "AUDAED",
-        "AUDARS",
-        "AUDATOM",
-        "AUDAVAX",
-        "AUDAXS",
-        "AUDBCH",
-        "AUDBGN",
-        "AUDBHD",
-        "AUDBNB",
-        "AUDBRL",
-        "AUDBTC",
-        "AUDBTG",
-        "AUDBUSD",
-        "AUDCAD",
-        "AUDCHF",
-        "AUDCLP",
-        "AUDCNY",
-        "AUDCNH",
-        "AUDCOP",
-        "AUDCZK",
-        "AUDDAI",
-        "AUDDASH",
-        "AUDDKK",
-        "AUDDOGE",
-        "AUDDOT",
-        "AUDEGLD",
-        "AUDENJ",
-        "AUDEOS",
-        "AUDETC",
-        "AUDETH",
-        "AUDEUR",
-        "AUDFIL",
-        "AUDFLOW",
-        "AUDFTM",
-        "AUDFTT",
-        "AUDGALA",
-        "AUDGBP",
-        "AUDGHS",
-        "AUDHBAR",
-        "AUDHKD",
-        "AUDHNT",
-        "AUDHRK",
-        "AUDHUF",
-        "AUDICP",
-        "AUDIDR",
-        "AUDILS",
-        "AUDINR",
-        "AUDISK",
-        "AUDJPY",
-        "AUDKES",
-        "AUDKRW",
-        "AUDKWD",
-        "AUDLINK",
-        "AUDLRC",
-        "AUDLTC",
-        "AUDLUNA",
-        "AUDMAD",
-        "AUDMANA",
-        "AUDMATIC",
-        "AUDMUR",
-        "AUDMXN",
-        "AUDMYR",
-        "AUDNEAR",
-        "AUDNEO",
-        "AUDNGN",
-        "AUDNOK",
-        "AUDNZD",
-        "AUDOMR",
-        "AUDPEN",
-        "AUDPHP",
-        "AUDPLN",
-        "AUDQAR",
-        "AUDRON",
-        "AUDROSE",
-        "AUDRUB",
-        "AUDSAND",
-        "AUDSAR",
-        "AUDSEK",
-        "AUDSGD",
-        "AUDSHIB",
-        "AUDSOL",
-        "AUDTHB",
-        "AUDTHETA",
-        "AUDTRX",
-        "AUDTRY",
-        "AUDTWD",
-        "AUDUNI",
-        "AUDUSD",
-        "AUDUSDT",
-        "AUDUST",
-        "AUDVET",
-        "AUDVND",
-        "AUDXAG",
-        "AUDXAU",
-        "AUDXLM",
-        "AUDXMR",
-        "AUDXOF",
-        "AUDXPD",
-        "AUDXPT",
-        "AUDXRP",
-        "AUDXTZ",
-        "AUDZAR",
-        "AUDZWL",
-        "AVAXALL",
-        "AVAXADA",
-        "AVAXAED",
-        "AVAXARS",
-        "AVAXATOM",
-        "AVAXAUD",
-        "AVAXAXS",
-        "AVAXBCH",
-        "AVAXBGN",
-        "AVAXBHD",
-        "AVAXBNB",
-        "AVAXBRL",
-        "AVAXBTC",
-        "AVAXBTG",
-        "AVAXBUSD",
-        "AVAXCAD",
-        "AVAXCHF",
-        "AVAXCLP",
-        "AVAXCNY",
-        "AVAXCNH",
-        "AVAXCOP",
-        "AVAXCZK",
-        "AVAXDAI",
-        "AVAXDASH",
-        "AVAXDKK",
-        "AVAXDOGE",
-        "AVAXDOT",
-        "AVAXEGLD",
-        "AVAXENJ",
-        "AVAXEOS",
-        "AVAXETC",
-        "AVAXETH",
-        "AVAXEUR",
-        "AVAXFIL",
-        "AVAXFLOW",
-        "AVAXFTM",
-        "AVAXFTT",
-        "AVAXGALA",
-        "AVAXGBP",
-        "AVAXGHS",
-        "AVAXHBAR",
-        "AVAXHKD",
-        "AVAXHNT",
-        "AVAXHRK",
-        "AVAXHUF",
-        "AVAXICP",
-        "AVAXIDR",
-        "AVAXILS",
-        "AVAXINR",
-        "AVAXISK",
-        "AVAXJPY",
-        "AVAXKES",
-        "AVAXKRW",
-        "AVAXKWD",
-        "AVAXLINK",
-        "AVAXLRC",
-        "AVAXLTC",
-        "AVAXLUNA",
-        "AVAXMAD",
-        "AVAXMANA",
-        "AVAXMATIC",
-        "AVAXMUR",
-        "AVAXMXN",
-        "AVAXMYR",
-        "AVAXNEAR",
-        "AVAXNEO",
-        "AVAXNGN",
-        "AVAXNOK",
-        "AVAXNZD",
-        "AVAXOMR",
-        "AVAXPEN",
-        "AVAXPHP",
-        "AVAXPLN",
-        "AVAXQAR",
-        "AVAXRON",
-        "AVAXROSE",
-        "AVAXRUB",
-        "AVAXSAND",
-        "AVAXSAR",
-        "AVAXSEK",
-        "AVAXSGD",
-        "AVAXSHIB",
-        "AVAXSOL",
-        "AVAXTHB",
-        "AVAXTHETA",
-        "AVAXTRX",
-        "AVAXTRY",
-        "AVAXTWD",
-        "AVAXUNI",
-        "AVAXUSD",
-        "AVAXUSDT",
-        "AVAXUST",
-        "AVAXVET",
-        "AVAXVND",
-        "AVAXXAG",
-        "AVAXXAU",
-        "AVAXXLM",
-        "AVAXXMR",
-        "AVAXXOF",
-        "AVAXXPD",
-        "AVAXXPT",
-        "AVAXXRP",
-        "AVAXXTZ",
-        "AVAXZAR",
-        "AVAXZWL",
-        "AXSALL",
-        "AXSADA",
-        "AXSAED",
-        "AXSARS",
-        "AXSATOM",
-        "AXSAUD",
-        "AXSAVAX",
-        "AXSBCH",
-        "AXSBGN",
-        "AXSBHD",
-        "AXSBNB",
-        "AXSBRL",
-        "AXSBTC",
-        "AXSBTG",
-        "AXSBUSD",
-        "AXSCAD",
-        "AXSCHF",
-        "AXSCLP",
-        "AXSCNY",
-        "AXSCNH",
-        "AXSCOP",
-        "AXSCZK",
-        "AXSDAI",
-        "AXSDASH",
-        "AXSDKK",
-        "AXSDOGE",
-        "AXSDOT",
-        "AXSEGLD",
-        "AXSENJ",
-        "AXSEOS",
-        "AXSETC",
-        "AXSETH",
-        "AXSEUR",
-        "AXSFIL",
-        "AXSFLOW",
-        "AXSFTM",
-        "AXSFTT",
-        "AXSGALA",
-        "AXSGBP",
-        "AXSGHS",
-        "AXSHBAR",
-        "AXSHKD",
-        "AXSHNT",
-        "AXSHRK",
-        "AXSHUF",
-        "AXSICP",
-        "AXSIDR",
-        "AXSILS",
-        "AXSINR",
-        "AXSISK",
-        "AXSJPY",
-        "AXSKES",
-        "AXSKRW",
-        "AXSKWD",
-        "AXSLINK",
-        "AXSLRC",
-        "AXSLTC",
-        "AXSLUNA",
-        "AXSMAD",
-        "AXSMANA",
-        "AXSMATIC",
-        "AXSMUR",
-        "AXSMXN",
-        "AXSMYR",
-        "AXSNEAR",
-        "AXSNEO",
-        "AXSNGN",
-        "AXSNOK",
-        "AXSNZD",
-        "AXSOMR",
-        "AXSPEN",
-        "AXSPHP",
-        "AXSPLN",
-        "AXSQAR",
-        "AXSRON",
-        "AXSROSE",
-        "AXSRUB",
-        "AXSSAND",
-        "AXSSAR",
-        "AXSSEK",
-        "AXSSGD",
-        "AXSSHIB",
-        "AXSSOL",
-        "AXSTHB",
-        "AXSTHETA",
-        "AXSTRX",
-        "AXSTRY",
-        "AXSTWD",
-        "AXSUNI",
-        "AXSUSD",
-        "AXSUSDT",
-        "AXSUST",
-        "AXSVET",
-        "AXSVND",
-        "AXSXAG",
-        "AXSXAU",
-        "AXSXLM",
-        "AXSXMR",
-        "AXSXOF",
-        "AXSXPD",
-        "AXSXPT",
-        "AXSXRP",
-        "AXSXTZ",
-        "AXSZAR",
-        "AXSZWL",
-        "BCHALL",
-        "BCHADA",
-        "BCHAED",
-        "BCHARS",
-        "BCHATOM",
-        "BCHAUD",
-        "BCHAVAX",
-        "BCHAXS",
-        "BCHBGN",
-        "BCHBHD",
-        "BCHBNB",
-        "BCHBRL",
-        "BCHBTC",
-        "BCHBTG",
-        "BCHBUSD",
-        "BCHCAD",
-        "BCHCHF",
-        "BCHCLP",
-        "BCHCNY",
-        "BCHCNH",
-        "BCHCOP",
-        "BCHCZK",
-        "BCHDAI",
-        "BCHDASH",
-        "BCHDKK",
-        "BCHDOGE",
-        "BCHDOT",
-        "BCHEGLD",
-        "BCHENJ",
-        "BCHEOS",
-        "BCHETC",
-        "BCHETH",
-        "BCHEUR",
-        "BCHFIL",
-        "BCHFLOW",
-        "BCHFTM",
-        "BCHFTT",
-        "BCHGALA",
-        "BCHGBP",
-        "BCHGHS",
-        "BCHHBAR",
-        "BCHHKD",
-        "BCHHNT",
-        "BCHHRK",
-        "BCHHUF",
-        "BCHICP",
-        "BCHIDR",
-        "BCHILS",
-        "BCHINR",
-        "BCHISK",
-        "BCHJPY",
-        "BCHKES",
-        "BCHKRW",
-        "BCHKWD",
-        "BCHLINK",
-        "BCHLRC",
-        "BCHLTC",
-        "BCHLUNA",
-        "BCHMAD",
-        "BCHMANA",
-        "BCHMATIC",
-        "BCHMUR",
-        "BCHMXN",
-        "BCHMYR",
-        "BCHNEAR",
-        "BCHNEO",
-        "BCHNGN",
-        "BCHNOK",
-        "BCHNZD",
-        "BCHOMR",
-        "BCHPEN",
-        "BCHPHP",
-        "BCHPLN",
-        "BCHQAR",
-        "BCHRON",
-        "BCHROSE",
-        "BCHRUB",
-        "BCHSAND",
-        "BCHSAR",
-        "BCHSEK",
-        "BCHSGD",
-        "BCHSHIB",
-        "BCHSOL",
-        "BCHTHB",
-        "BCHTHETA",
-        "BCHTRX",
-        "BCHTRY",
-        "BCHTWD",
-        "BCHUNI",
-        "BCHUSD",
-        "BCHUSDT",
-        "BCHUST",
-        "BCHVET",
-        "BCHVND",
-        "BCHXAG",
-        "BCHXAU",
-        "BCHXLM",
-        "BCHXMR",
-        "BCHXOF",
-        "BCHXPD",
-        "BCHXPT",
-        "BCHXRP",
-        "BCHXTZ",
-        "BCHZAR",
-        "BCHZWL",
-        "BGNALL",
-        "BGNADA",
-        "BGNAED",
-        "BGNARS",
-        "BGNATOM",
-        "BGNAUD",
-        "BGNAVAX",
-        "BGNAXS",
-        "BGNBCH",
-        "BGNBHD",
-        "BGNBNB",
-        "BGNBRL",
-        "BGNBTC",
-        "BGNBTG",
-        "BGNBUSD",
-        "BGNCAD",
-        "BGNCHF",
-        "BGNCLP",
-        "BGNCNY",
-        "BGNCNH",
-        "BGNCOP",
-        "BGNCZK",
-        "BGNDAI",
-        "BGNDASH",
-        "BGNDKK",
-        "BGNDOGE",
-        "BGNDOT",
-        "BGNEGLD",
-        "BGNENJ",
-        "BGNEOS",
-        "BGNETC",
-        "BGNETH",
-        "BGNEUR",
-        "BGNFIL",
-        "BGNFLOW",
-        "BGNFTM",
-        "BGNFTT",
-        "BGNGALA",
-        "BGNGBP",
-        "BGNGHS",
-        "BGNHBAR",
-        "BGNHKD",
-        "BGNHNT",
-        "BGNHRK",
-        "BGNHUF",
-        "BGNICP",
-        "BGNIDR",
-        "BGNILS",
-        "BGNINR",
-        "BGNISK",
-        "BGNJPY",
-        "BGNKES",
-        "BGNKRW",
-        "BGNKWD",
-        "BGNLINK",
-        "BGNLRC",
-        "BGNLTC",
-        "BGNLUNA",
-        "BGNMAD",
-        "BGNMANA",
-        "BGNMATIC",
-        "BGNMUR",
-        "BGNMXN",
-        "BGNMYR",
-        "BGNNEAR",
-        "BGNNEO",
-        "BGNNGN",
-        "BGNNOK",
-        "BGNNZD",
-        "BGNOMR",
-        "BGNPEN",
-        "BGNPHP",
-        "BGNPLN",
-        "BGNQAR",
-        "BGNRON",
-        "BGNROSE",
-        "BGNRUB",
-        "BGNSAND",
-        "BGNSAR",
-        "BGNSEK",
-        "BGNSGD",
-        "BGNSHIB",
-        "BGNSOL",
-        "BGNTHB",
-        "BGNTHETA",
-        "BGNTRX",
-        "BGNTRY",
-        "BGNTWD",
-        "BGNUNI",
-        "BGNUSD",
-        "BGNUSDT",
-        "BGNUST",
-        "BGNVET",
-        "BGNVND",
-        "BGNXAG",
-        "BGNXAU",
-        "BGNXLM",
-        "BGNXMR",
-        "BGNXOF",
-        "BGNXPD",
-        "BGNXPT",
-        "BGNXRP",
-        "BGNXTZ",
-        "BGNZAR",
-        "BGNZWL",
-        "BHDALL",
-        "BHDADA",
-        "BHDAED",
-        "BHDARS",
-        "BHDATOM",
-        "BHDAUD",
-        "BHDAVAX",
-        "BHDAXS",
-        "BHDBCH",
-        "BHDBGN",
-        "BHDBNB",
-        "BHDBRL",
-        "BHDBTC",
-        "BHDBTG",
-        "BHDBUSD",
-        "BHDCAD",
-        "BHDCHF",
-        "BHDCLP",
-        "BHDCNY",
-        "BHDCNH",
-        "BHDCOP",
-        "BHDCZK",
-        "BHDDAI",
-        "BHDDASH",
-        "BHDDKK",
-        "BHDDOGE",
-        "BHDDOT",
-        "BHDEGLD",
-        "BHDENJ",
-        "BHDEOS",
-        "BHDETC",
-        "BHDETH",
-        "BHDEUR",
-        "BHDFIL",
-        "BHDFLOW",
-        "BHDFTM",
-        "BHDFTT",
-        "BHDGALA",
-        "BHDGBP",
-        "BHDGHS",
-        "BHDHBAR",
-        "BHDHKD",
-        "BHDHNT",
-        "BHDHRK",
-        "BHDHUF",
-        "BHDICP",
-        "BHDIDR",
-        "BHDILS",
-        "BHDINR",
-        "BHDISK",
-        "BHDJPY",
-        "BHDKES",
-        "BHDKRW",
-        "BHDKWD",
-        "BHDLINK",
-        "BHDLRC",
-        "BHDLTC",
-        "BHDLUNA",
-        "BHDMAD",
-        "BHDMANA",
-        "BHDMATIC",
-        "BHDMUR",
-        "BHDMXN",
-        "BHDMYR",
-        "BHDNEAR",
-        "BHDNEO",
-        "BHDNGN",
-        "BHDNOK",
-        "BHDNZD",
-        "BHDOMR",
-        "BHDPEN",
-        "BHDPHP",
-        "BHDPLN",
-        "BHDQAR",
-        "BHDRON",
-        "BHDROSE",
-        "BHDRUB",
-        "BHDSAND",
-        "BHDSAR",
-        "BHDSEK",
-        "BHDSGD",
-        "BHDSHIB",
-        "BHDSOL",
-        "BHDTHB",
-        "BHDTHETA",
-        "BHDTRX",
-        "BHDTRY",
-        "BHDTWD",
-        "BHDUNI",
-        "BHDUSD",
-        "BHDUSDT",
-        "BHDUST",
-        "BHDVET",
-        "BHDVND",
-        "BHDXAG",
-        "BHDXAU",
-        "BHDXLM",
-        "BHDXMR",
-        "BHDXOF",
-        "BHDXPD",
-        "BHDXPT",
-        "BHDXRP",
-        "BHDXTZ",
-        "BHDZAR",
-        "BHDZWL",
-        "BNBALL",
-        "BNBADA",
-        "BNBAED",
-        "BNBARS",
-        "BNBATOM",
-        "BNBAUD",
-        "BNBAVAX",
-        "BNBAXS",
-        "BNBBCH",
-        "BNBBGN",
-        "BNBBHD",
-        "BNBBRL",
-        "BNBBTC",
-        "BNBBTG",
-        "BNBBUSD",
-        "BNBCAD",
-        "BNBCHF",
-        "BNBCLP",
-        "BNBCNY",
-        "BNBCNH",
-        "BNBCOP",
-        "BNBCZK",
-        "BNBDAI",
-        "BNBDASH",
-        "BNBDKK",
-        "BNBDOGE",
-        "BNBDOT",
-        "BNBEGLD",
-        "BNBENJ",
-        "BNBEOS",
-        "BNBETC",
-        "BNBETH",
-        "BNBEUR",
-        "BNBFIL",
-        "BNBFLOW",
-        "BNBFTM",
-        "BNBFTT",
-        "BNBGALA",
-        "BNBGBP",
-        "BNBGHS",
-        "BNBHBAR",
-        "BNBHKD",
-        "BNBHNT",
-        "BNBHRK",
-        "BNBHUF",
-        "BNBICP",
-        "BNBIDR",
-        "BNBILS",
-        "BNBINR",
-        "BNBISK",
-        "BNBJPY",
-        "BNBKES",
-        "BNBKRW",
-        "BNBKWD",
-        "BNBLINK",
-        "BNBLRC",
-        "BNBLTC",
-        "BNBLUNA",
-        "BNBMAD",
-        "BNBMANA",
-        "BNBMATIC",
-        "BNBMUR",
-        "BNBMXN",
-        "BNBMYR",
-        "BNBNEAR",
-        "BNBNEO",
-        "BNBNGN",
-        "BNBNOK",
-        "BNBNZD",
-        "BNBOMR",
-        "BNBPEN",
-        "BNBPHP",
-        "BNBPLN",
-        "BNBQAR",
-        "BNBRON",
-        "BNBROSE",
-        "BNBRUB",
-        "BNBSAND",
-        "BNBSAR",
-        "BNBSEK",
-        "BNBSGD",
-        "BNBSHIB",
-        "BNBSOL",
-        "BNBTHB",
-        "BNBTHETA",
-        "BNBTRX",
-        "BNBTRY",
-        "BNBTWD",
-        "BNBUNI",
-        "BNBUSD",
-        "BNBUSDT",
-        "BNBUST",
-        "BNBVET",
-        "BNBVND",
-        "BNBXAG",
-        "BNBXAU",
-        "BNBXLM",
-        "BNBXMR",
-        "BNBXOF",
-        "BNBXPD",
-        "BNBXPT",
-        "BNBXRP",
-        "BNBXTZ",
-        "BNBZAR",
-        "BNBZWL",
-        "BRLALL",
-        "BRLADA",
-        "BRLAED",
-        "BRLARS",
-        "BRLATOM",
-        "BRLAUD",
-        "BRLAVAX",
-        "BRLAXS",
-        "BRLBCH",
-        "BRLBGN",
-        "BRLBHD",
-        "BRLBNB",
-        "BRLBTC",
-        "BRLBTG",
-        "BRLBUSD",
-        "BRLCAD",
-        "BRLCHF",
-        "BRLCLP",
-        "BRLCNY",
-        "BRLCNH",
-        "BRLCOP",
-        "BRLCZK",
-        "BRLDAI",
-        "BRLDASH",
-        "BRLDKK",
-        "BRLDOGE",
-        "BRLDOT",
-        "BRLEGLD",
-        "BRLENJ",
-        "BRLEOS",
-        "BRLETC",
-        "BRLETH",
-        "BRLEUR",
-        "BRLFIL",
-        "BRLFLOW",
-        "BRLFTM",
-        "BRLFTT",
-        "BRLGALA",
-        "BRLGBP",
-        "BRLGHS",
-        "BRLHBAR",
-        "BRLHKD",
-        "BRLHNT",
-        "BRLHRK",
-        "BRLHUF",
-        "BRLICP",
-        "BRLIDR",
-        "BRLILS",
-        "BRLINR",
-        "BRLISK",
-        "BRLJPY",
-        "BRLKES",
-        "BRLKRW",
-        "BRLKWD",
-        "BRLLINK",
-        "BRLLRC",
-        "BRLLTC",
-        "BRLLUNA",
-        "BRLMAD",
-        "BRLMANA",
-        "BRLMATIC",
-        "BRLMUR",
-        "BRLMXN",
-        "BRLMYR",
-        "BRLNEAR",
-        "BRLNEO",
-        "BRLNGN",
-        "BRLNOK",
-        "BRLNZD",
-        "BRLOMR",
-        "BRLPEN",
-        "BRLPHP",
-        "BRLPLN",
-        "BRLQAR",
-        "BRLRON",
-        "BRLROSE",
-        "BRLRUB",
-        "BRLSAND",
-        "BRLSAR",
-        "BRLSEK",
-        "BRLSGD",
-        "BRLSHIB",
-        "BRLSOL",
-        "BRLTHB",
-        "BRLTHETA",
-        "BRLTRX",
-        "BRLTRY",
-        "BRLTWD",
-        "BRLUNI",
-        "BRLUSD",
-        "BRLUSDT",
-        "BRLUST",
-        "BRLVET",
-        "BRLVND",
-        "BRLXAG",
-        "BRLXAU",
-        "BRLXLM",
-        "BRLXMR",
-        "BRLXOF",
-        "BRLXPD",
-        "BRLXPT",
-        "BRLXRP",
-        "BRLXTZ",
-        "BRLZAR",
-        "BRLZWL",
-        "BTCALL",
-        "BTCADA",
-        "BTCAED",
-        "BTCARS",
-        "BTCATOM",
-        "BTCAUD",
-        "BTCAVAX",
-        "BTCAXS",
-        "BTCBCH",
-        "BTCBGN",
-        "BTCBHD",
-        "BTCBNB",
-        "BTCBRL",
-        "BTCBTG",
-        "BTCBUSD",
-        "BTCCAD",
-        "BTCCHF",
-        "BTCCLP",
-        "BTCCNY",
-        "BTCCNH",
-        "BTCCOP",
-        "BTCCZK",
-        "BTCDAI",
-        "BTCDASH",
-        "BTCDKK",
-        "BTCDOGE",
-        "BTCDOT",
-        "BTCEGLD",
-        "BTCENJ",
-        "BTCEOS",
-        "BTCETC",
-        "BTCETH",
-        "BTCEUR",
-        "BTCFIL",
-        "BTCFLOW",
-        "BTCFTM",
-        "BTCFTT",
-        "BTCGALA",
-        "BTCGBP",
-        "BTCGHS",
-        "BTCHBAR",
-        "BTCHKD",
-        "BTCHNT",
-        "BTCHRK",
-        "BTCHUF",
-        "BTCICP",
-        "BTCIDR",
-        "BTCILS",
-        "BTCINR",
-        "BTCISK",
-        "BTCJPY",
-        "BTCKES",
-        "BTCKRW",
-        "BTCKWD",
-        "BTCLINK",
-        "BTCLRC",
-        "BTCLTC",
-        "BTCLUNA",
-        "BTCMAD",
-        "BTCMANA",
-        "BTCMATIC",
-        "BTCMUR",
-        "BTCMXN",
-        "BTCMYR",
-        "BTCNEAR",
-        "BTCNEO",
-        "BTCNGN",
-        "BTCNOK",
-        "BTCNZD",
-        "BTCOMR",
-        "BTCPEN",
-        "BTCPHP",
-        "BTCPLN",
-        "BTCQAR",
-        "BTCRON",
-        "BTCROSE",
-        "BTCRUB",
-        "BTCSAND",
-        "BTCSAR",
-        "BTCSEK",
-        "BTCSGD",
-        "BTCSHIB",
-        "BTCSOL",
-        "BTCTHB",
-        "BTCTHETA",
-        "BTCTRX",
-        "BTCTRY",
-        "BTCTWD",
-        "BTCUNI",
-        "BTCUSD",
-        "BTCUSDT",
-        "BTCUST",
-        "BTCVET",
-        "BTCVND",
-        "BTCXAG",
-        "BTCXAU",
-        "BTCXLM",
-        "BTCXMR",
-        "BTCXOF",
-        "BTCXPD",
-        "BTCXPT",
-        "BTCXRP",
-        "BTCXTZ",
-        "BTCZAR",
-        "BTCZWL",
-        "BTGALL",
-        "BTGADA",
-        "BTGAED",
-        "BTGARS",
-        "BTGATOM",
-        "BTGAUD",
-        "BTGAVAX",
-        "BTGAXS",
-        "BTGBCH",
-        "BTGBGN",
-        "BTGBHD",
-        "BTGBNB",
-        "BTGBRL",
-        "BTGBTC",
-        "BTGBUSD",
-        "BTGCAD",
-        "BTGCHF",
-        "BTGCLP",
-        "BTGCNY",
-        "BTGCNH",
-        "BTGCOP",
-        "BTGCZK",
-        "BTGDAI",
-        "BTGDASH",
-        "BTGDKK",
-        "BTGDOGE",
-        "BTGDOT",
-        "BTGEGLD",
-        "BTGENJ",
-        "BTGEOS",
-        "BTGETC",
-        "BTGETH",
-        "BTGEUR",
-        "BTGFIL",
-        "BTGFLOW",
-        "BTGFTM",
-        "BTGFTT",
-        "BTGGALA",
-        "BTGGBP",
-        "BTGGHS",
-        "BTGHBAR",
-        "BTGHKD",
-        "BTGHNT",
-        "BTGHRK",
-        "BTGHUF",
-        "BTGICP",
-        "BTGIDR",
-        "BTGILS",
-        "BTGINR",
-        "BTGISK",
-        "BTGJPY",
-        "BTGKES",
-        "BTGKRW",
-        "BTGKWD",
-        "BTGLINK",
-        "BTGLRC",
-        "BTGLTC",
-        "BTGLUNA",
-        "BTGMAD",
-        "BTGMANA",
-        "BTGMATIC",
-        "BTGMUR",
-        "BTGMXN",
-        "BTGMYR",
-        "BTGNEAR",
-        "BTGNEO",
-        "BTGNGN",
-        "BTGNOK",
-        "BTGNZD",
-        "BTGOMR",
-        "BTGPEN",
-        "BTGPHP",
-        "BTGPLN",
-        "BTGQAR",
-        "BTGRON",
-        "BTGROSE",
-        "BTGRUB",
-        "BTGSAND",
-        "BTGSAR",
-        "BTGSEK",
-        "BTGSGD",
-        "BTGSHIB",
-        "BTGSOL",
-        "BTGTHB",
-        "BTGTHETA",
-        "BTGTRX",
-        "BTGTRY",
-        "BTGTWD",
-        "BTGUNI",
-        "BTGUSD",
-        "BTGUSDT",
-        "BTGUST",
-        "BTGVET",
-        "BTGVND",
-        "BTGXAG",
-        "BTGXAU",
-        "BTGXLM",
-        "BTGXMR",
-        "BTGXOF",
-        "BTGXPD",
-        "BTGXPT",
-        "BTGXRP",
-        "BTGXTZ",
-        "BTGZAR",
-        "BTGZWL",
-        "BUSDALL",
-        "BUSDADA",
-        "BUSDAED",
-        "BUSDARS",
-        "BUSDATOM",
-        "BUSDAUD",
-        "BUSDAVAX",
-        "BUSDAXS",
-        "BUSDBCH",
-        "BUSDBGN",
-        "BUSDBHD",
-        "BUSDBNB",
-        "BUSDBRL",
-        "BUSDBTC",
-        "BUSDBTG",
-        "BUSDCAD",
-        "BUSDCHF",
-        "BUSDCLP",
-        "BUSDCNY",
-        "BUSDCNH",
-        "BUSDCOP",
-        "BUSDCZK",
-        "BUSDDAI",
-        "BUSDDASH",
-        "BUSDDKK",
-        "BUSDDOGE",
-        "BUSDDOT",
-        "BUSDEGLD",
-        "BUSDENJ",
-        "BUSDEOS",
-        "BUSDETC",
-        "BUSDETH",
-        "BUSDEUR",
-        "BUSDFIL",
-        "BUSDFLOW",
-        "BUSDFTM",
-        "BUSDFTT",
-        "BUSDGALA",
-        "BUSDGBP",
-        "BUSDGHS",
-        "BUSDHBAR",
-        "BUSDHKD",
-        "BUSDHNT",
-        "BUSDHRK",
-        "BUSDHUF",
-        "BUSDICP",
-        "BUSDIDR",
-        "BUSDILS",
-        "BUSDINR",
-        "BUSDISK",
-        "BUSDJPY",
-        "BUSDKES",
-        "BUSDKRW",
-        "BUSDKWD",
-        "BUSDLINK",
-        "BUSDLRC",
-        "BUSDLTC",
-        "BUSDLUNA",
-        "BUSDMAD",
-        "BUSDMANA",
-        "BUSDMATIC",
-        "BUSDMUR",
-        "BUSDMXN",
-        "BUSDMYR",
-        "BUSDNEAR",
-        "BUSDNEO",
-        "BUSDNGN",
-        "BUSDNOK",
-        "BUSDNZD",
-        "BUSDOMR",
-        "BUSDPEN",
-        "BUSDPHP",
-        "BUSDPLN",
-        "BUSDQAR",
-        "BUSDRON",
-        "BUSDROSE",
-        "BUSDRUB",
-        "BUSDSAND",
-        "BUSDSAR",
-        "BUSDSEK",
-        "BUSDSGD",
-        "BUSDSHIB",
-        "BUSDSOL",
-        "BUSDTHB",
-        "BUSDTHETA",
-        "BUSDTRX",
-        "BUSDTRY",
-        "BUSDTWD",
-        "BUSDUNI",
-        "BUSDUSD",
-        "BUSDUSDT",
-        "BUSDUST",
-        "BUSDVET",
-        "BUSDVND",
-        "BUSDXAG",
-        "BUSDXAU",
-        "BUSDXLM",
-        "BUSDXMR",
-        "BUSDXOF",
-        "BUSDXPD",
-        "BUSDXPT",
-        "BUSDXRP",
-        "BUSDXTZ",
-        "BUSDZAR",
-        "BUSDZWL",
-        "CADALL",
-        "CADADA",
-        "CADAED",
-        "CADARS",
-        "CADATOM",
-        "CADAUD",
-        "CADAVAX",
-        "CADAXS",
-        "CADBCH",
-        "CADBGN",
-        "CADBHD",
-        "CADBNB",
-        "CADBRL",
-        "CADBTC",
-        "CADBTG",
-        "CADBUSD",
-        "CADCHF",
-        "CADCLP",
-        "CADCNY",
-        "CADCNH",
-        "CADCOP",
-        "CADCZK",
-        "CADDAI",
-        "CADDASH",
-        "CADDKK",
-        "CADDOGE",
-        "CADDOT",
-        "CADEGLD",
-        "CADENJ",
-        "CADEOS",
-        "CADETC",
-        "CADETH",
-        "CADEUR",
-        "CADFIL",
-        "CADFLOW",
-        "CADFTM",
-        "CADFTT",
-        "CADGALA",
-        "CADGBP",
-        "CADGHS",
-        "CADHBAR",
-        "CADHKD",
-        "CADHNT",
-        "CADHRK",
-        "CADHUF",
-        "CADICP",
-        "CADIDR",
-        "CADILS",
-        "CADINR",
-        "CADISK",
-        "CADJPY",
-        "CADKES",
-        "CADKRW",
-        "CADKWD",
-        "CADLINK",
-        "CADLRC",
-        "CADLTC",
-        "CADLUNA",
-        "CADMAD",
-        "CADMANA",
-        "CADMATIC",
-        "CADMUR",
-        "CADMXN",
-        "CADMYR",
-        "CADNEAR",
-        "CADNEO",
-        "CADNGN",
-        "CADNOK",
-        "CADNZD",
-        "CADOMR",
-        "CADPEN",
-        "CADPHP",
-        "CADPLN",
-        "CADQAR",
-        "CADRON",
-        "CADROSE",
-        "CADRUB",
-        "CADSAND",
-        "CADSAR",
-        "CADSEK",
-        "CADSGD",
-        "CADSHIB",
-        "CADSOL",
-        "CADTHB",
-        "CADTHETA",
-        "CADTRX",
-        "CADTRY",
-        "CADTWD",
-        "CADUNI",
-        "CADUSD",
-        "CADUSDT",
-        "CADUST",
-        "CADVET",
-        "CADVND",
-        "CADXAG",
-        "CADXAU",
-        "CADXLM",
-        "CADXMR",
-        "CADXOF",
-        "CADXPD",
-        "CADXPT",
-        "CADXRP",
-        "CADXTZ",
-        "CADZAR",
-        "CADZWL",
-        "CHFALL",
-        "CHFADA",
-        "CHFAED",
-        "CHFARS",
-        "CHFATOM",
-        "CHFAUD",
-        "CHFAVAX",
-        "CHFAXS",
-        "CHFBCH",
-        "CHFBGN",
-        "CHFBHD",
-        "CHFBNB",
-        "CHFBRL",
-        "CHFBTC",
-        "CHFBTG",
-        "CHFBUSD",
-        "CHFCAD",
-        "CHFCLP",
-        "CHFCNY",
-        "CHFCNH",
-        "CHFCOP",
-        "CHFCZK",
-        "CHFDAI",
-        "CHFDASH",
-        "CHFDKK",
-        "CHFDOGE",
-        "CHFDOT",
-        "CHFEGLD",
-        "CHFENJ",
-        "CHFEOS",
-        "CHFETC",
-        "CHFETH",
-        "CHFEUR",
-        "CHFFIL",
-        "CHFFLOW",
-        "CHFFTM",
-        "CHFFTT",
-        "CHFGALA",
-        "CHFGBP",
-        "CHFGHS",
-        "CHFHBAR",
-        "CHFHKD",
-        "CHFHNT",
-        "CHFHRK",
-        "CHFHUF",
-        "CHFICP",
-        "CHFIDR",
-        "CHFILS",
-        "CHFINR",
-        "CHFISK",
-        "CHFJPY",
-        "CHFKES",
-        "CHFKRW",
-        "CHFKWD",
-        "CHFLINK",
-        "CHFLRC",
-        "CHFLTC",
-        "CHFLUNA",
-        "CHFMAD",
-        "CHFMANA",
-        "CHFMATIC",
-        "CHFMUR",
-        "CHFMXN",
-        "CHFMYR",
-        "CHFNEAR",
-        "CHFNEO",
-        "CHFNGN",
-        "CHFNOK",
-        "CHFNZD",
-        "CHFOMR",
-        "CHFPEN",
-        "CHFPHP",
-        "CHFPLN",
-        "CHFQAR",
-        "CHFRON",
-        "CHFROSE",
-        "CHFRUB",
-        "CHFSAND",
-        "CHFSAR",
-        "CHFSEK",
-        "CHFSGD",
-        "CHFSHIB",
-        "CHFSOL",
-        "CHFTHB",
-        "CHFTHETA",
-        "CHFTRX",
-        "CHFTRY",
-        "CHFTWD",
-        "CHFUNI",
-        "CHFUSD",
-        "CHFUSDT",
-        "CHFUST",
-        "CHFVET",
-        "CHFVND",
-        "CHFXAG",
-        "CHFXAU",
-        "CHFXLM",
-        "CHFXMR",
-        "CHFXOF",
-        "CHFXPD",
-        "CHFXPT",
-        "CHFXRP",
-        "CHFXTZ",
-        "CHFZAR",
-        "CHFZWL",
-        "CLPALL",
-        "CLPADA",
-        "CLPAED",
-        "CLPARS",
-        "CLPATOM",
-        "CLPAUD",
-        "CLPAVAX",
-        "CLPAXS",
-        "CLPBCH",
-        "CLPBGN",
-        "CLPBHD",
-        "CLPBNB",
-        "CLPBRL",
-        "CLPBTC",
-        "CLPBTG",
-        "CLPBUSD",
-        "CLPCAD",
-        "CLPCHF",
-        "CLPCNY",
-        "CLPCNH",
-        "CLPCOP",
-        "CLPCZK",
-        "CLPDAI",
-        "CLPDASH",
-        "CLPDKK",
-        "CLPDOGE",
-        "CLPDOT",
-        "CLPEGLD",
-        "CLPENJ",
-        "CLPEOS",
-        "CLPETC",
-        "CLPETH",
-        "CLPEUR",
-        "CLPFIL",
-        "CLPFLOW",
-        "CLPFTM",
-        "CLPFTT",
-        "CLPGALA",
-        "CLPGBP",
-        "CLPGHS",
-        "CLPHBAR",
-        "CLPHKD",
-        "CLPHNT",
-        "CLPHRK",
-        "CLPHUF",
-        "CLPICP",
-        "CLPIDR",
-        "CLPILS",
-        "CLPINR",
-        "CLPISK",
-        "CLPJPY",
-        "CLPKES",
-        "CLPKRW",
-        "CLPKWD",
-        "CLPLINK",
-        "CLPLRC",
-        "CLPLTC",
-        "CLPLUNA",
-        "CLPMAD",
-        "CLPMANA",
-        "CLPMATIC",
-        "CLPMUR",
-        "CLPMXN",
-        "CLPMYR",
-        "CLPNEAR",
-        "CLPNEO",
-        "CLPNGN",
-        "CLPNOK",
-        "CLPNZD",
-        "CLPOMR",
-        "CLPPEN",
-        "CLPPHP",
-        "CLPPLN",
-        "CLPQAR",
-        "CLPRON",
-        "CLPROSE",
-        "CLPRUB",
-        "CLPSAND",
-        "CLPSAR",
-        "CLPSEK",
-        "CLPSGD",
-        "CLPSHIB",
-        "CLPSOL",
-        "CLPTHB",
-        "CLPTHETA",
-        "CLPTRX",
-        "CLPTRY",
-        "CLPTWD",
-        "CLPUNI",
-        "CLPUSD",
-        "CLPUSDT",
-        "CLPUST",
-        "CLPVET",
-        "CLPVND",
-        "CLPXAG",
-        "CLPXAU",
-        "CLPXLM",
-        "CLPXMR",
-        "CLPXOF",
-        "CLPXPD",
-        "CLPXPT",
-        "CLPXRP",
-        "CLPXTZ",
-        "CLPZAR",
-        "CLPZWL",
-        "CNYALL",
-        "CNYADA",
-        "CNYAED",
-        "CNYARS",
-        "CNYATOM",
-        "CNYAUD",
-        "CNYAVAX",
-        "CNYAXS",
-        "CNYBCH",
-        "CNYBGN",
-        "CNYBHD",
-        "CNYBNB",
-        "CNYBRL",
-        "CNYBTC",
-        "CNYBTG",
-        "CNYBUSD",
-        "CNYCAD",
-        "CNYCHF",
-        "CNYCLP",
-        "CNYCNH",
-        "CNYCOP",
-        "CNYCZK",
-        "CNYDAI",
-        "CNYDASH",
-        "CNYDKK",
-        "CNYDOGE",
-        "CNYDOT",
-        "CNYEGLD",
-        "CNYENJ",
-        "CNYEOS",
-        "CNYETC",
-        "CNYETH",
-        "CNYEUR",
-        "CNYFIL",
-        "CNYFLOW",
-        "CNYFTM",
-        "CNYFTT",
-        "CNYGALA",
-        "CNYGBP",
-        "CNYGHS",
-        "CNYHBAR",
-        "CNYHKD",
-        "CNYHNT",
-        "CNYHRK",
-        "CNYHUF",
-        "CNYICP",
-        "CNYIDR",
-        "CNYILS",
-        "CNYINR",
-        "CNYISK",
-        "CNYJPY",
-        "CNYKES",
-        "CNYKRW",
-        "CNYKWD",
-        "CNYLINK",
-        "CNYLRC",
-        "CNYLTC",
-        "CNYLUNA",
-        "CNYMAD",
-        "CNYMANA",
-        "CNYMATIC",
-        "CNYMUR",
-        "CNYMXN",
-        "CNYMYR",
-        "CNYNEAR",
-        "CNYNEO",
-        "CNYNGN",
-        "CNYNOK",
-        "CNYNZD",
-        "CNYOMR",
-        "CNYPEN",
-        "CNYPHP",
-        "CNYPLN",
-        "CNYQAR",
-        "CNYRON",
-        "CNYROSE",
-        "CNYRUB",
-        "CNYSAND",
-        "CNYSAR",
-        "CNYSEK",
-        "CNYSGD",
-        "CNYSHIB",
-        "CNYSOL",
-        "CNYTHB",
-        "CNYTHETA",
-        "CNYTRX",
-        "CNYTRY",
-        "CNYTWD",
-        "CNYUNI",
-        "CNYUSD",
-        "CNYUSDT",
-        "CNYUST",
-        "CNYVET",
-        "CNYVND",
-        "CNYXAG",
-        "CNYXAU",
-        "CNYXLM",
-        "CNYXMR",
-        "CNYXOF",
-        "CNYXPD",
-        "CNYXPT",
-        "CNYXRP",
-        "CNYXTZ",
-        "CNYZAR",
-        "CNYZWL",
-        "CNHALL",
-        "CNHADA",
-        "CNHAED",
-        "CNHARS",
-        "CNHATOM",
-        "CNHAUD",
-        "CNHAVAX",
-        "CNHAXS",
-        "CNHBCH",
-        "CNHBGN",
-        "CNHBHD",
-        "CNHBNB",
-        "CNHBRL",
-        "CNHBTC",
-        "CNHBTG",
-        "CNHBUSD",
-        "CNHCAD",
-        "CNHCHF",
-        "CNHCLP",
-        "CNHCNY",
-        "CNHCOP",
-        "CNHCZK",
-        "CNHDAI",
-        "CNHDASH",
-        "CNHDKK",
-        "CNHDOGE",
-        "CNHDOT",
-        "CNHEGLD",
-        "CNHENJ",
-        "CNHEOS",
-        "CNHETC",
-        "CNHETH",
-        "CNHEUR",
-        "CNHFIL",
-        "CNHFLOW",
-        "CNHFTM",
-        "CNHFTT",
-        "CNHGALA",
-        "CNHGBP",
-        "CNHGHS",
-        "CNHHBAR",
-        "CNHHKD",
-        "CNHHNT",
-        "CNHHRK",
-        "CNHHUF",
-        "CNHICP",
-        "CNHIDR",
-        "CNHILS",
-        "CNHINR",
-        "CNHISK",
-        "CNHJPY",
-        "CNHKES",
-        "CNHKRW",
-        "CNHKWD",
-        "CNHLINK",
-        "CNHLRC",
-        "CNHLTC",
-        "CNHLUNA",
-        "CNHMAD",
-        "CNHMANA",
-        "CNHMATIC",
-        "CNHMUR",
-        "CNHMXN",
-        "CNHMYR",
-        "CNHNEAR",
-        "CNHNEO",
-        "CNHNGN",
-        "CNHNOK",
-        "CNHNZD",
-        "CNHOMR",
-        "CNHPEN",
-        "CNHPHP",
-        "CNHPLN",
-        "CNHQAR",
-        "CNHRON",
-        "CNHROSE",
-        "CNHRUB",
-        "CNHSAND",
-        "CNHSAR",
-        "CNHSEK",
-        "CNHSGD",
-        "CNHSHIB",
-        "CNHSOL",
-        "CNHTHB",
-        "CNHTHETA",
-        "CNHTRX",
-        "CNHTRY",
-        "CNHTWD",
-        "CNHUNI",
-        "CNHUSD",
-        "CNHUSDT",
-        "CNHUST",
-        "CNHVET",
-        "CNHVND",
-        "CNHXAG",
-        "CNHXAU",
-        "CNHXLM",
-        "CNHXMR",
-        "CNHXOF",
-        "CNHXPD",
-        "CNHXPT",
-        "CNHXRP",
-        "CNHXTZ",
-        "CNHZAR",
-        "CNHZWL",
-        "COPALL",
-        "COPADA",
-        "COPAED",
-        "COPARS",
-        "COPATOM",
-        "COPAUD",
-        "COPAVAX",
-        "COPAXS",
-        "COPBCH",
-        "COPBGN",
-        "COPBHD",
-        "COPBNB",
-        "COPBRL",
-        "COPBTC",
-        "COPBTG",
-        "COPBUSD",
-        "COPCAD",
-        "COPCHF",
-        "COPCLP",
-        "COPCNY",
-        "COPCNH",
-        "COPCZK",
-        "COPDAI",
-        "COPDASH",
-        "COPDKK",
-        "COPDOGE",
-        "COPDOT",
-        "COPEGLD",
-        "COPENJ",
-        "COPEOS",
-        "COPETC",
-        "COPETH",
-        "COPEUR",
-        "COPFIL",
-        "COPFLOW",
-        "COPFTM",
-        "COPFTT",
-        "COPGALA",
-        "COPGBP",
-        "COPGHS",
-        "COPHBAR",
-        "COPHKD",
-        "COPHNT",
-        "COPHRK",
-        "COPHUF",
-        "COPICP",
-        "COPIDR",
-        "COPILS",
-        "COPINR",
-        "COPISK",
-        "COPJPY",
-        "COPKES",
-        "COPKRW",
-        "COPKWD",
-        "COPLINK",
-        "COPLRC",
-        "COPLTC",
-        "COPLUNA",
-        "COPMAD",
-        "COPMANA",
-        "COPMATIC",
-        "COPMUR",
-        "COPMXN",
-        "COPMYR",
-        "COPNEAR",
-        "COPNEO",
-        "COPNGN",
-        "COPNOK",
-        "COPNZD",
-        "COPOMR",
-        "COPPEN",
-        "COPPHP",
-        "COPPLN",
-        "COPQAR",
-        "COPRON",
-        "COPROSE",
-        "COPRUB",
-        "COPSAND",
-        "COPSAR",
-        "COPSEK",
-        "COPSGD",
-        "COPSHIB",
-        "COPSOL",
-        "COPTHB",
-        "COPTHETA",
-        "COPTRX",
-        "COPTRY",
-        "COPTWD",
-        "COPUNI",
-        "COPUSD",
-        "COPUSDT",
-        "COPUST",
-        "COPVET",
-        "COPVND",
-        "COPXAG",
-        "COPXAU",
-        "COPXLM",
-        "COPXMR",
-        "COPXOF",
-        "COPXPD",
-        "COPXPT",
-        "COPXRP",
-        "COPXTZ",
-        "COPZAR",
-        "COPZWL",
-        "CZKALL",
-        "CZKADA",
-        "CZKAED",
-        "CZKARS",
-        "CZKATOM",
-        "CZKAUD",
-        "CZKAVAX",
-        "CZKAXS",
-        "CZKBCH",
-        "CZKBGN",
-        "CZKBHD",
-        "CZKBNB",
-        "CZKBRL",
-        "CZKBTC",
-        "CZKBTG",
-        "CZKBUSD",
-        "CZKCAD",
-        "CZKCHF",
-        "CZKCLP",
-        "CZKCNY",
-        "CZKCNH",
-        "CZKCOP",
-        "CZKDAI",
-        "CZKDASH",
-        "CZKDKK",
-        "CZKDOGE",
-        "CZKDOT",
-        "CZKEGLD",
-        "CZKENJ",
-        "CZKEOS",
-        "CZKETC",
-        "CZKETH",
-        "CZKEUR",
-        "CZKFIL",
-        "CZKFLOW",
-        "CZKFTM",
-        "CZKFTT",
-        "CZKGALA",
-        "CZKGBP",
-        "CZKGHS",
-        "CZKHBAR",
-        "CZKHKD",
-        "CZKHNT",
-        "CZKHRK",
-        "CZKHUF",
-        "CZKICP",
-        "CZKIDR",
-        "CZKILS",
-        "CZKINR",
-        "CZKISK",
-        "CZKJPY",
-        "CZKKES",
-        "CZKKRW",
-        "CZKKWD",
-        "CZKLINK",
-        "CZKLRC",
-        "CZKLTC",
-        "CZKLUNA",
-        "CZKMAD",
-        "CZKMANA",
-        "CZKMATIC",
-        "CZKMUR",
-        "CZKMXN",
-        "CZKMYR",
-        "CZKNEAR",
-        "CZKNEO",
-        "CZKNGN",
-        "CZKNOK",
-        "CZKNZD",
-        "CZKOMR",
-        "CZKPEN",
-        "CZKPHP",
-        "CZKPLN",
-        "CZKQAR",
-        "CZKRON",
-        "CZKROSE",
-        "CZKRUB",
-        "CZKSAND",
-        "CZKSAR",
-        "CZKSEK",
-        "CZKSGD",
-        "CZKSHIB",
-        "CZKSOL",
-        "CZKTHB",
-        "CZKTHETA",
-        "CZKTRX",
-        "CZKTRY",
-        "CZKTWD",
-        "CZKUNI",
-        "CZKUSD",
-        "CZKUSDT",
-        "CZKUST",
-        "CZKVET",
-        "CZKVND",
-        "CZKXAG",
-        "CZKXAU",
-        "CZKXLM",
-        "CZKXMR",
-        "CZKXOF",
-        "CZKXPD",
-        "CZKXPT",
-        "CZKXRP",
-        "CZKXTZ",
-        "CZKZAR",
-        "CZKZWL",
-        "DAIALL",
-        "DAIADA",
-        "DAIAED",
-        "DAIARS",
-        "DAIATOM",
-        "DAIAUD",
-        "DAIAVAX",
-        "DAIAXS",
-        "DAIBCH",
-        "DAIBGN",
-        "DAIBHD",
-        "DAIBNB",
-        "DAIBRL",
-        "DAIBTC",
-        "DAIBTG",
-        "DAIBUSD",
-        "DAICAD",
-        "DAICHF",
-        "DAICLP",
-        "DAICNY",
-        "DAICNH",
-        "DAICOP",
-        "DAICZK",
-        "DAIDASH",
-        "DAIDKK",
-        "DAIDOGE",
-        "DAIDOT",
-        "DAIEGLD",
-        "DAIENJ",
-        "DAIEOS",
-        "DAIETC",
-        "DAIETH",
-        "DAIEUR",
-        "DAIFIL",
-        "DAIFLOW",
-        "DAIFTM",
-        "DAIFTT",
-        "DAIGALA",
-        "DAIGBP",
-        "DAIGHS",
-        "DAIHBAR",
-        "DAIHKD",
-        "DAIHNT",
-        "DAIHRK",
-        "DAIHUF",
-        "DAIICP",
-        "DAIIDR",
-        "DAIILS",
-        "DAIINR",
-        "DAIISK",
-        "DAIJPY",
-        "DAIKES",
-        "DAIKRW",
-        "DAIKWD",
-        "DAILINK",
-        "DAILRC",
-        "DAILTC",
-        "DAILUNA",
-        "DAIMAD",
-        "DAIMANA",
-        "DAIMATIC",
-        "DAIMUR",
-        "DAIMXN",
-        "DAIMYR",
-        "DAINEAR",
-        "DAINEO",
-        "DAINGN",
-        "DAINOK",
-        "DAINZD",
-        "DAIOMR",
-        "DAIPEN",
-        "DAIPHP",
-        "DAIPLN",
-        "DAIQAR",
-        "DAIRON",
-        "DAIROSE",
-        "DAIRUB",
-        "DAISAND",
-        "DAISAR",
-        "DAISEK",
-        "DAISGD",
-        "DAISHIB",
-        "DAISOL",
-        "DAITHB",
-        "DAITHETA",
-        "DAITRX",
-        "DAITRY",
-        "DAITWD",
-        "DAIUNI",
-        "DAIUSD",
-        "DAIUSDT",
-        "DAIUST",
-        "DAIVET",
-        "DAIVND",
-        "DAIXAG",
-        "DAIXAU",
-        "DAIXLM",
-        "DAIXMR",
-        "DAIXOF",
-        "DAIXPD",
-        "DAIXPT",
-        "DAIXRP",
-        "DAIXTZ",
-        "DAIZAR",
-        "DAIZWL",
-        "DASHALL",
-        "DASHADA",
-        "DASHAED",
-        "DASHARS",
-        "DASHATOM",
-        "DASHAUD",
-        "DASHAVAX",
-        "DASHAXS",
-        "DASHBCH",
-        "DASHBGN",
-        "DASHBHD",
-        "DASHBNB",
-        "DASHBRL",
-        "DASHBTC",
-        "DASHBTG",
-        "DASHBUSD",
-        "DASHCAD",
-        "DASHCHF",
-        "DASHCLP",
-        "DASHCNY",
-        "DASHCNH",
-        "DASHCOP",
-        "DASHCZK",
-        "DASHDAI",
-        "DASHDKK",
-        "DASHDOGE",
-        "DASHDOT",
-        "DASHEGLD",
-        "DASHENJ",
-        "DASHEOS",
-        "DASHETC",
-        "DASHETH",
-        "DASHEUR",
-        "DASHFIL",
-        "DASHFLOW",
-        "DASHFTM",
-        "DASHFTT",
-        "DASHGALA",
-        "DASHGBP",
-        "DASHGHS",
-        "DASHHBAR",
-        "DASHHKD",
-        "DASHHNT",
-        "DASHHRK",
-        "DASHHUF",
-        "DASHICP",
-        "DASHIDR",
-        "DASHILS",
-        "DASHINR",
-        "DASHISK",
-        "DASHJPY",
-        "DASHKES",
-        "DASHKRW",
-        "DASHKWD",
-        "DASHLINK",
-        "DASHLRC",
-        "DASHLTC",
-        "DASHLUNA",
-        "DASHMAD",
-        "DASHMANA",
-        "DASHMATIC",
-        "DASHMUR",
-        "DASHMXN",
-        "DASHMYR",
-        "DASHNEAR",
-        "DASHNEO",
-        "DASHNGN",
-        "DASHNOK",
-        "DASHNZD",
-        "DASHOMR",
-        "DASHPEN",
-        "DASHPHP",
-        "DASHPLN",
-        "DASHQAR",
-        "DASHRON",
-        "DASHROSE",
-        "DASHRUB",
-        "DASHSAND",
-        "DASHSAR",
-        "DASHSEK",
-        "DASHSGD",
-        "DASHSHIB",
-        "DASHSOL",
-        "DASHTHB",
-        "DASHTHETA",
-        "DASHTRX",
-        "DASHTRY",
-        "DASHTWD",
-        "DASHUNI",
-        "DASHUSD",
-        "DASHUSDT",
-        "DASHUST",
-        "DASHVET",
-        "DASHVND",
-        "DASHXAG",
-        "DASHXAU",
-        "DASHXLM",
-        "DASHXMR",
-        "DASHXOF",
-        "DASHXPD",
-        "DASHXPT",
-        "DASHXRP",
-        "DASHXTZ",
-        "DASHZAR",
-        "DASHZWL",
-        "DKKALL",
-        "DKKADA",
-        "DKKAED",
-        "DKKARS",
-        "DKKATOM",
-        "DKKAUD",
-        "DKKAVAX",
-        "DKKAXS",
-        "DKKBCH",
-        "DKKBGN",
-        "DKKBHD",
-        "DKKBNB",
-        "DKKBRL",
-        "DKKBTC",
-        "DKKBTG",
-        "DKKBUSD",
-        "DKKCAD",
-        "DKKCHF",
-        "DKKCLP",
-        "DKKCNY",
-        "DKKCNH",
-        "DKKCOP",
-        "DKKCZK",
-        "DKKDAI",
-        "DKKDASH",
-        "DKKDOGE",
-        "DKKDOT",
-        "DKKEGLD",
-        "DKKENJ",
-        "DKKEOS",
-        "DKKETC",
-        "DKKETH",
-        "DKKEUR",
-        "DKKFIL",
-        "DKKFLOW",
-        "DKKFTM",
-        "DKKFTT",
-        "DKKGALA",
-        "DKKGBP",
-        "DKKGHS",
-        "DKKHBAR",
-        "DKKHKD",
-        "DKKHNT",
-        "DKKHRK",
-        "DKKHUF",
-        "DKKICP",
-        "DKKIDR",
-        "DKKILS",
-        "DKKINR",
-        "DKKISK",
-        "DKKJPY",
-        "DKKKES",
-        "DKKKRW",
-        "DKKKWD",
-        "DKKLINK",
-        "DKKLRC",
-        "DKKLTC",
-        "DKKLUNA",
-        "DKKMAD",
-        "DKKMANA",
-        "DKKMATIC",
-        "DKKMUR",
-        "DKKMXN",
-        "DKKMYR",
-        "DKKNEAR",
-        "DKKNEO",
-        "DKKNGN",
-        "DKKNOK",
-        "DKKNZD",
-        "DKKOMR",
-        "DKKPEN",
-        "DKKPHP",
-        "DKKPLN",
-        "DKKQAR",
-        "DKKRON",
-        "DKKROSE",
-        "DKKRUB",
-        "DKKSAND",
-        "DKKSAR",
-        "DKKSEK",
-        "DKKSGD",
-        "DKKSHIB",
-        "DKKSOL",
-        "DKKTHB",
-        "DKKTHETA",
-        "DKKTRX",
-        "DKKTRY",
-        "DKKTWD",
-        "DKKUNI",
-        "DKKUSD",
-        "DKKUSDT",
-        "DKKUST",
-        "DKKVET",
-        "DKKVND",
-        "DKKXAG",
-        "DKKXAU",
-        "DKKXLM",
-        "DKKXMR",
-        "DKKXOF",
-        "DKKXPD",
-        "DKKXPT",
-        "DKKXRP",
-        "DKKXTZ",
-        "DKKZAR",
-        "DKKZWL",
-        "DOGEALL",
-        "DOGEADA",
-        "DOGEAED",
-        "DOGEARS",
-        "DOGEATOM",
-        "DOGEAUD",
-        "DOGEAVAX",
-        "DOGEAXS",
-        "DOGEBCH",
-        "DOGEBGN",
-        "DOGEBHD",
-        "DOGEBNB",
-        "DOGEBRL",
-        "DOGEBTC",
-        "DOGEBTG",
-        "DOGEBUSD",
-        "DOGECAD",
-        "DOGECHF",
-        "DOGECLP",
-        "DOGECNY",
-        "DOGECNH",
-        "DOGECOP",
-        "DOGECZK",
-        "DOGEDAI",
-        "DOGEDASH",
-        "DOGEDKK",
-        "DOGEDOT",
-        "DOGEEGLD",
-        "DOGEENJ",
-        "DOGEEOS",
-        "DOGEETC",
-        "DOGEETH",
-        "DOGEEUR",
-        "DOGEFIL",
-        "DOGEFLOW",
-        "DOGEFTM",
-        "DOGEFTT",
-        "DOGEGALA",
-        "DOGEGBP",
-        "DOGEGHS",
-        "DOGEHBAR",
-        "DOGEHKD",
-        "DOGEHNT",
-        "DOGEHRK",
-        "DOGEHUF",
-        "DOGEICP",
-        "DOGEIDR",
-        "DOGEILS",
-        "DOGEINR",
-        "DOGEISK",
-        "DOGEJPY",
-        "DOGEKES",
-        "DOGEKRW",
-        "DOGEKWD",
-        "DOGELINK",
-        "DOGELRC",
-        "DOGELTC",
-        "DOGELUNA",
-        "DOGEMAD",
-        "DOGEMANA",
-        "DOGEMATIC",
-        "DOGEMUR",
-        "DOGEMXN",
-        "DOGEMYR",
-        "DOGENEAR",
-        "DOGENEO",
-        "DOGENGN",
-        "DOGENOK",
-        "DOGENZD",
-        "DOGEOMR",
-        "DOGEPEN",
-        "DOGEPHP",
-        "DOGEPLN",
-        "DOGEQAR",
-        "DOGERON",
-        "DOGEROSE",
-        "DOGERUB",
-        "DOGESAND",
-        "DOGESAR",
-        "DOGESEK",
-        "DOGESGD",
-        "DOGESHIB",
-        "DOGESOL",
-        "DOGETHB",
-        "DOGETHETA",
-        "DOGETRX",
-        "DOGETRY",
-        "DOGETWD",
-        "DOGEUNI",
-        "DOGEUSD",
-        "DOGEUSDT",
-        "DOGEUST",
-        "DOGEVET",
-        "DOGEVND",
-        "DOGEXAG",
-        "DOGEXAU",
-        "DOGEXLM",
-        "DOGEXMR",
-        "DOGEXOF",
-        "DOGEXPD",
-        "DOGEXPT",
-        "DOGEXRP",
-        "DOGEXTZ",
-        "DOGEZAR",
-        "DOGEZWL",
-        "DOTALL",
-        "DOTADA",
-        "DOTAED",
-        "DOTARS",
-        "DOTATOM",
-        "DOTAUD",
-        "DOTAVAX",
-        "DOTAXS",
-        "DOTBCH",
-        "DOTBGN",
-        "DOTBHD",
-        "DOTBNB",
-        "DOTBRL",
-        "DOTBTC",
-        "DOTBTG",
-        "DOTBUSD",
-        "DOTCAD",
-        "DOTCHF",
-        "DOTCLP",
-        "DOTCNY",
-        "DOTCNH",
-        "DOTCOP",
-        "DOTCZK",
-        "DOTDAI",
-        "DOTDASH",
-        "DOTDKK",
-        "DOTDOGE",
-        "DOTEGLD",
-        "DOTENJ",
-        "DOTEOS",
-        "DOTETC",
-        "DOTETH",
-        "DOTEUR",
-        "DOTFIL",
-        "DOTFLOW",
-        "DOTFTM",
-        "DOTFTT",
-        "DOTGALA",
-        "DOTGBP",
-        "DOTGHS",
-        "DOTHBAR",
-        "DOTHKD",
-        "DOTHNT",
-        "DOTHRK",
-        "DOTHUF",
-        "DOTICP",
-        "DOTIDR",
-        "DOTILS",
-        "DOTINR",
-        "DOTISK",
-        "DOTJPY",
-        "DOTKES",
-        "DOTKRW",
-        "DOTKWD",
-        "DOTLINK",
-        "DOTLRC",
-        "DOTLTC",
-        "DOTLUNA",
-        "DOTMAD",
-        "DOTMANA",
-        "DOTMATIC",
-        "DOTMUR",
-        "DOTMXN",
-        "DOTMYR",
-        "DOTNEAR",
-        "DOTNEO",
-        "DOTNGN",
-        "DOTNOK",
-        "DOTNZD",
-        "DOTOMR",
-        "DOTPEN",
-        "DOTPHP",
-        "DOTPLN",
-        "DOTQAR",
-        "DOTRON",
-        "DOTROSE",
-        "DOTRUB",
-        "DOTSAND",
-        "DOTSAR",
-        "DOTSEK",
-        "DOTSGD",
-        "DOTSHIB",
-        "DOTSOL",
-        "DOTTHB",
-        "DOTTHETA",
-        "DOTTRX",
-        "DOTTRY",
-        "DOTTWD",
-        "DOTUNI",
-        "DOTUSD",
-        "DOTUSDT",
-        "DOTUST",
-        "DOTVET",
-        "DOTVND",
-        "DOTXAG",
-        "DOTXAU",
-        "DOTXLM",
-        "DOTXMR",
-        "DOTXOF",
-        "DOTXPD",
-        "DOTXPT",
-        "DOTXRP",
-        "DOTXTZ",
-        "DOTZAR",
-        "DOTZWL",
-        "EGLDALL",
-        "EGLDADA",
-        "EGLDAED",
-        "EGLDARS",
-        "EGLDATOM",
-        "EGLDAUD",
-        "EGLDAVAX",
-        "EGLDAXS",
-        "EGLDBCH",
-        "EGLDBGN",
-        "EGLDBHD",
-        "EGLDBNB",
-        "EGLDBRL",
-        "EGLDBTC",
-        "EGLDBTG",
-        "EGLDBUSD",
-        "EGLDCAD",
-        "EGLDCHF",
-        "EGLDCLP",
-        "EGLDCNY",
-        "EGLDCNH",
-        "EGLDCOP",
-        "EGLDCZK",
-        "EGLDDAI",
-        "EGLDDASH",
-        "EGLDDKK",
-        "EGLDDOGE",
-        "EGLDDOT",
-        "EGLDENJ",
-        "EGLDEOS",
-        "EGLDETC",
-        "EGLDETH",
-        "EGLDEUR",
-        "EGLDFIL",
-        "EGLDFLOW",
-        "EGLDFTM",
-        "EGLDFTT",
-        "EGLDGALA",
-        "EGLDGBP",
-        "EGLDGHS",
-        "EGLDHBAR",
-        "EGLDHKD",
-        "EGLDHNT",
-        "EGLDHRK",
-        "EGLDHUF",
-        "EGLDICP",
-        "EGLDIDR",
-        "EGLDILS",
-        "EGLDINR",
-        "EGLDISK",
-        "EGLDJPY",
-        "EGLDKES",
-        "EGLDKRW",
-        "EGLDKWD",
-        "EGLDLINK",
-        "EGLDLRC",
-        "EGLDLTC",
-        "EGLDLUNA",
-        "EGLDMAD",
-        "EGLDMANA",
-        "EGLDMATIC",
-        "EGLDMUR",
-        "EGLDMXN",
-        "EGLDMYR",
-        "EGLDNEAR",
-        "EGLDNEO",
-        "EGLDNGN",
-        "EGLDNOK",
-        "EGLDNZD",
-        "EGLDOMR",
-        "EGLDPEN",
-        "EGLDPHP",
-        "EGLDPLN",
-        "EGLDQAR",
-        "EGLDRON",
-        "EGLDROSE",
-        "EGLDRUB",
-        "EGLDSAND",
-        "EGLDSAR",
-        "EGLDSEK",
-        "EGLDSGD",
-        "EGLDSHIB",
-        "EGLDSOL",
-        "EGLDTHB",
-        "EGLDTHETA",
-        "EGLDTRX",
-        "EGLDTRY",
-        "EGLDTWD",
-        "EGLDUNI",
-        "EGLDUSD",
-        "EGLDUSDT",
-        "EGLDUST",
-        "EGLDVET",
-        "EGLDVND",
-        "EGLDXAG",
-        "EGLDXAU",
-        "EGLDXLM",
-        "EGLDXMR",
-        "EGLDXOF",
-        "EGLDXPD",
-        "EGLDXPT",
-        "EGLDXRP",
-        "EGLDXTZ",
-        "EGLDZAR",
-        "EGLDZWL",
-        "ENJALL",
-        "ENJADA",
-        "ENJAED",
-        "ENJARS",
-        "ENJATOM",
-        "ENJAUD",
-        "ENJAVAX",
-        "ENJAXS",
-        "ENJBCH",
-        "ENJBGN",
-        "ENJBHD",
-        "ENJBNB",
-        "ENJBRL",
-        "ENJBTC",
-        "ENJBTG",
-        "ENJBUSD",
-        "ENJCAD",
-        "ENJCHF",
-        "ENJCLP",
-        "ENJCNY",
-        "ENJCNH",
-        "ENJCOP",
-        "ENJCZK",
-        "ENJDAI",
-        "ENJDASH",
-        "ENJDKK",
-        "ENJDOGE",
-        "ENJDOT",
-        "ENJEGLD",
-        "ENJEOS",
-        "ENJETC",
-        "ENJETH",
-        "ENJEUR",
-        "ENJFIL",
-        "ENJFLOW",
-        "ENJFTM",
-        "ENJFTT",
-        "ENJGALA",
-        "ENJGBP",
-        "ENJGHS",
-        "ENJHBAR",
-        "ENJHKD",
-        "ENJHNT",
-        "ENJHRK",
-        "ENJHUF",
-        "ENJICP",
-        "ENJIDR",
-        "ENJILS",
-        "ENJINR",
-        "ENJISK",
-        "ENJJPY",
-        "ENJKES",
-        "ENJKRW",
-        "ENJKWD",
-        "ENJLINK",
-        "ENJLRC",
-        "ENJLTC",
-        "ENJLUNA",
-        "ENJMAD",
-        "ENJMANA",
-        "ENJMATIC",
-        "ENJMUR",
-        "ENJMXN",
-        "ENJMYR",
-        "ENJNEAR",
-        "ENJNEO",
-        "ENJNGN",
-        "ENJNOK",
-        "ENJNZD",
-        "ENJOMR",
-        "ENJPEN",
-        "ENJPHP",
-        "ENJPLN",
-        "ENJQAR",
-        "ENJRON",
-        "ENJROSE",
-        "ENJRUB",
-        "ENJSAND",
-        "ENJSAR",
-        "ENJSEK",
-        "ENJSGD",
-        "ENJSHIB",
-        "ENJSOL",
-        "ENJTHB",
-        "ENJTHETA",
-        "ENJTRX",
-        "ENJTRY",
-        "ENJTWD",
-        "ENJUNI",
-        "ENJUSD",
-        "ENJUSDT",
-        "ENJUST",
-        "ENJVET",
-        "ENJVND",
-        "ENJXAG",
-        "ENJXAU",
-        "ENJXLM",
-        "ENJXMR",
-        "ENJXOF",
-        "ENJXPD",
-        "ENJXPT",
-        "ENJXRP",
-        "ENJXTZ",
-        "ENJZAR",
-        "ENJZWL",
-        "EOSALL",
-        "EOSADA",
-        "EOSAED",
-        "EOSARS",
-        "EOSATOM",
-        "EOSAUD",
-        "EOSAVAX",
-        "EOSAXS",
-        "EOSBCH",
-        "EOSBGN",
-        "EOSBHD",
-        "EOSBNB",
-        "EOSBRL",
-        "EOSBTC",
-        "EOSBTG",
-        "EOSBUSD",
-        "EOSCAD",
-        "EOSCHF",
-        "EOSCLP",
-        "EOSCNY",
-        "EOSCNH",
-        "EOSCOP",
-        "EOSCZK",
-        "EOSDAI",
-        "EOSDASH",
-        "EOSDKK",
-        "EOSDOGE",
-        "EOSDOT",
-        "EOSEGLD",
-        "EOSENJ",
-        "EOSETC",
-        "EOSETH",
-        "EOSEUR",
-        "EOSFIL",
-        "EOSFLOW",
-        "EOSFTM",
-        "EOSFTT",
-        "EOSGALA",
-        "EOSGBP",
-        "EOSGHS",
-        "EOSHBAR",
-        "EOSHKD",
-        "EOSHNT",
-        "EOSHRK",
-        "EOSHUF",
-        "EOSICP",
-        "EOSIDR",
-        "EOSILS",
-        "EOSINR",
-        "EOSISK",
-        "EOSJPY",
-        "EOSKES",
-        "EOSKRW",
-        "EOSKWD",
-        "EOSLINK",
-        "EOSLRC",
-        "EOSLTC",
-        "EOSLUNA",
-        "EOSMAD",
-        "EOSMANA",
-        "EOSMATIC",
-        "EOSMUR",
-        "EOSMXN",
-        "EOSMYR",
-        "EOSNEAR",
-        "EOSNEO",
-        "EOSNGN",
-        "EOSNOK",
-        "EOSNZD",
-        "EOSOMR",
-        "EOSPEN",
-        "EOSPHP",
-        "EOSPLN",
-        "EOSQAR",
-        "EOSRON",
-        "EOSROSE",
-        "EOSRUB",
-        "EOSSAND",
-        "EOSSAR",
-        "EOSSEK",
-        "EOSSGD",
-        "EOSSHIB",
-        "EOSSOL",
-        "EOSTHB",
-        "EOSTHETA",
-        "EOSTRX",
-        "EOSTRY",
-        "EOSTWD",
-        "EOSUNI",
-        "EOSUSD",
-        "EOSUSDT",
-        "EOSUST",
-        "EOSVET",
-        "EOSVND",
-        "EOSXAG",
-        "EOSXAU",
-        "EOSXLM",
-        "EOSXMR",
-        "EOSXOF",
-        "EOSXPD",
-        "EOSXPT",
-        "EOSXRP",
-        "EOSXTZ",
-        "EOSZAR",
-        "EOSZWL",
-        "ETCALL",
-        "ETCADA",
-        "ETCAED",
-        "ETCARS",
-        "ETCATOM",
-        "ETCAUD",
-        "ETCAVAX",
-        "ETCAXS",
-        "ETCBCH",
-        "ETCBGN",
-        "ETCBHD",
-        "ETCBNB",
-        "ETCBRL",
-        "ETCBTC",
-        "ETCBTG",
-        "ETCBUSD",
-        "ETCCAD",
-        "ETCCHF",
-        "ETCCLP",
-        "ETCCNY",
-        "ETCCNH",
-        "ETCCOP",
-        "ETCCZK",
-        "ETCDAI",
-        "ETCDASH",
-        "ETCDKK",
-        "ETCDOGE",
-        "ETCDOT",
-        "ETCEGLD",
-        "ETCENJ",
-        "ETCEOS",
-        "ETCETH",
-        "ETCEUR",
-        "ETCFIL",
-        "ETCFLOW",
-        "ETCFTM",
-        "ETCFTT",
-        "ETCGALA",
-        "ETCGBP",
-        "ETCGHS",
-        "ETCHBAR",
-        "ETCHKD",
-        "ETCHNT",
-        "ETCHRK",
-        "ETCHUF",
-        "ETCICP",
-        "ETCIDR",
-        "ETCILS",
-        "ETCINR",
-        "ETCISK",
-        "ETCJPY",
-        "ETCKES",
-        "ETCKRW",
-        "ETCKWD",
-        "ETCLINK",
-        "ETCLRC",
-        "ETCLTC",
-        "ETCLUNA",
-        "ETCMAD",
-        "ETCMANA",
-        "ETCMATIC",
-        "ETCMUR",
-        "ETCMXN",
-        "ETCMYR",
-        "ETCNEAR",
-        "ETCNEO",
-        "ETCNGN",
-        "ETCNOK",
-        "ETCNZD",
-        "ETCOMR",
-        "ETCPEN",
-        "ETCPHP",
-        "ETCPLN",
-        "ETCQAR",
-        "ETCRON",
-        "ETCROSE",
-        "ETCRUB",
-        "ETCSAND",
-        "ETCSAR",
-        "ETCSEK",
-        "ETCSGD",
-        "ETCSHIB",
-        "ETCSOL",
-        "ETCTHB",
-        "ETCTHETA",
-        "ETCTRX",
-        "ETCTRY",
-        "ETCTWD",
-        "ETCUNI",
-        "ETCUSD",
-        "ETCUSDT",
-        "ETCUST",
-        "ETCVET",
-        "ETCVND",
-        "ETCXAG",
-        "ETCXAU",
-        "ETCXLM",
-        "ETCXMR",
-        "ETCXOF",
-        "ETCXPD",
-        "ETCXPT",
-        "ETCXRP",
-        "ETCXTZ",
-        "ETCZAR",
-        "ETCZWL",
-        "ETHALL",
-        "ETHADA",
-        "ETHAED",
-        "ETHARS",
-        "ETHATOM",
-        "ETHAUD",
-        "ETHAVAX",
-        "ETHAXS",
-        "ETHBCH",
-        "ETHBGN",
-        "ETHBHD",
-        "ETHBNB",
-        "ETHBRL",
-        "ETHBTC",
-        "ETHBTG",
-        "ETHBUSD",
-        "ETHCAD",
-        "ETHCHF",
-        "ETHCLP",
-        "ETHCNY",
-        "ETHCNH",
-        "ETHCOP",
-        "ETHCZK",
-        "ETHDAI",
-        "ETHDASH",
-        "ETHDKK",
-        "ETHDOGE",
-        "ETHDOT",
-        "ETHEGLD",
-        "ETHENJ",
-        "ETHEOS",
-        "ETHETC",
-        "ETHEUR",
-        "ETHFIL",
-        "ETHFLOW",
-        "ETHFTM",
-        "ETHFTT",
-        "ETHGALA",
-        "ETHGBP",
-        "ETHGHS",
-        "ETHHBAR",
-        "ETHHKD",
-        "ETHHNT",
-        "ETHHRK",
-        "ETHHUF",
-        "ETHICP",
-        "ETHIDR",
-        "ETHILS",
-        "ETHINR",
-        "ETHISK",
-        "ETHJPY",
-        "ETHKES",
-        "ETHKRW",
-        "ETHKWD",
-        "ETHLINK",
-        "ETHLRC",
-        "ETHLTC",
-        "ETHLUNA",
-        "ETHMAD",
-        "ETHMANA",
-        "ETHMATIC",
-        "ETHMUR",
-        "ETHMXN",
-        "ETHMYR",
-        "ETHNEAR",
-        "ETHNEO",
-        "ETHNGN",
-        "ETHNOK",
-        "ETHNZD",
-        "ETHOMR",
-        "ETHPEN",
-        "ETHPHP",
-        "ETHPLN",
-        "ETHQAR",
-        "ETHRON",
-        "ETHROSE",
-        "ETHRUB",
-        "ETHSAND",
-        "ETHSAR",
-        "ETHSEK",
-        "ETHSGD",
-        "ETHSHIB",
-        "ETHSOL",
-        "ETHTHB",
-        "ETHTHETA",
-        "ETHTRX",
-        "ETHTRY",
-        "ETHTWD",
-        "ETHUNI",
-        "ETHUSD",
-        "ETHUSDT",
-        "ETHUST",
-        "ETHVET",
-        "ETHVND",
-        "ETHXAG",
-        "ETHXAU",
-        "ETHXLM",
-        "ETHXMR",
-        "ETHXOF",
-        "ETHXPD",
-        "ETHXPT",
-        "ETHXRP",
-        "ETHXTZ",
-        "ETHZAR",
-        "ETHZWL",
-        "EURALL",
-        "EURADA",
-        "EURAED",
-        "EURARS",
-        "EURATOM",
-        "EURAUD",
-        "EURAVAX",
-        "EURAXS",
-        "EURBCH",
-        "EURBGN",
-        "EURBHD",
-        "EURBNB",
-        "EURBRL",
-        "EURBTC",
-        "EURBTG",
-        "EURBUSD",
-        "EURCAD",
-        "EURCHF",
-        "EURCLP",
-        "EURCNY",
-        "EURCNH",
-        "EURCOP",
-        "EURCZK",
-        "EURDAI",
-        "EURDASH",
-        "EURDKK",
-        "EURDOGE",
-        "EURDOT",
-        "EUREGLD",
-        "EURENJ",
-        "EUREOS",
-        "EURETC",
-        "EURETH",
-        "EURFIL",
-        "EURFLOW",
-        "EURFTM",
-        "EURFTT",
-        "EURGALA",
-        "EURGBP",
-        "EURGHS",
-        "EURHBAR",
-        "EURHKD",
-        "EURHNT",
-        "EURHRK",
-        "EURHUF",
-        "EURICP",
-        "EURIDR",
-        "EURILS",
-        "EURINR",
-        "EURISK",
-        "EURJPY",
-        "EURKES",
-        "EURKRW",
-        "EURKWD",
-        "EURLINK",
-        "EURLRC",
-        "EURLTC",
-        "EURLUNA",
-        "EURMAD",
-        "EURMANA",
-        "EURMATIC",
-        "EURMUR",
-        "EURMXN",
-        "EURMYR",
-        "EURNEAR",
-        "EURNEO",
-        "EURNGN",
-        "EURNOK",
-        "EURNZD",
-        "EUROMR",
-        "EURPEN",
-        "EURPHP",
-        "EURPLN",
-        "EURQAR",
-        "EURRON",
-        "EURROSE",
-        "EURRUB",
-        "EURSAND",
-        "EURSAR",
-        "EURSEK",
-        "EURSGD",
-        "EURSHIB",
-        "EURSOL",
-        "EURTHB",
-        "EURTHETA",
-        "EURTRX",
-        "EURTRY",
-        "EURTWD",
-        "EURUNI",
-        "EURUSD",
-        "EURUSDT",
-        "EURUST",
-        "EURVET",
-        "EURVND",
-        "EURXAG",
-        "EURXAU",
-        "EURXLM",
-        "EURXMR",
-        "EURXOF",
-        "EURXPD",
-        "EURXPT",
-        "EURXRP",
-        "EURXTZ",
-        "EURZAR",
-        "EURZWL",
-        "FILALL",
-        "FILADA",
-        "FILAED",
-        "FILARS",
-        "FILATOM",
-        "FILAUD",
-        "FILAVAX",
-        "FILAXS",
-        "FILBCH",
-        "FILBGN",
-        "FILBHD",
-        "FILBNB",
-        "FILBRL",
-        "FILBTC",
-        "FILBTG",
-        "FILBUSD",
-        "FILCAD",
-        "FILCHF",
-        "FILCLP",
-        "FILCNY",
-        "FILCNH",
-        "FILCOP",
-        "FILCZK",
-        "FILDAI",
-        "FILDASH",
-        "FILDKK",
-        "FILDOGE",
-        "FILDOT",
-        "FILEGLD",
-        "FILENJ",
-        "FILEOS",
-        "FILETC",
-        "FILETH",
-        "FILEUR",
-        "FILFLOW",
-        "FILFTM",
-        "FILFTT",
-        "FILGALA",
-        "FILGBP",
-        "FILGHS",
-        "FILHBAR",
-        "FILHKD",
-        "FILHNT",
-        "FILHRK",
-        "FILHUF",
-        "FILICP",
-        "FILIDR",
-        "FILILS",
-        "FILINR",
-        "FILISK",
-        "FILJPY",
-        "FILKES",
-        "FILKRW",
-        "FILKWD",
-        "FILLINK",
-        "FILLRC",
-        "FILLTC",
-        "FILLUNA",
-        "FILMAD",
-        "FILMANA",
-        "FILMATIC",
-        "FILMUR",
-        "FILMXN",
-        "FILMYR",
-        "FILNEAR",
-        "FILNEO",
-        "FILNGN",
-        "FILNOK",
-        "FILNZD",
-        "FILOMR",
-        "FILPEN",
-        "FILPHP",
-        "FILPLN",
-        "FILQAR",
-        "FILRON",
-        "FILROSE",
-        "FILRUB",
-        "FILSAND",
-        "FILSAR",
-        "FILSEK",
-        "FILSGD",
-        "FILSHIB",
-        "FILSOL",
-        "FILTHB",
-        "FILTHETA",
-        "FILTRX",
-        "FILTRY",
-        "FILTWD",
-        "FILUNI",
-        "FILUSD",
-        "FILUSDT",
-        "FILUST",
-        "FILVET",
-        "FILVND",
-        "FILXAG",
-        "FILXAU",
-        "FILXLM",
-        "FILXMR",
-        "FILXOF",
-        "FILXPD",
-        "FILXPT",
-        "FILXRP",
-        "FILXTZ",
-        "FILZAR",
-        "FILZWL",
-        "FLOWALL",
-        "FLOWADA",
-        "FLOWAED",
-        "FLOWARS",
-        "FLOWATOM",
-        "FLOWAUD",
-        "FLOWAVAX",
-        "FLOWAXS",
-        "FLOWBCH",
-        "FLOWBGN",
-        "FLOWBHD",
-        "FLOWBNB",
-        "FLOWBRL",
-        "FLOWBTC",
-        "FLOWBTG",
-        "FLOWBUSD",
-        "FLOWCAD",
-        "FLOWCHF",
-        "FLOWCLP",
-        "FLOWCNY",
-        "FLOWCNH",
-        "FLOWCOP",
-        "FLOWCZK",
-        "FLOWDAI",
-        "FLOWDASH",
-        "FLOWDKK",
-        "FLOWDOGE",
-        "FLOWDOT",
-        "FLOWEGLD",
-        "FLOWENJ",
-        "FLOWEOS",
-        "FLOWETC",
-        "FLOWETH",
-        "FLOWEUR",
-        "FLOWFIL",
-        "FLOWFTM",
-        "FLOWFTT",
-        "FLOWGALA",
-        "FLOWGBP",
-        "FLOWGHS",
-        "FLOWHBAR",
-        "FLOWHKD",
-        "FLOWHNT",
-        "FLOWHRK",
-        "FLOWHUF",
-        "FLOWICP",
-        "FLOWIDR",
-        "FLOWILS",
-        "FLOWINR",
-        "FLOWISK",
-        "FLOWJPY",
-        "FLOWKES",
-        "FLOWKRW",
-        "FLOWKWD",
-        "FLOWLINK",
-        "FLOWLRC",
-        "FLOWLTC",
-        "FLOWLUNA",
-        "FLOWMAD",
-        "FLOWMANA",
-        "FLOWMATIC",
-        "FLOWMUR",
-        "FLOWMXN",
-        "FLOWMYR",
-        "FLOWNEAR",
-        "FLOWNEO",
-        "FLOWNGN",
-        "FLOWNOK",
-        "FLOWNZD",
-        "FLOWOMR",
-        "FLOWPEN",
-        "FLOWPHP",
-        "FLOWPLN",
-        "FLOWQAR",
-        "FLOWRON",
-        "FLOWROSE",
-        "FLOWRUB",
-        "FLOWSAND",
-        "FLOWSAR",
-        "FLOWSEK",
-        "FLOWSGD",
-        "FLOWSHIB",
-        "FLOWSOL",
-        "FLOWTHB",
-        "FLOWTHETA",
-        "FLOWTRX",
-        "FLOWTRY",
-        "FLOWTWD",
-        "FLOWUNI",
-        "FLOWUSD",
-        "FLOWUSDT",
-        "FLOWUST",
-        "FLOWVET",
-        "FLOWVND",
-        "FLOWXAG",
-        "FLOWXAU",
-        "FLOWXLM",
-        "FLOWXMR",
-        "FLOWXOF",
-        "FLOWXPD",
-        "FLOWXPT",
-        "FLOWXRP",
-        "FLOWXTZ",
-        "FLOWZAR",
-        "FLOWZWL",
-        "FTMALL",
-        "FTMADA",
-        "FTMAED",
-        "FTMARS",
-        "FTMATOM",
-        "FTMAUD",
-        "FTMAVAX",
-        "FTMAXS",
-        "FTMBCH",
-        "FTMBGN",
-        "FTMBHD",
-        "FTMBNB",
-        "FTMBRL",
-        "FTMBTC",
-        "FTMBTG",
-        "FTMBUSD",
-        "FTMCAD",
-        "FTMCHF",
-        "FTMCLP",
-        "FTMCNY",
-        "FTMCNH",
-        "FTMCOP",
-        "FTMCZK",
-        "FTMDAI",
-        "FTMDASH",
-        "FTMDKK",
-        "FTMDOGE",
-        "FTMDOT",
-        "FTMEGLD",
-        "FTMENJ",
-        "FTMEOS",
-        "FTMETC",
-        "FTMETH",
-        "FTMEUR",
-        "FTMFIL",
-        "FTMFLOW",
-        "FTMFTT",
-        "FTMGALA",
-        "FTMGBP",
-        "FTMGHS",
-        "FTMHBAR",
-        "FTMHKD",
-        "FTMHNT",
-        "FTMHRK",
-        "FTMHUF",
-        "FTMICP",
-        "FTMIDR",
-        "FTMILS",
-        "FTMINR",
-        "FTMISK",
-        "FTMJPY",
-        "FTMKES",
-        "FTMKRW",
-        "FTMKWD",
-        "FTMLINK",
-        "FTMLRC",
-        "FTMLTC",
-        "FTMLUNA",
-        "FTMMAD",
-        "FTMMANA",
-        "FTMMATIC",
-        "FTMMUR",
-        "FTMMXN",
-        "FTMMYR",
-        "FTMNEAR",
-        "FTMNEO",
-        "FTMNGN",
-        "FTMNOK",
-        "FTMNZD",
-        "FTMOMR",
-        "FTMPEN",
-        "FTMPHP",
-        "FTMPLN",
-        "FTMQAR",
-        "FTMRON",
-        "FTMROSE",
-        "FTMRUB",
-        "FTMSAND",
-        "FTMSAR",
-        "FTMSEK",
-        "FTMSGD",
-        "FTMSHIB",
-        "FTMSOL",
-        "FTMTHB",
-        "FTMTHETA",
-        "FTMTRX",
-        "FTMTRY",
-        "FTMTWD",
-        "FTMUNI",
-        "FTMUSD",
-        "FTMUSDT",
-        "FTMUST",
-        "FTMVET",
-        "FTMVND",
-        "FTMXAG",
-        "FTMXAU",
-        "FTMXLM",
-        "FTMXMR",
-        "FTMXOF",
-        "FTMXPD",
-        "FTMXPT",
-        "FTMXRP",
-        "FTMXTZ",
-        "FTMZAR",
-        "FTMZWL",
-        "FTTALL",
-        "FTTADA",
-        "FTTAED",
-        "FTTARS",
-        "FTTATOM",
-        "FTTAUD",
-        "FTTAVAX",
-        "FTTAXS",
-        "FTTBCH",
-        "FTTBGN",
-        "FTTBHD",
-        "FTTBNB",
-        "FTTBRL",
-        "FTTBTC",
-        "FTTBTG",
-        "FTTBUSD",
-        "FTTCAD",
-        "FTTCHF",
-        "FTTCLP",
-        "FTTCNY",
-        "FTTCNH",
-        "FTTCOP",
-        "FTTCZK",
-        "FTTDAI",
-        "FTTDASH",
-        "FTTDKK",
-        "FTTDOGE",
-        "FTTDOT",
-        "FTTEGLD",
-        "FTTENJ",
-        "FTTEOS",
-        "FTTETC",
-        "FTTETH",
-        "FTTEUR",
-        "FTTFIL",
-        "FTTFLOW",
-        "FTTFTM",
-        "FTTGALA",
-        "FTTGBP",
-        "FTTGHS",
-        "FTTHBAR",
-        "FTTHKD",
-        "FTTHNT",
-        "FTTHRK",
-        "FTTHUF",
-        "FTTICP",
-        "FTTIDR",
-        "FTTILS",
-        "FTTINR",
-        "FTTISK",
-        "FTTJPY",
-        "FTTKES",
-        "FTTKRW",
-        "FTTKWD",
-        "FTTLINK",
-        "FTTLRC",
-        "FTTLTC",
-        "FTTLUNA",
-        "FTTMAD",
-        "FTTMANA",
-        "FTTMATIC",
-        "FTTMUR",
-        "FTTMXN",
-        "FTTMYR",
-        "FTTNEAR",
-        "FTTNEO",
-        "FTTNGN",
-        "FTTNOK",
-        "FTTNZD",
-        "FTTOMR",
-        "FTTPEN",
-        "FTTPHP",
-        "FTTPLN",
-        "FTTQAR",
-        "FTTRON",
-        "FTTROSE",
-        "FTTRUB",
-        "FTTSAND",
-        "FTTSAR",
-        "FTTSEK",
-        "FTTSGD",
-        "FTTSHIB",
-        "FTTSOL",
-        "FTTTHB",
-        "FTTTHETA",
-        "FTTTRX",
-        "FTTTRY",
-        "FTTTWD",
-        "FTTUNI",
-        "FTTUSD",
-        "FTTUSDT",
-        "FTTUST",
-        "FTTVET",
-        "FTTVND",
-        "FTTXAG",
-        "FTTXAU",
-        "FTTXLM",
-        "FTTXMR",
-        "FTTXOF",
-        "FTTXPD",
-        "FTTXPT",
-        "FTTXRP",
-        "FTTXTZ",
-        "FTTZAR",
-        "FTTZWL",
-        "GALAALL",
-        "GALAADA",
-        "GALAAED",
-        "GALAARS",
-        "GALAATOM",
-        "GALAAUD",
-        "GALAAVAX",
-        "GALAAXS",
-        "GALABCH",
-        "GALABGN",
-        "GALABHD",
-        "GALABNB",
-        "GALABRL",
-        "GALABTC",
-        "GALABTG",
-        "GALABUSD",
-        "GALACAD",
-        "GALACHF",
-        "GALACLP",
-        "GALACNY",
-        "GALACNH",
-        "GALACOP",
-        "GALACZK",
-        "GALADAI",
-        "GALADASH",
-        "GALADKK",
-        "GALADOGE",
-        "GALADOT",
-        "GALAEGLD",
-        "GALAENJ",
-        "GALAEOS",
-        "GALAETC",
-        "GALAETH",
-        "GALAEUR",
-        "GALAFIL",
-        "GALAFLOW",
-        "GALAFTM",
-        "GALAFTT",
-        "GALAGBP",
-        "GALAGHS",
-        "GALAHBAR",
-        "GALAHKD",
-        "GALAHNT",
-        "GALAHRK",
-        "GALAHUF",
-        "GALAICP",
-        "GALAIDR",
-        "GALAILS",
-        "GALAINR",
-        "GALAISK",
-        "GALAJPY",
-        "GALAKES",
-        "GALAKRW",
-        "GALAKWD",
-        "GALALINK",
-        "GALALRC",
-        "GALALTC",
-        "GALALUNA",
-        "GALAMAD",
-        "GALAMANA",
-        "GALAMATIC",
-        "GALAMUR",
-        "GALAMXN",
-        "GALAMYR",
-        "GALANEAR",
-        "GALANEO",
-        "GALANGN",
-        "GALANOK",
-        "GALANZD",
-        "GALAOMR",
-        "GALAPEN",
-        "GALAPHP",
-        "GALAPLN",
-        "GALAQAR",
-        "GALARON",
-        "GALAROSE",
-        "GALARUB",
-        "GALASAND",
-        "GALASAR",
-        "GALASEK",
-        "GALASGD",
-        "GALASHIB",
-        "GALASOL",
-        "GALATHB",
-        "GALATHETA",
-        "GALATRX",
-        "GALATRY",
-        "GALATWD",
-        "GALAUNI",
-        "GALAUSD",
-        "GALAUSDT",
-        "GALAUST",
-        "GALAVET",
-        "GALAVND",
-        "GALAXAG",
-        "GALAXAU",
-        "GALAXLM",
-        "GALAXMR",
-        "GALAXOF",
-        "GALAXPD",
-        "GALAXPT",
-        "GALAXRP",
-        "GALAXTZ",
-        "GALAZAR",
-        "GALAZWL",
-        "GBPALL",
-        "GBPADA",
-        "GBPAED",
-        "GBPARS",
-        "GBPATOM",
-        "GBPAUD",
-        "GBPAVAX",
-        "GBPAXS",
-        "GBPBCH",
-        "GBPBGN",
-        "GBPBHD",
-        "GBPBNB",
-        "GBPBRL",
-        "GBPBTC",
-        "GBPBTG",
-        "GBPBUSD",
-        "GBPCAD",
-        "GBPCHF",
-        "GBPCLP",
-        "GBPCNY",
-        "GBPCNH",
-        "GBPCOP",
-        "GBPCZK",
-        "GBPDAI",
-        "GBPDASH",
-        "GBPDKK",
-        "GBPDOGE",
-        "GBPDOT",
-        "GBPEGLD",
-        "GBPENJ",
-        "GBPEOS",
-        "GBPETC",
-        "GBPETH",
-        "GBPEUR",
-        "GBPFIL",
-        "GBPFLOW",
-        "GBPFTM",
-        "GBPFTT",
-        "GBPGALA",
-        "GBPGHS",
-        "GBPHBAR",
-        "GBPHKD",
-        "GBPHNT",
-        "GBPHRK",
-        "GBPHUF",
-        "GBPICP",
-        "GBPIDR",
-        "GBPILS",
-        "GBPINR",
-        "GBPISK",
-        "GBPJPY",
-        "GBPKES",
-        "GBPKRW",
-        "GBPKWD",
-        "GBPLINK",
-        "GBPLRC",
-        "GBPLTC",
-        "GBPLUNA",
-        "GBPMAD",
-        "GBPMANA",
-        "GBPMATIC",
-        "GBPMUR",
-        "GBPMXN",
-        "GBPMYR",
-        "GBPNEAR",
-        "GBPNEO",
-        "GBPNGN",
-        "GBPNOK",
-        "GBPNZD",
-        "GBPOMR",
-        "GBPPEN",
-        "GBPPHP",
-        "GBPPLN",
-        "GBPQAR",
-        "GBPRON",
-        "GBPROSE",
-        "GBPRUB",
-        "GBPSAND",
-        "GBPSAR",
-        "GBPSEK",
-        "GBPSGD",
-        "GBPSHIB",
-        "GBPSOL",
-        "GBPTHB",
-        "GBPTHETA",
-        "GBPTRX",
-        "GBPTRY",
-        "GBPTWD",
-        "GBPUNI",
-        "GBPUSD",
-        "GBPUSDT",
-        "GBPUST",
-        "GBPVET",
-        "GBPVND",
-        "GBPXAG",
-        "GBPXAU",
-        "GBPXLM",
-        "GBPXMR",
-        "GBPXOF",
-        "GBPXPD",
-        "GBPXPT",
-        "GBPXRP",
-        "GBPXTZ",
-        "GBPZAR",
-        "GBPZWL",
-        "GHSALL",
-        "GHSADA",
-        "GHSAED",
-        "GHSARS",
-        "GHSATOM",
-        "GHSAUD",
-        "GHSAVAX",
-        "GHSAXS",
-        "GHSBCH",
-        "GHSBGN",
-        "GHSBHD",
-        "GHSBNB",
-        "GHSBRL",
-        "GHSBTC",
-        "GHSBTG",
-        "GHSBUSD",
-        "GHSCAD",
-        "GHSCHF",
-        "GHSCLP",
-        "GHSCNY",
-        "GHSCNH",
-        "GHSCOP",
-        "GHSCZK",
-        "GHSDAI",
-        "GHSDASH",
-        "GHSDKK",
-        "GHSDOGE",
-        "GHSDOT",
-        "GHSEGLD",
-        "GHSENJ",
-        "GHSEOS",
-        "GHSETC",
-        "GHSETH",
-        "GHSEUR",
-        "GHSFIL",
-        "GHSFLOW",
-        "GHSFTM",
-        "GHSFTT",
-        "GHSGALA",
-        "GHSGBP",
-        "GHSHBAR",
-        "GHSHKD",
-        "GHSHNT",
-        "GHSHRK",
-        "GHSHUF",
-        "GHSICP",
-        "GHSIDR",
-        "GHSILS",
-        "GHSINR",
-        "GHSISK",
-        "GHSJPY",
-        "GHSKES",
-        "GHSKRW",
-        "GHSKWD",
-        "GHSLINK",
-        "GHSLRC",
-        "GHSLTC",
-        "GHSLUNA",
-        "GHSMAD",
-        "GHSMANA",
-        "GHSMATIC",
-        "GHSMUR",
-        "GHSMXN",
-        "GHSMYR",
-        "GHSNEAR",
-        "GHSNEO",
-        "GHSNGN",
-        "GHSNOK",
-        "GHSNZD",
-        "GHSOMR",
-        "GHSPEN",
-        "GHSPHP",
-        "GHSPLN",
-        "GHSQAR",
-        "GHSRON",
-        "GHSROSE",
-        "GHSRUB",
-        "GHSSAND",
-        "GHSSAR",
-        "GHSSEK",
-        "GHSSGD",
-        "GHSSHIB",
-        "GHSSOL",
-        "GHSTHB",
-        "GHSTHETA",
-        "GHSTRX",
-        "GHSTRY",
-        "GHSTWD",
-        "GHSUNI",
-        "GHSUSD",
-        "GHSUSDT",
-        "GHSUST",
-        "GHSVET",
-        "GHSVND",
-        "GHSXAG",
-        "GHSXAU",
-        "GHSXLM",
-        "GHSXMR",
-        "GHSXOF",
-        "GHSXPD",
-        "GHSXPT",
-        "GHSXRP",
-        "GHSXTZ",
-        "GHSZAR",
-        "GHSZWL",
-        "HBARALL",
-        "HBARADA",
-        "HBARAED",
-        "HBARARS",
-        "HBARATOM",
-        "HBARAUD",
-        "HBARAVAX",
-        "HBARAXS",
-        "HBARBCH",
-        "HBARBGN",
-        "HBARBHD",
-        "HBARBNB",
-        "HBARBRL",
-        "HBARBTC",
-        "HBARBTG",
-        "HBARBUSD",
-        "HBARCAD",
-        "HBARCHF",
-        "HBARCLP",
-        "HBARCNY",
-        "HBARCNH",
-        "HBARCOP",
-        "HBARCZK",
-        "HBARDAI",
-        "HBARDASH",
-        "HBARDKK",
-        "HBARDOGE",
-        "HBARDOT",
-        "HBAREGLD",
-        "HBARENJ",
-        "HBAREOS",
-        "HBARETC",
-        "HBARETH",
-        "HBAREUR",
-        "HBARFIL",
-        "HBARFLOW",
-        "HBARFTM",
-        "HBARFTT",
-        "HBARGALA",
-        "HBARGBP",
-        "HBARGHS",
-        "HBARHKD",
-        "HBARHNT",
-        "HBARHRK",
-        "HBARHUF",
-        "HBARICP",
-        "HBARIDR",
-        "HBARILS",
-        "HBARINR",
-        "HBARISK",
-        "HBARJPY",
-        "HBARKES",
-        "HBARKRW",
-        "HBARKWD",
-        "HBARLINK",
-        "HBARLRC",
-        "HBARLTC",
-        "HBARLUNA",
-        "HBARMAD",
-        "HBARMANA",
-        "HBARMATIC",
-        "HBARMUR",
-        "HBARMXN",
-        "HBARMYR",
-        "HBARNEAR",
-        "HBARNEO",
-        "HBARNGN",
-        "HBARNOK",
-        "HBARNZD",
-        "HBAROMR",
-        "HBARPEN",
-        "HBARPHP",
-        "HBARPLN",
-        "HBARQAR",
-        "HBARRON",
-        "HBARROSE",
-        "HBARRUB",
-        "HBARSAND",
-        "HBARSAR",
-        "HBARSEK",
-        "HBARSGD",
-        "HBARSHIB",
-        "HBARSOL",
-        "HBARTHB",
-        "HBARTHETA",
-        "HBARTRX",
-        "HBARTRY",
-        "HBARTWD",
-        "HBARUNI",
-        "HBARUSD",
-        "HBARUSDT",
-        "HBARUST",
-        "HBARVET",
-        "HBARVND",
-        "HBARXAG",
-        "HBARXAU",
-        "HBARXLM",
-        "HBARXMR",
-        "HBARXOF",
-        "HBARXPD",
-        "HBARXPT",
-        "HBARXRP",
-        "HBARXTZ",
-        "HBARZAR",
-        "HBARZWL",
-        "HKDALL",
-        "HKDADA",
-        "HKDAED",
-        "HKDARS",
-        "HKDATOM",
-        "HKDAUD",
-        "HKDAVAX",
-        "HKDAXS",
-        "HKDBCH",
-        "HKDBGN",
-        "HKDBHD",
-        "HKDBNB",
-        "HKDBRL",
-        "HKDBTC",
-        "HKDBTG",
-        "HKDBUSD",
-        "HKDCAD",
-        "HKDCHF",
-        "HKDCLP",
-        "HKDCNY",
-        "HKDCNH",
-        "HKDCOP",
-        "HKDCZK",
-        "HKDDAI",
-        "HKDDASH",
-        "HKDDKK",
-        "HKDDOGE",
-        "HKDDOT",
-        "HKDEGLD",
-        "HKDENJ",
-        "HKDEOS",
-        "HKDETC",
-        "HKDETH",
-        "HKDEUR",
-        "HKDFIL",
-        "HKDFLOW",
-        "HKDFTM",
-        "HKDFTT",
-        "HKDGALA",
-        "HKDGBP",
-        "HKDGHS",
-        "HKDHBAR",
-        "HKDHNT",
-        "HKDHRK",
-        "HKDHUF",
-        "HKDICP",
-        "HKDIDR",
-        "HKDILS",
-        "HKDINR",
-        "HKDISK",
-        "HKDJPY",
-        "HKDKES",
-        "HKDKRW",
-        "HKDKWD",
-        "HKDLINK",
-        "HKDLRC",
-        "HKDLTC",
-        "HKDLUNA",
-        "HKDMAD",
-        "HKDMANA",
-        "HKDMATIC",
-        "HKDMUR",
-        "HKDMXN",
-        "HKDMYR",
-        "HKDNEAR",
-        "HKDNEO",
-        "HKDNGN",
-        "HKDNOK",
-        "HKDNZD",
-        "HKDOMR",
-        "HKDPEN",
-        "HKDPHP",
-        "HKDPLN",
-        "HKDQAR",
-        "HKDRON",
-        "HKDROSE",
-        "HKDRUB",
-        "HKDSAND",
-        "HKDSAR",
-        "HKDSEK",
-        "HKDSGD",
-        "HKDSHIB",
-        "HKDSOL",
-        "HKDTHB",
-        "HKDTHETA",
-        "HKDTRX",
-        "HKDTRY",
-        "HKDTWD",
-        "HKDUNI",
-        "HKDUSD",
-        "HKDUSDT",
-        "HKDUST",
-        "HKDVET",
-        "HKDVND",
-        "HKDXAG",
-        "HKDXAU",
-        "HKDXLM",
-        "HKDXMR",
-        "HKDXOF",
-        "HKDXPD",
-        "HKDXPT",
-        "HKDXRP",
-        "HKDXTZ",
-        "HKDZAR",
-        "HKDZWL",
-        "HNTALL",
-        "HNTADA",
-        "HNTAED",
-        "HNTARS",
-        "HNTATOM",
-        "HNTAUD",
-        "HNTAVAX",
-        "HNTAXS",
-        "HNTBCH",
-        "HNTBGN",
-        "HNTBHD",
-        "HNTBNB",
-        "HNTBRL",
-        "HNTBTC",
-        "HNTBTG",
-        "HNTBUSD",
-        "HNTCAD",
-        "HNTCHF",
-        "HNTCLP",
-        "HNTCNY",
-        "HNTCNH",
-        "HNTCOP",
-        "HNTCZK",
-        "HNTDAI",
-        "HNTDASH",
-        "HNTDKK",
-        "HNTDOGE",
-        "HNTDOT",
-        "HNTEGLD",
-        "HNTENJ",
-        "HNTEOS",
-        "HNTETC",
-        "HNTETH",
-        "HNTEUR",
-        "HNTFIL",
-        "HNTFLOW",
-        "HNTFTM",
-        "HNTFTT",
-        "HNTGALA",
-        "HNTGBP",
-        "HNTGHS",
-        "HNTHBAR",
-        "HNTHKD",
-        "HNTHRK",
-        "HNTHUF",
-        "HNTICP",
-        "HNTIDR",
-        "HNTILS",
-        "HNTINR",
-        "HNTISK",
-        "HNTJPY",
-        "HNTKES",
-        "HNTKRW",
-        "HNTKWD",
-        "HNTLINK",
-        "HNTLRC",
-        "HNTLTC",
-        "HNTLUNA",
-        "HNTMAD",
-        "HNTMANA",
-        "HNTMATIC",
-        "HNTMUR",
-        "HNTMXN",
-        "HNTMYR",
-        "HNTNEAR",
-        "HNTNEO",
-        "HNTNGN",
-        "HNTNOK",
-        "HNTNZD",
-        "HNTOMR",
-        "HNTPEN",
-        "HNTPHP",
-        "HNTPLN",
-        "HNTQAR",
-        "HNTRON",
-        "HNTROSE",
-        "HNTRUB",
-        "HNTSAND",
-        "HNTSAR",
-        "HNTSEK",
-        "HNTSGD",
-        "HNTSHIB",
-        "HNTSOL",
-        "HNTTHB",
-        "HNTTHETA",
-        "HNTTRX",
-        "HNTTRY",
-        "HNTTWD",
-        "HNTUNI",
-        "HNTUSD",
-        "HNTUSDT",
-        "HNTUST",
-        "HNTVET",
-        "HNTVND",
-        "HNTXAG",
-        "HNTXAU",
-        "HNTXLM",
-        "HNTXMR",
-        "HNTXOF",
-        "HNTXPD",
-        "HNTXPT",
-        "HNTXRP",
-        "HNTXTZ",
-        "HNTZAR",
-        "HNTZWL",
-        "HRKALL",
-        "HRKADA",
-        "HRKAED",
-        "HRKARS",
-        "HRKATOM",
-        "HRKAUD",
-        "HRKAVAX",
-        "HRKAXS",
-        "HRKBCH",
-        "HRKBGN",
-        "HRKBHD",
-        "HRKBNB",
-        "HRKBRL",
-        "HRKBTC",
-        "HRKBTG",
-        "HRKBUSD",
-        "HRKCAD",
-        "HRKCHF",
-        "HRKCLP",
-        "HRKCNY",
-        "HRKCNH",
-        "HRKCOP",
-        "HRKCZK",
-        "HRKDAI",
-        "HRKDASH",
-        "HRKDKK",
-        "HRKDOGE",
-        "HRKDOT",
-        "HRKEGLD",
-        "HRKENJ",
-        "HRKEOS",
-        "HRKETC",
-        "HRKETH",
-        "HRKEUR",
-        "HRKFIL",
-        "HRKFLOW",
-        "HRKFTM",
-        "HRKFTT",
-        "HRKGALA",
-        "HRKGBP",
-        "HRKGHS",
-        "HRKHBAR",
-        "HRKHKD",
-        "HRKHNT",
-        "HRKHUF",
-        "HRKICP",
-        "HRKIDR",
-        "HRKILS",
-        "HRKINR",
-        "HRKISK",
-        "HRKJPY",
-        "HRKKES",
-        "HRKKRW",
-        "HRKKWD",
-        "HRKLINK",
-        "HRKLRC",
-        "HRKLTC",
-        "HRKLUNA",
-        "HRKMAD",
-        "HRKMANA",
-        "HRKMATIC",
-        "HRKMUR",
-        "HRKMXN",
-        "HRKMYR",
-        "HRKNEAR",
-        "HRKNEO",
-        "HRKNGN",
-        "HRKNOK",
-        "HRKNZD",
-        "HRKOMR",
-        "HRKPEN",
-        "HRKPHP",
-        "HRKPLN",
-        "HRKQAR",
-        "HRKRON",
-        "HRKROSE",
-        "HRKRUB",
-        "HRKSAND",
-        "HRKSAR",
-        "HRKSEK",
-        "HRKSGD",
-        "HRKSHIB",
-        "HRKSOL",
-        "HRKTHB",
-        "HRKTHETA",
-        "HRKTRX",
-        "HRKTRY",
-        "HRKTWD",
-        "HRKUNI",
-        "HRKUSD",
-        "HRKUSDT",
-        "HRKUST",
-        "HRKVET",
-        "HRKVND",
-        "HRKXAG",
-        "HRKXAU",
-        "HRKXLM",
-        "HRKXMR",
-        "HRKXOF",
-        "HRKXPD",
-        "HRKXPT",
-        "HRKXRP",
-        "HRKXTZ",
-        "HRKZAR",
-        "HRKZWL",
-        "HUFALL",
-        "HUFADA",
-        "HUFAED",
-        "HUFARS",
-        "HUFATOM",
-        "HUFAUD",
-        "HUFAVAX",
-        "HUFAXS",
-        "HUFBCH",
-        "HUFBGN",
-        "HUFBHD",
-        "HUFBNB",
-        "HUFBRL",
-        "HUFBTC",
-        "HUFBTG",
-        "HUFBUSD",
-        "HUFCAD",
-        "HUFCHF",
-        "HUFCLP",
-        "HUFCNY",
-        "HUFCNH",
-        "HUFCOP",
-        "HUFCZK",
-        "HUFDAI",
-        "HUFDASH",
-        "HUFDKK",
-        "HUFDOGE",
-        "HUFDOT",
-        "HUFEGLD",
-        "HUFENJ",
-        "HUFEOS",
-        "HUFETC",
-        "HUFETH",
-        "HUFEUR",
-        "HUFFIL",
-        "HUFFLOW",
-        "HUFFTM",
-        "HUFFTT",
-        "HUFGALA",
-        "HUFGBP",
-        "HUFGHS",
-        "HUFHBAR",
-        "HUFHKD",
-        "HUFHNT",
-        "HUFHRK",
-        "HUFICP",
-        "HUFIDR",
-        "HUFILS",
-        "HUFINR",
-        "HUFISK",
-        "HUFJPY",
-        "HUFKES",
-        "HUFKRW",
-        "HUFKWD",
-        "HUFLINK",
-        "HUFLRC",
-        "HUFLTC",
-        "HUFLUNA",
-        "HUFMAD",
-        "HUFMANA",
-        "HUFMATIC",
-        "HUFMUR",
-        "HUFMXN",
-        "HUFMYR",
-        "HUFNEAR",
-        "HUFNEO",
-        "HUFNGN",
-        "HUFNOK",
-        "HUFNZD",
-        "HUFOMR",
-        "HUFPEN",
-        "HUFPHP",
-        "HUFPLN",
-        "HUFQAR",
-        "HUFRON",
-        "HUFROSE",
-        "HUFRUB",
-        "HUFSAND",
-        "HUFSAR",
-        "HUFSEK",
-        "HUFSGD",
-        "HUFSHIB",
-        "HUFSOL",
-        "HUFTHB",
-        "HUFTHETA",
-        "HUFTRX",
-        "HUFTRY",
-        "HUFTWD",
-        "HUFUNI",
-        "HUFUSD",
-        "HUFUSDT",
-        "HUFUST",
-        "HUFVET",
-        "HUFVND",
-        "HUFXAG",
-        "HUFXAU",
-        "HUFXLM",
-        "HUFXMR",
-        "HUFXOF",
-        "HUFXPD",
-        "HUFXPT",
-        "HUFXRP",
-        "HUFXTZ",
-        "HUFZAR",
-        "HUFZWL",
-        "ICPALL",
-        "ICPADA",
-        "ICPAED",
-        "ICPARS",
-        "ICPATOM",
-        "ICPAUD",
-        "ICPAVAX",
-        "ICPAXS",
-        "ICPBCH",
-        "ICPBGN",
-        "ICPBHD",
-        "ICPBNB",
-        "ICPBRL",
-        "ICPBTC",
-        "ICPBTG",
-        "ICPBUSD",
-        "ICPCAD",
-        "ICPCHF",
-        "ICPCLP",
-        "ICPCNY",
-        "ICPCNH",
-        "ICPCOP",
-        "ICPCZK",
-        "ICPDAI",
-        "ICPDASH",
-        "ICPDKK",
-        "ICPDOGE",
-        "ICPDOT",
-        "ICPEGLD",
-        "ICPENJ",
-        "ICPEOS",
-        "ICPETC",
-        "ICPETH",
-        "ICPEUR",
-        "ICPFIL",
-        "ICPFLOW",
-        "ICPFTM",
-        "ICPFTT",
-        "ICPGALA",
-        "ICPGBP",
-        "ICPGHS",
-        "ICPHBAR",
-        "ICPHKD",
-        "ICPHNT",
-        "ICPHRK",
-        "ICPHUF",
-        "ICPIDR",
-        "ICPILS",
-        "ICPINR",
-        "ICPISK",
-        "ICPJPY",
-        "ICPKES",
-        "ICPKRW",
-        "ICPKWD",
-        "ICPLINK",
-        "ICPLRC",
-        "ICPLTC",
-        "ICPLUNA",
-        "ICPMAD",
-        "ICPMANA",
-        "ICPMATIC",
-        "ICPMUR",
-        "ICPMXN",
-        "ICPMYR",
-        "ICPNEAR",
-        "ICPNEO",
-        "ICPNGN",
-        "ICPNOK",
-        "ICPNZD",
-        "ICPOMR",
-        "ICPPEN",
-        "ICPPHP",
-        "ICPPLN",
-        "ICPQAR",
-        "ICPRON",
-        "ICPROSE",
-        "ICPRUB",
-        "ICPSAND",
-        "ICPSAR",
-        "ICPSEK",
-        "ICPSGD",
-        "ICPSHIB",
-        "ICPSOL",
-        "ICPTHB",
-        "ICPTHETA",
-        "ICPTRX",
-        "ICPTRY",
-        "ICPTWD",
-        "ICPUNI",
-        "ICPUSD",
-        "ICPUSDT",
-        "ICPUST",
-        "ICPVET",
-        "ICPVND",
-        "ICPXAG",
-        "ICPXAU",
-        "ICPXLM",
-        "ICPXMR",
-        "ICPXOF",
-        "ICPXPD",
-        "ICPXPT",
-        "ICPXRP",
-        "ICPXTZ",
-        "ICPZAR",
-        "ICPZWL",
-        "IDRALL",
-        "IDRADA",
-        "IDRAED",
-        "IDRARS",
-        "IDRATOM",
-        "IDRAUD",
-        "IDRAVAX",
-        "IDRAXS",
-        "IDRBCH",
-        "IDRBGN",
-        "IDRBHD",
-        "IDRBNB",
-        "IDRBRL",
-        "IDRBTC",
-        "IDRBTG",
-        "IDRBUSD",
-        "IDRCAD",
-        "IDRCHF",
-        "IDRCLP",
-        "IDRCNY",
-        "IDRCNH",
-        "IDRCOP",
-        "IDRCZK",
-        "IDRDAI",
-        "IDRDASH",
-        "IDRDKK",
-        "IDRDOGE",
-        "IDRDOT",
-        "IDREGLD",
-        "IDRENJ",
-        "IDREOS",
-        "IDRETC",
-        "IDRETH",
-        "IDREUR",
-        "IDRFIL",
-        "IDRFLOW",
-        "IDRFTM",
-        "IDRFTT",
-        "IDRGALA",
-        "IDRGBP",
-        "IDRGHS",
-        "IDRHBAR",
-        "IDRHKD",
-        "IDRHNT",
-        "IDRHRK",
-        "IDRHUF",
-        "IDRICP",
-        "IDRILS",
-        "IDRINR",
-        "IDRISK",
-        "IDRJPY",
-        "IDRKES",
-        "IDRKRW",
-        "IDRKWD",
-        "IDRLINK",
-        "IDRLRC",
-        "IDRLTC",
-        "IDRLUNA",
-        "IDRMAD",
-        "IDRMANA",
-        "IDRMATIC",
-        "IDRMUR",
-        "IDRMXN",
-        "IDRMYR",
-        "IDRNEAR",
-        "IDRNEO",
-        "IDRNGN",
-        "IDRNOK",
-        "IDRNZD",
-        "IDROMR",
-        "IDRPEN",
-        "IDRPHP",
-        "IDRPLN",
-        "IDRQAR",
-        "IDRRON",
-        "IDRROSE",
-        "IDRRUB",
-        "IDRSAND",
-        "IDRSAR",
-        "IDRSEK",
-        "IDRSGD",
-        "IDRSHIB",
-        "IDRSOL",
-        "IDRTHB",
-        "IDRTHETA",
-        "IDRTRX",
-        "IDRTRY",
-        "IDRTWD",
-        "IDRUNI",
-        "IDRUSD",
-        "IDRUSDT",
-        "IDRUST",
-        "IDRVET",
-        "IDRVND",
-        "IDRXAG",
-        "IDRXAU",
-        "IDRXLM",
-        "IDRXMR",
-        "IDRXOF",
-        "IDRXPD",
-        "IDRXPT",
-        "IDRXRP",
-        "IDRXTZ",
-        "IDRZAR",
-        "IDRZWL",
-        "ILSALL",
-        "ILSADA",
-        "ILSAED",
-        "ILSARS",
-        "ILSATOM",
-        "ILSAUD",
-        "ILSAVAX",
-        "ILSAXS",
-        "ILSBCH",
-        "ILSBGN",
-        "ILSBHD",
-        "ILSBNB",
-        "ILSBRL",
-        "ILSBTC",
-        "ILSBTG",
-        "ILSBUSD",
-        "ILSCAD",
-        "ILSCHF",
-        "ILSCLP",
-        "ILSCNY",
-        "ILSCNH",
-        "ILSCOP",
-        "ILSCZK",
-        "ILSDAI",
-        "ILSDASH",
-        "ILSDKK",
-        "ILSDOGE",
-        "ILSDOT",
-        "ILSEGLD",
-        "ILSENJ",
-        "ILSEOS",
-        "ILSETC",
-        "ILSETH",
-        "ILSEUR",
-        "ILSFIL",
-        "ILSFLOW",
-        "ILSFTM",
-        "ILSFTT",
-        "ILSGALA",
-        "ILSGBP",
-        "ILSGHS",
-        "ILSHBAR",
-        "ILSHKD",
-        "ILSHNT",
-        "ILSHRK",
-        "ILSHUF",
-        "ILSICP",
-        "ILSIDR",
-        "ILSINR",
-        "ILSISK",
-        "ILSJPY",
-        "ILSKES",
-        "ILSKRW",
-        "ILSKWD",
-        "ILSLINK",
-        "ILSLRC",
-        "ILSLTC",
-        "ILSLUNA",
-        "ILSMAD",
-        "ILSMANA",
-        "ILSMATIC",
-        "ILSMUR",
-        "ILSMXN",
-        "ILSMYR",
-        "ILSNEAR",
-        "ILSNEO",
-        "ILSNGN",
-        "ILSNOK",
-        "ILSNZD",
-        "ILSOMR",
-        "ILSPEN",
-        "ILSPHP",
-        "ILSPLN",
-        "ILSQAR",
-        "ILSRON",
-        "ILSROSE",
-        "ILSRUB",
-        "ILSSAND",
-        "ILSSAR",
-        "ILSSEK",
-        "ILSSGD",
-        "ILSSHIB",
-        "ILSSOL",
-        "ILSTHB",
-        "ILSTHETA",
-        "ILSTRX",
-        "ILSTRY",
-        "ILSTWD",
-        "ILSUNI",
-        "ILSUSD",
-        "ILSUSDT",
-        "ILSUST",
-        "ILSVET",
-        "ILSVND",
-        "ILSXAG",
-        "ILSXAU",
-        "ILSXLM",
-        "ILSXMR",
-        "ILSXOF",
-        "ILSXPD",
-        "ILSXPT",
-        "ILSXRP",
-        "ILSXTZ",
-        "ILSZAR",
-        "ILSZWL",
-        "INRALL",
-        "INRADA",
-        "INRAED",
-        "INRARS",
-        "INRATOM",
-        "INRAUD",
-        "INRAVAX",
-        "INRAXS",
-        "INRBCH",
-        "INRBGN",
-        "INRBHD",
-        "INRBNB",
-        "INRBRL",
-        "INRBTC",
-        "INRBTG",
-        "INRBUSD",
-        "INRCAD",
-        "INRCHF",
-        "INRCLP",
-        "INRCNY",
-        "INRCNH",
-        "INRCOP",
-        "INRCZK",
-        "INRDAI",
-        "INRDASH",
-        "INRDKK",
-        "INRDOGE",
-        "INRDOT",
-        "INREGLD",
-        "INRENJ",
-        "INREOS",
-        "INRETC",
-        "INRETH",
-        "INREUR",
-        "INRFIL",
-        "INRFLOW",
-        "INRFTM",
-        "INRFTT",
-        "INRGALA",
-        "INRGBP",
-        "INRGHS",
-        "INRHBAR",
-        "INRHKD",
-        "INRHNT",
-        "INRHRK",
-        "INRHUF",
-        "INRICP",
-        "INRIDR",
-        "INRILS",
-        "INRISK",
-        "INRJPY",
-        "INRKES",
-        "INRKRW",
-        "INRKWD",
-        "INRLINK",
-        "INRLRC",
-        "INRLTC",
-        "INRLUNA",
-        "INRMAD",
-        "INRMANA",
-        "INRMATIC",
-        "INRMUR",
-        "INRMXN",
-        "INRMYR",
-        "INRNEAR",
-        "INRNEO",
-        "INRNGN",
-        "INRNOK",
-        "INRNZD",
-        "INROMR",
-        "INRPEN",
-        "INRPHP",
-        "INRPLN",
-        "INRQAR",
-        "INRRON",
-        "INRROSE",
-        "INRRUB",
-        "INRSAND",
-        "INRSAR",
-        "INRSEK",
-        "INRSGD",
-        "INRSHIB",
-        "INRSOL",
-        "INRTHB",
-        "INRTHETA",
-        "INRTRX",
-        "INRTRY",
-        "INRTWD",
-        "INRUNI",
-        "INRUSD",
-        "INRUSDT",
-        "INRUST",
-        "INRVET",
-        "INRVND",
-        "INRXAG",
-        "INRXAU",
-        "INRXLM",
-        "INRXMR",
-        "INRXOF",
-        "INRXPD",
-        "INRXPT",
-        "INRXRP",
-        "INRXTZ",
-        "INRZAR",
-        "INRZWL",
-        "ISKALL",
-        "ISKADA",
-        "ISKAED",
-        "ISKARS",
-        "ISKATOM",
-        "ISKAUD",
-        "ISKAVAX",
-        "ISKAXS",
-        "ISKBCH",
-        "ISKBGN",
-        "ISKBHD",
-        "ISKBNB",
-        "ISKBRL",
-        "ISKBTC",
-        "ISKBTG",
-        "ISKBUSD",
-        "ISKCAD",
-        "ISKCHF",
-        "ISKCLP",
-        "ISKCNY",
-        "ISKCNH",
-        "ISKCOP",
-        "ISKCZK",
-        "ISKDAI",
-        "ISKDASH",
-        "ISKDKK",
-        "ISKDOGE",
-        "ISKDOT",
-        "ISKEGLD",
-        "ISKENJ",
-        "ISKEOS",
-        "ISKETC",
-        "ISKETH",
-        "ISKEUR",
-        "ISKFIL",
-        "ISKFLOW",
-        "ISKFTM",
-        "ISKFTT",
-        "ISKGALA",
-        "ISKGBP",
-        "ISKGHS",
-        "ISKHBAR",
-        "ISKHKD",
-        "ISKHNT",
-        "ISKHRK",
-        "ISKHUF",
-        "ISKICP",
-        "ISKIDR",
-        "ISKILS",
-        "ISKINR",
-        "ISKJPY",
-        "ISKKES",
-        "ISKKRW",
-        "ISKKWD",
-        "ISKLINK",
-        "ISKLRC",
-        "ISKLTC",
-        "ISKLUNA",
-        "ISKMAD",
-        "ISKMANA",
-        "ISKMATIC",
-        "ISKMUR",
-        "ISKMXN",
-        "ISKMYR",
-        "ISKNEAR",
-        "ISKNEO",
-        "ISKNGN",
-        "ISKNOK",
-        "ISKNZD",
-        "ISKOMR",
-        "ISKPEN",
-        "ISKPHP",
-        "ISKPLN",
-        "ISKQAR",
-        "ISKRON",
-        "ISKROSE",
-        "ISKRUB",
-        "ISKSAND",
-        "ISKSAR",
-        "ISKSEK",
-        "ISKSGD",
-        "ISKSHIB",
-        "ISKSOL",
-        "ISKTHB",
-        "ISKTHETA",
-        "ISKTRX",
-        "ISKTRY",
-        "ISKTWD",
-        "ISKUNI",
-        "ISKUSD",
-        "ISKUSDT",
-        "ISKUST",
-        "ISKVET",
-        "ISKVND",
-        "ISKXAG",
-        "ISKXAU",
-        "ISKXLM",
-        "ISKXMR",
-        "ISKXOF",
-        "ISKXPD",
-        "ISKXPT",
-        "ISKXRP",
-        "ISKXTZ",
-        "ISKZAR",
-        "ISKZWL",
-        "JPYALL",
-        "JPYADA",
-        "JPYAED",
-        "JPYARS",
-        "JPYATOM",
-        "JPYAUD",
-        "JPYAVAX",
-        "JPYAXS",
-        "JPYBCH",
-        "JPYBGN",
-        "JPYBHD",
-        "JPYBNB",
-        "JPYBRL",
-        "JPYBTC",
-        "JPYBTG",
-        "JPYBUSD",
-        "JPYCAD",
-        "JPYCHF",
-        "JPYCLP",
-        "JPYCNY",
-        "JPYCNH",
-        "JPYCOP",
-        "JPYCZK",
-        "JPYDAI",
-        "JPYDASH",
-        "JPYDKK",
-        "JPYDOGE",
-        "JPYDOT",
-        "JPYEGLD",
-        "JPYENJ",
-        "JPYEOS",
-        "JPYETC",
-        "JPYETH",
-        "JPYEUR",
-        "JPYFIL",
-        "JPYFLOW",
-        "JPYFTM",
-        "JPYFTT",
-        "JPYGALA",
-        "JPYGBP",
-        "JPYGHS",
-        "JPYHBAR",
-        "JPYHKD",
-        "JPYHNT",
-        "JPYHRK",
-        "JPYHUF",
-        "JPYICP",
-        "JPYIDR",
-        "JPYILS",
-        "JPYINR",
-        "JPYISK",
-        "JPYKES",
-        "JPYKRW",
-        "JPYKWD",
-        "JPYLINK",
-        "JPYLRC",
-        "JPYLTC",
-        "JPYLUNA",
-        "JPYMAD",
-        "JPYMANA",
-        "JPYMATIC",
-        "JPYMUR",
-        "JPYMXN",
-        "JPYMYR",
-        "JPYNEAR",
-        "JPYNEO",
-        "JPYNGN",
-        "JPYNOK",
-        "JPYNZD",
-        "JPYOMR",
-        "JPYPEN",
-        "JPYPHP",
-        "JPYPLN",
-        "JPYQAR",
-        "JPYRON",
-        "JPYROSE",
-        "JPYRUB",
-        "JPYSAND",
-        "JPYSAR",
-        "JPYSEK",
-        "JPYSGD",
-        "JPYSHIB",
-        "JPYSOL",
-        "JPYTHB",
-        "JPYTHETA",
-        "JPYTRX",
-        "JPYTRY",
-        "JPYTWD",
-        "JPYUNI",
-        "JPYUSD",
-        "JPYUSDT",
-        "JPYUST",
-        "JPYVET",
-        "JPYVND",
-        "JPYXAG",
-        "JPYXAU",
-        "JPYXLM",
-        "JPYXMR",
-        "JPYXOF",
-        "JPYXPD",
-        "JPYXPT",
-        "JPYXRP",
-        "JPYXTZ",
-        "JPYZAR",
-        "JPYZWL",
-        "KESALL",
-        "KESADA",
-        "KESAED",
-        "KESARS",
-        "KESATOM",
-        "KESAUD",
-        "KESAVAX",
-        "KESAXS",
-        "KESBCH",
-        "KESBGN",
-        "KESBHD",
-        "KESBNB",
-        "KESBRL",
-        "KESBTC",
-        "KESBTG",
-        "KESBUSD",
-        "KESCAD",
-        "KESCHF",
-        "KESCLP",
-        "KESCNY",
-        "KESCNH",
-        "KESCOP",
-        "KESCZK",
-        "KESDAI",
-        "KESDASH",
-        "KESDKK",
-        "KESDOGE",
-        "KESDOT",
-        "KESEGLD",
-        "KESENJ",
-        "KESEOS",
-        "KESETC",
-        "KESETH",
-        "KESEUR",
-        "KESFIL",
-        "KESFLOW",
-        "KESFTM",
-        "KESFTT",
-        "KESGALA",
-        "KESGBP",
-        "KESGHS",
-        "KESHBAR",
-        "KESHKD",
-        "KESHNT",
-        "KESHRK",
-        "KESHUF",
-        "KESICP",
-        "KESIDR",
-        "KESILS",
-        "KESINR",
-        "KESISK",
-        "KESJPY",
-        "KESKRW",
-        "KESKWD",
-        "KESLINK",
-        "KESLRC",
-        "KESLTC",
-        "KESLUNA",
-        "KESMAD",
-        "KESMANA",
-        "KESMATIC",
-        "KESMUR",
-        "KESMXN",
-        "KESMYR",
-        "KESNEAR",
-        "KESNEO",
-        "KESNGN",
-        "KESNOK",
-        "KESNZD",
-        "KESOMR",
-        "KESPEN",
-        "KESPHP",
-        "KESPLN",
-        "KESQAR",
-        "KESRON",
-        "KESROSE",
-        "KESRUB",
-        "KESSAND",
-        "KESSAR",
-        "KESSEK",
-        "KESSGD",
-        "KESSHIB",
-        "KESSOL",
-        "KESTHB",
-        "KESTHETA",
-        "KESTRX",
-        "KESTRY",
-        "KESTWD",
-        "KESUNI",
-        "KESUSD",
-        "KESUSDT",
-        "KESUST",
-        "KESVET",
-        "KESVND",
-        "KESXAG",
-        "KESXAU",
-        "KESXLM",
-        "KESXMR",
-        "KESXOF",
-        "KESXPD",
-        "KESXPT",
-        "KESXRP",
-        "KESXTZ",
-        "KESZAR",
-        "KESZWL",
-        "KRWALL",
-        "KRWADA",
-        "KRWAED",
-        "KRWARS",
-        "KRWATOM",
-        "KRWAUD",
-        "KRWAVAX",
-        "KRWAXS",
-        "KRWBCH",
-        "KRWBGN",
-        "KRWBHD",
-        "KRWBNB",
-        "KRWBRL",
-        "KRWBTC",
-        "KRWBTG",
-        "KRWBUSD",
-        "KRWCAD",
-        "KRWCHF",
-        "KRWCLP",
-        "KRWCNY",
-        "KRWCNH",
-        "KRWCOP",
-        "KRWCZK",
-        "KRWDAI",
-        "KRWDASH",
-        "KRWDKK",
-        "KRWDOGE",
-        "KRWDOT",
-        "KRWEGLD",
-        "KRWENJ",
-        "KRWEOS",
-        "KRWETC",
-        "KRWETH",
-        "KRWEUR",
-        "KRWFIL",
-        "KRWFLOW",
-        "KRWFTM",
-        "KRWFTT",
-        "KRWGALA",
-        "KRWGBP",
-        "KRWGHS",
-        "KRWHBAR",
-        "KRWHKD",
-        "KRWHNT",
-        "KRWHRK",
-        "KRWHUF",
-        "KRWICP",
-        "KRWIDR",
-        "KRWILS",
-        "KRWINR",
-        "KRWISK",
-        "KRWJPY",
-        "KRWKES",
-        "KRWKWD",
-        "KRWLINK",
-        "KRWLRC",
-        "KRWLTC",
-        "KRWLUNA",
-        "KRWMAD",
-        "KRWMANA",
-        "KRWMATIC",
-        "KRWMUR",
-        "KRWMXN",
-        "KRWMYR",
-        "KRWNEAR",
-        "KRWNEO",
-        "KRWNGN",
-        "KRWNOK",
-        "KRWNZD",
-        "KRWOMR",
-        "KRWPEN",
-        "KRWPHP",
-        "KRWPLN",
-        "KRWQAR",
-        "KRWRON",
-        "KRWROSE",
-        "KRWRUB",
-        "KRWSAND",
-        "KRWSAR",
-        "KRWSEK",
-        "KRWSGD",
-        "KRWSHIB",
-        "KRWSOL",
-        "KRWTHB",
-        "KRWTHETA",
-        "KRWTRX",
-        "KRWTRY",
-        "KRWTWD",
-        "KRWUNI",
-        "KRWUSD",
-        "KRWUSDT",
-        "KRWUST",
-        "KRWVET",
-        "KRWVND",
-        "KRWXAG",
-        "KRWXAU",
-        "KRWXLM",
-        "KRWXMR",
-        "KRWXOF",
-        "KRWXPD",
-        "KRWXPT",
-        "KRWXRP",
-        "KRWXTZ",
-        "KRWZAR",
-        "KRWZWL",
-        "KWDALL",
-        "KWDADA",
-        "KWDAED",
-        "KWDARS",
-        "KWDATOM",
-        "KWDAUD",
-        "KWDAVAX",
-        "KWDAXS",
-        "KWDBCH",
-        "KWDBGN",
-        "KWDBHD",
-        "KWDBNB",
-        "KWDBRL",
-        "KWDBTC",
-        "KWDBTG",
-        "KWDBUSD",
-        "KWDCAD",
-        "KWDCHF",
-        "KWDCLP",
-        "KWDCNY",
-        "KWDCNH",
-        "KWDCOP",
-        "KWDCZK",
-        "KWDDAI",
-        "KWDDASH",
-        "KWDDKK",
-        "KWDDOGE",
-        "KWDDOT",
-        "KWDEGLD",
-        "KWDENJ",
-        "KWDEOS",
-        "KWDETC",
-        "KWDETH",
-        "KWDEUR",
-        "KWDFIL",
-        "KWDFLOW",
-        "KWDFTM",
-        "KWDFTT",
-        "KWDGALA",
-        "KWDGBP",
-        "KWDGHS",
-        "KWDHBAR",
-        "KWDHKD",
-        "KWDHNT",
-        "KWDHRK",
-        "KWDHUF",
-        "KWDICP",
-        "KWDIDR",
-        "KWDILS",
-        "KWDINR",
-        "KWDISK",
-        "KWDJPY",
-        "KWDKES",
-        "KWDKRW",
-        "KWDLINK",
-        "KWDLRC",
-        "KWDLTC",
-        "KWDLUNA",
-        "KWDMAD",
-        "KWDMANA",
-        "KWDMATIC",
-        "KWDMUR",
-        "KWDMXN",
-        "KWDMYR",
-        "KWDNEAR",
-        "KWDNEO",
-        "KWDNGN",
-        "KWDNOK",
-        "KWDNZD",
-        "KWDOMR",
-        "KWDPEN",
-        "KWDPHP",
-        "KWDPLN",
-        "KWDQAR",
-        "KWDRON",
-        "KWDROSE",
-        "KWDRUB",
-        "KWDSAND",
-        "KWDSAR",
-        "KWDSEK",
-        "KWDSGD",
-        "KWDSHIB",
-        "KWDSOL",
-        "KWDTHB",
-        "KWDTHETA",
-        "KWDTRX",
-        "KWDTRY",
-        "KWDTWD",
-        "KWDUNI",
-        "KWDUSD",
-        "KWDUSDT",
-        "KWDUST",
-        "KWDVET",
-        "KWDVND",
-        "KWDXAG",
-        "KWDXAU",
-        "KWDXLM",
-        "KWDXMR",
-        "KWDXOF",
-        "KWDXPD",
-        "KWDXPT",
-        "KWDXRP",
-        "KWDXTZ",
-        "KWDZAR",
-        "KWDZWL",
-        "LINKALL",
-        "LINKADA",
-        "LINKAED",
-        "LINKARS",
-        "LINKATOM",
-        "LINKAUD",
-        "LINKAVAX",
-        "LINKAXS",
-        "LINKBCH",
-        "LINKBGN",
-        "LINKBHD",
-        "LINKBNB",
-        "LINKBRL",
-        "LINKBTC",
-        "LINKBTG",
-        "LINKBUSD",
-        "LINKCAD",
-        "LINKCHF",
-        "LINKCLP",
-        "LINKCNY",
-        "LINKCNH",
-        "LINKCOP",
-        "LINKCZK",
-        "LINKDAI",
-        "LINKDASH",
-        "LINKDKK",
-        "LINKDOGE",
-        "LINKDOT",
-        "LINKEGLD",
-        "LINKENJ",
-        "LINKEOS",
-        "LINKETC",
-        "LINKETH",
-        "LINKEUR",
-        "LINKFIL",
-        "LINKFLOW",
-        "LINKFTM",
-        "LINKFTT",
-        "LINKGALA",
-        "LINKGBP",
-        "LINKGHS",
-        "LINKHBAR",
-        "LINKHKD",
-        "LINKHNT",
-        "LINKHRK",
-        "LINKHUF",
-        "LINKICP",
-        "LINKIDR",
-        "LINKILS",
-        "LINKINR",
-        "LINKISK",
-        "LINKJPY",
-        "LINKKES",
-        "LINKKRW",
-        "LINKKWD",
-        "LINKLRC",
-        "LINKLTC",
-        "LINKLUNA",
-        "LINKMAD",
-        "LINKMANA",
-        "LINKMATIC",
-        "LINKMUR",
-        "LINKMXN",
-        "LINKMYR",
-        "LINKNEAR",
-        "LINKNEO",
-        "LINKNGN",
-        "LINKNOK",
-        "LINKNZD",
-        "LINKOMR",
-        "LINKPEN",
-        "LINKPHP",
-        "LINKPLN",
-        "LINKQAR",
-        "LINKRON",
-        "LINKROSE",
-        "LINKRUB",
-        "LINKSAND",
-        "LINKSAR",
-        "LINKSEK",
-        "LINKSGD",
-        "LINKSHIB",
-        "LINKSOL",
-        "LINKTHB",
-        "LINKTHETA",
-        "LINKTRX",
-        "LINKTRY",
-        "LINKTWD",
-        "LINKUNI",
-        "LINKUSD",
-        "LINKUSDT",
-        "LINKUST",
-        "LINKVET",
-        "LINKVND",
-        "LINKXAG",
-        "LINKXAU",
-        "LINKXLM",
-        "LINKXMR",
-        "LINKXOF",
-        "LINKXPD",
-        "LINKXPT",
-        "LINKXRP",
-        "LINKXTZ",
-        "LINKZAR",
-        "LINKZWL",
-        "LRCALL",
-        "LRCADA",
-        "LRCAED",
-        "LRCARS",
-        "LRCATOM",
-        "LRCAUD",
-        "LRCAVAX",
-        "LRCAXS",
-        "LRCBCH",
-        "LRCBGN",
-        "LRCBHD",
-        "LRCBNB",
-        "LRCBRL",
-        "LRCBTC",
-        "LRCBTG",
-        "LRCBUSD",
-        "LRCCAD",
-        "LRCCHF",
-        "LRCCLP",
-        "LRCCNY",
-        "LRCCNH",
-        "LRCCOP",
-        "LRCCZK",
-        "LRCDAI",
-        "LRCDASH",
-        "LRCDKK",
-        "LRCDOGE",
-        "LRCDOT",
-        "LRCEGLD",
-        "LRCENJ",
-        "LRCEOS",
-        "LRCETC",
-        "LRCETH",
-        "LRCEUR",
-        "LRCFIL",
-        "LRCFLOW",
-        "LRCFTM",
-        "LRCFTT",
-        "LRCGALA",
-        "LRCGBP",
-        "LRCGHS",
-        "LRCHBAR",
-        "LRCHKD",
-        "LRCHNT",
-        "LRCHRK",
-        "LRCHUF",
-        "LRCICP",
-        "LRCIDR",
-        "LRCILS",
-        "LRCINR",
-        "LRCISK",
-        "LRCJPY",
-        "LRCKES",
-        "LRCKRW",
-        "LRCKWD",
-        "LRCLINK",
-        "LRCLTC",
-        "LRCLUNA",
-        "LRCMAD",
-        "LRCMANA",
-        "LRCMATIC",
-        "LRCMUR",
-        "LRCMXN",
-        "LRCMYR",
-        "LRCNEAR",
-        "LRCNEO",
-        "LRCNGN",
-        "LRCNOK",
-        "LRCNZD",
-        "LRCOMR",
-        "LRCPEN",
-        "LRCPHP",
-        "LRCPLN",
-        "LRCQAR",
-        "LRCRON",
-        "LRCROSE",
-        "LRCRUB",
-        "LRCSAND",
-        "LRCSAR",
-        "LRCSEK",
-        "LRCSGD",
-        "LRCSHIB",
-        "LRCSOL",
-        "LRCTHB",
-        "LRCTHETA",
-        "LRCTRX",
-        "LRCTRY",
-        "LRCTWD",
-        "LRCUNI",
-        "LRCUSD",
-        "LRCUSDT",
-        "LRCUST",
-        "LRCVET",
-        "LRCVND",
-        "LRCXAG",
-        "LRCXAU",
-        "LRCXLM",
-        "LRCXMR",
-        "LRCXOF",
-        "LRCXPD",
-        "LRCXPT",
-        "LRCXRP",
-        "LRCXTZ",
-        "LRCZAR",
-        "LRCZWL",
-        "LTCALL",
-        "LTCADA",
-        "LTCAED",
-        "LTCARS",
-        "LTCATOM",
-        "LTCAUD",
-        "LTCAVAX",
-        "LTCAXS",
-        "LTCBCH",
-        "LTCBGN",
-        "LTCBHD",
-        "LTCBNB",
-        "LTCBRL",
-        "LTCBTC",
-        "LTCBTG",
-        "LTCBUSD",
-        "LTCCAD",
-        "LTCCHF",
-        "LTCCLP",
-        "LTCCNY",
-        "LTCCNH",
-        "LTCCOP",
-        "LTCCZK",
-        "LTCDAI",
-        "LTCDASH",
-        "LTCDKK",
-        "LTCDOGE",
-        "LTCDOT",
-        "LTCEGLD",
-        "LTCENJ",
-        "LTCEOS",
-        "LTCETC",
-        "LTCETH",
-        "LTCEUR",
-        "LTCFIL",
-        "LTCFLOW",
-        "LTCFTM",
-        "LTCFTT",
-        "LTCGALA",
-        "LTCGBP",
-        "LTCGHS",
-        "LTCHBAR",
-        "LTCHKD",
-        "LTCHNT",
-        "LTCHRK",
-        "LTCHUF",
-        "LTCICP",
-        "LTCIDR",
-        "LTCILS",
-        "LTCINR",
-        "LTCISK",
-        "LTCJPY",
-        "LTCKES",
-        "LTCKRW",
-        "LTCKWD",
-        "LTCLINK",
-        "LTCLRC",
-        "LTCLUNA",
-        "LTCMAD",
-        "LTCMANA",
-        "LTCMATIC",
-        "LTCMUR",
-        "LTCMXN",
-        "LTCMYR",
-        "LTCNEAR",
-        "LTCNEO",
-        "LTCNGN",
-        "LTCNOK",
-        "LTCNZD",
-        "LTCOMR",
-        "LTCPEN",
-        "LTCPHP",
-        "LTCPLN",
-        "LTCQAR",
-        "LTCRON",
-        "LTCROSE",
-        "LTCRUB",
-        "LTCSAND",
-        "LTCSAR",
-        "LTCSEK",
-        "LTCSGD",
-        "LTCSHIB",
-        "LTCSOL",
-        "LTCTHB",
-        "LTCTHETA",
-        "LTCTRX",
-        "LTCTRY",
-        "LTCTWD",
-        "LTCUNI",
-        "LTCUSD",
-        "LTCUSDT",
-        "LTCUST",
-        "LTCVET",
-        "LTCVND",
-        "LTCXAG",
-        "LTCXAU",
-        "LTCXLM",
-        "LTCXMR",
-        "LTCXOF",
-        "LTCXPD",
-        "LTCXPT",
-        "LTCXRP",
-        "LTCXTZ",
-        "LTCZAR",
-        "LTCZWL",
-        "LUNAALL",
-        "LUNAADA",
-        "LUNAAED",
-        "LUNAARS",
-        "LUNAATOM",
-        "LUNAAUD",
-        "LUNAAVAX",
-        "LUNAAXS",
-        "LUNABCH",
-        "LUNABGN",
-        "LUNABHD",
-        "LUNABNB",
-        "LUNABRL",
-        "LUNABTC",
-        "LUNABTG",
-        "LUNABUSD",
-        "LUNACAD",
-        "LUNACHF",
-        "LUNACLP",
-        "LUNACNY",
-        "LUNACNH",
-        "LUNACOP",
-        "LUNACZK",
-        "LUNADAI",
-        "LUNADASH",
-        "LUNADKK",
-        "LUNADOGE",
-        "LUNADOT",
-        "LUNAEGLD",
-        "LUNAENJ",
-        "LUNAEOS",
-        "LUNAETC",
-        "LUNAETH",
-        "LUNAEUR",
-        "LUNAFIL",
-        "LUNAFLOW",
-        "LUNAFTM",
-        "LUNAFTT",
-        "LUNAGALA",
-        "LUNAGBP",
-        "LUNAGHS",
-        "LUNAHBAR",
-        "LUNAHKD",
-        "LUNAHNT",
-        "LUNAHRK",
-        "LUNAHUF",
-        "LUNAICP",
-        "LUNAIDR",
-        "LUNAILS",
-        "LUNAINR",
-        "LUNAISK",
-        "LUNAJPY",
-        "LUNAKES",
-        "LUNAKRW",
-        "LUNAKWD",
-        "LUNALINK",
-        "LUNALRC",
-        "LUNALTC",
-        "LUNAMAD",
-        "LUNAMANA",
-        "LUNAMATIC",
-        "LUNAMUR",
-        "LUNAMXN",
-        "LUNAMYR",
-        "LUNANEAR",
-        "LUNANEO",
-        "LUNANGN",
-        "LUNANOK",
-        "LUNANZD",
-        "LUNAOMR",
-        "LUNAPEN",
-        "LUNAPHP",
-        "LUNAPLN",
-        "LUNAQAR",
-        "LUNARON",
-        "LUNAROSE",
-        "LUNARUB",
-        "LUNASAND",
-        "LUNASAR",
-        "LUNASEK",
-        "LUNASGD",
-        "LUNASHIB",
-        "LUNASOL",
-        "LUNATHB",
-        "LUNATHETA",
-        "LUNATRX",
-        "LUNATRY",
-        "LUNATWD",
-        "LUNAUNI",
-        "LUNAUSD",
-        "LUNAUSDT",
-        "LUNAUST",
-        "LUNAVET",
-        "LUNAVND",
-        "LUNAXAG",
-        "LUNAXAU",
-        "LUNAXLM",
-        "LUNAXMR",
-        "LUNAXOF",
-        "LUNAXPD",
-        "LUNAXPT",
-        "LUNAXRP",
-        "LUNAXTZ",
-        "LUNAZAR",
-        "LUNAZWL",
-        "MADALL",
-        "MADADA",
-        "MADAED",
-        "MADARS",
-        "MADATOM",
-        "MADAUD",
-        "MADAVAX",
-        "MADAXS",
-        "MADBCH",
-        "MADBGN",
-        "MADBHD",
-        "MADBNB",
-        "MADBRL",
-        "MADBTC",
-        "MADBTG",
-        "MADBUSD",
-        "MADCAD",
-        "MADCHF",
-        "MADCLP",
-        "MADCNY",
-        "MADCNH",
-        "MADCOP",
-        "MADCZK",
-        "MADDAI",
-        "MADDASH",
-        "MADDKK",
-        "MADDOGE",
-        "MADDOT",
-        "MADEGLD",
-        "MADENJ",
-        "MADEOS",
-        "MADETC",
-        "MADETH",
-        "MADEUR",
-        "MADFIL",
-        "MADFLOW",
-        "MADFTM",
-        "MADFTT",
-        "MADGALA",
-        "MADGBP",
-        "MADGHS",
-        "MADHBAR",
-        "MADHKD",
-        "MADHNT",
-        "MADHRK",
-        "MADHUF",
-        "MADICP",
-        "MADIDR",
-        "MADILS",
-        "MADINR",
-        "MADISK",
-        "MADJPY",
-        "MADKES",
-        "MADKRW",
-        "MADKWD",
-        "MADLINK",
-        "MADLRC",
-        "MADLTC",
-        "MADLUNA",
-        "MADMANA",
-        "MADMATIC",
-        "MADMUR",
-        "MADMXN",
-        "MADMYR",
-        "MADNEAR",
-        "MADNEO",
-        "MADNGN",
-        "MADNOK",
-        "MADNZD",
-        "MADOMR",
-        "MADPEN",
-        "MADPHP",
-        "MADPLN",
-        "MADQAR",
-        "MADRON",
-        "MADROSE",
-        "MADRUB",
-        "MADSAND",
-        "MADSAR",
-        "MADSEK",
-        "MADSGD",
-        "MADSHIB",
-        "MADSOL",
-        "MADTHB",
-        "MADTHETA",
-        "MADTRX",
-        "MADTRY",
-        "MADTWD",
-        "MADUNI",
-        "MADUSD",
-        "MADUSDT",
-        "MADUST",
-        "MADVET",
-        "MADVND",
-        "MADXAG",
-        "MADXAU",
-        "MADXLM",
-        "MADXMR",
-        "MADXOF",
-        "MADXPD",
-        "MADXPT",
-        "MADXRP",
-        "MADXTZ",
-        "MADZAR",
-        "MADZWL",
-        "MANAALL",
-        "MANAADA",
-        "MANAAED",
-        "MANAARS",
-        "MANAATOM",
-        "MANAAUD",
-        "MANAAVAX",
-        "MANAAXS",
-        "MANABCH",
-        "MANABGN",
-        "MANABHD",
-        "MANABNB",
-        "MANABRL",
-        "MANABTC",
-        "MANABTG",
-        "MANABUSD",
-        "MANACAD",
-        "MANACHF",
-        "MANACLP",
-        "MANACNY",
-        "MANACNH",
-        "MANACOP",
-        "MANACZK",
-        "MANADAI",
-        "MANADASH",
-        "MANADKK",
-        "MANADOGE",
-        "MANADOT",
-        "MANAEGLD",
-        "MANAENJ",
-        "MANAEOS",
-        "MANAETC",
-        "MANAETH",
-        "MANAEUR",
-        "MANAFIL",
-        "MANAFLOW",
-        "MANAFTM",
-        "MANAFTT",
-        "MANAGALA",
-        "MANAGBP",
-        "MANAGHS",
-        "MANAHBAR",
-        "MANAHKD",
-        "MANAHNT",
-        "MANAHRK",
-        "MANAHUF",
-        "MANAICP",
-        "MANAIDR",
-        "MANAILS",
-        "MANAINR",
-        "MANAISK",
-        "MANAJPY",
-        "MANAKES",
-        "MANAKRW",
-        "MANAKWD",
-        "MANALINK",
-        "MANALRC",
-        "MANALTC",
-        "MANALUNA",
-        "MANAMAD",
-        "MANAMATIC",
-        "MANAMUR",
-        "MANAMXN",
-        "MANAMYR",
-        "MANANEAR",
-        "MANANEO",
-        "MANANGN",
-        "MANANOK",
-        "MANANZD",
-        "MANAOMR",
-        "MANAPEN",
-        "MANAPHP",
-        "MANAPLN",
-        "MANAQAR",
-        "MANARON",
-        "MANAROSE",
-        "MANARUB",
-        "MANASAND",
-        "MANASAR",
-        "MANASEK",
-        "MANASGD",
-        "MANASHIB",
-        "MANASOL",
-        "MANATHB",
-        "MANATHETA",
-        "MANATRX",
-        "MANATRY",
-        "MANATWD",
-        "MANAUNI",
-        "MANAUSD",
-        "MANAUSDT",
-        "MANAUST",
-        "MANAVET",
-        "MANAVND",
-        "MANAXAG",
-        "MANAXAU",
-        "MANAXLM",
-        "MANAXMR",
-        "MANAXOF",
-        "MANAXPD",
-        "MANAXPT",
-        "MANAXRP",
-        "MANAXTZ",
-        "MANAZAR",
-        "MANAZWL",
-        "MATICALL",
-        "MATICADA",
-        "MATICAED",
-        "MATICARS",
-        "MATICATOM",
-        "MATICAUD",
-        "MATICAVAX",
-        "MATICAXS",
-        "MATICBCH",
-        "MATICBGN",
-        "MATICBHD",
-        "MATICBNB",
-        "MATICBRL",
-        "MATICBTC",
-        "MATICBTG",
-        "MATICBUSD",
-        "MATICCAD",
-        "MATICCHF",
-        "MATICCLP",
-        "MATICCNY",
-        "MATICCNH",
-        "MATICCOP",
-        "MATICCZK",
-        "MATICDAI",
-        "MATICDASH",
-        "MATICDKK",
-        "MATICDOGE",
-        "MATICDOT",
-        "MATICEGLD",
-        "MATICENJ",
-        "MATICEOS",
-        "MATICETC",
-        "MATICETH",
-        "MATICEUR",
-        "MATICFIL",
-        "MATICFLOW",
-        "MATICFTM",
-        "MATICFTT",
-        "MATICGALA",
-        "MATICGBP",
-        "MATICGHS",
-        "MATICHBAR",
-        "MATICHKD",
-        "MATICHNT",
-        "MATICHRK",
-        "MATICHUF",
-        "MATICICP",
-        "MATICIDR",
-        "MATICILS",
-        "MATICINR",
-        "MATICISK",
-        "MATICJPY",
-        "MATICKES",
-        "MATICKRW",
-        "MATICKWD",
-        "MATICLINK",
-        "MATICLRC",
-        "MATICLTC",
-        "MATICLUNA",
-        "MATICMAD",
-        "MATICMANA",
-        "MATICMUR",
-        "MATICMXN",
-        "MATICMYR",
-        "MATICNEAR",
-        "MATICNEO",
-        "MATICNGN",
-        "MATICNOK",
-        "MATICNZD",
-        "MATICOMR",
-        "MATICPEN",
-        "MATICPHP",
-        "MATICPLN",
-        "MATICQAR",
-        "MATICRON",
-        "MATICROSE",
-        "MATICRUB",
-        "MATICSAND",
-        "MATICSAR",
-        "MATICSEK",
-        "MATICSGD",
-        "MATICSHIB",
-        "MATICSOL",
-        "MATICTHB",
-        "MATICTHETA",
-        "MATICTRX",
-        "MATICTRY",
-        "MATICTWD",
-        "MATICUNI",
-        "MATICUSD",
-        "MATICUSDT",
-        "MATICUST",
-        "MATICVET",
-        "MATICVND",
-        "MATICXAG",
-        "MATICXAU",
-        "MATICXLM",
-        "MATICXMR",
-        "MATICXOF",
-        "MATICXPD",
-        "MATICXPT",
-        "MATICXRP",
-        "MATICXTZ",
-        "MATICZAR",
-        "MATICZWL",
-        "MURALL",
-        "MURADA",
-        "MURAED",
-        "MURARS",
-        "MURATOM",
-        "MURAUD",
-        "MURAVAX",
-        "MURAXS",
-        "MURBCH",
-        "MURBGN",
-        "MURBHD",
-        "MURBNB",
-        "MURBRL",
-        "MURBTC",
-        "MURBTG",
-        "MURBUSD",
-        "MURCAD",
-        "MURCHF",
-        "MURCLP",
-        "MURCNY",
-        "MURCNH",
-        "MURCOP",
-        "MURCZK",
-        "MURDAI",
-        "MURDASH",
-        "MURDKK",
-        "MURDOGE",
-        "MURDOT",
-        "MUREGLD",
-        "MURENJ",
-        "MUREOS",
-        "MURETC",
-        "MURETH",
-        "MUREUR",
-        "MURFIL",
-        "MURFLOW",
-        "MURFTM",
-        "MURFTT",
-        "MURGALA",
-        "MURGBP",
-        "MURGHS",
-        "MURHBAR",
-        "MURHKD",
-        "MURHNT",
-        "MURHRK",
-        "MURHUF",
-        "MURICP",
-        "MURIDR",
-        "MURILS",
-        "MURINR",
-        "MURISK",
-        "MURJPY",
-        "MURKES",
-        "MURKRW",
-        "MURKWD",
-        "MURLINK",
-        "MURLRC",
-        "MURLTC",
-        "MURLUNA",
-        "MURMAD",
-        "MURMANA",
-        "MURMATIC",
-        "MURMXN",
-        "MURMYR",
-        "MURNEAR",
-        "MURNEO",
-        "MURNGN",
-        "MURNOK",
-        "MURNZD",
-        "MUROMR",
-        "MURPEN",
-        "MURPHP",
-        "MURPLN",
-        "MURQAR",
-        "MURRON",
-        "MURROSE",
-        "MURRUB",
-        "MURSAND",
-        "MURSAR",
-        "MURSEK",
-        "MURSGD",
-        "MURSHIB",
-        "MURSOL",
-        "MURTHB",
-        "MURTHETA",
-        "MURTRX",
-        "MURTRY",
-        "MURTWD",
-        "MURUNI",
-        "MURUSD",
-        "MURUSDT",
-        "MURUST",
-        "MURVET",
-        "MURVND",
-        "MURXAG",
-        "MURXAU",
-        "MURXLM",
-        "MURXMR",
-        "MURXOF",
-        "MURXPD",
-        "MURXPT",
-        "MURXRP",
-        "MURXTZ",
-        "MURZAR",
-        "MURZWL",
-        "MXNALL",
-        "MXNADA",
-        "MXNAED",
-        "MXNARS",
-        "MXNATOM",
-        "MXNAUD",
-        "MXNAVAX",
-        "MXNAXS",
-        "MXNBCH",
-        "MXNBGN",
-        "MXNBHD",
-        "MXNBNB",
-        "MXNBRL",
-        "MXNBTC",
-        "MXNBTG",
-        "MXNBUSD",
-        "MXNCAD",
-        "MXNCHF",
-        "MXNCLP",
-        "MXNCNY",
-        "MXNCNH",
-        "MXNCOP",
-        "MXNCZK",
-        "MXNDAI",
-        "MXNDASH",
-        "MXNDKK",
-        "MXNDOGE",
-        "MXNDOT",
-        "MXNEGLD",
-        "MXNENJ",
-        "MXNEOS",
-        "MXNETC",
-        "MXNETH",
-        "MXNEUR",
-        "MXNFIL",
-        "MXNFLOW",
-        "MXNFTM",
-        "MXNFTT",
-        "MXNGALA",
-        "MXNGBP",
-        "MXNGHS",
-        "MXNHBAR",
-        "MXNHKD",
-        "MXNHNT",
-        "MXNHRK",
-        "MXNHUF",
-        "MXNICP",
-        "MXNIDR",
-        "MXNILS",
-        "MXNINR",
-        "MXNISK",
-        "MXNJPY",
-        "MXNKES",
-        "MXNKRW",
-        "MXNKWD",
-        "MXNLINK",
-        "MXNLRC",
-        "MXNLTC",
-        "MXNLUNA",
-        "MXNMAD",
-        "MXNMANA",
-        "MXNMATIC",
-        "MXNMUR",
-        "MXNMYR",
-        "MXNNEAR",
-        "MXNNEO",
-        "MXNNGN",
-        "MXNNOK",
-        "MXNNZD",
-        "MXNOMR",
-        "MXNPEN",
-        "MXNPHP",
-        "MXNPLN",
-        "MXNQAR",
-        "MXNRON",
-        "MXNROSE",
-        "MXNRUB",
-        "MXNSAND",
-        "MXNSAR",
-        "MXNSEK",
-        "MXNSGD",
-        "MXNSHIB",
-        "MXNSOL",
-        "MXNTHB",
-        "MXNTHETA",
-        "MXNTRX",
-        "MXNTRY",
-        "MXNTWD",
-        "MXNUNI",
-        "MXNUSD",
-        "MXNUSDT",
-        "MXNUST",
-        "MXNVET",
-        "MXNVND",
-        "MXNXAG",
-        "MXNXAU",
-        "MXNXLM",
-        "MXNXMR",
-        "MXNXOF",
-        "MXNXPD",
-        "MXNXPT",
-        "MXNXRP",
-        "MXNXTZ",
-        "MXNZAR",
-        "MXNZWL",
-        "MYRALL",
-        "MYRADA",
-        "MYRAED",
-        "MYRARS",
-        "MYRATOM",
-        "MYRAUD",
-        "MYRAVAX",
-        "MYRAXS",
-        "MYRBCH",
-        "MYRBGN",
-        "MYRBHD",
-        "MYRBNB",
-        "MYRBRL",
-        "MYRBTC",
-        "MYRBTG",
-        "MYRBUSD",
-        "MYRCAD",
-        "MYRCHF",
-        "MYRCLP",
-        "MYRCNY",
-        "MYRCNH",
-        "MYRCOP",
-        "MYRCZK",
-        "MYRDAI",
-        "MYRDASH",
-        "MYRDKK",
-        "MYRDOGE",
-        "MYRDOT",
-        "MYREGLD",
-        "MYRENJ",
-        "MYREOS",
-        "MYRETC",
-        "MYRETH",
-        "MYREUR",
-        "MYRFIL",
-        "MYRFLOW",
-        "MYRFTM",
-        "MYRFTT",
-        "MYRGALA",
-        "MYRGBP",
-        "MYRGHS",
-        "MYRHBAR",
-        "MYRHKD",
-        "MYRHNT",
-        "MYRHRK",
-        "MYRHUF",
-        "MYRICP",
-        "MYRIDR",
-        "MYRILS",
-        "MYRINR",
-        "MYRISK",
-        "MYRJPY",
-        "MYRKES",
-        "MYRKRW",
-        "MYRKWD",
-        "MYRLINK",
-        "MYRLRC",
-        "MYRLTC",
-        "MYRLUNA",
-        "MYRMAD",
-        "MYRMANA",
-        "MYRMATIC",
-        "MYRMUR",
-        "MYRMXN",
-        "MYRNEAR",
-        "MYRNEO",
-        "MYRNGN",
-        "MYRNOK",
-        "MYRNZD",
-        "MYROMR",
-        "MYRPEN",
-        "MYRPHP",
-        "MYRPLN",
-        "MYRQAR",
-        "MYRRON",
-        "MYRROSE",
-        "MYRRUB",
-        "MYRSAND",
-        "MYRSAR",
-        "MYRSEK",
-        "MYRSGD",
-        "MYRSHIB",
-        "MYRSOL",
-        "MYRTHB",
-        "MYRTHETA",
-        "MYRTRX",
-        "MYRTRY",
-        "MYRTWD",
-        "MYRUNI",
-        "MYRUSD",
-        "MYRUSDT",
-        "MYRUST",
-        "MYRVET",
-        "MYRVND",
-        "MYRXAG",
-        "MYRXAU",
-        "MYRXLM",
-        "MYRXMR",
-        "MYRXOF",
-        "MYRXPD",
-        "MYRXPT",
-        "MYRXRP",
-        "MYRXTZ",
-        "MYRZAR",
-        "MYRZWL",
-        "NEARALL",
-        "NEARADA",
-        "NEARAED",
-        "NEARARS",
-        "NEARATOM",
-        "NEARAUD",
-        "NEARAVAX",
-        "NEARAXS",
-        "NEARBCH",
-        "NEARBGN",
-        "NEARBHD",
-        "NEARBNB",
-        "NEARBRL",
-        "NEARBTC",
-        "NEARBTG",
-        "NEARBUSD",
-        "NEARCAD",
-        "NEARCHF",
-        "NEARCLP",
-        "NEARCNY",
-        "NEARCNH",
-        "NEARCOP",
-        "NEARCZK",
-        "NEARDAI",
-        "NEARDASH",
-        "NEARDKK",
-        "NEARDOGE",
-        "NEARDOT",
-        "NEAREGLD",
-        "NEARENJ",
-        "NEAREOS",
-        "NEARETC",
-        "NEARETH",
-        "NEAREUR",
-        "NEARFIL",
-        "NEARFLOW",
-        "NEARFTM",
-        "NEARFTT",
-        "NEARGALA",
-        "NEARGBP",
-        "NEARGHS",
-        "NEARHBAR",
-        "NEARHKD",
-        "NEARHNT",
-        "NEARHRK",
-        "NEARHUF",
-        "NEARICP",
-        "NEARIDR",
-        "NEARILS",
-        "NEARINR",
-        "NEARISK",
-        "NEARJPY",
-        "NEARKES",
-        "NEARKRW",
-        "NEARKWD",
-        "NEARLINK",
-        "NEARLRC",
-        "NEARLTC",
-        "NEARLUNA",
-        "NEARMAD",
-        "NEARMANA",
-        "NEARMATIC",
-        "NEARMUR",
-        "NEARMXN",
-        "NEARMYR",
-        "NEARNEO",
-        "NEARNGN",
-        "NEARNOK",
-        "NEARNZD",
-        "NEAROMR",
-        "NEARPEN",
-        "NEARPHP",
-        "NEARPLN",
-        "NEARQAR",
-        "NEARRON",
-        "NEARROSE",
-        "NEARRUB",
-        "NEARSAND",
-        "NEARSAR",
-        "NEARSEK",
-        "NEARSGD",
-        "NEARSHIB",
-        "NEARSOL",
-        "NEARTHB",
-        "NEARTHETA",
-        "NEARTRX",
-        "NEARTRY",
-        "NEARTWD",
-        "NEARUNI",
-        "NEARUSD",
-        "NEARUSDT",
-        "NEARUST",
-        "NEARVET",
-        "NEARVND",
-        "NEARXAG",
-        "NEARXAU",
-        "NEARXLM",
-        "NEARXMR",
-        "NEARXOF",
-        "NEARXPD",
-        "NEARXPT",
-        "NEARXRP",
-        "NEARXTZ",
-        "NEARZAR",
-        "NEARZWL",
-        "NEOALL",
-        "NEOADA",
-        "NEOAED",
-        "NEOARS",
-        "NEOATOM",
-        "NEOAUD",
-        "NEOAVAX",
-        "NEOAXS",
-        "NEOBCH",
-        "NEOBGN",
-        "NEOBHD",
-        "NEOBNB",
-        "NEOBRL",
-        "NEOBTC",
-        "NEOBTG",
-        "NEOBUSD",
-        "NEOCAD",
-        "NEOCHF",
-        "NEOCLP",
-        "NEOCNY",
-        "NEOCNH",
-        "NEOCOP",
-        "NEOCZK",
-        "NEODAI",
-        "NEODASH",
-        "NEODKK",
-        "NEODOGE",
-        "NEODOT",
-        "NEOEGLD",
-        "NEOENJ",
-        "NEOEOS",
-        "NEOETC",
-        "NEOETH",
-        "NEOEUR",
-        "NEOFIL",
-        "NEOFLOW",
-        "NEOFTM",
-        "NEOFTT",
-        "NEOGALA",
-        "NEOGBP",
-        "NEOGHS",
-        "NEOHBAR",
-        "NEOHKD",
-        "NEOHNT",
-        "NEOHRK",
-        "NEOHUF",
-        "NEOICP",
-        "NEOIDR",
-        "NEOILS",
-        "NEOINR",
-        "NEOISK",
-        "NEOJPY",
-        "NEOKES",
-        "NEOKRW",
-        "NEOKWD",
-        "NEOLINK",
-        "NEOLRC",
-        "NEOLTC",
-        "NEOLUNA",
-        "NEOMAD",
-        "NEOMANA",
-        "NEOMATIC",
-        "NEOMUR",
-        "NEOMXN",
-        "NEOMYR",
-        "NEONEAR",
-        "NEONGN",
-        "NEONOK",
-        "NEONZD",
-        "NEOOMR",
-        "NEOPEN",
-        "NEOPHP",
-        "NEOPLN",
-        "NEOQAR",
-        "NEORON",
-        "NEOROSE",
-        "NEORUB",
-        "NEOSAND",
-        "NEOSAR",
-        "NEOSEK",
-        "NEOSGD",
-        "NEOSHIB",
-        "NEOSOL",
-        "NEOTHB",
-        "NEOTHETA",
-        "NEOTRX",
-        "NEOTRY",
-        "NEOTWD",
-        "NEOUNI",
-        "NEOUSD",
-        "NEOUSDT",
-        "NEOUST",
-        "NEOVET",
-        "NEOVND",
-        "NEOXAG",
-        "NEOXAU",
-        "NEOXLM",
-        "NEOXMR",
-        "NEOXOF",
-        "NEOXPD",
-        "NEOXPT",
-        "NEOXRP",
-        "NEOXTZ",
-        "NEOZAR",
-        "NEOZWL",
-        "NGNALL",
-        "NGNADA",
-        "NGNAED",
-        "NGNARS",
-        "NGNATOM",
-        "NGNAUD",
-        "NGNAVAX",
-        "NGNAXS",
-        "NGNBCH",
-        "NGNBGN",
-        "NGNBHD",
-        "NGNBNB",
-        "NGNBRL",
-        "NGNBTC",
-        "NGNBTG",
-        "NGNBUSD",
-        "NGNCAD",
-        "NGNCHF",
-        "NGNCLP",
-        "NGNCNY",
-        "NGNCNH",
-        "NGNCOP",
-        "NGNCZK",
-        "NGNDAI",
-        "NGNDASH",
-        "NGNDKK",
-        "NGNDOGE",
-        "NGNDOT",
-        "NGNEGLD",
-        "NGNENJ",
-        "NGNEOS",
-        "NGNETC",
-        "NGNETH",
-        "NGNEUR",
-        "NGNFIL",
-        "NGNFLOW",
-        "NGNFTM",
-        "NGNFTT",
-        "NGNGALA",
-        "NGNGBP",
-        "NGNGHS",
-        "NGNHBAR",
-        "NGNHKD",
-        "NGNHNT",
-        "NGNHRK",
-        "NGNHUF",
-        "NGNICP",
-        "NGNIDR",
-        "NGNILS",
-        "NGNINR",
-        "NGNISK",
-        "NGNJPY",
-        "NGNKES",
-        "NGNKRW",
-        "NGNKWD",
-        "NGNLINK",
-        "NGNLRC",
-        "NGNLTC",
-        "NGNLUNA",
-        "NGNMAD",
-        "NGNMANA",
-        "NGNMATIC",
-        "NGNMUR",
-        "NGNMXN",
-        "NGNMYR",
-        "NGNNEAR",
-        "NGNNEO",
-        "NGNNOK",
-        "NGNNZD",
-        "NGNOMR",
-        "NGNPEN",
-        "NGNPHP",
-        "NGNPLN",
-        "NGNQAR",
-        "NGNRON",
-        "NGNROSE",
-        "NGNRUB",
-        "NGNSAND",
-        "NGNSAR",
-        "NGNSEK",
-        "NGNSGD",
-        "NGNSHIB",
-        "NGNSOL",
-        "NGNTHB",
-        "NGNTHETA",
-        "NGNTRX",
-        "NGNTRY",
-        "NGNTWD",
-        "NGNUNI",
-        "NGNUSD",
-        "NGNUSDT",
-        "NGNUST",
-        "NGNVET",
-        "NGNVND",
-        "NGNXAG",
-        "NGNXAU",
-        "NGNXLM",
-        "NGNXMR",
-        "NGNXOF",
-        "NGNXPD",
-        "NGNXPT",
-        "NGNXRP",
-        "NGNXTZ",
-        "NGNZAR",
-        "NGNZWL",
-        "NOKALL",
-        "NOKADA",
-        "NOKAED",
-        "NOKARS",
-        "NOKATOM",
-        "NOKAUD",
-        "NOKAVAX",
-        "NOKAXS",
-        "NOKBCH",
-        "NOKBGN",
-        "NOKBHD",
-        "NOKBNB",
-        "NOKBRL",
-        "NOKBTC",
-        "NOKBTG",
-        "NOKBUSD",
-        "NOKCAD",
-        "NOKCHF",
-        "NOKCLP",
-        "NOKCNY",
-        "NOKCNH",
-        "NOKCOP",
-        "NOKCZK",
-        "NOKDAI",
-        "NOKDASH",
-        "NOKDKK",
-        "NOKDOGE",
-        "NOKDOT",
-        "NOKEGLD",
-        "NOKENJ",
-        "NOKEOS",
-        "NOKETC",
-        "NOKETH",
-        "NOKEUR",
-        "NOKFIL",
-        "NOKFLOW",
-        "NOKFTM",
-        "NOKFTT",
-        "NOKGALA",
-        "NOKGBP",
-        "NOKGHS",
-        "NOKHBAR",
-        "NOKHKD",
-        "NOKHNT",
-        "NOKHRK",
-        "NOKHUF",
-        "NOKICP",
-        "NOKIDR",
-        "NOKILS",
-        "NOKINR",
-        "NOKISK",
-        "NOKJPY",
-        "NOKKES",
-        "NOKKRW",
-        "NOKKWD",
-        "NOKLINK",
-        "NOKLRC",
-        "NOKLTC",
-        "NOKLUNA",
-        "NOKMAD",
-        "NOKMANA",
-        "NOKMATIC",
-        "NOKMUR",
-        "NOKMXN",
-        "NOKMYR",
-        "NOKNEAR",
-        "NOKNEO",
-        "NOKNGN",
-        "NOKNZD",
-        "NOKOMR",
-        "NOKPEN",
-        "NOKPHP",
-        "NOKPLN",
-        "NOKQAR",
-        "NOKRON",
-        "NOKROSE",
-        "NOKRUB",
-        "NOKSAND",
-        "NOKSAR",
-        "NOKSEK",
-        "NOKSGD",
-        "NOKSHIB",
-        "NOKSOL",
-        "NOKTHB",
-        "NOKTHETA",
-        "NOKTRX",
-        "NOKTRY",
-        "NOKTWD",
-        "NOKUNI",
-        "NOKUSD",
-        "NOKUSDT",
-        "NOKUST",
-        "NOKVET",
-        "NOKVND",
-        "NOKXAG",
-        "NOKXAU",
-        "NOKXLM",
-        "NOKXMR",
-        "NOKXOF",
-        "NOKXPD",
-        "NOKXPT",
-        "NOKXRP",
-        "NOKXTZ",
-        "NOKZAR",
-        "NOKZWL",
-        "NZDALL",
-        "NZDADA",
-        "NZDAED",
-        "NZDARS",
-        "NZDATOM",
-        "NZDAUD",
-        "NZDAVAX",
-        "NZDAXS",
-        "NZDBCH",
-        "NZDBGN",
-        "NZDBHD",
-        "NZDBNB",
-        "NZDBRL",
-        "NZDBTC",
-        "NZDBTG",
-        "NZDBUSD",
-        "NZDCAD",
-        "NZDCHF",
-        "NZDCLP",
-        "NZDCNY",
-        "NZDCNH",
-        "NZDCOP",
-        "NZDCZK",
-        "NZDDAI",
-        "NZDDASH",
-        "NZDDKK",
-        "NZDDOGE",
-        "NZDDOT",
-        "NZDEGLD",
-        "NZDENJ",
-        "NZDEOS",
-        "NZDETC",
-        "NZDETH",
-        "NZDEUR",
-        "NZDFIL",
-        "NZDFLOW",
-        "NZDFTM",
-        "NZDFTT",
-        "NZDGALA",
-        "NZDGBP",
-        "NZDGHS",
-        "NZDHBAR",
-        "NZDHKD",
-        "NZDHNT",
-        "NZDHRK",
-        "NZDHUF",
-        "NZDICP",
-        "NZDIDR",
-        "NZDILS",
-        "NZDINR",
-        "NZDISK",
-        "NZDJPY",
-        "NZDKES",
-        "NZDKRW",
-        "NZDKWD",
-        "NZDLINK",
-        "NZDLRC",
-        "NZDLTC",
-        "NZDLUNA",
-        "NZDMAD",
-        "NZDMANA",
-        "NZDMATIC",
-        "NZDMUR",
-        "NZDMXN",
-        "NZDMYR",
-        "NZDNEAR",
-        "NZDNEO",
-        "NZDNGN",
-        "NZDNOK",
-        "NZDOMR",
-        "NZDPEN",
-        "NZDPHP",
-        "NZDPLN",
-        "NZDQAR",
-        "NZDRON",
-        "NZDROSE",
-        "NZDRUB",
-        "NZDSAND",
-        "NZDSAR",
-        "NZDSEK",
-        "NZDSGD",
-        "NZDSHIB",
-        "NZDSOL",
-        "NZDTHB",
-        "NZDTHETA",
-        "NZDTRX",
-        "NZDTRY",
-        "NZDTWD",
-        "NZDUNI",
-        "NZDUSD",
-        "NZDUSDT",
-        "NZDUST",
-        "NZDVET",
-        "NZDVND",
-        "NZDXAG",
-        "NZDXAU",
-        "NZDXLM",
-        "NZDXMR",
-        "NZDXOF",
-        "NZDXPD",
-        "NZDXPT",
-        "NZDXRP",
-        "NZDXTZ",
-        "NZDZAR",
-        "NZDZWL",
-        "OMRALL",
-        "OMRADA",
-        "OMRAED",
-        "OMRARS",
-        "OMRATOM",
-        "OMRAUD",
-        "OMRAVAX",
-        "OMRAXS",
-        "OMRBCH",
-        "OMRBGN",
-        "OMRBHD",
-        "OMRBNB",
-        "OMRBRL",
-        "OMRBTC",
-        "OMRBTG",
-        "OMRBUSD",
-        "OMRCAD",
-        "OMRCHF",
-        "OMRCLP",
-        "OMRCNY",
-        "OMRCNH",
-        "OMRCOP",
-        "OMRCZK",
-        "OMRDAI",
-        "OMRDASH",
-        "OMRDKK",
-        "OMRDOGE",
-        "OMRDOT",
-        "OMREGLD",
-        "OMRENJ",
-        "OMREOS",
-        "OMRETC",
-        "OMRETH",
-        "OMREUR",
-        "OMRFIL",
-        "OMRFLOW",
-        "OMRFTM",
-        "OMRFTT",
-        "OMRGALA",
-        "OMRGBP",
-        "OMRGHS",
-        "OMRHBAR",
-        "OMRHKD",
-        "OMRHNT",
-        "OMRHRK",
-        "OMRHUF",
-        "OMRICP",
-        "OMRIDR",
-        "OMRILS",
-        "OMRINR",
-        "OMRISK",
-        "OMRJPY",
-        "OMRKES",
-        "OMRKRW",
-        "OMRKWD",
-        "OMRLINK",
-        "OMRLRC",
-        "OMRLTC",
-        "OMRLUNA",
-        "OMRMAD",
-        "OMRMANA",
-        "OMRMATIC",
-        "OMRMUR",
-        "OMRMXN",
-        "OMRMYR",
-        "OMRNEAR",
-        "OMRNEO",
-        "OMRNGN",
-        "OMRNOK",
-        "OMRNZD",
-        "OMRPEN",
-        "OMRPHP",
-        "OMRPLN",
-        "OMRQAR",
-        "OMRRON",
-        "OMRROSE",
-        "OMRRUB",
-        "OMRSAND",
-        "OMRSAR",
-        "OMRSEK",
-        "OMRSGD",
-        "OMRSHIB",
-        "OMRSOL",
-        "OMRTHB",
-        "OMRTHETA",
-        "OMRTRX",
-        "OMRTRY",
-        "OMRTWD",
-        "OMRUNI",
-        "OMRUSD",
-        "OMRUSDT",
-        "OMRUST",
-        "OMRVET",
-        "OMRVND",
-        "OMRXAG",
-        "OMRXAU",
-        "OMRXLM",
-        "OMRXMR",
-        "OMRXOF",
-        "OMRXPD",
-        "OMRXPT",
-        "OMRXRP",
-        "OMRXTZ",
-        "OMRZAR",
-        "OMRZWL",
-        "PENALL",
-        "PENADA",
-        "PENAED",
-        "PENARS",
-        "PENATOM",
-        "PENAUD",
-        "PENAVAX",
-        "PENAXS",
-        "PENBCH",
-        "PENBGN",
-        "PENBHD",
-        "PENBNB",
-        "PENBRL",
-        "PENBTC",
-        "PENBTG",
-        "PENBUSD",
-        "PENCAD",
-        "PENCHF",
-        "PENCLP",
-        "PENCNY",
-        "PENCNH",
-        "PENCOP",
-        "PENCZK",
-        "PENDAI",
-        "PENDASH",
-        "PENDKK",
-        "PENDOGE",
-        "PENDOT",
-        "PENEGLD",
-        "PENENJ",
-        "PENEOS",
-        "PENETC",
-        "PENETH",
-        "PENEUR",
-        "PENFIL",
-        "PENFLOW",
-        "PENFTM",
-        "PENFTT",
-        "PENGALA",
-        "PENGBP",
-        "PENGHS",
-        "PENHBAR",
-        "PENHKD",
-        "PENHNT",
-        "PENHRK",
-        "PENHUF",
-        "PENICP",
-        "PENIDR",
-        "PENILS",
-        "PENINR",
-        "PENISK",
-        "PENJPY",
-        "PENKES",
-        "PENKRW",
-        "PENKWD",
-        "PENLINK",
-        "PENLRC",
-        "PENLTC",
-        "PENLUNA",
-        "PENMAD",
-        "PENMANA",
-        "PENMATIC",
-        "PENMUR",
-        "PENMXN",
-        "PENMYR",
-        "PENNEAR",
-        "PENNEO",
-        "PENNGN",
-        "PENNOK",
-        "PENNZD",
-        "PENOMR",
-        "PENPHP",
-        "PENPLN",
-        "PENQAR",
-        "PENRON",
-        "PENROSE",
-        "PENRUB",
-        "PENSAND",
-        "PENSAR",
-        "PENSEK",
-        "PENSGD",
-        "PENSHIB",
-        "PENSOL",
-        "PENTHB",
-        "PENTHETA",
-        "PENTRX",
-        "PENTRY",
-        "PENTWD",
-        "PENUNI",
-        "PENUSD",
-        "PENUSDT",
-        "PENUST",
-        "PENVET",
-        "PENVND",
-        "PENXAG",
-        "PENXAU",
-        "PENXLM",
-        "PENXMR",
-        "PENXOF",
-        "PENXPD",
-        "PENXPT",
-        "PENXRP",
-        "PENXTZ",
-        "PENZAR",
-        "PENZWL",
-        "PHPALL",
-        "PHPADA",
-        "PHPAED",
-        "PHPARS",
-        "PHPATOM",
-        "PHPAUD",
-        "PHPAVAX",
-        "PHPAXS",
-        "PHPBCH",
-        "PHPBGN",
-        "PHPBHD",
-        "PHPBNB",
-        "PHPBRL",
-        "PHPBTC",
-        "PHPBTG",
-        "PHPBUSD",
-        "PHPCAD",
-        "PHPCHF",
-        "PHPCLP",
-        "PHPCNY",
-        "PHPCNH",
-        "PHPCOP",
-        "PHPCZK",
-        "PHPDAI",
-        "PHPDASH",
-        "PHPDKK",
-        "PHPDOGE",
-        "PHPDOT",
-        "PHPEGLD",
-        "PHPENJ",
-        "PHPEOS",
-        "PHPETC",
-        "PHPETH",
-        "PHPEUR",
-        "PHPFIL",
-        "PHPFLOW",
-        "PHPFTM",
-        "PHPFTT",
-        "PHPGALA",
-        "PHPGBP",
-        "PHPGHS",
-        "PHPHBAR",
-        "PHPHKD",
-        "PHPHNT",
-        "PHPHRK",
-        "PHPHUF",
-        "PHPICP",
-        "PHPIDR",
-        "PHPILS",
-        "PHPINR",
-        "PHPISK",
-        "PHPJPY",
-        "PHPKES",
-        "PHPKRW",
-        "PHPKWD",
-        "PHPLINK",
-        "PHPLRC",
-        "PHPLTC",
-        "PHPLUNA",
-        "PHPMAD",
-        "PHPMANA",
-        "PHPMATIC",
-        "PHPMUR",
-        "PHPMXN",
-        "PHPMYR",
-        "PHPNEAR",
-        "PHPNEO",
-        "PHPNGN",
-        "PHPNOK",
-        "PHPNZD",
-        "PHPOMR",
-        "PHPPEN",
-        "PHPPLN",
-        "PHPQAR",
-        "PHPRON",
-        "PHPROSE",
-        "PHPRUB",
-        "PHPSAND",
-        "PHPSAR",
-        "PHPSEK",
-        "PHPSGD",
-        "PHPSHIB",
-        "PHPSOL",
-        "PHPTHB",
-        "PHPTHETA",
-        "PHPTRX",
-        "PHPTRY",
-        "PHPTWD",
-        "PHPUNI",
-        "PHPUSD",
-        "PHPUSDT",
-        "PHPUST",
-        "PHPVET",
-        "PHPVND",
-        "PHPXAG",
-        "PHPXAU",
-        "PHPXLM",
-        "PHPXMR",
-        "PHPXOF",
-        "PHPXPD",
-        "PHPXPT",
-        "PHPXRP",
-        "PHPXTZ",
-        "PHPZAR",
-        "PHPZWL",
-        "PLNALL",
-        "PLNADA",
-        "PLNAED",
-        "PLNARS",
-        "PLNATOM",
-        "PLNAUD",
-        "PLNAVAX",
-        "PLNAXS",
-        "PLNBCH",
-        "PLNBGN",
-        "PLNBHD",
-        "PLNBNB",
-        "PLNBRL",
-        "PLNBTC",
-        "PLNBTG",
-        "PLNBUSD",
-        "PLNCAD",
-        "PLNCHF",
-        "PLNCLP",
-        "PLNCNY",
-        "PLNCNH",
-        "PLNCOP",
-        "PLNCZK",
-        "PLNDAI",
-        "PLNDASH",
-        "PLNDKK",
-        "PLNDOGE",
-        "PLNDOT",
-        "PLNEGLD",
-        "PLNENJ",
-        "PLNEOS",
-        "PLNETC",
-        "PLNETH",
-        "PLNEUR",
-        "PLNFIL",
-        "PLNFLOW",
-        "PLNFTM",
-        "PLNFTT",
-        "PLNGALA",
-        "PLNGBP",
-        "PLNGHS",
-        "PLNHBAR",
-        "PLNHKD",
-        "PLNHNT",
-        "PLNHRK",
-        "PLNHUF",
-        "PLNICP",
-        "PLNIDR",
-        "PLNILS",
-        "PLNINR",
-        "PLNISK",
-        "PLNJPY",
-        "PLNKES",
-        "PLNKRW",
-        "PLNKWD",
-        "PLNLINK",
-        "PLNLRC",
-        "PLNLTC",
-        "PLNLUNA",
-        "PLNMAD",
-        "PLNMANA",
-        "PLNMATIC",
-        "PLNMUR",
-        "PLNMXN",
-        "PLNMYR",
-        "PLNNEAR",
-        "PLNNEO",
-        "PLNNGN",
-        "PLNNOK",
-        "PLNNZD",
-        "PLNOMR",
-        "PLNPEN",
-        "PLNPHP",
-        "PLNQAR",
-        "PLNRON",
-        "PLNROSE",
-        "PLNRUB",
-        "PLNSAND",
-        "PLNSAR",
-        "PLNSEK",
-        "PLNSGD",
-        "PLNSHIB",
-        "PLNSOL",
-        "PLNTHB",
-        "PLNTHETA",
-        "PLNTRX",
-        "PLNTRY",
-        "PLNTWD",
-        "PLNUNI",
-        "PLNUSD",
-        "PLNUSDT",
-        "PLNUST",
-        "PLNVET",
-        "PLNVND",
-        "PLNXAG",
-        "PLNXAU",
-        "PLNXLM",
-        "PLNXMR",
-        "PLNXOF",
-        "PLNXPD",
-        "PLNXPT",
-        "PLNXRP",
-        "PLNXTZ",
-        "PLNZAR",
-        "PLNZWL",
-        "QARALL",
-        "QARADA",
-        "QARAED",
-        "QARARS",
-        "QARATOM",
-        "QARAUD",
-        "QARAVAX",
-        "QARAXS",
-        "QARBCH",
-        "QARBGN",
-        "QARBHD",
-        "QARBNB",
-        "QARBRL",
-        "QARBTC",
-        "QARBTG",
-        "QARBUSD",
-        "QARCAD",
-        "QARCHF",
-        "QARCLP",
-        "QARCNY",
-        "QARCNH",
-        "QARCOP",
-        "QARCZK",
-        "QARDAI",
-        "QARDASH",
-        "QARDKK",
-        "QARDOGE",
-        "QARDOT",
-        "QAREGLD",
-        "QARENJ",
-        "QAREOS",
-        "QARETC",
-        "QARETH",
-        "QAREUR",
-        "QARFIL",
-        "QARFLOW",
-        "QARFTM",
-        "QARFTT",
-        "QARGALA",
-        "QARGBP",
-        "QARGHS",
-        "QARHBAR",
-        "QARHKD",
-        "QARHNT",
-        "QARHRK",
-        "QARHUF",
-        "QARICP",
-        "QARIDR",
-        "QARILS",
-        "QARINR",
-        "QARISK",
-        "QARJPY",
-        "QARKES",
-        "QARKRW",
-        "QARKWD",
-        "QARLINK",
-        "QARLRC",
-        "QARLTC",
-        "QARLUNA",
-        "QARMAD",
-        "QARMANA",
-        "QARMATIC",
-        "QARMUR",
-        "QARMXN",
-        "QARMYR",
-        "QARNEAR",
-        "QARNEO",
-        "QARNGN",
-        "QARNOK",
-        "QARNZD",
-        "QAROMR",
-        "QARPEN",
-        "QARPHP",
-        "QARPLN",
-        "QARRON",
-        "QARROSE",
-        "QARRUB",
-        "QARSAND",
-        "QARSAR",
-        "QARSEK",
-        "QARSGD",
-        "QARSHIB",
-        "QARSOL",
-        "QARTHB",
-        "QARTHETA",
-        "QARTRX",
-        "QARTRY",
-        "QARTWD",
-        "QARUNI",
-        "QARUSD",
-        "QARUSDT",
-        "QARUST",
-        "QARVET",
-        "QARVND",
-        "QARXAG",
-        "QARXAU",
-        "QARXLM",
-        "QARXMR",
-        "QARXOF",
-        "QARXPD",
-        "QARXPT",
-        "QARXRP",
-        "QARXTZ",
-        "QARZAR",
-        "QARZWL",
-        "RONALL",
-        "RONADA",
-        "RONAED",
-        "RONARS",
-        "RONATOM",
-        "RONAUD",
-        "RONAVAX",
-        "RONAXS",
-        "RONBCH",
-        "RONBGN",
-        "RONBHD",
-        "RONBNB",
-        "RONBRL",
-        "RONBTC",
-        "RONBTG",
-        "RONBUSD",
-        "RONCAD",
-        "RONCHF",
-        "RONCLP",
-        "RONCNY",
-        "RONCNH",
-        "RONCOP",
-        "RONCZK",
-        "RONDAI",
-        "RONDASH",
-        "RONDKK",
-        "RONDOGE",
-        "RONDOT",
-        "RONEGLD",
-        "RONENJ",
-        "RONEOS",
-        "RONETC",
-        "RONETH",
-        "RONEUR",
-        "RONFIL",
-        "RONFLOW",
-        "RONFTM",
-        "RONFTT",
-        "RONGALA",
-        "RONGBP",
-        "RONGHS",
-        "RONHBAR",
-        "RONHKD",
-        "RONHNT",
-        "RONHRK",
-        "RONHUF",
-        "RONICP",
-        "RONIDR",
-        "RONILS",
-        "RONINR",
-        "RONISK",
-        "RONJPY",
-        "RONKES",
-        "RONKRW",
-        "RONKWD",
-        "RONLINK",
-        "RONLRC",
-        "RONLTC",
-        "RONLUNA",
-        "RONMAD",
-        "RONMANA",
-        "RONMATIC",
-        "RONMUR",
-        "RONMXN",
-        "RONMYR",
-        "RONNEAR",
-        "RONNEO",
-        "RONNGN",
-        "RONNOK",
-        "RONNZD",
-        "RONOMR",
-        "RONPEN",
-        "RONPHP",
-        "RONPLN",
-        "RONQAR",
-        "RONROSE",
-        "RONRUB",
-        "RONSAND",
-        "RONSAR",
-        "RONSEK",
-        "RONSGD",
-        "RONSHIB",
-        "RONSOL",
-        "RONTHB",
-        "RONTHETA",
-        "RONTRX",
-        "RONTRY",
-        "RONTWD",
-        "RONUNI",
-        "RONUSD",
-        "RONUSDT",
-        "RONUST",
-        "RONVET",
-        "RONVND",
-        "RONXAG",
-        "RONXAU",
-        "RONXLM",
-        "RONXMR",
-        "RONXOF",
-        "RONXPD",
-        "RONXPT",
-        "RONXRP",
-        "RONXTZ",
-        "RONZAR",
-        "RONZWL",
-        "ROSEALL",
-        "ROSEADA",
-        "ROSEAED",
-        "ROSEARS",
-        "ROSEATOM",
-        "ROSEAUD",
-        "ROSEAVAX",
-        "ROSEAXS",
-        "ROSEBCH",
-        "ROSEBGN",
-        "ROSEBHD",
-        "ROSEBNB",
-        "ROSEBRL",
-        "ROSEBTC",
-        "ROSEBTG",
-        "ROSEBUSD",
-        "ROSECAD",
-        "ROSECHF",
-        "ROSECLP",
-        "ROSECNY",
-        "ROSECNH",
-        "ROSECOP",
-        "ROSECZK",
-        "ROSEDAI",
-        "ROSEDASH",
-        "ROSEDKK",
-        "ROSEDOGE",
-        "ROSEDOT",
-        "ROSEEGLD",
-        "ROSEENJ",
-        "ROSEEOS",
-        "ROSEETC",
-        "ROSEETH",
-        "ROSEEUR",
-        "ROSEFIL",
-        "ROSEFLOW",
-        "ROSEFTM",
-        "ROSEFTT",
-        "ROSEGALA",
-        "ROSEGBP",
-        "ROSEGHS",
-        "ROSEHBAR",
-        "ROSEHKD",
-        "ROSEHNT",
-        "ROSEHRK",
-        "ROSEHUF",
-        "ROSEICP",
-        "ROSEIDR",
-        "ROSEILS",
-        "ROSEINR",
-        "ROSEISK",
-        "ROSEJPY",
-        "ROSEKES",
-        "ROSEKRW",
-        "ROSEKWD",
-        "ROSELINK",
-        "ROSELRC",
-        "ROSELTC",
-        "ROSELUNA",
-        "ROSEMAD",
-        "ROSEMANA",
-        "ROSEMATIC",
-        "ROSEMUR",
-        "ROSEMXN",
-        "ROSEMYR",
-        "ROSENEAR",
-        "ROSENEO",
-        "ROSENGN",
-        "ROSENOK",
-        "ROSENZD",
-        "ROSEOMR",
-        "ROSEPEN",
-        "ROSEPHP",
-        "ROSEPLN",
-        "ROSEQAR",
-        "ROSERON",
-        "ROSERUB",
-        "ROSESAND",
-        "ROSESAR",
-        "ROSESEK",
-        "ROSESGD",
-        "ROSESHIB",
-        "ROSESOL",
-        "ROSETHB",
-        "ROSETHETA",
-        "ROSETRX",
-        "ROSETRY",
-        "ROSETWD",
-        "ROSEUNI",
-        "ROSEUSD",
-        "ROSEUSDT",
-        "ROSEUST",
-        "ROSEVET",
-        "ROSEVND",
-        "ROSEXAG",
-        "ROSEXAU",
-        "ROSEXLM",
-        "ROSEXMR",
-        "ROSEXOF",
-        "ROSEXPD",
-        "ROSEXPT",
-        "ROSEXRP",
-        "ROSEXTZ",
-        "ROSEZAR",
-        "ROSEZWL",
-        "RUBALL",
-        "RUBADA",
-        "RUBAED",
-        "RUBARS",
-        "RUBATOM",
-        "RUBAUD",
-        "RUBAVAX",
-        "RUBAXS",
-        "RUBBCH",
-        "RUBBGN",
-        "RUBBHD",
-        "RUBBNB",
-        "RUBBRL",
-        "RUBBTC",
-        "RUBBTG",
-        "RUBBUSD",
-        "RUBCAD",
-        "RUBCHF",
-        "RUBCLP",
-        "RUBCNY",
-        "RUBCNH",
-        "RUBCOP",
-        "RUBCZK",
-        "RUBDAI",
-        "RUBDASH",
-        "RUBDKK",
-        "RUBDOGE",
-        "RUBDOT",
-        "RUBEGLD",
-        "RUBENJ",
-        "RUBEOS",
-        "RUBETC",
-        "RUBETH",
-        "RUBEUR",
-        "RUBFIL",
-        "RUBFLOW",
-        "RUBFTM",
-        "RUBFTT",
-        "RUBGALA",
-        "RUBGBP",
-        "RUBGHS",
-        "RUBHBAR",
-        "RUBHKD",
-        "RUBHNT",
-        "RUBHRK",
-        "RUBHUF",
-        "RUBICP",
-        "RUBIDR",
-        "RUBILS",
-        "RUBINR",
-        "RUBISK",
-        "RUBJPY",
-        "RUBKES",
-        "RUBKRW",
-        "RUBKWD",
-        "RUBLINK",
-        "RUBLRC",
-        "RUBLTC",
-        "RUBLUNA",
-        "RUBMAD",
-        "RUBMANA",
-        "RUBMATIC",
-        "RUBMUR",
-        "RUBMXN",
-        "RUBMYR",
-        "RUBNEAR",
-        "RUBNEO",
-        "RUBNGN",
-        "RUBNOK",
-        "RUBNZD",
-        "RUBOMR",
-        "RUBPEN",
-        "RUBPHP",
-        "RUBPLN",
-        "RUBQAR",
-        "RUBRON",
-        "RUBROSE",
-        "RUBSAND",
-        "RUBSAR",
-        "RUBSEK",
-        "RUBSGD",
-        "RUBSHIB",
-        "RUBSOL",
-        "RUBTHB",
-        "RUBTHETA",
-        "RUBTRX",
-        "RUBTRY",
-        "RUBTWD",
-        "RUBUNI",
-        "RUBUSD",
-        "RUBUSDT",
-        "RUBUST",
-        "RUBVET",
-        "RUBVND",
-        "RUBXAG",
-        "RUBXAU",
-        "RUBXLM",
-        "RUBXMR",
-        "RUBXOF",
-        "RUBXPD",
-        "RUBXPT",
-        "RUBXRP",
-        "RUBXTZ",
-        "RUBZAR",
-        "RUBZWL",
-        "SANDALL",
-        "SANDADA",
-        "SANDAED",
-        "SANDARS",
-        "SANDATOM",
-        "SANDAUD",
-        "SANDAVAX",
-        "SANDAXS",
-        "SANDBCH",
-        "SANDBGN",
-        "SANDBHD",
-        "SANDBNB",
-        "SANDBRL",
-        "SANDBTC",
-        "SANDBTG",
-        "SANDBUSD",
-        "SANDCAD",
-        "SANDCHF",
-        "SANDCLP",
-        "SANDCNY",
-        "SANDCNH",
-        "SANDCOP",
-        "SANDCZK",
-        "SANDDAI",
-        "SANDDASH",
-        "SANDDKK",
-        "SANDDOGE",
-        "SANDDOT",
-        "SANDEGLD",
-        "SANDENJ",
-        "SANDEOS",
-        "SANDETC",
-        "SANDETH",
-        "SANDEUR",
-        "SANDFIL",
-        "SANDFLOW",
-        "SANDFTM",
-        "SANDFTT",
-        "SANDGALA",
-        "SANDGBP",
-        "SANDGHS",
-        "SANDHBAR",
-        "SANDHKD",
-        "SANDHNT",
-        "SANDHRK",
-        "SANDHUF",
-        "SANDICP",
-        "SANDIDR",
-        "SANDILS",
-        "SANDINR",
-        "SANDISK",
-        "SANDJPY",
-        "SANDKES",
-        "SANDKRW",
-        "SANDKWD",
-        "SANDLINK",
-        "SANDLRC",
-        "SANDLTC",
-        "SANDLUNA",
-        "SANDMAD",
-        "SANDMANA",
-        "SANDMATIC",
-        "SANDMUR",
-        "SANDMXN",
-        "SANDMYR",
-        "SANDNEAR",
-        "SANDNEO",
-        "SANDNGN",
-        "SANDNOK",
-        "SANDNZD",
-        "SANDOMR",
-        "SANDPEN",
-        "SANDPHP",
-        "SANDPLN",
-        "SANDQAR",
-        "SANDRON",
-        "SANDROSE",
-        "SANDRUB",
-        "SANDSAR",
-        "SANDSEK",
-        "SANDSGD",
-        "SANDSHIB",
-        "SANDSOL",
-        "SANDTHB",
-        "SANDTHETA",
-        "SANDTRX",
-        "SANDTRY",
-        "SANDTWD",
-        "SANDUNI",
-        "SANDUSD",
-        "SANDUSDT",
-        "SANDUST",
-        "SANDVET",
-        "SANDVND",
-        "SANDXAG",
-        "SANDXAU",
-        "SANDXLM",
-        "SANDXMR",
-        "SANDXOF",
-        "SANDXPD",
-        "SANDXPT",
-        "SANDXRP",
-        "SANDXTZ",
-        "SANDZAR",
-        "SANDZWL",
-        "SARALL",
-        "SARADA",
-        "SARAED",
-        "SARARS",
-        "SARATOM",
-        "SARAUD",
-        "SARAVAX",
-        "SARAXS",
-        "SARBCH",
-        "SARBGN",
-        "SARBHD",
-        "SARBNB",
-        "SARBRL",
-        "SARBTC",
-        "SARBTG",
-        "SARBUSD",
-        "SARCAD",
-        "SARCHF",
-        "SARCLP",
-        "SARCNY",
-        "SARCNH",
-        "SARCOP",
-        "SARCZK",
-        "SARDAI",
-        "SARDASH",
-        "SARDKK",
-        "SARDOGE",
-        "SARDOT",
-        "SAREGLD",
-        "SARENJ",
-        "SAREOS",
-        "SARETC",
-        "SARETH",
-        "SAREUR",
-        "SARFIL",
-        "SARFLOW",
-        "SARFTM",
-        "SARFTT",
-        "SARGALA",
-        "SARGBP",
-        "SARGHS",
-        "SARHBAR",
-        "SARHKD",
-        "SARHNT",
-        "SARHRK",
-        "SARHUF",
-        "SARICP",
-        "SARIDR",
-        "SARILS",
-        "SARINR",
-        "SARISK",
-        "SARJPY",
-        "SARKES",
-        "SARKRW",
-        "SARKWD",
-        "SARLINK",
-        "SARLRC",
-        "SARLTC",
-        "SARLUNA",
-        "SARMAD",
-        "SARMANA",
-        "SARMATIC",
-        "SARMUR",
-        "SARMXN",
-        "SARMYR",
-        "SARNEAR",
-        "SARNEO",
-        "SARNGN",
-        "SARNOK",
-        "SARNZD",
-        "SAROMR",
-        "SARPEN",
-        "SARPHP",
-        "SARPLN",
-        "SARQAR",
-        "SARRON",
-        "SARROSE",
-        "SARRUB",
-        "SARSAND",
-        "SARSEK",
-        "SARSGD",
-        "SARSHIB",
-        "SARSOL",
-        "SARTHB",
-        "SARTHETA",
-        "SARTRX",
-        "SARTRY",
-        "SARTWD",
-        "SARUNI",
-        "SARUSD",
-        "SARUSDT",
-        "SARUST",
-        "SARVET",
-        "SARVND",
-        "SARXAG",
-        "SARXAU",
-        "SARXLM",
-        "SARXMR",
-        "SARXOF",
-        "SARXPD",
-        "SARXPT",
-        "SARXRP",
-        "SARXTZ",
-        "SARZAR",
-        "SARZWL",
-        "SEKALL",
-        "SEKADA",
-        "SEKAED",
-        "SEKARS",
-        "SEKATOM",
-        "SEKAUD",
-        "SEKAVAX",
-        "SEKAXS",
-        "SEKBCH",
-        "SEKBGN",
-        "SEKBHD",
-        "SEKBNB",
-        "SEKBRL",
-        "SEKBTC",
-        "SEKBTG",
-        "SEKBUSD",
-        "SEKCAD",
-        "SEKCHF",
-        "SEKCLP",
-        "SEKCNY",
-        "SEKCNH",
-        "SEKCOP",
-        "SEKCZK",
-        "SEKDAI",
-        "SEKDASH",
-        "SEKDKK",
-        "SEKDOGE",
-        "SEKDOT",
-        "SEKEGLD",
-        "SEKENJ",
-        "SEKEOS",
-        "SEKETC",
-        "SEKETH",
-        "SEKEUR",
-        "SEKFIL",
-        "SEKFLOW",
-        "SEKFTM",
-        "SEKFTT",
-        "SEKGALA",
-        "SEKGBP",
-        "SEKGHS",
-        "SEKHBAR",
-        "SEKHKD",
-        "SEKHNT",
-        "SEKHRK",
-        "SEKHUF",
-        "SEKICP",
-        "SEKIDR",
-        "SEKILS",
-        "SEKINR",
-        "SEKISK",
-        "SEKJPY",
-        "SEKKES",
-        "SEKKRW",
-        "SEKKWD",
-        "SEKLINK",
-        "SEKLRC",
-        "SEKLTC",
-        "SEKLUNA",
-        "SEKMAD",
-        "SEKMANA",
-        "SEKMATIC",
-        "SEKMUR",
-        "SEKMXN",
-        "SEKMYR",
-        "SEKNEAR",
-        "SEKNEO",
-        "SEKNGN",
-        "SEKNOK",
-        "SEKNZD",
-        "SEKOMR",
-        "SEKPEN",
-        "SEKPHP",
-        "SEKPLN",
-        "SEKQAR",
-        "SEKRON",
-        "SEKROSE",
-        "SEKRUB",
-        "SEKSAND",
-        "SEKSAR",
-        "SEKSGD",
-        "SEKSHIB",
-        "SEKSOL",
-        "SEKTHB",
-        "SEKTHETA",
-        "SEKTRX",
-        "SEKTRY",
-        "SEKTWD",
-        "SEKUNI",
-        "SEKUSD",
-        "SEKUSDT",
-        "SEKUST",
-        "SEKVET",
-        "SEKVND",
-        "SEKXAG",
-        "SEKXAU",
-        "SEKXLM",
-        "SEKXMR",
-        "SEKXOF",
-        "SEKXPD",
-        "SEKXPT",
-        "SEKXRP",
-        "SEKXTZ",
-        "SEKZAR",
-        "SEKZWL",
-        "SGDALL",
-        "SGDADA",
-        "SGDAED",
-        "SGDARS",
-        "SGDATOM",
-        "SGDAUD",
-        "SGDAVAX",
-        "SGDAXS",
-        "SGDBCH",
-        "SGDBGN",
-        "SGDBHD",
-        "SGDBNB",
-        "SGDBRL",
-        "SGDBTC",
-        "SGDBTG",
-        "SGDBUSD",
-        "SGDCAD",
-        "SGDCHF",
-        "SGDCLP",
-        "SGDCNY",
-        "SGDCNH",
-        "SGDCOP",
-        "SGDCZK",
-        "SGDDAI",
-        "SGDDASH",
-        "SGDDKK",
-        "SGDDOGE",
-        "SGDDOT",
-        "SGDEGLD",
-        "SGDENJ",
-        "SGDEOS",
-        "SGDETC",
-        "SGDETH",
-        "SGDEUR",
-        "SGDFIL",
-        "SGDFLOW",
-        "SGDFTM",
-        "SGDFTT",
-        "SGDGALA",
-        "SGDGBP",
-        "SGDGHS",
-        "SGDHBAR",
-        "SGDHKD",
-        "SGDHNT",
-        "SGDHRK",
-        "SGDHUF",
-        "SGDICP",
-        "SGDIDR",
-        "SGDILS",
-        "SGDINR",
-        "SGDISK",
-        "SGDJPY",
-        "SGDKES",
-        "SGDKRW",
-        "SGDKWD",
-        "SGDLINK",
-        "SGDLRC",
-        "SGDLTC",
-        "SGDLUNA",
-        "SGDMAD",
-        "SGDMANA",
-        "SGDMATIC",
-        "SGDMUR",
-        "SGDMXN",
-        "SGDMYR",
-        "SGDNEAR",
-        "SGDNEO",
-        "SGDNGN",
-        "SGDNOK",
-        "SGDNZD",
-        "SGDOMR",
-        "SGDPEN",
-        "SGDPHP",
-        "SGDPLN",
-        "SGDQAR",
-        "SGDRON",
-        "SGDROSE",
-        "SGDRUB",
-        "SGDSAND",
-        "SGDSAR",
-        "SGDSEK",
-        "SGDSHIB",
-        "SGDSOL",
-        "SGDTHB",
-        "SGDTHETA",
-        "SGDTRX",
-        "SGDTRY",
-        "SGDTWD",
-        "SGDUNI",
-        "SGDUSD",
-        "SGDUSDT",
-        "SGDUST",
-        "SGDVET",
-        "SGDVND",
-        "SGDXAG",
-        "SGDXAU",
-        "SGDXLM",
-        "SGDXMR",
-        "SGDXOF",
-        "SGDXPD",
-        "SGDXPT",
-        "SGDXRP",
-        "SGDXTZ",
-        "SGDZAR",
-        "SGDZWL",
-        "SHIBALL",
-        "SHIBADA",
-        "SHIBAED",
-        "SHIBARS",
-        "SHIBATOM",
-        "SHIBAUD",
-        "SHIBAVAX",
-        "SHIBAXS",
-        "SHIBBCH",
-        "SHIBBGN",
-        "SHIBBHD",
-        "SHIBBNB",
-        "SHIBBRL",
-        "SHIBBTC",
-        "SHIBBTG",
-        "SHIBBUSD",
-        "SHIBCAD",
-        "SHIBCHF",
-        "SHIBCLP",
-        "SHIBCNY",
-        "SHIBCNH",
-        "SHIBCOP",
-        "SHIBCZK",
-        "SHIBDAI",
-        "SHIBDASH",
-        "SHIBDKK",
-        "SHIBDOGE",
-        "SHIBDOT",
-        "SHIBEGLD",
-        "SHIBENJ",
-        "SHIBEOS",
-        "SHIBETC",
-        "SHIBETH",
-        "SHIBEUR",
-        "SHIBFIL",
-        "SHIBFLOW",
-        "SHIBFTM",
-        "SHIBFTT",
-        "SHIBGALA",
-        "SHIBGBP",
-        "SHIBGHS",
-        "SHIBHBAR",
-        "SHIBHKD",
-        "SHIBHNT",
-        "SHIBHRK",
-        "SHIBHUF",
-        "SHIBICP",
-        "SHIBIDR",
-        "SHIBILS",
-        "SHIBINR",
-        "SHIBISK",
-        "SHIBJPY",
-        "SHIBKES",
-        "SHIBKRW",
-        "SHIBKWD",
-        "SHIBLINK",
-        "SHIBLRC",
-        "SHIBLTC",
-        "SHIBLUNA",
-        "SHIBMAD",
-        "SHIBMANA",
-        "SHIBMATIC",
-        "SHIBMUR",
-        "SHIBMXN",
-        "SHIBMYR",
-        "SHIBNEAR",
-        "SHIBNEO",
-        "SHIBNGN",
-        "SHIBNOK",
-        "SHIBNZD",
-        "SHIBOMR",
-        "SHIBPEN",
-        "SHIBPHP",
-        "SHIBPLN",
-        "SHIBQAR",
-        "SHIBRON",
-        "SHIBROSE",
-        "SHIBRUB",
-        "SHIBSAND",
-        "SHIBSAR",
-        "SHIBSEK",
-        "SHIBSGD",
-        "SHIBSOL",
-        "SHIBTHB",
-        "SHIBTHETA",
-        "SHIBTRX",
-        "SHIBTRY",
-        "SHIBTWD",
-        "SHIBUNI",
-        "SHIBUSD",
-        "SHIBUSDT",
-        "SHIBUST",
-        "SHIBVET",
-        "SHIBVND",
-        "SHIBXAG",
-        "SHIBXAU",
-        "SHIBXLM",
-        "SHIBXMR",
-        "SHIBXOF",
-        "SHIBXPD",
-        "SHIBXPT",
-        "SHIBXRP",
-        "SHIBXTZ",
-        "SHIBZAR",
-        "SHIBZWL",
-        "SOLALL",
-        "SOLADA",
-        "SOLAED",
-        "SOLARS",
-        "SOLATOM",
-        "SOLAUD",
-        "SOLAVAX",
-        "SOLAXS",
-        "SOLBCH",
-        "SOLBGN",
-        "SOLBHD",
-        "SOLBNB",
-        "SOLBRL",
-        "SOLBTC",
-        "SOLBTG",
-        "SOLBUSD",
-        "SOLCAD",
-        "SOLCHF",
-        "SOLCLP",
-        "SOLCNY",
-        "SOLCNH",
-        "SOLCOP",
-        "SOLCZK",
-        "SOLDAI",
-        "SOLDASH",
-        "SOLDKK",
-        "SOLDOGE",
-        "SOLDOT",
-        "SOLEGLD",
-        "SOLENJ",
-        "SOLEOS",
-        "SOLETC",
-        "SOLETH",
-        "SOLEUR",
-        "SOLFIL",
-        "SOLFLOW",
-        "SOLFTM",
-        "SOLFTT",
-        "SOLGALA",
-        "SOLGBP",
-        "SOLGHS",
-        "SOLHBAR",
-        "SOLHKD",
-        "SOLHNT",
-        "SOLHRK",
-        "SOLHUF",
-        "SOLICP",
-        "SOLIDR",
-        "SOLILS",
-        "SOLINR",
-        "SOLISK",
-        "SOLJPY",
-        "SOLKES",
-        "SOLKRW",
-        "SOLKWD",
-        "SOLLINK",
-        "SOLLRC",
-        "SOLLTC",
-        "SOLLUNA",
-        "SOLMAD",
-        "SOLMANA",
-        "SOLMATIC",
-        "SOLMUR",
-        "SOLMXN",
-        "SOLMYR",
-        "SOLNEAR",
-        "SOLNEO",
-        "SOLNGN",
-        "SOLNOK",
-        "SOLNZD",
-        "SOLOMR",
-        "SOLPEN",
-        "SOLPHP",
-        "SOLPLN",
-        "SOLQAR",
-        "SOLRON",
-        "SOLROSE",
-        "SOLRUB",
-        "SOLSAND",
-        "SOLSAR",
-        "SOLSEK",
-        "SOLSGD",
-        "SOLSHIB",
-        "SOLTHB",
-        "SOLTHETA",
-        "SOLTRX",
-        "SOLTRY",
-        "SOLTWD",
-        "SOLUNI",
-        "SOLUSD",
-        "SOLUSDT",
-        "SOLUST",
-        "SOLVET",
-        "SOLVND",
-        "SOLXAG",
-        "SOLXAU",
-        "SOLXLM",
-        "SOLXMR",
-        "SOLXOF",
-        "SOLXPD",
-        "SOLXPT",
-        "SOLXRP",
-        "SOLXTZ",
-        "SOLZAR",
-        "SOLZWL",
-        "THBALL",
-        "THBADA",
-        "THBAED",
-        "THBARS",
-        "THBATOM",
-        "THBAUD",
-        "THBAVAX",
-        "THBAXS",
-        "THBBCH",
-        "THBBGN",
-        "THBBHD",
-        "THBBNB",
-        "THBBRL",
-        "THBBTC",
-        "THBBTG",
-        "THBBUSD",
-        "THBCAD",
-        "THBCHF",
-        "THBCLP",
-        "THBCNY",
-        "THBCNH",
-        "THBCOP",
-        "THBCZK",
-        "THBDAI",
-        "THBDASH",
-        "THBDKK",
-        "THBDOGE",
-        "THBDOT",
-        "THBEGLD",
-        "THBENJ",
-        "THBEOS",
-        "THBETC",
-        "THBETH",
-        "THBEUR",
-        "THBFIL",
-        "THBFLOW",
-        "THBFTM",
-        "THBFTT",
-        "THBGALA",
-        "THBGBP",
-        "THBGHS",
-        "THBHBAR",
-        "THBHKD",
-        "THBHNT",
-        "THBHRK",
-        "THBHUF",
-        "THBICP",
-        "THBIDR",
-        "THBILS",
-        "THBINR",
-        "THBISK",
-        "THBJPY",
-        "THBKES",
-        "THBKRW",
-        "THBKWD",
-        "THBLINK",
-        "THBLRC",
-        "THBLTC",
-        "THBLUNA",
-        "THBMAD",
-        "THBMANA",
-        "THBMATIC",
-        "THBMUR",
-        "THBMXN",
-        "THBMYR",
-        "THBNEAR",
-        "THBNEO",
-        "THBNGN",
-        "THBNOK",
-        "THBNZD",
-        "THBOMR",
-        "THBPEN",
-        "THBPHP",
-        "THBPLN",
-        "THBQAR",
-        "THBRON",
-        "THBROSE",
-        "THBRUB",
-        "THBSAND",
-        "THBSAR",
-        "THBSEK",
-        "THBSGD",
-        "THBSHIB",
-        "THBSOL",
-        "THBTHETA",
-        "THBTRX",
-        "THBTRY",
-        "THBTWD",
-        "THBUNI",
-        "THBUSD",
-        "THBUSDT",
-        "THBUST",
-        "THBVET",
-        "THBVND",
-        "THBXAG",
-        "THBXAU",
-        "THBXLM",
-        "THBXMR",
-        "THBXOF",
-        "THBXPD",
-        "THBXPT",
-        "THBXRP",
-        "THBXTZ",
-        "THBZAR",
-        "THBZWL",
-        "THETAALL",
-        "THETAADA",
-        "THETAAED",
-        "THETAARS",
-        "THETAATOM",
-        "THETAAUD",
-        "THETAAVAX",
-        "THETAAXS",
-        "THETABCH",
-        "THETABGN",
-        "THETABHD",
-        "THETABNB",
-        "THETABRL",
-        "THETABTC",
-        "THETABTG",
-        "THETABUSD",
-        "THETACAD",
-        "THETACHF",
-        "THETACLP",
-        "THETACNY",
-        "THETACNH",
-        "THETACOP",
-        "THETACZK",
-        "THETADAI",
-        "THETADASH",
-        "THETADKK",
-        "THETADOGE",
-        "THETADOT",
-        "THETAEGLD",
-        "THETAENJ",
-        "THETAEOS",
-        "THETAETC",
-        "THETAETH",
-        "THETAEUR",
-        "THETAFIL",
-        "THETAFLOW",
-        "THETAFTM",
-        "THETAFTT",
-        "THETAGALA",
-        "THETAGBP",
-        "THETAGHS",
-        "THETAHBAR",
-        "THETAHKD",
-        "THETAHNT",
-        "THETAHRK",
-        "THETAHUF",
-        "THETAICP",
-        "THETAIDR",
-        "THETAILS",
-        "THETAINR",
-        "THETAISK",
-        "THETAJPY",
-        "THETAKES",
-        "THETAKRW",
-        "THETAKWD",
-        "THETALINK",
-        "THETALRC",
-        "THETALTC",
-        "THETALUNA",
-        "THETAMAD",
-        "THETAMANA",
-        "THETAMATIC",
-        "THETAMUR",
-        "THETAMXN",
-        "THETAMYR",
-        "THETANEAR",
-        "THETANEO",
-        "THETANGN",
-        "THETANOK",
-        "THETANZD",
-        "THETAOMR",
-        "THETAPEN",
-        "THETAPHP",
-        "THETAPLN",
-        "THETAQAR",
-        "THETARON",
-        "THETAROSE",
-        "THETARUB",
-        "THETASAND",
-        "THETASAR",
-        "THETASEK",
-        "THETASGD",
-        "THETASHIB",
-        "THETASOL",
-        "THETATHB",
-        "THETATRX",
-        "THETATRY",
-        "THETATWD",
-        "THETAUNI",
-        "THETAUSD",
-        "THETAUSDT",
-        "THETAUST",
-        "THETAVET",
-        "THETAVND",
-        "THETAXAG",
-        "THETAXAU",
-        "THETAXLM",
-        "THETAXMR",
-        "THETAXOF",
-        "THETAXPD",
-        "THETAXPT",
-        "THETAXRP",
-        "THETAXTZ",
-        "THETAZAR",
-        "THETAZWL",
-        "TRXALL",
-        "TRXADA",
-        "TRXAED",
-        "TRXARS",
-        "TRXATOM",
-        "TRXAUD",
-        "TRXAVAX",
-        "TRXAXS",
-        "TRXBCH",
-        "TRXBGN",
-        "TRXBHD",
-        "TRXBNB",
-        "TRXBRL",
-        "TRXBTC",
-        "TRXBTG",
-        "TRXBUSD",
-        "TRXCAD",
-        "TRXCHF",
-        "TRXCLP",
-        "TRXCNY",
-        "TRXCNH",
-        "TRXCOP",
-        "TRXCZK",
-        "TRXDAI",
-        "TRXDASH",
-        "TRXDKK",
-        "TRXDOGE",
-        "TRXDOT",
-        "TRXEGLD",
-        "TRXENJ",
-        "TRXEOS",
-        "TRXETC",
-        "TRXETH",
-        "TRXEUR",
-        "TRXFIL",
-        "TRXFLOW",
-        "TRXFTM",
-        "TRXFTT",
-        "TRXGALA",
-        "TRXGBP",
-        "TRXGHS",
-        "TRXHBAR",
-        "TRXHKD",
-        "TRXHNT",
-        "TRXHRK",
-        "TRXHUF",
-        "TRXICP",
-        "TRXIDR",
-        "TRXILS",
-        "TRXINR",
-        "TRXISK",
-        "TRXJPY",
-        "TRXKES",
-        "TRXKRW",
-        "TRXKWD",
-        "TRXLINK",
-        "TRXLRC",
-        "TRXLTC",
-        "TRXLUNA",
-        "TRXMAD",
-        "TRXMANA",
-        "TRXMATIC",
-        "TRXMUR",
-        "TRXMXN",
-        "TRXMYR",
-        "TRXNEAR",
-        "TRXNEO",
-        "TRXNGN",
-        "TRXNOK",
-        "TRXNZD",
-        "TRXOMR",
-        "TRXPEN",
-        "TRXPHP",
-        "TRXPLN",
-        "TRXQAR",
-        "TRXRON",
-        "TRXROSE",
-        "TRXRUB",
-        "TRXSAND",
-        "TRXSAR",
-        "TRXSEK",
-        "TRXSGD",
-        "TRXSHIB",
-        "TRXSOL",
-        "TRXTHB",
-        "TRXTHETA",
-        "TRXTRY",
-        "TRXTWD",
-        "TRXUNI",
-        "TRXUSD",
-        "TRXUSDT",
-        "TRXUST",
-        "TRXVET",
-        "TRXVND",
-        "TRXXAG",
-        "TRXXAU",
-        "TRXXLM",
-        "TRXXMR",
-        "TRXXOF",
-        "TRXXPD",
-        "TRXXPT",
-        "TRXXRP",
-        "TRXXTZ",
-        "TRXZAR",
-        "TRXZWL",
-        "TRYALL",
-        "TRYADA",
-        "TRYAED",
-        "TRYARS",
-        "TRYATOM",
-        "TRYAUD",
-        "TRYAVAX",
-        "TRYAXS",
-        "TRYBCH",
-        "TRYBGN",
-        "TRYBHD",
-        "TRYBNB",
-        "TRYBRL",
-        "TRYBTC",
-        "TRYBTG",
-        "TRYBUSD",
-        "TRYCAD",
-        "TRYCHF",
-        "TRYCLP",
-        "TRYCNY",
-        "TRYCNH",
-        "TRYCOP",
-        "TRYCZK",
-        "TRYDAI",
-        "TRYDASH",
-        "TRYDKK",
-        "TRYDOGE",
-        "TRYDOT",
-        "TRYEGLD",
-        "TRYENJ",
-        "TRYEOS",
-        "TRYETC",
-        "TRYETH",
-        "TRYEUR",
-        "TRYFIL",
-        "TRYFLOW",
-        "TRYFTM",
-        "TRYFTT",
-        "TRYGALA",
-        "TRYGBP",
-        "TRYGHS",
-        "TRYHBAR",
-        "TRYHKD",
-        "TRYHNT",
-        "TRYHRK",
-        "TRYHUF",
-        "TRYICP",
-        "TRYIDR",
-        "TRYILS",
-        "TRYINR",
-        "TRYISK",
-        "TRYJPY",
-        "TRYKES",
-        "TRYKRW",
-        "TRYKWD",
-        "TRYLINK",
-        "TRYLRC",
-        "TRYLTC",
-        "TRYLUNA",
-        "TRYMAD",
-        "TRYMANA",
-        "TRYMATIC",
-        "TRYMUR",
-        "TRYMXN",
-        "TRYMYR",
-        "TRYNEAR",
-        "TRYNEO",
-        "TRYNGN",
-        "TRYNOK",
-        "TRYNZD",
-        "TRYOMR",
-        "TRYPEN",
-        "TRYPHP",
-        "TRYPLN",
-        "TRYQAR",
-        "TRYRON",
-        "TRYROSE",
-        "TRYRUB",
-        "TRYSAND",
-        "TRYSAR",
-        "TRYSEK",
-        "TRYSGD",
-        "TRYSHIB",
-        "TRYSOL",
-        "TRYTHB",
-        "TRYTHETA",
-        "TRYTRX",
-        "TRYTWD",
-        "TRYUNI",
-        "TRYUSD",
-        "TRYUSDT",
-        "TRYUST",
-        "TRYVET",
-        "TRYVND",
-        "TRYXAG",
-        "TRYXAU",
-        "TRYXLM",
-        "TRYXMR",
-        "TRYXOF",
-        "TRYXPD",
-        "TRYXPT",
-        "TRYXRP",
-        "TRYXTZ",
-        "TRYZAR",
-        "TRYZWL",
-        "TWDALL",
-        "TWDADA",
-        "TWDAED",
-        "TWDARS",
-        "TWDATOM",
-        "TWDAUD",
-        "TWDAVAX",
-        "TWDAXS",
-        "TWDBCH",
-        "TWDBGN",
-        "TWDBHD",
-        "TWDBNB",
-        "TWDBRL",
-        "TWDBTC",
-        "TWDBTG",
-        "TWDBUSD",
-        "TWDCAD",
-        "TWDCHF",
-        "TWDCLP",
-        "TWDCNY",
-        "TWDCNH",
-        "TWDCOP",
-        "TWDCZK",
-        "TWDDAI",
-        "TWDDASH",
-        "TWDDKK",
-        "TWDDOGE",
-        "TWDDOT",
-        "TWDEGLD",
-        "TWDENJ",
-        "TWDEOS",
-        "TWDETC",
-        "TWDETH",
-        "TWDEUR",
-        "TWDFIL",
-        "TWDFLOW",
-        "TWDFTM",
-        "TWDFTT",
-        "TWDGALA",
-        "TWDGBP",
-        "TWDGHS",
-        "TWDHBAR",
-        "TWDHKD",
-        "TWDHNT",
-        "TWDHRK",
-        "TWDHUF",
-        "TWDICP",
-        "TWDIDR",
-        "TWDILS",
-        "TWDINR",
-        "TWDISK",
-        "TWDJPY",
-        "TWDKES",
-        "TWDKRW",
-        "TWDKWD",
-        "TWDLINK",
-        "TWDLRC",
-        "TWDLTC",
-        "TWDLUNA",
-        "TWDMAD",
-        "TWDMANA",
-        "TWDMATIC",
-        "TWDMUR",
-        "TWDMXN",
-        "TWDMYR",
-        "TWDNEAR",
-        "TWDNEO",
-        "TWDNGN",
-        "TWDNOK",
-        "TWDNZD",
-        "TWDOMR",
-        "TWDPEN",
-        "TWDPHP",
-        "TWDPLN",
-        "TWDQAR",
-        "TWDRON",
-        "TWDROSE",
-        "TWDRUB",
-        "TWDSAND",
-        "TWDSAR",
-        "TWDSEK",
-        "TWDSGD",
-        "TWDSHIB",
-        "TWDSOL",
-        "TWDTHB",
-        "TWDTHETA",
-        "TWDTRX",
-        "TWDTRY",
-        "TWDUNI",
-        "TWDUSD",
-        "TWDUSDT",
-        "TWDUST",
-        "TWDVET",
-        "TWDVND",
-        "TWDXAG",
-        "TWDXAU",
-        "TWDXLM",
-        "TWDXMR",
-        "TWDXOF",
-        "TWDXPD",
-        "TWDXPT",
-        "TWDXRP",
-        "TWDXTZ",
-        "TWDZAR",
-        "TWDZWL",
-        "UNIALL",
-        "UNIADA",
-        "UNIAED",
-        "UNIARS",
-        "UNIATOM",
-        "UNIAUD",
-        "UNIAVAX",
-        "UNIAXS",
-        "UNIBCH",
-        "UNIBGN",
-        "UNIBHD",
-        "UNIBNB",
-        "UNIBRL",
-        "UNIBTC",
-        "UNIBTG",
-        "UNIBUSD",
-        "UNICAD",
-        "UNICHF",
-        "UNICLP",
-        "UNICNY",
-        "UNICNH",
-        "UNICOP",
-        "UNICZK",
-        "UNIDAI",
-        "UNIDASH",
-        "UNIDKK",
-        "UNIDOGE",
-        "UNIDOT",
-        "UNIEGLD",
-        "UNIENJ",
-        "UNIEOS",
-        "UNIETC",
-        "UNIETH",
-        "UNIEUR",
-        "UNIFIL",
-        "UNIFLOW",
-        "UNIFTM",
-        "UNIFTT",
-        "UNIGALA",
-        "UNIGBP",
-        "UNIGHS",
-        "UNIHBAR",
-        "UNIHKD",
-        "UNIHNT",
-        "UNIHRK",
-        "UNIHUF",
-        "UNIICP",
-        "UNIIDR",
-        "UNIILS",
-        "UNIINR",
-        "UNIISK",
-        "UNIJPY",
-        "UNIKES",
-        "UNIKRW",
-        "UNIKWD",
-        "UNILINK",
-        "UNILRC",
-        "UNILTC",
-        "UNILUNA",
-        "UNIMAD",
-        "UNIMANA",
-        "UNIMATIC",
-        "UNIMUR",
-        "UNIMXN",
-        "UNIMYR",
-        "UNINEAR",
-        "UNINEO",
-        "UNINGN",
-        "UNINOK",
-        "UNINZD",
-        "UNIOMR",
-        "UNIPEN",
-        "UNIPHP",
-        "UNIPLN",
-        "UNIQAR",
-        "UNIRON",
-        "UNIROSE",
-        "UNIRUB",
-        "UNISAND",
-        "UNISAR",
-        "UNISEK",
-        "UNISGD",
-        "UNISHIB",
-        "UNISOL",
-        "UNITHB",
-        "UNITHETA",
-        "UNITRX",
-        "UNITRY",
-        "UNITWD",
-        "UNIUSD",
-        "UNIUSDT",
-        "UNIUST",
-        "UNIVET",
-        "UNIVND",
-        "UNIXAG",
-        "UNIXAU",
-        "UNIXLM",
-        "UNIXMR",
-        "UNIXOF",
-        "UNIXPD",
-        "UNIXPT",
-        "UNIXRP",
-        "UNIXTZ",
-        "UNIZAR",
-        "UNIZWL",
-        "USDALL",
-        "USDADA",
-        "USDAED",
-        "USDARS",
-        "USDATOM",
-        "USDAUD",
-        "USDAVAX",
-        "USDAXS",
-        "USDBCH",
-        "USDBGN",
-        "USDBHD",
-        "USDBNB",
-        "USDBRL",
-        "USDBTC",
-        "USDBTG",
-        "USDBUSD",
-        "USDCAD",
-        "USDCHF",
-        "USDCLP",
-        "USDCNY",
-        "USDCNH",
-        "USDCOP",
-        "USDCZK",
-        "USDDAI",
-        "USDDASH",
-        "USDDKK",
-        "USDDOGE",
-        "USDDOT",
-        "USDEGLD",
-        "USDENJ",
-        "USDEOS",
-        "USDETC",
-        "USDETH",
-        "USDEUR",
-        "USDFIL",
-        "USDFLOW",
-        "USDFTM",
-        "USDFTT",
-        "USDGALA",
-        "USDGBP",
-        "USDGHS",
-        "USDHBAR",
-        "USDHKD",
-        "USDHNT",
-        "USDHRK",
-        "USDHUF",
-        "USDICP",
-        "USDIDR",
-        "USDILS",
-        "USDINR",
-        "USDISK",
-        "USDJPY",
-        "USDKES",
-        "USDKRW",
-        "USDKWD",
-        "USDLINK",
-        "USDLRC",
-        "USDLTC",
-        "USDLUNA",
-        "USDMAD",
-        "USDMANA",
-        "USDMATIC",
-        "USDMUR",
-        "USDMXN",
-        "USDMYR",
-        "USDNEAR",
-        "USDNEO",
-        "USDNGN",
-        "USDNOK",
-        "USDNZD",
-        "USDOMR",
-        "USDPEN",
-        "USDPHP",
-        "USDPLN",
-        "USDQAR",
-        "USDRON",
-        "USDROSE",
-        "USDRUB",
-        "USDSAND",
-        "USDSAR",
-        "USDSEK",
-        "USDSGD",
-        "USDSHIB",
-        "USDSOL",
-        "USDTHB",
-        "USDTHETA",
-        "USDTRX",
-        "USDTRY",
-        "USDTWD",
-        "USDUNI",
-        "USDUSDT",
-        "USDUST",
-        "USDVET",
-        "USDVND",
-        "USDXAG",
-        "USDXAU",
-        "USDXLM",
-        "USDXMR",
-        "USDXOF",
-        "USDXPD",
-        "USDXPT",
-        "USDXRP",
-        "USDXTZ",
-        "USDZAR",
-        "USDZWL",
-        "USDTALL",
-        "USDTADA",
-        "USDTAED",
-        "USDTARS",
-        "USDTATOM",
-        "USDTAUD",
-        "USDTAVAX",
-        "USDTAXS",
-        "USDTBCH",
-        "USDTBGN",
-        "USDTBHD",
-        "USDTBNB",
-        "USDTBRL",
-        "USDTBTC",
-        "USDTBTG",
-        "USDTBUSD",
-        "USDTCAD",
-        "USDTCHF",
-        "USDTCLP",
-        "USDTCNY",
-        "USDTCNH",
-        "USDTCOP",
-        "USDTCZK",
-        "USDTDAI",
-        "USDTDASH",
-        "USDTDKK",
-        "USDTDOGE",
-        "USDTDOT",
-        "USDTEGLD",
-        "USDTENJ",
-        "USDTEOS",
-        "USDTETC",
-        "USDTETH",
-        "USDTEUR",
-        "USDTFIL",
-        "USDTFLOW",
-        "USDTFTM",
-        "USDTFTT",
-        "USDTGALA",
-        "USDTGBP",
-        "USDTGHS",
-        "USDTHBAR",
-        "USDTHKD",
-        "USDTHNT",
-        "USDTHRK",
-        "USDTHUF",
-        "USDTICP",
-        "USDTIDR",
-        "USDTILS",
-        "USDTINR",
-        "USDTISK",
-        "USDTJPY",
-        "USDTKES",
-        "USDTKRW",
-        "USDTKWD",
-        "USDTLINK",
-        "USDTLRC",
-        "USDTLTC",
-        "USDTLUNA",
-        "USDTMAD",
-        "USDTMANA",
-        "USDTMATIC",
-        "USDTMUR",
-        "USDTMXN",
-        "USDTMYR",
-        "USDTNEAR",
-        "USDTNEO",
-        "USDTNGN",
-        "USDTNOK",
-        "USDTNZD",
-        "USDTOMR",
-        "USDTPEN",
-        "USDTPHP",
-        "USDTPLN",
-        "USDTQAR",
-        "USDTRON",
-        "USDTROSE",
-        "USDTRUB",
-        "USDTSAND",
-        "USDTSAR",
-        "USDTSEK",
-        "USDTSGD",
-        "USDTSHIB",
-        "USDTSOL",
-        "USDTTHB",
-        "USDTTHETA",
-        "USDTTRX",
-        "USDTTRY",
-        "USDTTWD",
-        "USDTUNI",
-        "USDTUSD",
-        "USDTUST",
-        "USDTVET",
-        "USDTVND",
-        "USDTXAG",
-        "USDTXAU",
-        "USDTXLM",
-        "USDTXMR",
-        "USDTXOF",
-        "USDTXPD",
-        "USDTXPT",
-        "USDTXRP",
-        "USDTXTZ",
-        "USDTZAR",
-        "USDTZWL",
-        "USTALL",
-        "USTADA",
-        "USTAED",
-        "USTARS",
-        "USTATOM",
-        "USTAUD",
-        "USTAVAX",
-        "USTAXS",
-        "USTBCH",
-        "USTBGN",
-        "USTBHD",
-        "USTBNB",
-        "USTBRL",
-        "USTBTC",
-        "USTBTG",
-        "USTBUSD",
-        "USTCAD",
-        "USTCHF",
-        "USTCLP",
-        "USTCNY",
-        "USTCNH",
-        "USTCOP",
-        "USTCZK",
-        "USTDAI",
-        "USTDASH",
-        "USTDKK",
-        "USTDOGE",
-        "USTDOT",
-        "USTEGLD",
-        "USTENJ",
-        "USTEOS",
-        "USTETC",
-        "USTETH",
-        "USTEUR",
-        "USTFIL",
-        "USTFLOW",
-        "USTFTM",
-        "USTFTT",
-        "USTGALA",
-        "USTGBP",
-        "USTGHS",
-        "USTHBAR",
-        "USTHKD",
-        "USTHNT",
-        "USTHRK",
-        "USTHUF",
-        "USTICP",
-        "USTIDR",
-        "USTILS",
-        "USTINR",
-        "USTISK",
-        "USTJPY",
-        "USTKES",
-        "USTKRW",
-        "USTKWD",
-        "USTLINK",
-        "USTLRC",
-        "USTLTC",
-        "USTLUNA",
-        "USTMAD",
-        "USTMANA",
-        "USTMATIC",
-        "USTMUR",
-        "USTMXN",
-        "USTMYR",
-        "USTNEAR",
-        "USTNEO",
-        "USTNGN",
-        "USTNOK",
-        "USTNZD",
-        "USTOMR",
-        "USTPEN",
-        "USTPHP",
-        "USTPLN",
-        "USTQAR",
-        "USTRON",
-        "USTROSE",
-        "USTRUB",
-        "USTSAND",
-        "USTSAR",
-        "USTSEK",
-        "USTSGD",
-        "USTSHIB",
-        "USTSOL",
-        "USTTHB",
-        "USTTHETA",
-        "USTTRX",
-        "USTTRY",
-        "USTTWD",
-        "USTUNI",
-        "USTUSD",
-        "USTUSDT",
-        "USTVET",
-        "USTVND",
-        "USTXAG",
-        "USTXAU",
-        "USTXLM",
-        "USTXMR",
-        "USTXOF",
-        "USTXPD",
-        "USTXPT",
-        "USTXRP",
-        "USTXTZ",
-        "USTZAR",
-        "USTZWL",
-        "VETALL",
-        "VETADA",
-        "VETAED",
-        "VETARS",
-        "VETATOM",
-        "VETAUD",
-        "VETAVAX",
-        "VETAXS",
-        "VETBCH",
-        "VETBGN",
-        "VETBHD",
-        "VETBNB",
-        "VETBRL",
-        "VETBTC",
-        "VETBTG",
-        "VETBUSD",
-        "VETCAD",
-        "VETCHF",
-        "VETCLP",
-        "VETCNY",
-        "VETCNH",
-        "VETCOP",
-        "VETCZK",
-        "VETDAI",
-        "VETDASH",
-        "VETDKK",
-        "VETDOGE",
-        "VETDOT",
-        "VETEGLD",
-        "VETENJ",
-        "VETEOS",
-        "VETETC",
-        "VETETH",
-        "VETEUR",
-        "VETFIL",
-        "VETFLOW",
-        "VETFTM",
-        "VETFTT",
-        "VETGALA",
-        "VETGBP",
-        "VETGHS",
-        "VETHBAR",
-        "VETHKD",
-        "VETHNT",
-        "VETHRK",
-        "VETHUF",
-        "VETICP",
-        "VETIDR",
-        "VETILS",
-        "VETINR",
-        "VETISK",
-        "VETJPY",
-        "VETKES",
-        "VETKRW",
-        "VETKWD",
-        "VETLINK",
-        "VETLRC",
-        "VETLTC",
-        "VETLUNA",
-        "VETMAD",
-        "VETMANA",
-        "VETMATIC",
-        "VETMUR",
-        "VETMXN",
-        "VETMYR",
-        "VETNEAR",
-        "VETNEO",
-        "VETNGN",
-        "VETNOK",
-        "VETNZD",
-        "VETOMR",
-        "VETPEN",
-        "VETPHP",
-        "VETPLN",
-        "VETQAR",
-        "VETRON",
-        "VETROSE",
-        "VETRUB",
-        "VETSAND",
-        "VETSAR",
-        "VETSEK",
-        "VETSGD",
-        "VETSHIB",
-        "VETSOL",
-        "VETTHB",
-        "VETTHETA",
-        "VETTRX",
-        "VETTRY",
-        "VETTWD",
-        "VETUNI",
-        "VETUSD",
-        "VETUSDT",
-        "VETUST",
-        "VETVND",
-        "VETXAG",
-        "VETXAU",
-        "VETXLM",
-        "VETXMR",
-        "VETXOF",
-        "VETXPD",
-        "VETXPT",
-        "VETXRP",
-        "VETXTZ",
-        "VETZAR",
-        "VETZWL",
-        "VNDALL",
-        "VNDADA",
-        "VNDAED",
-        "VNDARS",
-        "VNDATOM",
-        "VNDAUD",
-        "VNDAVAX",
-        "VNDAXS",
-        "VNDBCH",
-        "VNDBGN",
-        "VNDBHD",
-        "VNDBNB",
-        "VNDBRL",
-        "VNDBTC",
-        "VNDBTG",
-        "VNDBUSD",
-        "VNDCAD",
-        "VNDCHF",
-        "VNDCLP",
-        "VNDCNY",
-        "VNDCNH",
-        "VNDCOP",
-        "VNDCZK",
-        "VNDDAI",
-        "VNDDASH",
-        "VNDDKK",
-        "VNDDOGE",
-        "VNDDOT",
-        "VNDEGLD",
-        "VNDENJ",
-        "VNDEOS",
-        "VNDETC",
-        "VNDETH",
-        "VNDEUR",
-        "VNDFIL",
-        "VNDFLOW",
-        "VNDFTM",
-        "VNDFTT",
-        "VNDGALA",
-        "VNDGBP",
-        "VNDGHS",
-        "VNDHBAR",
-        "VNDHKD",
-        "VNDHNT",
-        "VNDHRK",
-        "VNDHUF",
-        "VNDICP",
-        "VNDIDR",
-        "VNDILS",
-        "VNDINR",
-        "VNDISK",
-        "VNDJPY",
-        "VNDKES",
-        "VNDKRW",
-        "VNDKWD",
-        "VNDLINK",
-        "VNDLRC",
-        "VNDLTC",
-        "VNDLUNA",
-        "VNDMAD",
-        "VNDMANA",
-        "VNDMATIC",
-        "VNDMUR",
-        "VNDMXN",
-        "VNDMYR",
-        "VNDNEAR",
-        "VNDNEO",
-        "VNDNGN",
-        "VNDNOK",
-        "VNDNZD",
-        "VNDOMR",
-        "VNDPEN",
-        "VNDPHP",
-        "VNDPLN",
-        "VNDQAR",
-        "VNDRON",
-        "VNDROSE",
-        "VNDRUB",
-        "VNDSAND",
-        "VNDSAR",
-        "VNDSEK",
-        "VNDSGD",
-        "VNDSHIB",
-        "VNDSOL",
-        "VNDTHB",
-        "VNDTHETA",
-        "VNDTRX",
-        "VNDTRY",
-        "VNDTWD",
-        "VNDUNI",
-        "VNDUSD",
-        "VNDUSDT",
-        "VNDUST",
-        "VNDVET",
-        "VNDXAG",
-        "VNDXAU",
-        "VNDXLM",
-        "VNDXMR",
-        "VNDXOF",
-        "VNDXPD",
-        "VNDXPT",
-        "VNDXRP",
-        "VNDXTZ",
-        "VNDZAR",
-        "VNDZWL",
-        "XAGALL",
-        "XAGADA",
-        "XAGAED",
-        "XAGARS",
-        "XAGATOM",
-        "XAGAUD",
-        "XAGAVAX",
-        "XAGAXS",
-        "XAGBCH",
-        "XAGBGN",
-        "XAGBHD",
-        "XAGBNB",
-        "XAGBRL",
-        "XAGBTC",
-        "XAGBTG",
-        "XAGBUSD",
-        "XAGCAD",
-        "XAGCHF",
-        "XAGCLP",
-        "XAGCNY",
-        "XAGCNH",
-        "XAGCOP",
-        "XAGCZK",
-        "XAGDAI",
-        "XAGDASH",
-        "XAGDKK",
-        "XAGDOGE",
-        "XAGDOT",
-        "XAGEGLD",
-        "XAGENJ",
-        "XAGEOS",
-        "XAGETC",
-        "XAGETH",
-        "XAGEUR",
-        "XAGFIL",
-        "XAGFLOW",
-        "XAGFTM",
-        "XAGFTT",
-        "XAGGALA",
-        "XAGGBP",
-        "XAGGHS",
-        "XAGHBAR",
-        "XAGHKD",
-        "XAGHNT",
-        "XAGHRK",
-        "XAGHUF",
-        "XAGICP",
-        "XAGIDR",
-        "XAGILS",
-        "XAGINR",
-        "XAGISK",
-        "XAGJPY",
-        "XAGKES",
-        "XAGKRW",
-        "XAGKWD",
-        "XAGLINK",
-        "XAGLRC",
-        "XAGLTC",
-        "XAGLUNA",
-        "XAGMAD",
-        "XAGMANA",
-        "XAGMATIC",
-        "XAGMUR",
-        "XAGMXN",
-        "XAGMYR",
-        "XAGNEAR",
-        "XAGNEO",
-        "XAGNGN",
-        "XAGNOK",
-        "XAGNZD",
-        "XAGOMR",
-        "XAGPEN",
-        "XAGPHP",
-        "XAGPLN",
-        "XAGQAR",
-        "XAGRON",
-        "XAGROSE",
-        "XAGRUB",
-        "XAGSAND",
-        "XAGSAR",
-        "XAGSEK",
-        "XAGSGD",
-        "XAGSHIB",
-        "XAGSOL",
-        "XAGTHB",
-        "XAGTHETA",
-        "XAGTRX",
-        "XAGTRY",
-        "XAGTWD",
-        "XAGUNI",
-        "XAGUSD",
-        "XAGUSDT",
-        "XAGUST",
-        "XAGVET",
-        "XAGVND",
-        "XAGXAU",
-        "XAGXLM",
-        "XAGXMR",
-        "XAGXOF",
-        "XAGXPD",
-        "XAGXPT",
-        "XAGXRP",
-        "XAGXTZ",
-        "XAGZAR",
-        "XAGZWL",
-        "XAUALL",
-        "XAUADA",
-        "XAUAED",
-        "XAUARS",
-        "XAUATOM",
-        "XAUAUD",
-        "XAUAVAX",
-        "XAUAXS",
-        "XAUBCH",
-        "XAUBGN",
-        "XAUBHD",
-        "XAUBNB",
-        "XAUBRL",
-        "XAUBTC",
-        "XAUBTG",
-        "XAUBUSD",
-        "XAUCAD",
-        "XAUCHF",
-        "XAUCLP",
-        "XAUCNY",
-        "XAUCNH",
-        "XAUCOP",
-        "XAUCZK",
-        "XAUDAI",
-        "XAUDASH",
-        "XAUDKK",
-        "XAUDOGE",
-        "XAUDOT",
-        "XAUEGLD",
-        "XAUENJ",
-        "XAUEOS",
-        "XAUETC",
-        "XAUETH",
-        "XAUEUR",
-        "XAUFIL",
-        "XAUFLOW",
-        "XAUFTM",
-        "XAUFTT",
-        "XAUGALA",
-        "XAUGBP",
-        "XAUGHS",
-        "XAUHBAR",
-        "XAUHKD",
-        "XAUHNT",
-        "XAUHRK",
-        "XAUHUF",
-        "XAUICP",
-        "XAUIDR",
-        "XAUILS",
-        "XAUINR",
-        "XAUISK",
-        "XAUJPY",
-        "XAUKES",
-        "XAUKRW",
-        "XAUKWD",
-        "XAULINK",
-        "XAULRC",
-        "XAULTC",
-        "XAULUNA",
-        "XAUMAD",
-        "XAUMANA",
-        "XAUMATIC",
-        "XAUMUR",
-        "XAUMXN",
-        "XAUMYR",
-        "XAUNEAR",
-        "XAUNEO",
-        "XAUNGN",
-        "XAUNOK",
-        "XAUNZD",
-        "XAUOMR",
-        "XAUPEN",
-        "XAUPHP",
-        "XAUPLN",
-        "XAUQAR",
-        "XAURON",
-        "XAUROSE",
-        "XAURUB",
-        "XAUSAND",
-        "XAUSAR",
-        "XAUSEK",
-        "XAUSGD",
-        "XAUSHIB",
-        "XAUSOL",
-        "XAUTHB",
-        "XAUTHETA",
-        "XAUTRX",
-        "XAUTRY",
-        "XAUTWD",
-        "XAUUNI",
-        "XAUUSD",
-        "XAUUSDT",
-        "XAUUST",
-        "XAUVET",
-        "XAUVND",
-        "XAUXAG",
-        "XAUXLM",
-        "XAUXMR",
-        "XAUXOF",
-        "XAUXPD",
-        "XAUXPT",
-        "XAUXRP",
-        "XAUXTZ",
-        "XAUZAR",
-        "XAUZWL",
-        "XLMALL",
-        "XLMADA",
-        "XLMAED",
-        "XLMARS",
-        "XLMATOM",
-        "XLMAUD",
-        "XLMAVAX",
-        "XLMAXS",
-        "XLMBCH",
-        "XLMBGN",
-        "XLMBHD",
-        "XLMBNB",
-        "XLMBRL",
-        "XLMBTC",
-        "XLMBTG",
-        "XLMBUSD",
-        "XLMCAD",
-        "XLMCHF",
-        "XLMCLP",
-        "XLMCNY",
-        "XLMCNH",
-        "XLMCOP",
-        "XLMCZK",
-        "XLMDAI",
-        "XLMDASH",
-        "XLMDKK",
-        "XLMDOGE",
-        "XLMDOT",
-        "XLMEGLD",
-        "XLMENJ",
-        "XLMEOS",
-        "XLMETC",
-        "XLMETH",
-        "XLMEUR",
-        "XLMFIL",
-        "XLMFLOW",
-        "XLMFTM",
-        "XLMFTT",
-        "XLMGALA",
-        "XLMGBP",
-        "XLMGHS",
-        "XLMHBAR",
-        "XLMHKD",
-        "XLMHNT",
-        "XLMHRK",
-        "XLMHUF",
-        "XLMICP",
-        "XLMIDR",
-        "XLMILS",
-        "XLMINR",
-        "XLMISK",
-        "XLMJPY",
-        "XLMKES",
-        "XLMKRW",
-        "XLMKWD",
-        "XLMLINK",
-        "XLMLRC",
-        "XLMLTC",
-        "XLMLUNA",
-        "XLMMAD",
-        "XLMMANA",
-        "XLMMATIC",
-        "XLMMUR",
-        "XLMMXN",
-        "XLMMYR",
-        "XLMNEAR",
-        "XLMNEO",
-        "XLMNGN",
-        "XLMNOK",
-        "XLMNZD",
-        "XLMOMR",
-        "XLMPEN",
-        "XLMPHP",
-        "XLMPLN",
-        "XLMQAR",
-        "XLMRON",
-        "XLMROSE",
-        "XLMRUB",
-        "XLMSAND",
-        "XLMSAR",
-        "XLMSEK",
-        "XLMSGD",
-        "XLMSHIB",
-        "XLMSOL",
-        "XLMTHB",
-        "XLMTHETA",
-        "XLMTRX",
-        "XLMTRY",
-        "XLMTWD",
-        "XLMUNI",
-        "XLMUSD",
-        "XLMUSDT",
-        "XLMUST",
-        "XLMVET",
-        "XLMVND",
-        "XLMXAG",
-        "XLMXAU",
-        "XLMXMR",
-        "XLMXOF",
-        "XLMXPD",
-        "XLMXPT",
-        "XLMXRP",
-        "XLMXTZ",
-        "XLMZAR",
-        "XLMZWL",
-        "XMRALL",
-        "XMRADA",
-        "XMRAED",
-        "XMRARS",
-        "XMRATOM",
-        "XMRAUD",
-        "XMRAVAX",
-        "XMRAXS",
-        "XMRBCH",
-        "XMRBGN",
-        "XMRBHD",
-        "XMRBNB",
-        "XMRBRL",
-        "XMRBTC",
-        "XMRBTG",
-        "XMRBUSD",
-        "XMRCAD",
-        "XMRCHF",
-        "XMRCLP",
-        "XMRCNY",
-        "XMRCNH",
-        "XMRCOP",
-        "XMRCZK",
-        "XMRDAI",
-        "XMRDASH",
-        "XMRDKK",
-        "XMRDOGE",
-        "XMRDOT",
-        "XMREGLD",
-        "XMRENJ",
-        "XMREOS",
-        "XMRETC",
-        "XMRETH",
-        "XMREUR",
-        "XMRFIL",
-        "XMRFLOW",
-        "XMRFTM",
-        "XMRFTT",
-        "XMRGALA",
-        "XMRGBP",
-        "XMRGHS",
-        "XMRHBAR",
-        "XMRHKD",
-        "XMRHNT",
-        "XMRHRK",
-        "XMRHUF",
-        "XMRICP",
-        "XMRIDR",
-        "XMRILS",
-        "XMRINR",
-        "XMRISK",
-        "XMRJPY",
-        "XMRKES",
-        "XMRKRW",
-        "XMRKWD",
-        "XMRLINK",
-        "XMRLRC",
-        "XMRLTC",
-        "XMRLUNA",
-        "XMRMAD",
-        "XMRMANA",
-        "XMRMATIC",
-        "XMRMUR",
-        "XMRMXN",
-        "XMRMYR",
-        "XMRNEAR",
-        "XMRNEO",
-        "XMRNGN",
-        "XMRNOK",
-        "XMRNZD",
-        "XMROMR",
-        "XMRPEN",
-        "XMRPHP",
-        "XMRPLN",
-        "XMRQAR",
-        "XMRRON",
-        "XMRROSE",
-        "XMRRUB",
-        "XMRSAND",
-        "XMRSAR",
-        "XMRSEK",
-        "XMRSGD",
-        "XMRSHIB",
-        "XMRSOL",
-        "XMRTHB",
-        "XMRTHETA",
-        "XMRTRX",
-        "XMRTRY",
-        "XMRTWD",
-        "XMRUNI",
-        "XMRUSD",
-        "XMRUSDT",
-        "XMRUST",
-        "XMRVET",
-        "XMRVND",
-        "XMRXAG",
-        "XMRXAU",
-        "XMRXLM",
-        "XMRXOF",
-        "XMRXPD",
-        "XMRXPT",
-        "XMRXRP",
-        "XMRXTZ",
-        "XMRZAR",
-        "XMRZWL",
-        "XOFALL",
-        "XOFADA",
-        "XOFAED",
-        "XOFARS",
-        "XOFATOM",
-        "XOFAUD",
-        "XOFAVAX",
-        "XOFAXS",
-        "XOFBCH",
-        "XOFBGN",
-        "XOFBHD",
-        "XOFBNB",
-        "XOFBRL",
-        "XOFBTC",
-        "XOFBTG",
-        "XOFBUSD",
-        "XOFCAD",
-        "XOFCHF",
-        "XOFCLP",
-        "XOFCNY",
-        "XOFCNH",
-        "XOFCOP",
-        "XOFCZK",
-        "XOFDAI",
-        "XOFDASH",
-        "XOFDKK",
-        "XOFDOGE",
-        "XOFDOT",
-        "XOFEGLD",
-        "XOFENJ",
-        "XOFEOS",
-        "XOFETC",
-        "XOFETH",
-        "XOFEUR",
-        "XOFFIL",
-        "XOFFLOW",
-        "XOFFTM",
-        "XOFFTT",
-        "XOFGALA",
-        "XOFGBP",
-        "XOFGHS",
-        "XOFHBAR",
-        "XOFHKD",
-        "XOFHNT",
-        "XOFHRK",
-        "XOFHUF",
-        "XOFICP",
-        "XOFIDR",
-        "XOFILS",
-        "XOFINR",
-        "XOFISK",
-        "XOFJPY",
-        "XOFKES",
-        "XOFKRW",
-        "XOFKWD",
-        "XOFLINK",
-        "XOFLRC",
-        "XOFLTC",
-        "XOFLUNA",
-        "XOFMAD",
-        "XOFMANA",
-        "XOFMATIC",
-        "XOFMUR",
-        "XOFMXN",
-        "XOFMYR",
-        "XOFNEAR",
-        "XOFNEO",
-        "XOFNGN",
-        "XOFNOK",
-        "XOFNZD",
-        "XOFOMR",
-        "XOFPEN",
-        "XOFPHP",
-        "XOFPLN",
-        "XOFQAR",
-        "XOFRON",
-        "XOFROSE",
-        "XOFRUB",
-        "XOFSAND",
-        "XOFSAR",
-        "XOFSEK",
-        "XOFSGD",
-        "XOFSHIB",
-        "XOFSOL",
-        "XOFTHB",
-        "XOFTHETA",
-        "XOFTRX",
-        "XOFTRY",
-        "XOFTWD",
-        "XOFUNI",
-        "XOFUSD",
-        "XOFUSDT",
-        "XOFUST",
-        "XOFVET",
-        "XOFVND",
-        "XOFXAG",
-        "XOFXAU",
-        "XOFXLM",
-        "XOFXMR",
-        "XOFXPD",
-        "XOFXPT",
-        "XOFXRP",
-        "XOFXTZ",
-        "XOFZAR",
-        "XOFZWL",
-        "XPDALL",
-        "XPDADA",
-        "XPDAED",
-        "XPDARS",
-        "XPDATOM",
-        "XPDAUD",
-        "XPDAVAX",
-        "XPDAXS",
-        "XPDBCH",
-        "XPDBGN",
-        "XPDBHD",
-        "XPDBNB",
-        "XPDBRL",
-        "XPDBTC",
-        "XPDBTG",
-        "XPDBUSD",
-        "XPDCAD",
-        "XPDCHF",
-        "XPDCLP",
-        "XPDCNY",
-        "XPDCNH",
-        "XPDCOP",
-        "XPDCZK",
-        "XPDDAI",
-        "XPDDASH",
-        "XPDDKK",
-        "XPDDOGE",
-        "XPDDOT",
-        "XPDEGLD",
-        "XPDENJ",
-        "XPDEOS",
-        "XPDETC",
-        "XPDETH",
-        "XPDEUR",
-        "XPDFIL",
-        "XPDFLOW",
-        "XPDFTM",
-        "XPDFTT",
-        "XPDGALA",
-        "XPDGBP",
-        "XPDGHS",
-        "XPDHBAR",
-        "XPDHKD",
-        "XPDHNT",
-        "XPDHRK",
-        "XPDHUF",
-        "XPDICP",
-        "XPDIDR",
-        "XPDILS",
-        "XPDINR",
-        "XPDISK",
-        "XPDJPY",
-        "XPDKES",
-        "XPDKRW",
-        "XPDKWD",
-        "XPDLINK",
-        "XPDLRC",
-        "XPDLTC",
-        "XPDLUNA",
-        "XPDMAD",
-        "XPDMANA",
-        "XPDMATIC",
-        "XPDMUR",
-        "XPDMXN",
-        "XPDMYR",
-        "XPDNEAR",
-        "XPDNEO",
-        "XPDNGN",
-        "XPDNOK",
-        "XPDNZD",
-        "XPDOMR",
-        "XPDPEN",
-        "XPDPHP",
-        "XPDPLN",
-        "XPDQAR",
-        "XPDRON",
-        "XPDROSE",
-        "XPDRUB",
-        "XPDSAND",
-        "XPDSAR",
-        "XPDSEK",
-        "XPDSGD",
-        "XPDSHIB",
-        "XPDSOL",
-        "XPDTHB",
-        "XPDTHETA",
-        "XPDTRX",
-        "XPDTRY",
-        "XPDTWD",
-        "XPDUNI",
-        "XPDUSD",
-        "XPDUSDT",
-        "XPDUST",
-        "XPDVET",
-        "XPDVND",
-        "XPDXAG",
-        "XPDXAU",
-        "XPDXLM",
-        "XPDXMR",
-        "XPDXOF",
-        "XPDXPT",
-        "XPDXRP",
-        "XPDXTZ",
-        "XPDZAR",
-        "XPDZWL",
-        "XPTALL",
-        "XPTADA",
-        "XPTAED",
-        "XPTARS",
-        "XPTATOM",
-        "XPTAUD",
-        "XPTAVAX",
-        "XPTAXS",
-        "XPTBCH",
-        "XPTBGN",
-        "XPTBHD",
-        "XPTBNB",
-        "XPTBRL",
-        "XPTBTC",
-        "XPTBTG",
-        "XPTBUSD",
-        "XPTCAD",
-        "XPTCHF",
-        "XPTCLP",
-        "XPTCNY",
-        "XPTCNH",
-        "XPTCOP",
-        "XPTCZK",
-        "XPTDAI",
-        "XPTDASH",
-        "XPTDKK",
-        "XPTDOGE",
-        "XPTDOT",
-        "XPTEGLD",
-        "XPTENJ",
-        "XPTEOS",
-        "XPTETC",
-        "XPTETH",
-        "XPTEUR",
-        "XPTFIL",
-        "XPTFLOW",
-        "XPTFTM",
-        "XPTFTT",
-        "XPTGALA",
-        "XPTGBP",
-        "XPTGHS",
-        "XPTHBAR",
-        "XPTHKD",
-        "XPTHNT",
-        "XPTHRK",
-        "XPTHUF",
-        "XPTICP",
-        "XPTIDR",
-        "XPTILS",
-        "XPTINR",
-        "XPTISK",
-        "XPTJPY",
-        "XPTKES",
-        "XPTKRW",
-        "XPTKWD",
-        "XPTLINK",
-        "XPTLRC",
-        "XPTLTC",
-        "XPTLUNA",
-        "XPTMAD",
-        "XPTMANA",
-        "XPTMATIC",
-        "XPTMUR",
-        "XPTMXN",
-        "XPTMYR",
-        "XPTNEAR",
-        "XPTNEO",
-        "XPTNGN",
-        "XPTNOK",
-        "XPTNZD",
-        "XPTOMR",
-        "XPTPEN",
-        "XPTPHP",
-        "XPTPLN",
-        "XPTQAR",
-        "XPTRON",
-        "XPTROSE",
-        "XPTRUB",
-        "XPTSAND",
-        "XPTSAR",
-        "XPTSEK",
-        "XPTSGD",
-        "XPTSHIB",
-        "XPTSOL",
-        "XPTTHB",
-        "XPTTHETA",
-        "XPTTRX",
-        "XPTTRY",
-        "XPTTWD",
-        "XPTUNI",
-        "XPTUSD",
-        "XPTUSDT",
-        "XPTUST",
-        "XPTVET",
-        "XPTVND",
-        "XPTXAG",
-        "XPTXAU",
-        "XPTXLM",
-        "XPTXMR",
-        "XPTXOF",
-        "XPTXPD",
-        "XPTXRP",
-        "XPTXTZ",
-        "XPTZAR",
-        "XPTZWL",
-        "XRPALL",
-        "XRPADA",
-        "XRPAED",
-        "XRPARS",
-        "XRPATOM",
-        "XRPAUD",
-        "XRPAVAX",
-        "XRPAXS",
-        "XRPBCH",
-        "XRPBGN",
-        "XRPBHD",
-        "XRPBNB",
-        "XRPBRL",
-        "XRPBTC",
-        "XRPBTG",
-        "XRPBUSD",
-        "XRPCAD",
-        "XRPCHF",
-        "XRPCLP",
-        "XRPCNY",
-        "XRPCNH",
-        "XRPCOP",
-        "XRPCZK",
-        "XRPDAI",
-        "XRPDASH",
-        "XRPDKK",
-        "XRPDOGE",
-        "XRPDOT",
-        "XRPEGLD",
-        "XRPENJ",
-        "XRPEOS",
-        "XRPETC",
-        "XRPETH",
-        "XRPEUR",
-        "XRPFIL",
-        "XRPFLOW",
-        "XRPFTM",
-        "XRPFTT",
-        "XRPGALA",
-        "XRPGBP",
-        "XRPGHS",
-        "XRPHBAR",
-        "XRPHKD",
-        "XRPHNT",
-        "XRPHRK",
-        "XRPHUF",
-        "XRPICP",
-        "XRPIDR",
-        "XRPILS",
-        "XRPINR",
-        "XRPISK",
-        "XRPJPY",
-        "XRPKES",
-        "XRPKRW",
-        "XRPKWD",
-        "XRPLINK",
-        "XRPLRC",
-        "XRPLTC",
-        "XRPLUNA",
-        "XRPMAD",
-        "XRPMANA",
-        "XRPMATIC",
-        "XRPMUR",
-        "XRPMXN",
-        "XRPMYR",
-        "XRPNEAR",
-        "XRPNEO",
-        "XRPNGN",
-        "XRPNOK",
-        "XRPNZD",
-        "XRPOMR",
-        "XRPPEN",
-        "XRPPHP",
-        "XRPPLN",
-        "XRPQAR",
-        "XRPRON",
-        "XRPROSE",
-        "XRPRUB",
-        "XRPSAND",
-        "XRPSAR",
-        "XRPSEK",
-        "XRPSGD",
-        "XRPSHIB",
-        "XRPSOL",
-        "XRPTHB",
-        "XRPTHETA",
-        "XRPTRX",
-        "XRPTRY",
-        "XRPTWD",
-        "XRPUNI",
-        "XRPUSD",
-        "XRPUSDT",
-        "XRPUST",
-        "XRPVET",
-        "XRPVND",
-        "XRPXAG",
-        "XRPXAU",
-        "XRPXLM",
-        "XRPXMR",
-        "XRPXOF",
-        "XRPXPD",
-        "XRPXPT",
-        "XRPXTZ",
-        "XRPZAR",
-        "XRPZWL",
-        "XTZALL",
-        "XTZADA",
-        "XTZAED",
-        "XTZARS",
-        "XTZATOM",
-        "XTZAUD",
-        "XTZAVAX",
-        "XTZAXS",
-        "XTZBCH",
-        "XTZBGN",
-        "XTZBHD",
-        "XTZBNB",
-        "XTZBRL",
-        "XTZBTC",
-        "XTZBTG",
-        "XTZBUSD",
-        "XTZCAD",
-        "XTZCHF",
-        "XTZCLP",
-        "XTZCNY",
-        "XTZCNH",
-        "XTZCOP",
-        "XTZCZK",
-        "XTZDAI",
-        "XTZDASH",
-        "XTZDKK",
-        "XTZDOGE",
-        "XTZDOT",
-        "XTZEGLD",
-        "XTZENJ",
-        "XTZEOS",
-        "XTZETC",
-        "XTZETH",
-        "XTZEUR",
-        "XTZFIL",
-        "XTZFLOW",
-        "XTZFTM",
-        "XTZFTT",
-        "XTZGALA",
-        "XTZGBP",
-        "XTZGHS",
-        "XTZHBAR",
-        "XTZHKD",
-        "XTZHNT",
-        "XTZHRK",
-        "XTZHUF",
-        "XTZICP",
-        "XTZIDR",
-        "XTZILS",
-        "XTZINR",
-        "XTZISK",
-        "XTZJPY",
-        "XTZKES",
-        "XTZKRW",
-        "XTZKWD",
-        "XTZLINK",
-        "XTZLRC",
-        "XTZLTC",
-        "XTZLUNA",
-        "XTZMAD",
-        "XTZMANA",
-        "XTZMATIC",
-        "XTZMUR",
-        "XTZMXN",
-        "XTZMYR",
-        "XTZNEAR",
-        "XTZNEO",
-        "XTZNGN",
-        "XTZNOK",
-        "XTZNZD",
-        "XTZOMR",
-        "XTZPEN",
-        "XTZPHP",
-        "XTZPLN",
-        "XTZQAR",
-        "XTZRON",
-        "XTZROSE",
-        "XTZRUB",
-        "XTZSAND",
-        "XTZSAR",
-        "XTZSEK",
-        "XTZSGD",
-        "XTZSHIB",
-        "XTZSOL",
-        "XTZTHB",
-        "XTZTHETA",
-        "XTZTRX",
-        "XTZTRY",
-        "XTZTWD",
-        "XTZUNI",
-        "XTZUSD",
-        "XTZUSDT",
-        "XTZUST",
-        "XTZVET",
-        "XTZVND",
-        "XTZXAG",
-        "XTZXAU",
-        "XTZXLM",
-        "XTZXMR",
-        "XTZXOF",
-        "XTZXPD",
-        "XTZXPT",
-        "XTZXRP",
-        "XTZZAR",
-        "XTZZWL",
-        "ZARALL",
-        "ZARADA",
-        "ZARAED",
-        "ZARARS",
-        "ZARATOM",
-        "ZARAUD",
-        "ZARAVAX",
-        "ZARAXS",
-        "ZARBCH",
-        "ZARBGN",
-        "ZARBHD",
-        "ZARBNB",
-        "ZARBRL",
-        "ZARBTC",
-        "ZARBTG",
-        "ZARBUSD",
-        "ZARCAD",
-        "ZARCHF",
-        "ZARCLP",
-        "ZARCNY",
-        "ZARCNH",
-        "ZARCOP",
-        "ZARCZK",
-        "ZARDAI",
-        "ZARDASH",
-        "ZARDKK",
-        "ZARDOGE",
-        "ZARDOT",
-        "ZAREGLD",
-        "ZARENJ",
-        "ZAREOS",
-        "ZARETC",
-        "ZARETH",
-        "ZAREUR",
-        "ZARFIL",
-        "ZARFLOW",
-        "ZARFTM",
-        "ZARFTT",
-        "ZARGALA",
-        "ZARGBP",
-        "ZARGHS",
-        "ZARHBAR",
-        "ZARHKD",
-        "ZARHNT",
-        "ZARHRK",
-        "ZARHUF",
-        "ZARICP",
-        "ZARIDR",
-        "ZARILS",
-        "ZARINR",
-        "ZARISK",
-        "ZARJPY",
-        "ZARKES",
-        "ZARKRW",
-        "ZARKWD",
-        "ZARLINK",
-        "ZARLRC",
-        "ZARLTC",
-        "ZARLUNA",
-        "ZARMAD",
-        "ZARMANA",
-        "ZARMATIC",
-        "ZARMUR",
-        "ZARMXN",
-        "ZARMYR",
-        "ZARNEAR",
-        "ZARNEO",
-        "ZARNGN",
-        "ZARNOK",
-        "ZARNZD",
-        "ZAROMR",
-        "ZARPEN",
-        "ZARPHP",
-        "ZARPLN",
-        "ZARQAR",
-        "ZARRON",
-        "ZARROSE",
-        "ZARRUB",
-        "ZARSAND",
-        "ZARSAR",
-        "ZARSEK",
-        "ZARSGD",
-        "ZARSHIB",
-        "ZARSOL",
-        "ZARTHB",
-        "ZARTHETA",
-        "ZARTRX",
-        "ZARTRY",
-        "ZARTWD",
-        "ZARUNI",
-        "ZARUSD",
-        "ZARUSDT",
-        "ZARUST",
-        "ZARVET",
-        "ZARVND",
-        "ZARXAG",
-        "ZARXAU",
-        "ZARXLM",
-        "ZARXMR",
-        "ZARXOF",
-        "ZARXPD",
-        "ZARXPT",
-        "ZARXRP",
-        "ZARXTZ",
-        "ZARZWL",
-        "ZWLALL",
-        "ZWLADA",
-        "ZWLAED",
-        "ZWLARS",
-        "ZWLATOM",
-        "ZWLAUD",
-        "ZWLAVAX",
-        "ZWLAXS",
-        "ZWLBCH",
-        "ZWLBGN",
-        "ZWLBHD",
-        "ZWLBNB",
-        "ZWLBRL",
-        "ZWLBTC",
-        "ZWLBTG",
-        "ZWLBUSD",
-        "ZWLCAD",
-        "ZWLCHF",
-        "ZWLCLP",
-        "ZWLCNY",
-        "ZWLCNH",
-        "ZWLCOP",
-        "ZWLCZK",
-        "ZWLDAI",
-        "ZWLDASH",
-        "ZWLDKK",
-        "ZWLDOGE",
-        "ZWLDOT",
-        "ZWLEGLD",
-        "ZWLENJ",
-        "ZWLEOS",
-        "ZWLETC",
-        "ZWLETH",
-        "ZWLEUR",
-        "ZWLFIL",
-        "ZWLFLOW",
-        "ZWLFTM",
-        "ZWLFTT",
-        "ZWLGALA",
-        "ZWLGBP",
-        "ZWLGHS",
-        "ZWLHBAR",
-        "ZWLHKD",
-        "ZWLHNT",
-        "ZWLHRK",
-        "ZWLHUF",
-        "ZWLICP",
-        "ZWLIDR",
-        "ZWLILS",
-        "ZWLINR",
-        "ZWLISK",
-        "ZWLJPY",
-        "ZWLKES",
-        "ZWLKRW",
-        "ZWLKWD",
-        "ZWLLINK",
-        "ZWLLRC",
-        "ZWLLTC",
-        "ZWLLUNA",
-        "ZWLMAD",
-        "ZWLMANA",
-        "ZWLMATIC",
-        "ZWLMUR",
-        "ZWLMXN",
-        "ZWLMYR",
-        "ZWLNEAR",
-        "ZWLNEO",
-        "ZWLNGN",
-        "ZWLNOK",
-        "ZWLNZD",
-        "ZWLOMR",
-        "ZWLPEN",
-        "ZWLPHP",
-        "ZWLPLN",
-        "ZWLQAR",
-        "ZWLRON",
-        "ZWLROSE",
-        "ZWLRUB",
-        "ZWLSAND",
-        "ZWLSAR",
-        "ZWLSEK",
-        "ZWLSGD",
-        "ZWLSHIB",
-        "ZWLSOL",
-        "ZWLTHB",
-        "ZWLTHETA",
-        "ZWLTRX",
-        "ZWLTRY",
-        "ZWLTWD",
-        "ZWLUNI",
-        "ZWLUSD",
-        "ZWLUSDT",
-        "ZWLUST",
-        "ZWLVET",
-        "ZWLVND",
-        "ZWLXAG",
-        "ZWLXAU",
-        "ZWLXLM",
-        "ZWLXMR",
-        "ZWLXOF",
-        "ZWLXPD",
-        "ZWLXPT",
-        "ZWLXRP",
-        "ZWLXTZ",
-        "ZWLZAR"
-    ]
+    return tuple(_pair_parts())
+
+
+@functools.lru_cache(maxsize=None)
+def get_currency_pairs_set():
+    """Множество валютных пар для проверки принадлежности за O(1)."""
+    return frozenset(_pair_parts())
+
+
+def split_currency_pair(pair):
+    """Возвращает (базовая валюта, котируемая валюта) или None, если такой пары нет."""
+    return _pair_parts().get(pair)
+
+
+@functools.lru_cache(maxsize=None)
+def get_pairs_by_base():
+    """Базовая валюта -> кортеж пар с этой базовой валютой."""
+    return _index_pairs(0)
+
+
+@functools.lru_cache(maxsize=None)
+def get_pairs_by_quote():
+    """Котируемая валюта -> кортеж пар с этой котируемой валютой."""
+    return _index_pairs(1)
+
+
+def _index_pairs(part):
+    index = {currency: [] for currency in get_currencies()}
+    for pair, parts in _pair_parts().items():
+        index[parts[part]].append(pair)
+    return MappingProxyType({currency: tuple(pairs) for currency, pairs in index.items()})
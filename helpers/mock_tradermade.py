@@ -0,0 +1,291 @@
+"""
+Локальная имитация TraderMade timeseries для нагрузочного тестирования без расхода квоты.
+Принимает те же параметры запроса (currency, api_key, start_date, end_date, interval, format=records)
+и отвечает в том же формате records. Свечи либо берутся из записанных ответов биржи (replay),
+либо генерируются (см. benchmarks.synthetic); можно добавить задержку, ответы 429, ошибки 5xx,
+зависания и ответы не в формате JSON.
+
+Запуск из корня проекта:
+    python -m helpers.mock_tradermade --port 8800 --latency 0.05 --rate-limit 0.05 --failures 0.02
+и в config.yaml:
+    exchange_url: http://127.0.0.1:8800/api/v1/timeseries
+"""
+import argparse
+import collections
+import datetime
+import functools
+import json
+import logging
+import random
+import threading
+import time
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+import numpy as np
+
+from benchmarks.synthetic import synthetic_arrays, to_records
+
+_path = '/api/v1/timeseries'
+_required_params = ('currency', 'api_key', 'start_date', 'end_date', 'interval')
+_frequencies = {'hourly': 'H', 'daily': 'D'}
+_steps = {'hourly': datetime.timedelta(hours=1), 'daily': datetime.timedelta(days=1)}
+
+
+class MockTraderMade:
+    """
+    HTTP сервер, отвечающий на запросы timeseries как TraderMade.
+    Источник свечей:
+    payloads - словарь записанных ответов биржи по ключу '<валюта>_<интервал>' или '<валюта>';
+    replay_dir - каталог с такими ответами в файлах '<валюта>_<интервал>.json' или '<валюта>.json';
+    если не задано ни то, ни другое, свечи генерируются: для каждой валюты и интервала строится один
+    ряд от origin, поэтому повторные и пересекающиеся запросы возвращают одни и те же свечи.
+    Записанные ответы возвращаются целиком, при clip_dates=True - только свечи между start_date и end_date.
+    Сбои: latency (+ случайно до jitter) секунд задержки каждого ответа; с вероятностью rate_limit -
+    ответ 429 с заголовком Retry-After, а при key_rate - 429 для ключа, сделавшего больше key_rate
+    запросов за последнюю секунду; failures - ответ 503; timeouts - ответ после hang секунд;
+    junk - ответ 200 не в формате JSON. Если задан api_keys, запросы с другими ключами получают 401.
+    Количество ответов по кодам - в stats().
+    """
+
+    def __init__(self, host='127.0.0.1', port=0, payloads=None, replay_dir=None, clip_dates=False,
+                 latency=0.0, jitter=0.0, rate_limit=0.0, retry_after=1, key_rate=None, failures=0.0,
+                 timeouts=0.0, hang=60.0, junk=0.0, api_keys=None, origin='2020-01-01', seed=0,
+                 synthetic_options=None, logger=logging.getLogger('mock_tradermade')):
+        self._logger = logger
+        self.payloads = dict(payloads or dict())
+        self.replay_dir = Path(replay_dir) if replay_dir else None
+        self.clip_dates = clip_dates
+        self.latency = latency
+        self.jitter = jitter
+        self.rate_limit = rate_limit
+        self.retry_after = retry_after
+        self.key_rate = key_rate
+        self.failures = failures
+        self.timeouts = timeouts
+        self.hang = hang
+        self.junk = junk
+        self.api_keys = set(api_keys) if api_keys else None
+        self.origin = datetime.datetime.fromisoformat(origin)
+        self.seed = seed
+        self.synthetic_options = synthetic_options or dict()
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._key_requests = collections.defaultdict(collections.deque)
+        self._stats = collections.Counter()
+        self._server = ThreadingHTTPServer((host, port), self._handler())
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f'http://{host}:{port}{_path}'
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, name='mock_tradermade', daemon=True)
+        self._thread.start()
+        self._logger.info(f'Имитация TraderMade запущена на {self.url}')
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def serve_forever(self):
+        self._logger.info(f'Имитация TraderMade запущена на {self.url}')
+        try:
+            self._server.serve_forever()
+        finally:
+            self._server.server_close()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return dict(self._stats)
+
+    def respond(self, path, params) -> tuple:
+        """Возвращает (код ответа, заголовки, тело) на запрос path с параметрами params."""
+        if urlparse(path).path.rstrip('/') != _path:
+            return self._error(404, f'{path} - unknown endpoint')
+        missing = [param for param in _required_params if param not in params]
+        if missing:
+            return self._error(400, f'missing parameters: {", ".join(missing)}')
+        if self.api_keys is not None and params['api_key'] not in self.api_keys:
+            return self._error(401, 'invalid api_key')
+        if params['interval'] not in _frequencies:
+            return self._error(400, f'{params["interval"]} - unknown interval, expected one of {list(_frequencies)}')
+        if params.get('format', 'records') != 'records':
+            return self._error(400, 'only format=records is supported')
+
+        with self._lock:
+            roll = self._random.random()
+            rate_limited = roll < self.rate_limit or self._key_limited(params['api_key'])
+        if rate_limited:
+            return self._error(429, 'too many requests', {'Retry-After': str(self.retry_after)})
+        roll -= self.rate_limit
+        if roll < self.failures:
+            return self._error(503, 'service unavailable')
+        roll -= self.failures
+        if roll < self.timeouts:
+            time.sleep(self.hang)
+            return self._error(504, 'gateway timeout')
+        roll -= self.timeouts
+        if roll < self.junk:
+            return 200, {'Content-Type': 'text/html'}, b'<html>maintenance</html>'
+
+        try:
+            start = datetime.datetime.fromisoformat(params['start_date'])
+            end = datetime.datetime.fromisoformat(params['end_date'])
+        except ValueError as ex:
+            return self._error(400, f'invalid date: {ex}')
+        quotes = self._quotes(params['currency'], params['interval'], start, end)
+        if quotes is None:
+            return self._error(400, f'{params["currency"]} - no data for this currency')
+        body = {
+            'base_currency': params['currency'][:3],
+            'quote_currency': params['currency'][3:],
+            'endpoint': 'timeseries',
+            'start_date': params['start_date'],
+            'end_date': params['end_date'],
+            'request_time': datetime.datetime.utcnow().strftime('%a, %d %b %Y %H:%M:%S GMT'),
+            'quotes': quotes,
+        }
+        return 200, {'Content-Type': 'application/json'}, json.dumps(body).encode()
+
+    def _key_limited(self, api_key) -> bool:
+        if not self.key_rate:
+            return False
+        now = time.monotonic()
+        requests = self._key_requests[api_key]
+        while requests and requests[0] <= now - 1:
+            requests.popleft()
+        if len(requests) >= self.key_rate:
+            return True
+        requests.append(now)
+        return False
+
+    def _quotes(self, currency, interval, start, end):
+        payload = self._payload(currency, interval)
+        if payload is not None:
+            quotes = payload.get('quotes', [])
+            if self.clip_dates:
+                quotes = [quote for quote in quotes
+                          if start <= datetime.datetime.fromisoformat(quote['date']) <= end]
+            return quotes
+        if self.payloads or self.replay_dir is not None:
+            return None
+        return self._synthetic_quotes(currency, interval, start, end)
+
+    def _payload(self, currency, interval):
+        for name in (f'{currency}_{interval}', currency):
+            if name in self.payloads:
+                return self.payloads[name]
+            if self.replay_dir is not None:
+                path = self.replay_dir / f'{name}.json'
+                if path.exists():
+                    with open(path, encoding='utf-8') as file:
+                        payload = json.load(file)
+                    with self._lock:
+                        self.payloads[name] = payload
+                    return payload
+        return None
+
+    def _synthetic_quotes(self, currency, interval, start, end) -> list:
+        step = _steps[interval]
+        first = max(0, -(-(start - self.origin) // step))
+        last = (end - self.origin) // step
+        if last < first:
+            return []
+        dates, *ohlc = self._series(currency, interval, self._series_length(last + 1))
+        return to_records(dates[first:last + 1], *(values[first:last + 1] for values in ohlc),
+                          freq=_frequencies[interval])
+
+    @staticmethod
+    def _series_length(candles) -> int:
+        # Ряд строится с запасом, чтобы кэш не пересоздавался на каждой новой свече
+        return -(-candles // 1024) * 1024
+
+    @functools.lru_cache(maxsize=256)
+    def _series(self, currency, interval, candles):
+        seed = zlib.crc32(f'{currency}_{interval}'.encode()) + self.seed
+        price = float(np.random.default_rng(seed).uniform(0.5, 150))
+        return synthetic_arrays(candles, seed=seed, freq=_frequencies[interval], start=self.origin, price=price,
+                                **self.synthetic_options)
+
+    def _error(self, status, message, headers=None) -> tuple:
+        body = json.dumps({'error': status, 'message': message}).encode()
+        return status, {'Content-Type': 'application/json', **(headers or dict())}, body
+
+    def _handler(self):
+        mock = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def do_GET(self):
+                params = {name: values[0] for name, values in parse_qs(urlparse(self.path).query).items()}
+                delay = mock.latency + (mock._random.uniform(0, mock.jitter) if mock.jitter else 0.0)
+                if delay:
+                    time.sleep(delay)
+                status, headers, body = mock.respond(self.path, params)
+                with mock._lock:
+                    mock._stats[status] += 1
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                mock._logger.debug(f'{self.address_string()} {format % args}')
+
+        return Handler
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8800)
+    parser.add_argument('--replay', help='каталог с записанными ответами <валюта>_<интервал>.json')
+    parser.add_argument('--clip-dates', action='store_true', help='отдавать из записей только свечи окна запроса')
+    parser.add_argument('--latency', type=float, default=0.0, help='задержка ответа, с')
+    parser.add_argument('--jitter', type=float, default=0.0, help='случайная добавка к задержке, до, с')
+    parser.add_argument('--rate-limit', type=float, default=0.0, help='доля ответов 429')
+    parser.add_argument('--retry-after', type=int, default=1)
+    parser.add_argument('--key-rate', type=int, help='запросов в секунду на ключ, сверх - 429')
+    parser.add_argument('--failures', type=float, default=0.0, help='доля ответов 503')
+    parser.add_argument('--timeouts', type=float, default=0.0, help='доля зависших ответов')
+    parser.add_argument('--hang', type=float, default=60.0, help='время зависания, с')
+    parser.add_argument('--junk', type=float, default=0.0, help='доля ответов не в формате JSON')
+    parser.add_argument('--api-keys', nargs='+', help='допустимые ключи, по умолчанию - любые')
+    parser.add_argument('--volatility', type=float, default=0.002)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--log-level', default='INFO')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=args.log_level)
+    mock = MockTraderMade(args.host, args.port, replay_dir=args.replay, clip_dates=args.clip_dates,
+                          latency=args.latency, jitter=args.jitter, rate_limit=args.rate_limit,
+                          retry_after=args.retry_after, key_rate=args.key_rate, failures=args.failures,
+                          timeouts=args.timeouts, hang=args.hang, junk=args.junk, api_keys=args.api_keys,
+                          seed=args.seed, synthetic_options={'volatility': args.volatility})
+    try:
+        mock.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    print(f'Ответы по кодам: {mock.stats()}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,56 @@
+from PyQt5.QtCore import QAbstractListModel, QModelIndex, QSortFilterProxyModel, Qt
+
+
+class CurrencyListModel(QAbstractListModel):
+    """
+    Модель списка валют с флажками для QListView.
+    Отмеченные валюты хранятся в самой модели множеством, поэтому список из тысяч пар
+    не создаёт виджетов, а получение выбора не требует обхода всех строк.
+    """
+
+    def __init__(self, currencies, parent=None):
+        super().__init__(parent)
+        self._currencies = tuple(currencies)
+        self._rows = {currency: row for row, currency in enumerate(self._currencies)}
+        self._checked = set()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._currencies)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        currency = self._currencies[index.row()]
+        if role == Qt.DisplayRole:
+            return currency
+        if role == Qt.CheckStateRole:
+            return Qt.Checked if currency in self._checked else Qt.Unchecked
+        return None
+
+    def setData(self, index, value, role=Qt.EditRole):
+        if not index.isValid() or role != Qt.CheckStateRole:
+            return False
+        currency = self._currencies[index.row()]
+        if Qt.CheckState(value) == Qt.Checked:
+            self._checked.add(currency)
+        else:
+            self._checked.discard(currency)
+        self.dataChanged.emit(index, index, [Qt.CheckStateRole])
+        return True
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable | Qt.ItemIsUserCheckable
+
+    def checked_currencies(self) -> list:
+        """Отмеченные валюты в порядке списка."""
+        return sorted(self._checked, key=self._rows.__getitem__)
+
+
+class CurrencyFilterProxyModel(QSortFilterProxyModel):
+    """Фильтр списка валют по подстроке без учёта регистра."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setFilterCaseSensitivity(Qt.CaseInsensitive)
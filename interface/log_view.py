@@ -0,0 +1,128 @@
+import collections
+import datetime
+import logging
+import threading
+
+from PyQt5.QtCore import QAbstractListModel, QModelIndex, QSortFilterProxyModel, Qt, QTimer
+from PyQt5.QtGui import QBrush, QColor
+
+LOG_LEVELS = {'DEBUG': logging.DEBUG, 'INFO': logging.INFO, 'WARNING': logging.WARNING, 'ERROR': logging.ERROR}
+LevelRole = Qt.UserRole + 1
+
+
+class RingBufferLogHandler(logging.Handler):
+    """
+    Обработчик logging, который складывает записи в кольцевой буфер на capacity записей.
+    emit только добавляет строку в буфер, поэтому логировать можно из любого потока,
+    а интерфейс забирает накопленные записи пачкой методом take.
+    Если интерфейс не успевает, старые записи вытесняются, их количество - dropped.
+    """
+
+    def __init__(self, capacity=5000, level=logging.NOTSET):
+        super().__init__(level)
+        self._entries = collections.deque(maxlen=capacity)
+        self._entries_lock = threading.Lock()
+        self.dropped = 0
+
+    def emit(self, record):
+        try:
+            time = datetime.datetime.fromtimestamp(record.created).time()
+            entry = (record.levelno, f'{time}--{self.format(record)}')
+        except Exception:
+            self.handleError(record)
+            return
+        with self._entries_lock:
+            if len(self._entries) == self._entries.maxlen:
+                self.dropped += 1
+            self._entries.append(entry)
+
+    def take(self) -> list:
+        with self._entries_lock:
+            entries = list(self._entries)
+            self._entries.clear()
+        return entries
+
+
+class LogListModel(QAbstractListModel):
+    """Модель строк лога для QListView, хранит не более capacity последних строк."""
+
+    def __init__(self, capacity=5000, parent=None):
+        super().__init__(parent)
+        self.capacity = capacity
+        self._entries = collections.deque()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._entries)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        level, text = self._entries[index.row()]
+        if role == Qt.DisplayRole:
+            return text
+        if role == LevelRole:
+            return level
+        if role == Qt.ForegroundRole and level >= logging.WARNING:
+            return QBrush(QColor('red') if level >= logging.ERROR else QColor('darkorange'))
+        return None
+
+    def append(self, entries):
+        entries = entries[-self.capacity:]
+        if not entries:
+            return
+        overflow = len(self._entries) + len(entries) - self.capacity
+        if overflow > 0:
+            self.beginRemoveRows(QModelIndex(), 0, overflow - 1)
+            for _ in range(overflow):
+                self._entries.popleft()
+            self.endRemoveRows()
+        self.beginInsertRows(QModelIndex(), len(self._entries), len(self._entries) + len(entries) - 1)
+        self._entries.extend(entries)
+        self.endInsertRows()
+
+
+class LogLevelFilterProxyModel(QSortFilterProxyModel):
+    """Показывает только строки лога с уровнем не ниже min_level."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.min_level = logging.NOTSET
+
+    def set_min_level(self, level):
+        self.min_level = level
+        self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        index = self.sourceModel().index(source_row, 0, source_parent)
+        return self.sourceModel().data(index, LevelRole) >= self.min_level
+
+    def export(self, path):
+        """Записывает в файл показанные строки лога."""
+        with open(path, 'w', encoding='utf-8') as file:
+            for row in range(self.rowCount()):
+                file.write(f'{self.index(row, 0).data()}\n')
+
+
+class LogView:
+    """
+    Связывает RingBufferLogHandler с QListView: раз в flush_interval мс накопленные записи
+    добавляются в модель одной пачкой, а список прокручивается к последней строке.
+    """
+
+    def __init__(self, list_view, capacity=5000, flush_interval=200, level=logging.NOTSET):
+        self.list_view = list_view
+        self.handler = RingBufferLogHandler(capacity, level)
+        self.handler.setFormatter(logging.Formatter('%(levelname)s--%(message)s'))
+        self.model = LogListModel(capacity, list_view)
+        self.proxy_model = LogLevelFilterProxyModel(list_view)
+        self.proxy_model.setSourceModel(self.model)
+        list_view.setModel(self.proxy_model)
+        self._timer = QTimer(list_view)
+        self._timer.timeout.connect(self.flush)
+        self._timer.start(flush_interval)
+
+    def flush(self):
+        entries = self.handler.take()
+        if entries:
+            self.model.append(entries)
+            self.list_view.scrollToBottom()
@@ -2,7 +2,7 @@
 
 # Form implementation generated from reading ui file 'main_window.ui'
 #
-# Created by: PyQt5 UI code generator 5.15.7
+# Created by: PyQt5 UI code generator 5.15.11
 #
 # WARNING: Any manual changes made to this file will be lost when pyuic5 is
 # run again.  Do not edit this file unless you know what you are doing.
@@ -17,9 +17,14 @@ class Ui_MainWindow(object):
         MainWindow.resize(810, 600)
         self.centralwidget = QtWidgets.QWidget(MainWindow)
         self.centralwidget.setObjectName("centralwidget")
-        self.currencyListWidget = QtWidgets.QListWidget(self.centralwidget)
-        self.currencyListWidget.setGeometry(QtCore.QRect(20, 60, 256, 311))
-        self.currencyListWidget.setObjectName("currencyListWidget")
+        self.currencySearchLineEdit = QtWidgets.QLineEdit(self.centralwidget)
+        self.currencySearchLineEdit.setGeometry(QtCore.QRect(20, 60, 256, 24))
+        self.currencySearchLineEdit.setClearButtonEnabled(True)
+        self.currencySearchLineEdit.setObjectName("currencySearchLineEdit")
+        self.currencyListView = QtWidgets.QListView(self.centralwidget)
+        self.currencyListView.setGeometry(QtCore.QRect(20, 90, 256, 281))
+        self.currencyListView.setUniformItemSizes(True)
+        self.currencyListView.setObjectName("currencyListView")
         self.currencyLabel = QtWidgets.QLabel(self.centralwidget)
         self.currencyLabel.setGeometry(QtCore.QRect(20, 30, 91, 16))
         font = QtGui.QFont()
@@ -52,15 +57,30 @@ class Ui_MainWindow(object):
         self.startPushButton = QtWidgets.QPushButton(self.centralwidget)
         self.startPushButton.setGeometry(QtCore.QRect(20, 510, 121, 28))
         self.startPushButton.setObjectName("startPushButton")
+        self.cancelPushButton = QtWidgets.QPushButton(self.centralwidget)
+        self.cancelPushButton.setEnabled(False)
+        self.cancelPushButton.setGeometry(QtCore.QRect(150, 510, 121, 28))
+        self.cancelPushButton.setObjectName("cancelPushButton")
+        self.searchProgressBar = QtWidgets.QProgressBar(self.centralwidget)
+        self.searchProgressBar.setGeometry(QtCore.QRect(20, 550, 251, 23))
+        self.searchProgressBar.setProperty("value", 0)
+        self.searchProgressBar.setObjectName("searchProgressBar")
         self.unselectedListWidget = QtWidgets.QListWidget(self.centralwidget)
         self.unselectedListWidget.setGeometry(QtCore.QRect(300, 60, 221, 192))
         self.unselectedListWidget.setObjectName("unselectedListWidget")
         self.selectedListWidget = QtWidgets.QListWidget(self.centralwidget)
         self.selectedListWidget.setGeometry(QtCore.QRect(570, 60, 221, 192))
         self.selectedListWidget.setObjectName("selectedListWidget")
-        self.logsListWidget = QtWidgets.QListWidget(self.centralwidget)
-        self.logsListWidget.setGeometry(QtCore.QRect(290, 300, 501, 241))
-        self.logsListWidget.setObjectName("logsListWidget")
+        self.logsListView = QtWidgets.QListView(self.centralwidget)
+        self.logsListView.setGeometry(QtCore.QRect(290, 300, 501, 241))
+        self.logsListView.setUniformItemSizes(True)
+        self.logsListView.setObjectName("logsListView")
+        self.logLevelComboBox = QtWidgets.QComboBox(self.centralwidget)
+        self.logLevelComboBox.setGeometry(QtCore.QRect(480, 265, 141, 24))
+        self.logLevelComboBox.setObjectName("logLevelComboBox")
+        self.exportLogsPushButton = QtWidgets.QPushButton(self.centralwidget)
+        self.exportLogsPushButton.setGeometry(QtCore.QRect(630, 265, 161, 24))
+        self.exportLogsPushButton.setObjectName("exportLogsPushButton")
         self.logsLlabel = QtWidgets.QLabel(self.centralwidget)
         self.logsLlabel.setGeometry(QtCore.QRect(290, 260, 171, 31))
         font = QtGui.QFont()
@@ -93,11 +113,14 @@ class Ui_MainWindow(object):
     def retranslateUi(self, MainWindow):
         _translate = QtCore.QCoreApplication.translate
         MainWindow.setWindowTitle(_translate("MainWindow", "MainWindow"))
+        self.currencySearchLineEdit.setPlaceholderText(_translate("MainWindow", "Поиск валюты"))
         self.currencyLabel.setText(_translate("MainWindow", "Валюты:"))
         self.dailyCheckBox.setText(_translate("MainWindow", "Дневной интервал"))
         self.hourlyCheckBox.setText(_translate("MainWindow", "Часов интервал"))
         self.intervalLabel.setText(_translate("MainWindow", "Интервал:"))
         self.startPushButton.setText(_translate("MainWindow", "Начать"))
+        self.cancelPushButton.setText(_translate("MainWindow", "Отменить"))
+        self.exportLogsPushButton.setText(_translate("MainWindow", "Сохранить логи"))
         self.logsLlabel.setText(_translate("MainWindow", "Логи:"))
         self.ubselectedLabel.setText(_translate("MainWindow", "Не выбранные паттерны"))
         self.selectedLabel.setText(_translate("MainWindow", "Выбранные паттерны"))
@@ -1,47 +1,62 @@
 # -*- coding: utf-8 -*-
-import datetime
+import logging
+import os
 
 from PyQt5 import QtWidgets
-from PyQt5.QtWidgets import QCheckBox, QListWidgetItem
+from PyQt5.QtWidgets import QListWidgetItem
 
 import main
+from currency_model import CurrencyFilterProxyModel, CurrencyListModel
 from exchange_data import get_currency_pairs_names, get_candle_names
-from main import Interval, run_for_ui
+from log_view import LOG_LEVELS, LogView
+from main import Interval
+from pattern_cache import get_pattern_cache
 from py.main_window import Ui_MainWindow
+from search_worker import SearchWorker
 
+_config_path = './../config.yaml'
+# Пути в конфигурации заданы относительно корня проекта, а интерфейс запускается из interface/
+_path_options = ('api_key_state', 'candle_store', 'data_dir', 'record_dir', 'pattern_cache_dir', 'metrics_dir')
 
-class LogManger:
-    def __init__(self, logsListWidget, log_level=20):
-        self.logsListWidget = logsListWidget
-        self.log_level = log_level
 
-    def debug(self, msg):
-        if self.log_level < 20:
-            self.print_to_list_widget(msg)
-
-    def info(self, msg):
-        self.print_to_list_widget(msg)
-
-    def print_to_list_widget(self, msg):
-        time = datetime.datetime.now().time()
-        self.logsListWidget.addItem(f"{time}--{msg}")
+def load_config(path=_config_path) -> dict:
+    config = main.Config(path).config
+    root = os.path.dirname(path)
+    for option in _path_options:
+        if config.get(option) and not os.path.isabs(config[option]):
+            config[option] = os.path.join(root, config[option])
+    return config
 
 
 class MyWindow(QtWidgets.QWidget, Ui_MainWindow):
     def __init__(self, parent=None):
         QtWidgets.QWidget.__init__(self, parent)
         self.MainWindow = QtWidgets.QMainWindow()
-        self.yaml_config = main.Config('./../config.yaml').config
+        self.yaml_config = load_config()
         self.setupUi(self.MainWindow)
-        self._logger = LogManger(self.logsListWidget, log_level=self.yaml_config['log_level'])
+        self._logger = logging.getLogger('interface')
+        self.add_log_view()
+        # Кэш живёт между запусками, повторный запуск с теми же данными не пересоздаёт отчёты
+        self.pattern_cache = get_pattern_cache(self.yaml_config)
+        self.search_worker = SearchWorker(self)
+        self._active_runs = 0
+        self.search_worker.run_started.connect(self.on_run_started)
+        self.search_worker.progress.connect(self.on_run_progress)
+        self.search_worker.run_finished.connect(self.on_run_finished)
+        QtWidgets.QApplication.instance().aboutToQuit.connect(self.search_worker.stop)
         self.add_currencies()
         self.add_patterns()
 
+        self.currencySearchLineEdit.textChanged.connect(self.currency_proxy_model.setFilterFixedString)
+
         self.unselectedListWidget.doubleClicked.connect(self.move_to_selected)
         self.selectedListWidget.doubleClicked.connect(self.move_to_unselected)
         self.unselectAllSelectedPushButton.clicked.connect(self.all_selected_to_unselected_list)
         self.selectAllUnselectedPushButton.clicked.connect(self.all_unselected_to_selected_list)
         self.startPushButton.clicked.connect(self.start_search)
+        self.cancelPushButton.clicked.connect(self.cancel_search)
+        self.logLevelComboBox.currentTextChanged.connect(self.change_log_level)
+        self.exportLogsPushButton.clicked.connect(self.export_logs)
         self._logger.info("Программа готова к работе")
 
     def move_to_selected(self):
@@ -70,13 +85,7 @@ class MyWindow(QtWidgets.QWidget, Ui_MainWindow):
 
     def start_search(self):
         self._logger.info('НАЧАЛО РАБОТЫ СКРИПТА.')
-        currencies = [self.currencyListWidget.itemWidget(self.currencyListWidget.item(i)) for i in
-                      range(0, self.currencyListWidget.count())]
-
-        choose_currencies = []
-        for cb in currencies:
-            if cb.isChecked():
-                choose_currencies.append(cb.text())
+        choose_currencies = self.currency_model.checked_currencies()
 
         choose_patterns_list = [self.selectedListWidget.item(i).data(1) for i in
                                 range(0, self.selectedListWidget.count())]
@@ -93,14 +102,17 @@ class MyWindow(QtWidgets.QWidget, Ui_MainWindow):
         print(choose_interval)
 
         if len(choose_currencies) != 0 and len(choose_patterns_list) != 0 and len(choose_interval) != 0:
-            self._logger.info('Процесс запущен. Ожидайте окончания...')
-            config = {
-                'currencies': choose_currencies,
-                'api_keys': self.yaml_config['api_keys']
-            }
-
-            self._logger.info('Скрипт выполнен успешно!')
-            run_for_ui(config, choose_interval, choose_patterns_dict, ui_logger=self._logger)
+            # Все параметры загрузки (ограничения и квота ключей, повторы, exchange_url) - из config.yaml
+            config = {**self.yaml_config, 'currencies': choose_currencies}
+
+            run_id = self.search_worker.enqueue(config=config, intervals=choose_interval,
+                                                candle_names=choose_patterns_dict, ui_logger=self._logger,
+                                                candle_engine=self.yaml_config.get('candle_engine', 'talib'),
+                                                pattern_cache=self.pattern_cache)
+            self._active_runs += 1
+            self.cancelPushButton.setEnabled(True)
+            self._logger.info(f'Запуск {run_id} добавлен в очередь, запусков в очереди: '
+                              f'{self.search_worker.pending()}')
         elif len(choose_currencies) == 0:
             self._logger.info("Вылюты не выбраны")
         elif len(choose_patterns_list) == 0:
@@ -110,17 +122,62 @@ class MyWindow(QtWidgets.QWidget, Ui_MainWindow):
         else:
             self._logger.info("Не ожиданная ошибка ввода данных...")
 
-        self._logger.info('КОНЕЦ РАБОТЫ СКРИПТА.')
+    def cancel_search(self):
+        self._logger.info('Отмена текущего запуска и всех запусков в очереди...')
+        self.search_worker.cancel_all()
+
+    def on_run_started(self, run_id, total):
+        self.searchProgressBar.setMaximum(max(total, 1))
+        self.searchProgressBar.setValue(0)
+        self._logger.info(f'Запуск {run_id}: процесс запущен. Ожидайте окончания...')
+
+    def on_run_progress(self, run_id, done, total, interval, currency, path, error):
+        self.searchProgressBar.setValue(done)
+        if error:
+            self._logger.error(f'Запуск {run_id}: {interval}-{currency} не загружена: {error}')
+        else:
+            self._logger.info(f'Запуск {run_id}: {interval}-{currency} готово ({done}/{total}): {path}')
+
+    def on_run_finished(self, run_id, cancelled, error):
+        if error:
+            self._logger.error(f'Запуск {run_id} завершился с ошибкой: {error}')
+        elif cancelled:
+            self._logger.info(f'Запуск {run_id} отменён')
+        else:
+            self._logger.info(f'Запуск {run_id}: скрипт выполнен успешно!')
+        self._active_runs -= 1
+        if not self._active_runs:
+            self.cancelPushButton.setEnabled(False)
+            self._logger.info('КОНЕЦ РАБОТЫ СКРИПТА.')
+
+    def add_log_view(self):
+        """
+        Все логи программы (logging) выводятся в logsListView через кольцевой буфер,
+        в списке хранится не более log_view_capacity последних строк.
+        """
+        log_level = self.yaml_config['log_level']
+        self.log_view = LogView(self.logsListView, capacity=self.yaml_config.get('log_view_capacity', 5000))
+        root_logger = logging.getLogger()
+        root_logger.setLevel(log_level)
+        root_logger.addHandler(self.log_view.handler)
+        self.logLevelComboBox.addItems(LOG_LEVELS)
+        self.logLevelComboBox.setCurrentText(logging.getLevelName(log_level))
+
+    def change_log_level(self, level_name):
+        self.log_view.proxy_model.set_min_level(LOG_LEVELS.get(level_name, logging.NOTSET))
+
+    def export_logs(self):
+        path, _ = QtWidgets.QFileDialog.getSaveFileName(self.MainWindow, 'Сохранить логи', 'logs.txt',
+                                                        'Text files (*.txt)')
+        if path:
+            self.log_view.proxy_model.export(path)
+            self._logger.info(f'Логи сохранены в {path}')
 
     def add_currencies(self):
-        currencies = get_currency_pairs_names()
-        for currency in currencies:
-            box = QCheckBox()  # Instantiate a QCheckBox, it passed into text
-            item = QListWidgetItem()
-            box.setText(currency)
-
-            self.currencyListWidget.addItem(item)  # The QListWidgetItem join QListWidget
-            self.currencyListWidget.setItemWidget(item, box)
+        self.currency_model = CurrencyListModel(get_currency_pairs_names(), self)
+        self.currency_proxy_model = CurrencyFilterProxyModel(self)
+        self.currency_proxy_model.setSourceModel(self.currency_model)
+        self.currencyListView.setModel(self.currency_proxy_model)
 
     def add_patterns(self):
         patterns = get_candle_names()
@@ -0,0 +1,91 @@
+import itertools
+import queue
+import threading
+
+from PyQt5.QtCore import QThread, pyqtSignal
+
+from main import run_for_ui
+
+
+class SearchWorker(QThread):
+    """
+    Выполняет запуски run_for_ui в отдельном потоке, чтобы окно не зависало.
+    Запуски ставятся в очередь методом enqueue и выполняются по одному.
+    О ходе работы поток сообщает сигналами, которые Qt доставляет в главный поток:
+    run_started(номер запуска, количество валют × интервалов),
+    progress(номер запуска, обработано, всего, интервал, валюта, путь к отчёту, ошибка),
+    run_finished(номер запуска, отменён ли, текст ошибки или пустая строка).
+    cancel отменяет текущий запуск, cancel_all - ещё и все запуски в очереди.
+    """
+
+    run_started = pyqtSignal(int, int)
+    progress = pyqtSignal(int, int, int, str, str, str, str)
+    run_finished = pyqtSignal(int, bool, str)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._runs = queue.Queue()
+        self._run_ids = itertools.count(1)
+        self._last_run_id = 0
+        self._cancelled_up_to = 0
+        self._cancel_event = threading.Event()
+        self._lock = threading.Lock()
+
+    def enqueue(self, **run_for_ui_kwargs) -> int:
+        """Ставит запуск в очередь, аргументы передаются в run_for_ui. Возвращает номер запуска."""
+        with self._lock:
+            run_id = self._last_run_id = next(self._run_ids)
+            self._runs.put((run_id, run_for_ui_kwargs))
+        if not self.isRunning():
+            self.start()
+        return run_id
+
+    def pending(self) -> int:
+        """Количество запусков в очереди, не считая текущего."""
+        return self._runs.qsize()
+
+    def cancel(self):
+        self._cancel_event.set()
+
+    def cancel_all(self):
+        with self._lock:
+            self._cancelled_up_to = self._last_run_id
+            self._cancel_event.set()
+
+    def stop(self):
+        """Отменяет все запуски и завершает поток."""
+        self.cancel_all()
+        self._runs.put(None)
+        self.wait()
+
+    def run(self):
+        while True:
+            item = self._runs.get()
+            if item is None:
+                break
+            run_id, kwargs = item
+            with self._lock:
+                cancelled = run_id <= self._cancelled_up_to
+                if not cancelled:
+                    self._cancel_event.clear()
+            if cancelled:
+                self.run_finished.emit(run_id, True, '')
+            else:
+                self._run(run_id, kwargs)
+
+    def _run(self, run_id, kwargs):
+        total = len(kwargs['config']['currencies']) * len(kwargs['intervals'])
+        done = 0
+        self.run_started.emit(run_id, total)
+
+        def progress_callback(interval, currency, path=None, error=None):
+            nonlocal done
+            done += 1
+            self.progress.emit(run_id, done, total, interval.name, currency, str(path or ''), str(error or ''))
+
+        try:
+            run_for_ui(progress_callback=progress_callback, cancel_event=self._cancel_event, **kwargs)
+        except Exception as ex:
+            self.run_finished.emit(run_id, self._cancel_event.is_set(), f'{type(ex).__name__}: {ex}')
+        else:
+            self.run_finished.emit(run_id, self._cancel_event.is_set(), '')
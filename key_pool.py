@@ -0,0 +1,220 @@
+import contextlib
+import datetime
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+
+if os.name == 'nt':
+    import msvcrt
+else:
+    import fcntl
+
+KEY_STRATEGIES = ('least_used', 'round_robin')
+
+
+class KeyPool:
+    """
+    Пул api ключей биржи.
+    acquire выбирает ключ для очередного запроса и сразу учитывает запрос:
+    least_used - ключ, который освободится раньше остальных, при равенстве - с наименьшим
+    количеством запросов за месяц; round_robin - ключи по очереди.
+    Для каждого ключа действует ограничение частоты (token bucket: rate запросов в секунду,
+    не более burst подряд) и месячная квота monthly_quota. Ключи с исчерпанной квотой пропускаются.
+    Счётчики запросов за текущий месяц (UTC) сохраняются в state_path и переживают перезапуск,
+    в начале нового месяца они обнуляются. Файл могут использовать несколько процессов
+    (например, парсер и интерфейс): запросы этого процесса добавляются к счётчикам из файла
+    под блокировкой файла не чаще раза в save_interval секунд или save_requests запросов
+    и при вызове flush. remaining и capacity возвращают остаток квоты.
+    """
+
+    def __init__(self, api_keys, rate=None, burst=1, monthly_quota=None, state_path=None, strategy='least_used',
+                 save_interval=5.0, save_requests=100, logger=logging.getLogger('key_pool'), clock=time.monotonic):
+        if strategy not in KEY_STRATEGIES:
+            raise ValueError(f'{strategy} - unknown key strategy, expected one of {list(KEY_STRATEGIES)}')
+        self._logger = logger
+        self.api_keys = list(api_keys)
+        self.rate = rate
+        self.burst = max(1, int(burst))
+        self.monthly_quota = monthly_quota
+        self.state_path = Path(state_path) if state_path else None
+        self.strategy = strategy
+        self.save_interval = save_interval
+        self.save_requests = max(1, int(save_requests))
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._save_lock = threading.Lock()
+        self._next_key = 0
+        self._tokens = {api_key: float(self.burst) for api_key in self.api_keys}
+        self._updated = {api_key: clock() for api_key in self.api_keys}
+        # Запросы этого процесса, ещё не добавленные в state_path
+        self._pending = dict()
+        self._last_save = clock()
+        self._month, self._used = self._load_state()
+
+    def acquire(self, exclude=()):
+        """
+        Возвращает ключ для запроса, при необходимости дожидаясь освобождения ключа
+        по ограничению частоты, или None, если у всех ключей кроме exclude исчерпана месячная квота.
+        """
+        with self._lock:
+            self._roll_month()
+            api_keys = [api_key for api_key in self.api_keys
+                        if api_key not in exclude and not self._exhausted(api_key)]
+            if not api_keys:
+                return None
+            now = self._clock()
+            for api_key in api_keys:
+                self._refill(api_key, now)
+            if self.strategy == 'round_robin':
+                api_key = min(api_keys, key=lambda key: (self.api_keys.index(key) - self._next_key)
+                              % len(self.api_keys))
+                self._next_key = (self.api_keys.index(api_key) + 1) % len(self.api_keys)
+            else:
+                api_key = min(api_keys, key=lambda key: (self._wait_time(key), self._used.get(key, 0)))
+            wait = self._wait_time(api_key)
+            self._tokens[api_key] -= 1
+            self._used[api_key] = self._used.get(api_key, 0) + 1
+            self._pending[api_key] = self._pending.get(api_key, 0) + 1
+            save = sum(self._pending.values()) >= self.save_requests or \
+                self._clock() - self._last_save >= self.save_interval
+        if save:
+            self.flush()
+        if wait > 0:
+            self._logger.debug(f'Ожидание ключа {self._mask_key(api_key)}: {wait:.2f} сек')
+            time.sleep(wait)
+        return api_key
+
+    def available(self, exclude=()) -> bool:
+        """Есть ли кроме exclude ключ с неисчерпанной месячной квотой."""
+        with self._lock:
+            self._roll_month()
+            return any(api_key not in exclude and not self._exhausted(api_key) for api_key in self.api_keys)
+
+    def flush(self):
+        """
+        Добавляет запросы этого процесса к счётчикам в state_path и перечитывает из него
+        запросы других процессов.
+        """
+        if self.state_path is None:
+            return
+        with self._save_lock:
+            with self._lock:
+                month, pending = self._month, self._pending
+                self._pending = dict()
+                self._last_save = self._clock()
+            try:
+                with self._locked_state():
+                    stored_month, used = self._read_state()
+                    if stored_month != month:
+                        used = dict()
+                    for api_key, count in pending.items():
+                        used[api_key] = used.get(api_key, 0) + count
+                    self._write_state(month, used)
+            except OSError as ex:
+                self._logger.warning(f'Не удалось сохранить {self.state_path}: {ex}')
+                with self._lock:
+                    if self._month == month:
+                        for api_key, count in pending.items():
+                            self._pending[api_key] = self._pending.get(api_key, 0) + count
+                return
+            with self._lock:
+                if self._month == month:
+                    self._used = {api_key: used.get(api_key, 0) + self._pending.get(api_key, 0)
+                                  for api_key in set(used) | set(self._pending)}
+
+    def remaining(self) -> dict:
+        """Возвращает остаток месячной квоты по каждому ключу, None - квота не ограничена."""
+        with self._lock:
+            self._roll_month()
+            return {self._mask_key(api_key): self._remaining(api_key) for api_key in self.api_keys}
+
+    def capacity(self):
+        """Суммарный остаток месячной квоты всех ключей или None, если квота не ограничена."""
+        if self.monthly_quota is None:
+            return None
+        return sum(self.remaining().values())
+
+    def usage(self) -> dict:
+        """Возвращает количество запросов за текущий месяц по каждому ключу."""
+        with self._lock:
+            self._roll_month()
+            return {self._mask_key(api_key): self._used.get(api_key, 0) for api_key in self.api_keys}
+
+    def _remaining(self, api_key):
+        if self.monthly_quota is None:
+            return None
+        return max(0, self.monthly_quota - self._used.get(api_key, 0))
+
+    def _exhausted(self, api_key) -> bool:
+        return self.monthly_quota is not None and self._used.get(api_key, 0) >= self.monthly_quota
+
+    def _refill(self, api_key, now):
+        if self.rate:
+            elapsed = now - self._updated[api_key]
+            self._tokens[api_key] = min(float(self.burst), self._tokens[api_key] + elapsed * self.rate)
+        self._updated[api_key] = now
+
+    def _wait_time(self, api_key) -> float:
+        if not self.rate or self._tokens[api_key] >= 1:
+            return 0.0
+        return (1 - self._tokens[api_key]) / self.rate
+
+    @staticmethod
+    def _current_month() -> str:
+        return datetime.datetime.utcnow().strftime('%Y-%m')
+
+    def _roll_month(self):
+        month = self._current_month()
+        if month != self._month:
+            self._logger.info(f'Новый месяц {month}, счётчики запросов обнулены')
+            self._month, self._used, self._pending = month, dict(), dict()
+
+    def _load_state(self):
+        month = self._current_month()
+        stored_month, used = self._read_state()
+        if stored_month != month:
+            return month, dict()
+        return month, used
+
+    def _read_state(self):
+        """Возвращает (месяц, счётчики) из state_path или (None, {}), если файла нет или он повреждён."""
+        if self.state_path is None or not self.state_path.exists():
+            return None, dict()
+        try:
+            with open(self.state_path) as file:
+                state = json.load(file)
+            return state.get('month'), {api_key: int(used) for api_key, used in state.get('used', dict()).items()}
+        except (OSError, ValueError, AttributeError):
+            self._logger.warning(f'Не удалось прочитать {self.state_path}, счётчики запросов обнулены')
+            return None, dict()
+
+    def _write_state(self, month, used):
+        temp_path = self.state_path.with_name(f'{self.state_path.name}.{os.getpid()}.tmp')
+        with open(temp_path, 'w') as file:
+            json.dump({'month': month, 'used': used}, file)
+        os.replace(temp_path, self.state_path)
+
+    @contextlib.contextmanager
+    def _locked_state(self):
+        """Блокировка state_path между процессами на время чтения и записи счётчиков."""
+        with open(self.state_path.with_name(f'{self.state_path.name}.lock'), 'a+') as file:
+            file.seek(0)
+            if os.name == 'nt':
+                msvcrt.locking(file.fileno(), msvcrt.LK_LOCK, 1)
+            else:
+                fcntl.flock(file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if os.name == 'nt':
+                    file.seek(0)
+                    msvcrt.locking(file.fileno(), msvcrt.LK_UNLCK, 1)
+                else:
+                    fcntl.flock(file, fcntl.LOCK_UN)
+
+    @staticmethod
+    def _mask_key(api_key) -> str:
+        return f'{api_key[:4]}***'
@@ -1,24 +1,54 @@
-import copy
 import datetime
+import functools
+import itertools
+import json
 import logging
+import os
 import threading
 import time
-import traceback
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 from pathlib import PurePath
 
+import numpy as np
 import pandas as pd
 import requests
-import talib
+from requests.adapters import HTTPAdapter
 import yaml
 
 import exchange_data
+import numpy_candles
+from candle_store import CandleStore
+from data_sources import JSON_DECODER, OhlcBatch, as_batch, get_data_source
+from key_pool import KeyPool
+from metrics import Metrics, get_metrics
+from numpy_candles import get_candle_engine
+from pattern_cache import get_pattern_cache
+from pattern_pool import search_patterns_parallel
+from report_sinks import get_report_sink
+from resample import resample_quotes
+from resilience import CircuitBreaker, FetchError, RetryPolicy
+from scheduler import Scheduler
+from sparse_signals import SparseSignals
 
 
 class Interval(Enum):
     hourly = 7
     daily = 30
 
+    @property
+    def period(self) -> datetime.timedelta:
+        """Длительность свечи интервала, по её закрытию выравнивается планировщик."""
+        if self == Interval.daily:
+            return datetime.timedelta(days=1)
+        return datetime.timedelta(hours=1)
+
+
+# Источники свечей интервала: запрос к бирже или сборка из часовых свечей
+_interval_sources = ('fetch', 'derive')
+_derive_source = Interval.hourly
+_exchange_url = "https://marketdata.tradermade.com/api/v1/timeseries"
+
 
 class Config:
     """
@@ -43,48 +73,348 @@ class Config:
 class Exchange:
     """
     Класс предоставляет возможность получение данных от биржи.
-    Метод get_data является основным и возвращает словарь json-файлов,
+    Метод get_data является основным и возвращает словарь свечей (data_sources.OhlcBatch),
     где ключ является валютой.
     _build_query - приватный метод необходимый для генерации запросов
-    в зависимости от параметров.
+    в зависимости от параметров. Объект можно использовать как контекстный менеджер.
     """
 
-    def __init__(self, exchange_config, logger=logging.getLogger('exchange')):
+    def __init__(self, exchange_config, logger=logging.getLogger('exchange'), metrics=None):
         self._logger = logger
+        self.metrics = metrics or Metrics()
         self.exchange_config = exchange_config
         self.currencies = self.exchange_config['currencies']
         self.api_keys = self.exchange_config['api_keys']
-        self._url = "https://marketdata.tradermade.com/api/v1/timeseries"
+        self.key_pool = KeyPool(self.api_keys,
+                                rate=self.exchange_config.get('api_key_rate'),
+                                burst=self.exchange_config.get('api_key_burst', 1),
+                                monthly_quota=self.exchange_config.get('api_key_monthly_quota'),
+                                state_path=self.exchange_config.get('api_key_state'),
+                                strategy=self.exchange_config.get('api_key_strategy', 'least_used'))
+        self.concurrency = max(1, int(self.exchange_config.get('concurrency', 1)))
+        self._url = self.exchange_config.get('exchange_url', _exchange_url)
+        self._sessions = dict()
+        self._sessions_lock = threading.Lock()
+        self.history_days = self.exchange_config.get('history_days') or dict()
+        store_path = self.exchange_config.get('candle_store')
+        self.candle_store = CandleStore(store_path) if store_path else None
+        self.interval_sources = self.exchange_config.get('interval_sources') or dict()
+        self._derived_intervals = self._load_derived_intervals()
+        self._fetch_locks = dict()
+        self.request_timeout = tuple(self.exchange_config.get('request_timeout', (5, 30)))
+        self.retry_policy = RetryPolicy(attempts=self.exchange_config.get('retry_attempts', 4),
+                                        base_delay=self.exchange_config.get('retry_base_delay', 0.5),
+                                        max_delay=self.exchange_config.get('retry_max_delay', 30))
+        self.circuit_breaker = CircuitBreaker(failure_threshold=self.exchange_config.get('circuit_failures', 5),
+                                              reset_timeout=self.exchange_config.get('circuit_reset', 60))
+        self.failures = dict()
+        self._failures_lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        with self._sessions_lock:
+            sessions, self._sessions = self._sessions, dict()
+        for session in sessions.values():
+            session.close()
+        if self.candle_store is not None:
+            self.candle_store.close()
+        self.key_pool.flush()
+        self._logger.debug('Сессии биржи закрыты')
+
+    def connection_stats(self) -> dict:
+        """
+        Возвращает статистику переиспользования соединений по каждому api ключу:
+        количество выполненных запросов и количество открытых соединений.
+        """
+        stats = dict()
+        with self._sessions_lock:
+            sessions = list(self._sessions.items())
+        for api_key, session in sessions:
+            requests_count = 0
+            connections_count = 0
+            for adapter in set(session.adapters.values()):
+                pools = adapter.poolmanager.pools
+                for pool_key in pools.keys():
+                    pool = pools.get(pool_key)
+                    if pool is not None:
+                        requests_count += pool.num_requests
+                        connections_count += pool.num_connections
+            stats[self._mask_key(api_key)] = {
+                'requests': requests_count,
+                'connections': connections_count,
+                'reused': requests_count - connections_count
+            }
+        return stats
+
+    def _session(self, api_key) -> requests.Session:
+        """Своя сессия для каждого api ключа с пулом keep-alive соединений размера concurrency."""
+        with self._sessions_lock:
+            session = self._sessions.get(api_key)
+            if session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.concurrency, pool_block=True)
+                session.mount('https://', adapter)
+                session.mount('http://', adapter)
+                self._sessions[api_key] = session
+        return session
+
+    def _load_derived_intervals(self) -> list:
+        derived_intervals = []
+        for interval in Interval:
+            source = self.interval_sources.get(interval.name, 'fetch')
+            if source not in _interval_sources:
+                raise ValueError(f'{source} - unknown interval source, expected one of {list(_interval_sources)}')
+            if source != 'derive':
+                continue
+            if interval == _derive_source:
+                raise ValueError(f'{interval.name} - can not be derived from itself')
+            if self.candle_store is None:
+                raise ValueError(f'{interval.name} - candle_store is required to derive candles')
+            derived_intervals.append(interval)
+        return derived_intervals
+
+    @staticmethod
+    def _mask_key(api_key) -> str:
+        return f'{api_key[:4]}***'
+
+    def is_derived(self, interval: Interval) -> bool:
+        return interval in self._derived_intervals
+
+    def get_data(self, interval: Interval, currencies=None, cancel_event=None):
+        """
+        Загружает данные по валютам currencies (по умолчанию - по всем из конфигурации)
+        параллельно, количество одновременных запросов ограничено параметром concurrency.
+        Интервалы из interval_sources со значением derive собираются из часовых свечей, см. _derive.
+        После установки cancel_event (threading.Event) оставшиеся валюты не загружаются.
+        Причины, по которым валюты не загрузились, сохраняются в failures[interval.name],
+        время этапов и счётчики по каждой валюте - в metrics (см. metrics.Metrics).
+        """
+        load = self._derive if self.is_derived(interval) else self._fetch
+
+        def fetch(interval, currency):
+            if cancel_event is not None and cancel_event.is_set():
+                return None
+            return load(interval, currency)
+
+        with self._failures_lock:
+            self.failures[interval.name] = dict()
+        with ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix='exchange') as executor:
+            futures = {currency: executor.submit(fetch, interval, currency)
+                       for currency in (self.currencies if currencies is None else currencies)}
 
-    def get_data(self, interval: Interval):
         raw_historical_data = dict()
-        # test without copy
-        currencies = copy.copy(self.currencies)
-        for api_key in self.api_keys:
-            try:
-                while len(currencies) != 0:
-                    currency = currencies.pop()
-                    query = self._build_query(interval, currency, api_key)
-                    response = requests.get(self._url, params=query)
-                    self._logger.info(f'Код ответа для {interval}-{currency}: {response.status_code}')
-                    self._logger.debug(f'{response.text}')
-                    raw_historical_data[currency] = response.json()
-            except Exception as ex:
-                self._logger.error(traceback.print_tb(ex.__traceback__))
+        for currency, future in futures.items():
+            data = future.result()
+            if data is not None:
+                raw_historical_data[currency] = data
+        self._logger.debug(f'Статистика соединений: {self.connection_stats()}')
+        self._logger.debug(f'Запросов по ключам за месяц: {self.key_pool.usage()}')
+        failures = self.failures[interval.name]
+        if failures:
+            summary = ', '.join(f'{currency} ({failure["kind"]})' for currency, failure in failures.items())
+            self._logger.warning(f'{interval}: не загружено валют - {len(failures)}: {summary}')
         return raw_historical_data
 
-    def _build_query(self, interval: Interval, currency, api_key) -> dict:
-        if interval == Interval.daily:
-            today = datetime.datetime.utcnow().date()
+    def _fetch(self, interval: Interval, currency):
+        with self.metrics.context(interval=interval.name, currency=currency), self.metrics.timer('fetch'):
+            try:
+                with self._fetch_lock(interval, currency):
+                    return self._fetch_unlocked(interval, currency)
+            except Exception as ex:
+                return self._unexpected_failure(interval, currency, ex)
+
+    def _unexpected_failure(self, interval: Interval, currency, error):
+        """Непредвиденная ошибка одной валюты (хранилище, разбор свечей) не прерывает загрузку остальных."""
+        self._logger.exception(f'Не удалось загрузить {interval}-{currency}: {error}')
+        self.metrics.increment('fetch_failures')
+        self._record_failure(interval, currency, error, 1)
+        return None
+
+    def _fetch_lock(self, interval: Interval, currency) -> threading.Lock:
+        return self._fetch_locks.setdefault((interval, currency), threading.Lock())
+
+    def _fetch_unlocked(self, interval: Interval, currency):
+        """
+        Запрашивает свечи (при candle_store - только недостающий хвост, см. _top_up_start)
+        с ключом из key_pool (см. key_pool.KeyPool), повторяя запрос по retry_policy при таймаутах,
+        обрывах соединения, ответах 429 и 5xx. При 429, 401 и 403 следующая попытка сразу выполняется с другим ключом,
+        если он есть; когда другие ключи закончились, 429 повторяется с паузой на любом ключе.
+        Пока circuit_breaker разомкнут (биржа деградировала), запросы не выполняются.
+        Если запрос так и не удался, причина сохраняется в failures и возвращается None.
+        """
+        start_date = self._top_up_start(interval, currency)
+        excluded_keys = set()
+        error = None
+        attempt = 0
+        for attempt in range(1, self.retry_policy.attempts + 1):
+            if attempt > 1:
+                self.metrics.increment('retries')
+            if not self.circuit_breaker.allow():
+                error = FetchError('circuit_open', 'запросы к бирже приостановлены')
+                break
+            try:
+                api_key = self.key_pool.acquire(exclude=excluded_keys)
+                if api_key is None:
+                    error = error or FetchError('quota', 'месячная квота api ключей исчерпана')
+                    break
+                data = self._request(interval, currency, api_key, start_date)
+            except FetchError as ex:
+                error = ex
+                self.metrics.increment('request_errors')
+                self._logger.warning(f'{interval}-{currency}, попытка {attempt}: {ex}')
+                if ex.kind in ('rate_limited', 'auth'):
+                    excluded_keys.add(api_key)
+                    if self.key_pool.available(exclude=excluded_keys):
+                        continue
+                    excluded_keys.clear()
+                if not ex.retryable or attempt == self.retry_policy.attempts:
+                    break
+                time.sleep(self.retry_policy.delay(attempt - 1, ex.retry_after))
+                continue
+            finally:
+                # Пробный запрос, не дошедший до биржи, не должен оставлять цепь разомкнутой навсегда
+                self.circuit_breaker.release()
+            if self.candle_store is not None:
+                self.candle_store.save(currency, interval.name, data)
+                data = self.candle_store.load(currency, interval.name, self._window_start(interval))
+            return data
+
+        self._logger.error(f'Не удалось загрузить {interval}-{currency}: {error}')
+        self.metrics.increment('fetch_failures')
+        self._record_failure(interval, currency, error, attempt)
+        return None
+
+    def _request(self, interval: Interval, currency, api_key, start_date) -> OhlcBatch:
+        query = self._build_query(interval, currency, api_key, start_date)
+        self.metrics.increment('requests')
+        try:
+            with self.metrics.timer('http_request'):
+                response = self._session(api_key).get(self._url, params=query, timeout=self.request_timeout)
+        except requests.Timeout as ex:
+            self.circuit_breaker.record_failure()
+            raise FetchError('timeout', str(ex)) from ex
+        except requests.RequestException as ex:
+            self.circuit_breaker.record_failure()
+            raise FetchError('connection', str(ex)) from ex
+        self._logger.info(f'Код ответа для {interval}-{currency}: {response.status_code}')
+        self.metrics.increment('response_bytes', len(response.content))
+        if self._logger.isEnabledFor(logging.DEBUG):
+            self._logger.debug(f'{response.text}')
+        if response.status_code >= 500:
+            self.circuit_breaker.record_failure()
         else:
-            today = datetime.datetime.utcnow()
-            today = today - datetime.timedelta(hours=1)
+            self.circuit_breaker.record_success()
+        if response.status_code != 200:
+            raise FetchError.from_status(response.status_code, response.text[:200],
+                                         self._retry_after(response))
+        try:
+            with self.metrics.timer('json_decode'):
+                return OhlcBatch.from_json(response.content)
+        except json.JSONDecodeError as ex:
+            raise FetchError('invalid', f'response is not JSON ({JSON_DECODER}): {ex}') from ex
+        except ValueError as ex:
+            raise FetchError('client', f'{ex}: {response.text[:200]}') from ex
+
+    @staticmethod
+    def _retry_after(response):
+        try:
+            return float(response.headers.get('Retry-After'))
+        except (TypeError, ValueError):
+            return None
+
+    def _record_failure(self, interval: Interval, currency, error, attempts):
+        with self._failures_lock:
+            self.failures.setdefault(interval.name, dict())[currency] = {
+                'kind': error.kind if isinstance(error, FetchError) else 'unknown',
+                'error': str(error),
+                'attempts': attempts,
+                'time': datetime.datetime.utcnow(),
+            }
+
+    def _derive(self, interval: Interval, currency):
+        """
+        Собирает свечи interval из сохранённых часовых свечей. Если последняя закрытая
+        часовая свеча ещё не сохранена, часовые свечи сначала докачиваются с биржи.
+        """
+        with self.metrics.context(interval=interval.name, currency=currency), self.metrics.timer('fetch'):
+            try:
+                with self._fetch_lock(_derive_source, currency):
+                    if not self._source_is_fresh(currency) and \
+                            self._fetch_unlocked(_derive_source, currency) is None:
+                        with self._failures_lock:
+                            failure = self.failures.get(_derive_source.name, dict()).get(currency)
+                            self.failures.setdefault(interval.name, dict())[currency] = failure
+                        return None
+                quotes = self.candle_store.load(currency, _derive_source.name, self._window_start(interval))
+                with self.metrics.timer('derive'):
+                    derived_quotes = resample_quotes(quotes, interval.period)
+            except Exception as ex:
+                return self._unexpected_failure(interval, currency, ex)
+        self._logger.info(f'Свечи {interval}-{currency} собраны из {len(quotes)} свечей {_derive_source}')
+        return derived_quotes
+
+    def _source_is_fresh(self, currency) -> bool:
+        last_date = self.candle_store.last_date(currency, _derive_source.name)
+        if last_date is None:
+            return False
+        try:
+            last_date = datetime.datetime.fromisoformat(last_date)
+        except ValueError:
+            return False
+        last_closed = self._end_date(_derive_source).replace(minute=0, second=0, microsecond=0)
+        return last_date >= last_closed
+
+    def _top_up_start(self, interval: Interval, currency):
+        """
+        Возвращает дату, с которой нужно докачать свечи, или None,
+        если сохранённых свечей нет либо они старше окна истории.
+        Последняя сохранённая свеча запрашивается повторно, так как она могла быть незакрытой.
+        """
+        if self.candle_store is None:
+            return None
+        last_date = self.candle_store.last_date(currency, interval.name)
+        if last_date is None:
+            return None
+        try:
+            start_date = datetime.datetime.fromisoformat(last_date)
+        except ValueError:
+            self._logger.debug(f'Не удалось разобрать дату {last_date} для {interval}-{currency}')
+            return None
+        if interval == Interval.daily:
+            start_date = start_date.date()
+        if start_date <= self._fetch_window_start(interval):
+            return None
+        return start_date
 
+    def _end_date(self, interval: Interval):
+        if interval == Interval.daily:
+            return datetime.datetime.utcnow().date()
+        return datetime.datetime.utcnow() - datetime.timedelta(hours=1)
+
+    def _window_start(self, interval: Interval):
+        days = self.history_days.get(interval.name, interval.value)
+        return self._end_date(interval) - datetime.timedelta(days=days)
+
+    def _fetch_window_start(self, interval: Interval):
+        """Начало окна загрузки: окно самого интервала или производных от него интервалов."""
+        start = self._window_start(interval)
+        if interval != _derive_source:
+            return start
+        for derived_interval in self._derived_intervals:
+            start = min(start, datetime.datetime.combine(self._window_start(derived_interval), datetime.time()))
+        return start
+
+    def _build_query(self, interval: Interval, currency, api_key, start_date=None) -> dict:
         query = {
             "currency": currency,
             "api_key": api_key,
-            "start_date": str(today - datetime.timedelta(days=interval.value)),
-            "end_date": str(today),
+            "start_date": str(start_date or self._fetch_window_start(interval)),
+            "end_date": str(self._end_date(interval)),
             "format": "records",
             "interval": interval.name,
             "period": 1
@@ -97,123 +427,435 @@ class Analyzer:
     """
     Основной класс программы нужен для анализа полученных с биржи данных.
     В gen_results полученные сырые данные распаковываются и предаются в метод
-    search_pattern в нем при помощи библиотеки TA-lib происходит поиск свечных паттернов.
-    После нахождение паттернов для полученных данных выполняется функция clear_data, она
-    как понятно из называния возыварщает ощиченные от пустых полей данные.
+    search_signals, в нем при помощи TA-lib (или numpy_candles) происходит поиск свечных паттернов.
+    После нахождение паттернов для полученных данных выполняется функция clear_signals, она
+    возвращает таблицу отчёта без пустых строк и столбцов, отчёт сохраняет report_sink.
     """
 
-    def __init__(self, candle_names=exchange_data.get_candle_names(), logger=logging.getLogger('analyzer')):
+    def __init__(self, candle_names=exchange_data.get_candle_names(), logger=logging.getLogger('analyzer'),
+                 report_sink=None, processes=1, candle_engine='talib', pattern_cache=None,
+                 incremental=False, metrics=None):
         self._logger = logger
         self.bearish = "Нисходящий тренд"
         self.bullish = "Восходящий тренд"
         self.candle_names = candle_names
+        self.report_sink = report_sink or get_report_sink()
+        self.processes = processes
+        self.candle_engine = candle_engine
+        self._engine = get_candle_engine(candle_engine)
+        self.pattern_cache = pattern_cache
+        self.incremental = incremental
+        self.metrics = metrics or Metrics()
+        # Lookback паттернов совпадает у обоих движков, numpy_candles не требует TA-Lib
+        self._lookbacks = {candle: getattr(numpy_candles, candle).lookback for candle in candle_names}
+        self._previous_results = dict()
+        self._previous_results_lock = threading.Lock()
 
     def gen_results(self, row_historical_dict, interval: Interval, path_to_result='reports/',
-                    simple_name_for_file=False):
+                    simple_name_for_file=False, progress_callback=None, cancel_event=None):
+        """
+        Ищет паттерны по каждой валюте (при processes > 1 - в пуле процессов, см. pattern_pool;
+        при incremental - только для новых свечей, см. search_signals_incremental) и сохраняет отчёты.
+        Для валют, свечи которых не изменились, сигналы берутся из pattern_cache, а отчёт
+        не перезаписывается, пока прежний отчёт с теми же параметрами на месте.
+        Время этапов и счётчики по каждой валюте учитываются в metrics (см. metrics.Metrics).
+        :param row_historical_dict: словарь валюта -> свечи (data_sources.OhlcBatch или ответ биржи)
+        :param progress_callback: вызывается как progress_callback(interval, currency, path=путь к отчёту)
+            после обработки каждой валюты
+        :param cancel_event: threading.Event, при его установке обработка оставшихся валют прекращается
+        """
         start_time = datetime.datetime.utcnow().strftime("%d_%m_%Y--%H_%M_%S")
-        for currency, data in row_historical_dict.items():
-            # candlestick_pattern_search_results
-            candle_patterns_sr = self.search_pattern(data)
+        row_historical_dict = {currency: as_batch(data) for currency, data in row_historical_dict.items()}
+        cache_keys = dict()
+        cached_signals = dict()
+        # От этих параметров зависит отчёт, но не найденные сигналы
+        report_options = (path_to_result, simple_name_for_file, self.bearish, self.bullish,
+                          type(self.report_sink).__name__, self.report_sink.extension)
+        if self.pattern_cache is not None:
+            cache_keys = {currency: self.pattern_cache.key(data, self.candle_names, interval.name, currency)
+                          for currency, data in row_historical_dict.items()}
+            entries = {currency: self._cache_entry(cache_keys[currency]) for currency in row_historical_dict}
+            actual_reports = {currency: self._actual_report(interval, currency, entries[currency], report_options)
+                              for currency in row_historical_dict}
+            row_historical_dict = {currency: data for currency, data in row_historical_dict.items()
+                                   if actual_reports[currency] is None}
+            self.metrics.increment('actual_reports', len(cache_keys) - len(row_historical_dict),
+                                   interval=interval.name)
+            cached_signals = {currency: SparseSignals(data, *entries[currency]['signals'], len(self.candle_names))
+                              for currency, data in row_historical_dict.items() if entries[currency] is not None}
+            self.metrics.increment('cached_signals', len(cached_signals), interval=interval.name)
+            if self.incremental:
+                with self._previous_results_lock:
+                    self._previous_results.update({(interval.name, currency): signals
+                                                   for currency, signals in cached_signals.items()})
+            if progress_callback is not None:
+                for currency, path in actual_reports.items():
+                    if path is not None:
+                        progress_callback(interval, currency, path=path)
+
+        row_historical_dict = {currency: data for currency, data in row_historical_dict.items()
+                               if currency not in cached_signals}
+        if self.processes > 1 and len(row_historical_dict) > 1 and not self.incremental:
+            search_results = self._timed_search(interval, search_patterns_parallel(
+                row_historical_dict, self.candle_names, self.processes, self.candle_engine))
+        else:
+            search_results = ((currency, self._search(interval, currency, data))
+                              for currency, data in row_historical_dict.items())
+        # Для валют с сигналами из кэша пересоздаётся только отчёт
+        search_results = itertools.chain(cached_signals.items(), search_results)
+        # candlestick_pattern_search_results
+        for currency, signals in search_results:
+            if cancel_event is not None and cancel_event.is_set():
+                self._logger.info(f'Поиск паттернов для {interval} отменён')
+                break
             self._logger.info(f'Данные для {interval}-{currency} были найдены')
-            self._logger.debug(f'{candle_patterns_sr}')
-            cleaned_candle_patterns_sr = self.clear_data(candle_patterns_sr)
-            self._logger.info(f'Данные для {interval}-{currency} были очищены')
-            self._logger.debug(f'{cleaned_candle_patterns_sr}')
-            if simple_name_for_file:
-                cleaned_candle_patterns_sr.to_excel(PurePath(f'{path_to_result}{interval.name}_{currency}.xlsx'))
-            else:
-                cleaned_candle_patterns_sr.to_excel(
-                    PurePath(f'{path_to_result}{interval.name}_{currency}-{start_time}.xlsx'))
-            self._logger.info(f'reports/{interval.name}_{currency}-{start_time}.xlsx был создан')
+            self._logger.debug(f'Сигналы {interval}-{currency}: {len(signals)} на {len(signals.batch)} свечей')
+            with self.metrics.context(interval=interval.name, currency=currency):
+                with self.metrics.timer('clear_data'):
+                    cleaned_candle_patterns_sr = self.clear_signals(signals)
+                self._logger.info(f'Данные для {interval}-{currency} были очищены')
+                self._logger.debug(f'{cleaned_candle_patterns_sr}')
+                if simple_name_for_file:
+                    path = self.report_sink.path_for(f'{path_to_result}{interval.name}_{currency}')
+                else:
+                    path = self.report_sink.path_for(f'{path_to_result}{interval.name}_{currency}-{start_time}')
+                with self.metrics.timer('report_write'):
+                    self.report_sink.write(cleaned_candle_patterns_sr, path)
+                self.metrics.increment('reports_written')
+            self._logger.info(f'{path} был создан')
+            if currency in cache_keys:
+                self.pattern_cache.put(cache_keys[currency], {
+                    'signals': (signals.index, signals.pattern, signals.direction),
+                    'report_options': report_options,
+                    'report': self._report_state(path),
+                })
+            if progress_callback is not None:
+                progress_callback(interval, currency, path=path)
+
+    def _search(self, interval: Interval, currency, row_historical_data):
+        with self.metrics.context(interval=interval.name, currency=currency):
+            if self.incremental:
+                return self._search_incremental(interval, currency, row_historical_data)
+            return self.search_signals(row_historical_data)
+
+    def _timed_search(self, interval: Interval, search_results):
+        """Учитывает в metrics время ожидания результата каждой валюты из пула процессов."""
+        search_results = iter(search_results)
+        while True:
+            start = time.perf_counter()
+            result = next(search_results, None)
+            if result is None:
+                return
+            self.metrics.observe('pattern_search', time.perf_counter() - start,
+                                 interval=interval.name, currency=result[0])
+            yield result
+
+    def _search_incremental(self, interval: Interval, currency, row_historical_data):
+        with self._previous_results_lock:
+            previous = self._previous_results.get((interval.name, currency))
+        result = self.search_signals_incremental(row_historical_data, previous)
+        with self._previous_results_lock:
+            self._previous_results[(interval.name, currency)] = result
+        return result
+
+    def _cache_entry(self, cache_key):
+        entry = self.pattern_cache.get(cache_key)
+        if not isinstance(entry, dict) or 'signals' not in entry:
+            return None
+        return entry
+
+    def _actual_report(self, interval: Interval, currency, entry, report_options):
+        """
+        Возвращает путь к отчёту, если свечи не изменились с прошлого запуска, а отчёт,
+        созданный по ним с теми же параметрами (каталог, имя файла, формат), не был изменён
+        или удалён, иначе None.
+        """
+        if entry is None or entry['report_options'] != report_options:
+            return None
+        report_state = entry['report']
+        if report_state != self._report_state(report_state['path']):
+            return None
+        self._logger.info(f'Данные для {interval}-{currency} не изменились, отчёт {report_state["path"]} актуален')
+        return report_state['path']
+
+    @staticmethod
+    def _report_state(path) -> dict:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return {'path': str(path), 'size': None, 'mtime': None}
+        return {'path': str(path), 'size': stat.st_size, 'mtime': stat.st_mtime_ns}
 
     def search_pattern(self, row_historical_data):
-        hd = pd.DataFrame(row_historical_data["quotes"],
-                          columns=['date', 'close', 'high', 'low', 'open'],
-                          )
-        quotes = [hd['open'], hd['high'], hd['low'], hd['close']]
-
-        candle_patterns_sr = copy.copy(hd)
-        for candle, names in self.candle_names.items():
-            candle_patterns_sr[f"{names[1]}({names[0]})"] = getattr(talib, candle)(*quotes)
-
-        return candle_patterns_sr
+        """
+        :param row_historical_data: свечи валюты, data_sources.OhlcBatch или ответ биржи {'quotes': [...]}
+        :return: DataFrame со столбцами date, close, high, low, open и столбцом сигналов каждого паттерна
+        """
+        signals = self.search_signals(row_historical_data)
+        with self.metrics.timer('dataframe_build'):
+            return pd.concat([signals.batch.frame(), pd.DataFrame(signals.to_dense(), columns=self._columns())],
+                             axis=1)
+
+    def search_signals(self, row_historical_data):
+        """
+        Поиск паттернов без DataFrame: функции паттернов вызываются на непрерывных массивах float64
+        OhlcBatch, от результата каждого паттерна сохраняются только найденные сигналы,
+        плотная матрица (свечи × паттерны) не создаётся. Отчёт строится при записи, см. clear_signals.
+        :return: sparse_signals.SparseSignals
+        """
+        batch = as_batch(row_historical_data)
+        quotes = (batch.open, batch.high, batch.low, batch.close)
+        index, pattern, values = [], [], []
+        with self.metrics.timer('pattern_search'):
+            for number, candle in enumerate(self.candle_names):
+                self._collect(getattr(self._engine, candle)(*quotes), 0, number, index, pattern, values)
+        return self._sparse(batch, index, pattern, values)
+
+    def search_signals_incremental(self, row_historical_data, previous=None):
+        """
+        Инкрементальный вариант search_signals.
+        previous - результат прошлого поиска по этой же валюте. Сигналы свечей, которые совпадают
+        с previous по дате и ценам, берутся из previous (кроме первых lookback свечей окна,
+        где полный поиск сигналов не даёт). Для новых и изменившихся свечей (например,
+        последней, которая была незакрытой) каждый паттерн вычисляется только на хвосте ряда:
+        lookback паттерна плюс новые свечи, поэтому стоимость зависит от количества новых свечей,
+        а не от глубины истории. Если previous не подходит, выполняется обычный search_signals.
+        """
+        batch = as_batch(row_historical_data)
+        if previous is None or len(previous.batch) == 0 or len(batch) == 0:
+            return self.search_signals(batch)
+        previous_dates = pd.Index(previous.batch.dates)
+        if previous.patterns != len(self.candle_names) or not previous_dates.is_unique:
+            return self.search_signals(batch)
+
+        quotes = (batch.open, batch.high, batch.low, batch.close)
+        positions = previous_dates.get_indexer(batch.dates)
+        same = (positions >= 0) & (positions == positions[0] + np.arange(len(batch)))
+        previous_quotes = previous.batch.ohlc()[:, np.maximum(positions, 0)]
+        same &= (previous_quotes == np.stack(quotes)).all(axis=0)
+        first_changed = len(batch) if same.all() else int(np.argmin(same))
+        if first_changed == 0:
+            return self.search_signals(batch)
+
+        # Совпавшие свечи идут в previous подряд начиная с positions[0]. Как и при полном поиске,
+        # в первых lookback свечах нового окна сигналов паттерна нет
+        lookbacks = np.array([self._lookbacks[candle] for candle in self.candle_names])
+        shifted = previous.index.astype(np.int64) - positions[0]
+        kept = (shifted >= lookbacks[previous.pattern]) & (shifted < first_changed)
+        index = [shifted[kept]]
+        pattern = [previous.pattern[kept]]
+        values = [previous.values()[kept]]
+        if first_changed < len(batch):
+            with self.metrics.timer('pattern_search'):
+                for number, candle in enumerate(self.candle_names):
+                    start = max(0, first_changed - self._lookbacks[candle])
+                    tail = getattr(self._engine, candle)(*[quote[start:] for quote in quotes])
+                    self._collect(tail[first_changed - start:], first_changed, number, index, pattern, values)
+        self._logger.debug(f'Паттерны вычислены для {len(batch) - first_changed} новых свечей из {len(batch)}')
+        return self._sparse(batch, index, pattern, values)
+
+    @staticmethod
+    def _collect(signals, offset, number, index, pattern, values):
+        found = np.flatnonzero(signals)
+        index.append(found + offset)
+        pattern.append(np.full(len(found), number, dtype=np.int16))
+        values.append(signals[found])
+
+    def _sparse(self, batch, index, pattern, values) -> SparseSignals:
+        return SparseSignals(batch, np.concatenate(index), np.concatenate(pattern),
+                             SparseSignals.encode(np.concatenate(values)), len(self.candle_names))
 
     def clear_data(self, candle_patterns_sr):
-        candle_patterns_sr.drop('open', axis=1, inplace=True)
-        candle_patterns_sr.drop('high', axis=1, inplace=True)
-        candle_patterns_sr.drop('low', axis=1, inplace=True)
-        candle_patterns_sr.drop('close', axis=1, inplace=True)
-
-        for i in candle_patterns_sr.index:
-            for _, names in self.candle_names.items():
-                if candle_patterns_sr.loc[i, f"{names[1]}({names[0]})"] == -100:
-                    candle_patterns_sr.loc[i, f"{names[1]}({names[0]})"] = self.bearish
-                if candle_patterns_sr.loc[i, f"{names[1]}({names[0]})"] == 100:
-                    candle_patterns_sr.loc[i, f"{names[1]}({names[0]})"] = self.bullish
-
-        for index in range(len(candle_patterns_sr) - 1, -1, -1):
-            row = candle_patterns_sr.iloc[index].to_list()
-            if self.bearish in row or self.bullish in row:
-                continue
-            else:
-                candle_patterns_sr = candle_patterns_sr.drop(index)
-
-        for _, names in self.candle_names.items():
-            col = list(candle_patterns_sr[f"{names[1]}({names[0]})"])
-            if self.bearish in col or self.bullish in col:
+        """Вариант clear_signals для результата search_pattern."""
+        return self.clear_signals(SparseSignals.from_dense(OhlcBatch.from_frame(candle_patterns_sr),
+                                                           candle_patterns_sr[self._columns()].to_numpy()))
+
+    def clear_signals(self, signals):
+        """
+        Строит таблицу отчёта из разреженного результата поиска: остаются только строки и столбцы,
+        в которых найден хотя бы один паттерн, значения -100/100 заменяются на подписи тренда.
+        Из сигналов собирается только матрица оставшихся строк и столбцов.
+        :param signals: sparse_signals.SparseSignals, см. search_signals
+        """
+        columns = np.array(self._columns(), dtype=object)
+        values = signals.values()
+        found = np.abs(values) == 100
+        self.metrics.increment('signals_found', int(found.sum()))
+        rows = np.unique(signals.index[found])
+        cols = np.unique(signals.pattern[found])
+
+        # Сигналы из оставшихся строк и столбцов, в том числе ±80 и ±200
+        row = np.searchsorted(rows, signals.index).clip(max=max(len(rows) - 1, 0))
+        col = np.searchsorted(cols, signals.pattern).clip(max=max(len(cols) - 1, 0))
+        kept = (rows[row] == signals.index) & (cols[col] == signals.pattern) if len(rows) else found
+        matrix = np.zeros((len(rows), len(cols)), dtype=np.int32)
+        matrix[row[kept], col[kept]] = values[kept]
+
+        labels = matrix.astype(object)
+        labels[matrix == -100] = self.bearish
+        labels[matrix == 100] = self.bullish
+
+        cleaned = pd.DataFrame(labels, index=rows.astype(np.int64), columns=columns[cols])
+        cleaned.insert(0, 'date', signals.batch.dates[rows])
+        return cleaned
+
+    def _columns(self) -> list:
+        return [f"{names[1]}({names[0]})" for names in self.candle_names.values()]
+
+    @staticmethod
+    def stack_quotes(row_historical_dict):
+        """
+        Собирает котировки всех валют в одну матрицу для screen.
+        Ряды выравниваются по последней свече, более короткие дополняются слева NaN
+        (обе реализации паттернов пропускают NaN в начале ряда так же, как если бы их не было).
+        :return: (список валют, матрица дат (валюты × свечи), OHLC формы (4, валюты × свечи))
+        """
+        currencies = list(row_historical_dict)
+        batches = [as_batch(row_historical_dict[currency]) for currency in currencies]
+        candles = max(map(len, batches), default=0)
+        dates = np.full((len(batches), candles), None, dtype=object)
+        ohlc = np.full((4, len(batches), candles), np.nan)
+        for row, batch in enumerate(batches):
+            if not len(batch):
                 continue
+            start = candles - len(batch)
+            dates[row, start:] = batch.dates
+            ohlc[:, row, start:] = batch.ohlc()
+        return currencies, dates, ohlc
+
+    def screen(self, currencies, dates, ohlc):
+        """
+        Пакетный поиск паттернов сразу по всем валютам.
+        Каждый паттерн вычисляется одним вызовом на всей матрице (candle_engine='numpy'),
+        для TA-Lib - по строкам, так как он принимает только одномерные ряды.
+        :param currencies: названия валют, по одному на строку матрицы
+        :param dates: даты свечей (валюты × свечи), см. stack_quotes
+        :param ohlc: массив формы (4, валюты, свечи) - open, high, low, close
+        :return: DataFrame со столбцами currency, date, pattern, signal только для найденных
+            паттернов; знак signal - направление (как у TA-Lib: ±100, ±80, ±200)
+        """
+        ohlc = np.asarray(ohlc, dtype=float)
+        currency_index, candle_index, pattern_index, signal = [], [], [], []
+        for pattern, candle in enumerate(self.candle_names):
+            function = getattr(self._engine, candle)
+            if self._engine is numpy_candles:
+                signals = function(*ohlc)
             else:
-                candle_patterns_sr.pop(f"{names[1]}({names[0]})")
-
-        return candle_patterns_sr
+                signals = np.stack([function(*ohlc[:, row]) for row in range(ohlc.shape[1])]) \
+                    if ohlc.shape[1] else np.empty(ohlc.shape[1:], dtype=np.int32)
+            rows, cols = np.nonzero(signals)
+            currency_index.append(rows)
+            candle_index.append(cols)
+            pattern_index.append(np.full(len(rows), pattern))
+            signal.append(signals[rows, cols])
+
+        rows = np.concatenate(currency_index)
+        cols = np.concatenate(candle_index)
+        patterns = np.concatenate(pattern_index)
+        order = np.lexsort((patterns, cols, rows))
+        rows, cols, patterns = rows[order], cols[order], patterns[order]
+        return pd.DataFrame({
+            'currency': np.asarray(currencies, dtype=object)[rows],
+            'date': np.asarray(dates, dtype=object)[rows, cols],
+            'pattern': np.array(list(self.candle_names), dtype=object)[patterns],
+            'signal': np.concatenate(signal)[order],
+        })
+
+    def screen_quotes(self, row_historical_dict):
+        """Пакетный поиск паттернов по результату get_data источника свечей, см. stack_quotes и screen."""
+        return self.screen(*self.stack_quotes(row_historical_dict))
+
+
+def open_data_source(config, logger=None, metrics=None):
+    """
+    Создаёт источник свечей по параметру data_source конфигурации (см. data_sources),
+    для tradermade - вместе с Exchange.
+    """
+    exchange = None
+    if config.get('data_source', 'tradermade') == 'tradermade':
+        exchange = Exchange(config, logger=logger or logging.getLogger('exchange'), metrics=metrics)
+    return get_data_source(config, exchange=exchange, logger=logger or logging.getLogger('data_source'),
+                           metrics=metrics)
 
 
-def run_parser(interval: Interval, ui_config=None):
+def run_parser(intervals=tuple(Interval), ui_config=None):
     """
-    Функция объединяет в себе все классы и нужна для работы скрипта в многопоточном режиме.
-    Так же с её помощью реализовано ожидание обновления.
-    :param interval:
+    Функция объединяет в себе все классы и нужна для работы скрипта в терминальном режиме.
+    Config, источник свечей (см. open_data_source) и Analyzer создаются один раз, а загрузка
+    и анализ по каждому интервалу выполняются планировщиком (см. scheduler) сразу при запуске и затем после закрытия каждой свечи.
+    После каждого запуска сводка metrics сохраняется в каталог metrics_dir, если он задан.
+    :param intervals: интервалы, для которых создаются отчёты
     :return:
     """
     config = Config(PurePath('./config.yaml')).config
     logging.basicConfig(level=config['log_level'])
     main_logger = logging.getLogger('runner')
 
-    exchange = Exchange(ui_config or config)
-    analyzer = Analyzer()
-    main_logger.info(f'Start {interval.name} loop')
-    while True:
-        raw_historical_data = exchange.get_data(interval)
-        analyzer.gen_results(raw_historical_data, interval)
-        time_now = datetime.datetime.utcnow()
-        if interval == Interval.hourly:
-            left_min_until_next_hour = 59 - time_now.minute
-            left_sec_until_next_hour = 59 - time_now.second
-            left = left_min_until_next_hour * 60 + left_sec_until_next_hour
-            main_logger.info(f'Next {interval.name} report will be crated through {left} sec')
-            time.sleep(left)
-        elif interval == Interval.daily:
-            left_hour_until_next_day = 23 - time_now.hour
-            left_min_until_next_day = 59 - time_now.minute
-            left_sec_until_next_day = 59 - time_now.second
-            left = (left_hour_until_next_day * 3600) + (left_min_until_next_day * 60) + left_sec_until_next_day
-            main_logger.info(f'Next {interval.name} report will be crated through {left} sec')
-            time.sleep(left)
-        else:
-            raise f'{interval.name} - invalid interval'
-
+    metrics = get_metrics(config)
+    source = open_data_source(ui_config or config, metrics=metrics)
+    analyzer = Analyzer(report_sink=get_report_sink(config.get('report_format', 'xlsx')),
+                        processes=config.get('analysis_processes', 1),
+                        candle_engine=config.get('candle_engine', 'talib'),
+                        pattern_cache=get_pattern_cache(config),
+                        incremental=config.get('incremental_search', False),
+                        metrics=metrics)
+    scheduler = Scheduler(workers=config.get('scheduler_workers', len(intervals)))
+
+    def run_interval(interval: Interval):
+        currencies = source.currencies
+        capacity = source.capacity(interval)
+        if capacity is not None and capacity < len(currencies):
+            main_logger.warning(f'Остаток квоты api ключей {capacity} меньше количества валют {len(currencies)}, '
+                                f'{interval.name} загружается только для первых {capacity}')
+            currencies = currencies[:capacity]
+        metrics.begin_run(interval.name)
+        try:
+            raw_historical_data = source.get_data(interval, currencies)
+            analyzer.gen_results(raw_historical_data, interval)
+        finally:
+            summary = metrics.end_run(interval.name)
+        main_logger.info(f'{interval.name}: {summary["duration_seconds"]:.1f} с, {summary["counters"]}')
+        main_logger.debug(f'Время этапов {interval.name}: {summary["stages"]}')
+        main_logger.debug(f'Статистика планировщика: {scheduler.job_stats()}')
 
-def run_for_ui(config, intervals, candle_names, ui_logger=None):
-    exchange = Exchange(config, logger=ui_logger)
-    analyzer = Analyzer(candle_names=candle_names, logger=ui_logger)
     for interval in intervals:
-        raw_historical_data = exchange.get_data(interval)
-        analyzer.gen_results(raw_historical_data, interval, path_to_result='./../reports/', simple_name_for_file=True)
+        scheduler.add_job(interval.name, interval.period, functools.partial(run_interval, interval),
+                          delay=config.get('schedule_delay', 0), run_immediately=True)
+    main_logger.info(f'Start {", ".join(interval.name for interval in intervals)} loop')
+    with source:
+        scheduler.run()
 
 
-if __name__ == '__main__':
-    hourly_thread = threading.Thread(target=run_parser, args=[Interval.hourly])
-    daily_thread = threading.Thread(target=run_parser, args=[Interval.daily])
+def run_for_ui(config, intervals, candle_names, ui_logger=None, report_format='xlsx', candle_engine='talib',
+               pattern_cache=None, progress_callback=None, cancel_event=None, metrics=None):
+    """
+    Загружает данные и создаёт отчёты для графического интерфейса.
+    progress_callback(interval, currency, path=None, error=None) вызывается для каждой валюты
+    каждого интервала: с путём к отчёту или с описанием ошибки загрузки.
+    После установки cancel_event (threading.Event) оставшаяся работа не выполняется.
+    metrics (см. metrics.Metrics) собирает время этапов и счётчики, запуск каждого интервала
+    завершается end_run.
+    """
+    ui_logger = ui_logger or logging.getLogger('interface')
+    metrics = metrics or Metrics()
+    analyzer = Analyzer(candle_names=candle_names, logger=ui_logger, report_sink=get_report_sink(report_format),
+                        candle_engine=candle_engine, pattern_cache=pattern_cache, metrics=metrics)
+    with open_data_source(config, logger=ui_logger, metrics=metrics) as source:
+        for interval in intervals:
+            if cancel_event is not None and cancel_event.is_set():
+                break
+            metrics.begin_run(interval.name)
+            try:
+                raw_historical_data = source.get_data(interval, cancel_event=cancel_event)
+                if progress_callback is not None:
+                    for currency, failure in source.failures.get(interval.name, dict()).items():
+                        progress_callback(interval, currency, error=failure['error'] if failure else 'unknown')
+                analyzer.gen_results(raw_historical_data, interval, path_to_result='./../reports/',
+                                     simple_name_for_file=True, progress_callback=progress_callback,
+                                     cancel_event=cancel_event)
+            finally:
+                metrics.end_run(interval.name)
 
-    hourly_thread.start()
-    daily_thread.start()
+
+if __name__ == '__main__':
+    run_parser()
@@ -0,0 +1,170 @@
+import contextlib
+import datetime
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+
+_label_names = ('interval', 'currency')
+_prefix = 'searchpatterns'
+
+
+class Metrics:
+    """
+    Время этапов и счётчики цикла загрузки и анализа.
+    timer и observe учитывают время этапа (количество, сумма и максимум в секундах),
+    increment - счётчики (запросы, байты, повторы, найденные сигналы и т.д.).
+    Значения разделяются по меткам interval и currency; если метка не передана явно,
+    она берётся из context текущего потока, поэтому вложенный код не обязан знать валюту.
+    begin_run(interval) очищает значения интервала перед очередным циклом, end_run возвращает
+    сводку цикла и, если задан directory, сохраняет её в JSON, а все текущие значения -
+    в текстовый файл Prometheus (textfile collector). Методы потокобезопасны.
+    """
+
+    def __init__(self, directory=None, logger=logging.getLogger('metrics')):
+        self._logger = logger
+        self.directory = Path(directory) if directory else None
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._timers = dict()
+        self._counters = dict()
+        self._runs = dict()
+        if self.directory is not None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+
+    @contextlib.contextmanager
+    def context(self, **labels):
+        previous = getattr(self._local, 'labels', dict())
+        self._local.labels = {**previous, **labels}
+        try:
+            yield
+        finally:
+            self._local.labels = previous
+
+    @contextlib.contextmanager
+    def timer(self, stage, **labels):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(stage, time.perf_counter() - start, **labels)
+
+    def observe(self, stage, seconds, **labels):
+        key = (stage, *self._labels(labels))
+        with self._lock:
+            count, total, maximum = self._timers.get(key, (0, 0.0, 0.0))
+            self._timers[key] = (count + 1, total + seconds, max(maximum, seconds))
+
+    def increment(self, name, value=1, **labels):
+        key = (name, *self._labels(labels))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def begin_run(self, interval):
+        with self._lock:
+            self._timers = {key: value for key, value in self._timers.items() if key[1] != interval}
+            self._counters = {key: value for key, value in self._counters.items() if key[1] != interval}
+            self._runs[interval] = {'started': time.time(), 'duration': None}
+
+    def end_run(self, interval) -> dict:
+        with self._lock:
+            run = self._runs.setdefault(interval, {'started': time.time()})
+            run['duration'] = time.time() - run['started']
+        summary = self.summary(interval)
+        if self.directory is not None:
+            started = datetime.datetime.utcfromtimestamp(run['started']).strftime('%Y%m%d_%H%M%S')
+            self._write(self.directory / f'{interval}_{started}.json', json.dumps(summary, indent=1))
+            self._write(self.directory / f'{_prefix}.prom', self.to_prometheus())
+        return summary
+
+    def summary(self, interval) -> dict:
+        """
+        Сводка цикла интервала: время и счётчики по этапам в целом (stages, counters)
+        и по каждой валюте (currencies).
+        """
+        with self._lock:
+            timers = [(key, value) for key, value in self._timers.items() if key[1] == interval]
+            counters = [(key, value) for key, value in self._counters.items() if key[1] == interval]
+            run = dict(self._runs.get(interval, dict()))
+        stages = dict()
+        currencies = dict()
+        for (stage, _, currency), (count, total, maximum) in timers:
+            stage_summary = stages.setdefault(stage, {'count': 0, 'seconds': 0.0, 'max_seconds': 0.0})
+            stage_summary['count'] += count
+            stage_summary['seconds'] += total
+            stage_summary['max_seconds'] = max(stage_summary['max_seconds'], maximum)
+            if currency:
+                currencies.setdefault(currency, dict())[f'{stage}_seconds'] = total
+        totals = dict()
+        for (name, _, currency), value in counters:
+            totals[name] = totals.get(name, 0) + value
+            if currency:
+                currencies.setdefault(currency, dict())[name] = value
+        return {
+            'interval': interval,
+            'started': datetime.datetime.utcfromtimestamp(run['started']).isoformat() if run.get('started') else None,
+            'duration_seconds': run.get('duration'),
+            'stages': stages,
+            'counters': totals,
+            'currencies': currencies,
+        }
+
+    def to_prometheus(self) -> str:
+        with self._lock:
+            timers = sorted(self._timers.items())
+            counters = sorted(self._counters.items())
+            runs = sorted(self._runs.items())
+        lines = [f'# HELP {_prefix}_stage_seconds Time spent in a stage during the last run',
+                 f'# TYPE {_prefix}_stage_seconds gauge']
+        lines += [f'{_prefix}_stage_seconds{self._format_labels(stage=key[0], labels=key[1:])} {total:.6f}'
+                  for key, (_, total, _) in timers]
+        lines += [f'# HELP {_prefix}_stage_calls Number of times a stage ran during the last run',
+                  f'# TYPE {_prefix}_stage_calls gauge']
+        lines += [f'{_prefix}_stage_calls{self._format_labels(stage=key[0], labels=key[1:])} {count}'
+                  for key, (count, _, _) in timers]
+        lines += [f'# HELP {_prefix}_stage_max_seconds Longest single run of a stage during the last run',
+                  f'# TYPE {_prefix}_stage_max_seconds gauge']
+        lines += [f'{_prefix}_stage_max_seconds{self._format_labels(stage=key[0], labels=key[1:])} {maximum:.6f}'
+                  for key, (_, _, maximum) in timers]
+        for name in sorted({key[0] for key, _ in counters}):
+            lines += [f'# HELP {_prefix}_{name} Counter {name} during the last run', f'# TYPE {_prefix}_{name} gauge']
+            lines += [f'{_prefix}_{name}{self._format_labels(labels=key[1:])} {value}'
+                      for key, value in counters if key[0] == name]
+        lines += [f'# HELP {_prefix}_run_duration_seconds Duration of the last run',
+                  f'# TYPE {_prefix}_run_duration_seconds gauge']
+        lines += [f'{_prefix}_run_duration_seconds{{interval="{interval}"}} {run["duration"]:.6f}'
+                  for interval, run in runs if run.get('duration') is not None]
+        lines += [f'# HELP {_prefix}_run_timestamp_seconds Start time of the last run',
+                  f'# TYPE {_prefix}_run_timestamp_seconds gauge']
+        lines += [f'{_prefix}_run_timestamp_seconds{{interval="{interval}"}} {run["started"]:.3f}'
+                  for interval, run in runs]
+        return '\n'.join(lines) + '\n'
+
+    def _labels(self, labels):
+        context = getattr(self._local, 'labels', dict())
+        return tuple(str(labels.get(name, context.get(name, ''))) for name in _label_names)
+
+    @staticmethod
+    def _format_labels(stage=None, labels=()):
+        pairs = [('stage', stage)] if stage is not None else []
+        pairs += [(name, value) for name, value in zip(_label_names, labels) if value]
+        if not pairs:
+            return ''
+        escaped = (str(value).replace('\\', '\\\\').replace('"', '\\"') for _, value in pairs)
+        return '{' + ','.join(f'{name}="{value}"' for (name, _), value in zip(pairs, escaped)) + '}'
+
+    def _write(self, path, text):
+        temp_path = path.with_name(f'{path.name}.tmp')
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as file:
+                file.write(text)
+            os.replace(temp_path, path)
+        except OSError as ex:
+            self._logger.warning(f'Не удалось сохранить {path}: {ex}')
+
+
+def get_metrics(config):
+    """Создаёт Metrics, файлы сохраняются в каталог metrics_dir конфигурации, если он задан."""
+    return Metrics(directory=config.get('metrics_dir'))
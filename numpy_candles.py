@@ -0,0 +1,851 @@
+import functools
+import logging
+import sys
+from fractions import Fraction
+
+import numpy as np
+
+try:
+    import talib
+except ImportError:
+    talib = None
+
+# Движок поиска свечных паттернов на NumPy.
+# Функции называются и вызываются так же, как одноимённые функции TA-Lib
+# (CDL2CROWS(open, high, low, close) и т.д.) и повторяют их результат бит в бит:
+# те же настройки свечей, тот же порядок накопления скользящих сумм и та же обработка
+# NaN в начале ряда. Вместо цикла по свечам каждое условие паттерна считается сразу
+# для всего ряда сдвинутыми срезами массивов. Кроме одномерных рядов принимаются
+# массивы вида (..., свечи): каждая строка считается отдельным рядом.
+
+_REAL_BODY, _HIGH_LOW, _SHADOWS = range(3)
+
+# Настройки свечей TA-Lib по умолчанию: тип диапазона, период усреднения, множитель
+_CANDLE_SETTINGS = {
+    'BodyLong': (_REAL_BODY, 10, 1.0),
+    'BodyVeryLong': (_REAL_BODY, 10, 3.0),
+    'BodyShort': (_REAL_BODY, 10, 1.0),
+    'BodyDoji': (_HIGH_LOW, 10, 0.1),
+    'ShadowLong': (_REAL_BODY, 0, 1.0),
+    'ShadowVeryLong': (_REAL_BODY, 0, 2.0),
+    'ShadowShort': (_SHADOWS, 10, 1.0),
+    'ShadowVeryShort': (_HIGH_LOW, 10, 0.1),
+    'Near': (_HIGH_LOW, 5, 0.2),
+    'Far': (_HIGH_LOW, 5, 0.6),
+    'Equal': (_HIGH_LOW, 5, 0.05),
+}
+
+CANDLE_ENGINES = ('talib', 'numpy')
+
+
+class _Candles:
+    """
+    Котировки одного или нескольких рядов без NaN в начале.
+    Методы со сдвигом shift возвращают значения свечи i - shift для всех
+    свечей i начиная с lookback, то есть для всех свечей, по которым есть результат.
+    """
+
+    def __init__(self, open, high, low, close, lookback):
+        self._open, self._high, self._low, self._close = open, high, low, close
+        self.lookback = lookback
+        self.stop = close.shape[-1]
+        self._white = close >= open
+        self._ranges = dict()
+
+    def extended(self, candles):
+        """Тот же ряд, но результаты начинаются на candles свечей раньше."""
+        extended = _Candles(self._open, self._high, self._low, self._close, self.lookback - candles)
+        extended._ranges = self._ranges
+        return extended
+
+    def _at(self, series, shift):
+        return series[..., self.lookback - shift:self.stop - shift]
+
+    def open(self, shift=0):
+        return self._at(self._open, shift)
+
+    def high(self, shift=0):
+        return self._at(self._high, shift)
+
+    def low(self, shift=0):
+        return self._at(self._low, shift)
+
+    def close(self, shift=0):
+        return self._at(self._close, shift)
+
+    def color(self, shift=0):
+        return np.where(self._at(self._white, shift), 1, -1)
+
+    def white(self, shift=0):
+        return self._at(self._white, shift)
+
+    def black(self, shift=0):
+        return ~self._at(self._white, shift)
+
+    def body(self, shift=0):
+        return self._at(self._range(_REAL_BODY), shift)
+
+    def upper_shadow(self, shift=0):
+        return self.high(shift) - np.where(self.white(shift), self.close(shift), self.open(shift))
+
+    def lower_shadow(self, shift=0):
+        return np.where(self.white(shift), self.open(shift), self.close(shift)) - self.low(shift)
+
+    def body_top(self, shift=0):
+        return _max(self.open(shift), self.close(shift))
+
+    def body_bottom(self, shift=0):
+        return _min(self.open(shift), self.close(shift))
+
+    def body_gap_up(self, shift2, shift1):
+        return self.body_bottom(shift2) > self.body_top(shift1)
+
+    def body_gap_down(self, shift2, shift1):
+        return self.body_top(shift2) < self.body_bottom(shift1)
+
+    def gap_up(self, shift2, shift1):
+        return self.low(shift2) > self.high(shift1)
+
+    def gap_down(self, shift2, shift1):
+        return self.high(shift2) < self.low(shift1)
+
+    def _range(self, range_type):
+        if range_type not in self._ranges:
+            if range_type == _REAL_BODY:
+                value = np.abs(self._close - self._open)
+            elif range_type == _HIGH_LOW:
+                value = self._high - self._low
+            else:
+                value = ((self._high - np.where(self._white, self._close, self._open))
+                         + (np.where(self._white, self._open, self._close) - self._low))
+            self._ranges[range_type] = value
+        return self._ranges[range_type]
+
+    def average(self, setting, shift=0, start=None):
+        """
+        Аналог TA_CANDLEAVERAGE для свечи i - shift.
+        Скользящая сумма накапливается так же, как в TA-Lib: сумма окна перед свечой start
+        и дальше прибавление разности входящей и выходящей свечи, поэтому результат
+        совпадает с TA-Lib до последнего бита. start задаётся, если TA-Lib начинает
+        накапливать сумму раньше первой выдаваемой свечи.
+        """
+        range_type, period, factor = _CANDLE_SETTINGS[setting]
+        divisor = 2.0 if range_type == _SHADOWS else 1.0
+        ranges = self._range(range_type)
+        if not period:
+            return factor * self._at(ranges, shift) / divisor
+        start = self.lookback if start is None else start
+        first = start - shift
+        last = self.stop - shift - 1
+        steps = ranges[..., first:last] - ranges[..., first - period:last - period]
+        totals = np.cumsum(np.concatenate([ranges[..., first - period:first], steps], axis=-1), axis=-1)
+        return factor * (totals[..., period - 1 + self.lookback - start:] / period) / divisor
+
+
+def _min(a, b):
+    # min и max из TA-Lib: при NaN возвращается второй аргумент
+    return np.where(a < b, a, b)
+
+
+def _max(a, b):
+    return np.where(a > b, a, b)
+
+
+def _fma_greater(value, a, b, c):
+    """
+    value > fma(a, b, c) с однократным округлением, как в TA-Lib.
+    Обычное a * b + c округляется дважды, поэтому спорные случаи рядом с границей
+    пересчитываются точно через дроби.
+    """
+    approx = a * b + c
+    result = value > approx
+    margin = (np.abs(a * b) + np.abs(c)) * (4 * np.finfo(np.float64).eps)
+    unsure = np.nonzero((np.abs(value - approx) <= margin) & np.isfinite(approx) & np.isfinite(value))
+    for index in zip(*unsure):
+        exact = float(Fraction(float(a[index])) * Fraction(float(b)) + Fraction(float(c[index])))
+        result[index] = value[index] > exact
+    return result
+
+
+def _signal(condition, value):
+    return np.where(condition, value, 0).astype(np.int32)
+
+
+def _lookback(*settings, offset=0):
+    return max([_CANDLE_SETTINGS[setting][1] for setting in settings], default=0) + offset
+
+
+def _pattern(lookback):
+    """
+    Превращает функцию условия паттерна в функцию с интерфейсом TA-Lib.
+    Как и в обёртке TA-Lib, свечи до первой строки без NaN пропускаются,
+    а первые lookback результатов после неё равны нулю.
+    """
+
+    def decorator(evaluate):
+        @functools.wraps(evaluate)
+        def wrapper(open, high, low, close, **params):
+            quotes = np.stack(np.broadcast_arrays(*[np.asarray(series, dtype=np.float64)
+                                                    for series in (open, high, low, close)]))
+            shape = quotes.shape[1:]
+            if quotes.size == 0:
+                # Пустой ряд или матрица без строк: как TA-Lib, возвращается пустой результат
+                return np.zeros(shape, dtype=np.int32)
+            quotes = quotes.reshape(4, -1, shape[-1] if shape else 1)
+            signals = np.zeros(quotes.shape[1:], dtype=np.int32)
+            valid = ~np.isnan(quotes).any(axis=0)
+            begin = np.where(valid.any(axis=-1), valid.argmax(axis=-1), quotes.shape[-1])
+            for first in np.unique(begin):
+                if quotes.shape[-1] - first <= lookback:
+                    continue
+                rows = np.flatnonzero(begin == first)
+                candles = _Candles(*quotes[:, rows, first:], lookback)
+                signals[rows, first + lookback:] = evaluate(candles, **params)
+            return signals.reshape(shape)
+
+        wrapper.lookback = lookback
+        return wrapper
+
+    return decorator
+
+
+@_pattern(_lookback('BodyLong', offset=2))
+def CDL2CROWS(q):
+    return _signal(q.white(2) & (q.body(2) > q.average('BodyLong', 2)) &
+                   q.black(1) & q.body_gap_up(1, 2) &
+                   q.black() & (q.open() < q.open(1)) & (q.open() > q.close(1)) &
+                   (q.close() > q.open(2)) & (q.close() < q.close(2)), -100)
+
+
+@_pattern(_lookback('ShadowVeryShort', offset=3))
+def CDL3BLACKCROWS(q):
+    return _signal(q.white(3) & q.black(2) & q.black(1) & q.black() &
+                   (q.open(1) < q.open(2)) & (q.open(1) > q.close(2)) &
+                   (q.open() < q.open(1)) & (q.open() > q.close(1)) &
+                   (q.high(3) > q.close(2)) & (q.close(2) > q.close(1)) & (q.close(1) > q.close()) &
+                   (q.lower_shadow(2) < q.average('ShadowVeryShort', 2)) &
+                   (q.lower_shadow(1) < q.average('ShadowVeryShort', 1)) &
+                   (q.lower_shadow() < q.average('ShadowVeryShort')), -100)
+
+
+@_pattern(_lookback('BodyShort', 'BodyLong', offset=2))
+def CDL3INSIDE(q):
+    condition = ((_max(q.close(1), q.open(1)) < _max(q.close(2), q.open(2))) &
+                 (_min(q.close(1), q.open(1)) > _min(q.close(2), q.open(2))) &
+                 ((q.white(2) & q.black() & (q.close() < q.open(2))) |
+                  (q.black(2) & q.white() & (q.close() > q.open(2)))) &
+                 (q.body(2) > q.average('BodyLong', 2)) &
+                 (q.body(1) <= q.average('BodyShort', 1)))
+    return _signal(condition, -q.color(2) * 100)
+
+
+@_pattern(_lookback('Near', offset=3))
+def CDL3LINESTRIKE(q):
+    near3 = q.average('Near', 3)
+    near2 = q.average('Near', 2)
+    condition = ((q.color(3) == q.color(2)) & (q.color(2) == q.color(1)) & (q.color() == -q.color(1)) &
+                 (q.open(2) >= _min(q.open(3), q.close(3)) - near3) &
+                 (q.open(2) <= _max(q.open(3), q.close(3)) + near3) &
+                 (q.open(1) >= _min(q.open(2), q.close(2)) - near2) &
+                 (q.open(1) <= _max(q.open(2), q.close(2)) + near2) &
+                 ((q.white(1) & (q.close(1) > q.close(2)) & (q.close(2) > q.close(3)) &
+                   (q.open() > q.close(1)) & (q.close() < q.open(3))) |
+                  (q.black(1) & (q.close(1) < q.close(2)) & (q.close(2) < q.close(3)) &
+                   (q.open() < q.close(1)) & (q.close() > q.open(3)))))
+    return _signal(condition, q.color(1) * 100)
+
+
+@_pattern(3)
+def CDL3OUTSIDE(q):
+    condition = ((q.white(1) & q.black(2) & (q.close(1) > q.open(2)) & (q.open(1) < q.close(2)) &
+                  (q.close() > q.close(1))) |
+                 (q.black(1) & q.white(2) & (q.open(1) > q.close(2)) & (q.close(1) < q.open(2)) &
+                  (q.close() < q.close(1))))
+    return _signal(condition, q.color(1) * 100)
+
+
+@_pattern(_lookback('ShadowVeryShort', 'ShadowLong', 'BodyLong', 'BodyShort', offset=2))
+def CDL3STARSINSOUTH(q):
+    very_short0 = q.average('ShadowVeryShort')
+    return _signal(q.black(2) & q.black(1) & q.black() &
+                   (q.body(2) > q.average('BodyLong', 2)) &
+                   (q.lower_shadow(2) > q.average('ShadowLong', 2)) &
+                   (q.body(1) < q.body(2)) &
+                   (q.open(1) > q.close(2)) & (q.open(1) <= q.high(2)) &
+                   (q.low(1) < q.close(2)) & (q.low(1) >= q.low(2)) &
+                   (q.lower_shadow(1) > q.average('ShadowVeryShort', 1)) &
+                   (q.body() < q.average('BodyShort')) &
+                   (q.lower_shadow() < very_short0) & (q.upper_shadow() < very_short0) &
+                   (q.low() > q.low(1)) & (q.high() < q.high(1)), 100)
+
+
+@_pattern(_lookback('ShadowVeryShort', 'BodyShort', 'Far', 'Near', offset=2))
+def CDL3WHITESOLDIERS(q):
+    return _signal(q.white(2) & (q.upper_shadow(2) < q.average('ShadowVeryShort', 2)) &
+                   q.white(1) & (q.upper_shadow(1) < q.average('ShadowVeryShort', 1)) &
+                   q.white() & (q.upper_shadow() < q.average('ShadowVeryShort')) &
+                   (q.close() > q.close(1)) & (q.close(1) > q.close(2)) &
+                   (q.open(1) > q.open(2)) & (q.open(1) <= q.close(2) + q.average('Near', 2)) &
+                   (q.open() > q.open(1)) & (q.open() <= q.close(1) + q.average('Near', 1)) &
+                   (q.body(1) > q.body(2) - q.average('Far', 2)) &
+                   (q.body() > q.body(1) - q.average('Far', 1)) &
+                   (q.body() > q.average('BodyShort')), 100)
+
+
+@_pattern(_lookback('BodyDoji', 'BodyLong', 'BodyShort', offset=2))
+def CDLABANDONEDBABY(q, penetration=0.3):
+    condition = ((q.body(2) > q.average('BodyLong', 2)) &
+                 (q.body(1) <= q.average('BodyDoji', 1)) &
+                 (q.body() > q.average('BodyShort')) &
+                 ((q.white(2) & q.black() & (q.close() < q.close(2) - q.body(2) * penetration) &
+                   q.gap_up(1, 2) & q.gap_down(0, 1)) |
+                  (q.black(2) & q.white() & _fma_greater(q.close(), q.body(2), penetration, q.close(2)) &
+                   q.gap_down(1, 2) & q.gap_up(0, 1))))
+    return _signal(condition, q.color() * 100)
+
+
+@_pattern(_lookback('ShadowLong', 'ShadowShort', 'Far', 'Near', 'BodyLong', offset=2))
+def CDLADVANCEBLOCK(q):
+    near1 = q.average('Near', 1)
+    condition = (q.white(2) & q.white(1) & q.white() &
+                 (q.close() > q.close(1)) & (q.close(1) > q.close(2)) &
+                 (q.open(1) > q.open(2)) & (q.open(1) <= q.close(2) + q.average('Near', 2)) &
+                 (q.open() > q.open(1)) & (q.open() <= q.close(1) + near1) &
+                 (q.body(2) > q.average('BodyLong', 2)) &
+                 (q.upper_shadow(2) < q.average('ShadowShort', 2)) &
+                 (((q.body(1) < q.body(2) - q.average('Far', 2)) & (q.body() < q.body(1) + near1)) |
+                  (q.body() < q.body(1) - q.average('Far', 1)) |
+                  ((q.body() < q.body(1)) & (q.body(1) < q.body(2)) &
+                   ((q.upper_shadow() > q.average('ShadowShort')) |
+                    (q.upper_shadow(1) > q.average('ShadowShort', 1)))) |
+                  ((q.body() < q.body(1)) & (q.upper_shadow() > q.average('ShadowLong')))))
+    return _signal(condition, -100)
+
+
+@_pattern(_lookback('BodyLong', 'ShadowVeryShort'))
+def CDLBELTHOLD(q):
+    very_short = q.average('ShadowVeryShort')
+    condition = ((q.body() > q.average('BodyLong')) &
+                 ((q.white() & (q.lower_shadow() < very_short)) |
+                  (q.black() & (q.upper_shadow() < very_short))))
+    return _signal(condition, q.color() * 100)
+
+
+@_pattern(_lookback('BodyLong', offset=4))
+def CDLBREAKAWAY(q):
+    condition = ((q.color(4) == q.color(3)) & (q.color(3) == q.color(1)) & (q.color(1) == -q.color()) &
+                 (q.body(4) > q.average('BodyLong', 4)) &
+                 ((q.black(4) & q.body_gap_down(3, 4) &
+                   (q.high(2) < q.high(3)) & (q.low(2) < q.low(3)) &
+                   (q.high(1) < q.high(2)) & (q.low(1) < q.low(2)) &
+                   (q.close() > q.open(3)) & (q.close() < q.close(4))) |
+                  (q.white(4) & q.body_gap_up(3, 4) &
+                   (q.high(2) > q.high(3)) & (q.low(2) > q.low(3)) &
+                   (q.high(1) > q.high(2)) & (q.low(1) > q.low(2)) &
+                   (q.close() < q.open(3)) & (q.close() > q.close(4)))))
+    return _signal(condition, q.color() * 100)
+
+
+@_pattern(_lookback('BodyLong', 'ShadowVeryShort'))
+def CDLCLOSINGMARUBOZU(q):
+    very_short = q.average('ShadowVeryShort')
+    condition = ((q.body() > q.average('BodyLong')) &
+                 ((q.white() & (q.upper_shadow() < very_short)) |
+                  (q.black() & (q.lower_shadow() < very_short))))
+    return _signal(condition, q.color() * 100)
+
+
+@_pattern(_lookback('ShadowVeryShort', offset=3))
+def CDLCONCEALBABYSWALL(q):
+    very_short3 = q.average('ShadowVeryShort', 3)
+    very_short2 = q.average('ShadowVeryShort', 2)
+    return _signal(q.black(3) & q.black(2) & q.black(1) & q.black() &
+                   (q.lower_shadow(3) < very_short3) & (q.upper_shadow(3) < very_short3) &
+                   (q.lower_shadow(2) < very_short2) & (q.upper_shadow(2) < very_short2) &
+                   q.body_gap_down(1, 2) &
+                   (q.upper_shadow(1) > q.average('ShadowVeryShort', 1)) &
+                   (q.high(1) > q.close(2)) & (q.high() > q.high(1)) & (q.low() < q.low(1)), 100)
+
+
+@_pattern(_lookback('Equal', 'BodyLong', offset=1))
+def CDLCOUNTERATTACK(q):
+    equal = q.average('Equal', 1)
+    condition = ((q.color(1) == -q.color()) &
+                 (q.body(1) > q.average('BodyLong', 1)) & (q.body() > q.average('BodyLong')) &
+                 (q.close() <= q.close(1) + equal) & (q.close() >= q.close(1) - equal))
+    return _signal(condition, q.color() * 100)
+
+
+@_pattern(_lookback('BodyLong', offset=1))
+def CDLDARKCLOUDCOVER(q, penetration=0.5):
+    return _signal(q.white(1) & (q.body(1) > q.average('BodyLong', 1)) &
+                   q.black() & (q.open() > q.high(1)) & (q.close() > q.open(1)) &
+                   (q.close() < q.close(1) - q.body(1) * penetration), -100)
+
+
+@_pattern(_lookback('BodyDoji'))
+def CDLDOJI(q):
+    return _signal(q.body() <= q.average('BodyDoji'), 100)
+
+
+@_pattern(_lookback('BodyDoji', 'BodyLong', offset=1))
+def CDLDOJISTAR(q):
+    condition = ((q.body(1) > q.average('BodyLong', 1)) & (q.body() <= q.average('BodyDoji')) &
+                 ((q.white(1) & q.body_gap_up(0, 1)) | (q.black(1) & q.body_gap_down(0, 1))))
+    return _signal(condition, -q.color(1) * 100)
+
+
+@_pattern(_lookback('BodyDoji', 'ShadowVeryShort'))
+def CDLDRAGONFLYDOJI(q):
+    very_short = q.average('ShadowVeryShort')
+    return _signal((q.body() <= q.average('BodyDoji')) &
+                   (q.upper_shadow() < very_short) & (q.lower_shadow() > very_short), 100)
+
+
+@_pattern(2)
+def CDLENGULFING(q):
+    condition = ((q.white() & q.black(1) &
+                  (((q.close() >= q.open(1)) & (q.open() < q.close(1))) |
+                   ((q.close() > q.open(1)) & (q.open() <= q.close(1))))) |
+                 (q.black() & q.white(1) &
+                  (((q.open() >= q.close(1)) & (q.close() < q.open(1))) |
+                   ((q.open() > q.close(1)) & (q.close() <= q.open(1))))))
+    strength = np.where((q.open() != q.close(1)) & (q.close() != q.open(1)), 100, 80)
+    return _signal(condition, q.color() * strength)
+
+
+@_pattern(_lookback('BodyDoji', 'BodyLong', 'BodyShort', offset=2))
+def CDLEVENINGDOJISTAR(q, penetration=0.3):
+    return _signal(q.white(2) & q.black() & q.body_gap_up(1, 2) &
+                   (q.close() < q.close(2) - q.body(2) * penetration) &
+                   (q.body(2) > q.average('BodyLong', 2)) &
+                   (q.body(1) <= q.average('BodyDoji', 1)) &
+                   (q.body() > q.average('BodyShort')), -100)
+
+
+@_pattern(_lookback('BodyShort', 'BodyLong', offset=2))
+def CDLEVENINGSTAR(q, penetration=0.3):
+    return _signal(q.white(2) & q.black() & q.body_gap_up(1, 2) &
+                   (q.close() < q.close(2) - q.body(2) * penetration) &
+                   (q.body(2) > q.average('BodyLong', 2)) &
+                   (q.body(1) <= q.average('BodyShort', 1)) &
+                   (q.body() > q.average('BodyShort')), -100)
+
+
+@_pattern(_lookback('Near', 'Equal', offset=2))
+def CDLGAPSIDESIDEWHITE(q):
+    near = q.average('Near', 1)
+    equal = q.average('Equal', 1)
+    gap_up = q.body_gap_up(1, 2)
+    condition = (((gap_up & q.body_gap_up(0, 2)) | (q.body_gap_down(1, 2) & q.body_gap_down(0, 2))) &
+                 q.white(1) & q.white() &
+                 (q.body() >= q.body(1) - near) & (q.body() <= q.body(1) + near) &
+                 (q.open() >= q.open(1) - equal) & (q.open() <= q.open(1) + equal))
+    return _signal(condition, np.where(gap_up, 100, -100))
+
+
+@_pattern(_lookback('BodyDoji', 'ShadowVeryShort'))
+def CDLGRAVESTONEDOJI(q):
+    very_short = q.average('ShadowVeryShort')
+    return _signal((q.body() <= q.average('BodyDoji')) &
+                   (q.lower_shadow() < very_short) & (q.upper_shadow() > very_short), 100)
+
+
+@_pattern(_lookback('BodyShort', 'ShadowLong', 'ShadowVeryShort', 'Near', offset=1))
+def CDLHAMMER(q):
+    return _signal((q.body() < q.average('BodyShort')) &
+                   (q.lower_shadow() > q.average('ShadowLong')) &
+                   (q.upper_shadow() < q.average('ShadowVeryShort')) &
+                   (_min(q.close(), q.open()) <= q.low(1) + q.average('Near', 1)), 100)
+
+
+@_pattern(_lookback('BodyShort', 'ShadowLong', 'ShadowVeryShort', 'Near', offset=1))
+def CDLHANGINGMAN(q):
+    return _signal((q.body() < q.average('BodyShort')) &
+                   (q.lower_shadow() > q.average('ShadowLong')) &
+                   (q.upper_shadow() < q.average('ShadowVeryShort')) &
+                   (_min(q.close(), q.open()) >= q.high(1) - q.average('Near', 1)), -100)
+
+
+def _harami(q, small_body):
+    top, bottom = _max(q.close(), q.open()), _min(q.close(), q.open())
+    top1, bottom1 = _max(q.close(1), q.open(1)), _min(q.close(1), q.open(1))
+    candidate = (q.body(1) > q.average('BodyLong', 1)) & small_body
+    strength = np.where((top < top1) & (bottom > bottom1), 100,
+                        np.where((top <= top1) & (bottom >= bottom1), 80, 0))
+    return _signal(candidate, -q.color(1) * strength)
+
+
+@_pattern(_lookback('BodyShort', 'BodyLong', offset=1))
+def CDLHARAMI(q):
+    return _harami(q, q.body() <= q.average('BodyShort'))
+
+
+@_pattern(_lookback('BodyDoji', 'BodyLong', offset=1))
+def CDLHARAMICROSS(q):
+    return _harami(q, q.body() <= q.average('BodyDoji'))
+
+
+@_pattern(_lookback('BodyShort', 'ShadowVeryLong'))
+def CDLHIGHWAVE(q):
+    very_long = q.average('ShadowVeryLong')
+    condition = ((q.body() < q.average('BodyShort')) &
+                 (q.upper_shadow() > very_long) & (q.lower_shadow() > very_long))
+    return _signal(condition, q.color() * 100)
+
+
+def _hikkake_signals(q, pattern):
+    """
+    Сигналы хикакэ: сам паттерн даёт +-100, а пробой его внутреннего бара
+    в течение трёх следующих свечей (если раньше не было нового паттерна
+    или пробоя) даёт подтверждение +-200.
+    q и pattern начинаются на три свечи раньше первой выдаваемой свечи,
+    как предварительный проход в TA-Lib.
+    """
+    result = np.where(q.high() < q.high(1), 100, -100)
+    signals = np.where(pattern, result, 0)
+    size = pattern.shape[-1]
+
+    def breakout(shift, distance):
+        close = q.close()[..., distance:size - shift + distance]
+        direction = result[..., :size - shift]
+        return (((direction > 0) & (close > q.high(1)[..., :size - shift])) |
+                ((direction < 0) & (close < q.low(1)[..., :size - shift])))
+
+    for shift in range(1, 4):
+        confirmed = pattern[..., :size - shift] & breakout(shift, shift) & ~pattern[..., shift:]
+        for distance in range(1, shift):
+            confirmed &= ~pattern[..., distance:size - shift + distance] & ~breakout(shift, distance)
+        signals[..., shift:] = np.where(confirmed, result[..., :size - shift] * 2, signals[..., shift:])
+    return signals[..., 3:].astype(np.int32)
+
+
+@_pattern(5)
+def CDLHIKKAKE(q):
+    q = q.extended(3)
+    pattern = ((q.high(1) < q.high(2)) & (q.low(1) > q.low(2)) &
+               (((q.high() < q.high(1)) & (q.low() < q.low(1))) |
+                ((q.high() > q.high(1)) & (q.low() > q.low(1)))))
+    return _hikkake_signals(q, pattern)
+
+
+@_pattern(max(1, _lookback('Near')) + 5)
+def CDLHIKKAKEMOD(q):
+    q = q.extended(3)
+    near = q.average('Near', 2)
+    pattern = ((q.high(2) < q.high(3)) & (q.low(2) > q.low(3)) &
+               (q.high(1) < q.high(2)) & (q.low(1) > q.low(2)) &
+               (((q.high() < q.high(1)) & (q.low() < q.low(1)) & (q.close(2) <= q.low(2) + near)) |
+                ((q.high() > q.high(1)) & (q.low() > q.low(1)) & (q.close(2) >= q.high(2) - near))))
+    return _hikkake_signals(q, pattern)
+
+
+@_pattern(_lookback('BodyShort', 'BodyLong', offset=1))
+def CDLHOMINGPIGEON(q):
+    return _signal(q.black(1) & q.black() &
+                   (q.body(1) > q.average('BodyLong', 1)) & (q.body() <= q.average('BodyShort')) &
+                   (q.open() < q.open(1)) & (q.close() > q.close(1)), 100)
+
+
+@_pattern(_lookback('ShadowVeryShort', 'Equal', offset=2))
+def CDLIDENTICAL3CROWS(q):
+    equal2 = q.average('Equal', 2)
+    equal1 = q.average('Equal', 1)
+    return _signal(q.black(2) & (q.lower_shadow(2) < q.average('ShadowVeryShort', 2)) &
+                   q.black(1) & (q.lower_shadow(1) < q.average('ShadowVeryShort', 1)) &
+                   q.black() & (q.lower_shadow() < q.average('ShadowVeryShort')) &
+                   (q.close(2) > q.close(1)) & (q.close(1) > q.close()) &
+                   (q.open(1) <= q.close(2) + equal2) & (q.open(1) >= q.close(2) - equal2) &
+                   (q.open() <= q.close(1) + equal1) & (q.open() >= q.close(1) - equal1), -100)
+
+
+@_pattern(_lookback('Equal', 'BodyLong', offset=1))
+def CDLINNECK(q):
+    return _signal(q.black(1) & (q.body(1) > q.average('BodyLong', 1)) &
+                   q.white() & (q.open() < q.low(1)) &
+                   (q.close() <= q.close(1) + q.average('Equal', 1)) & (q.close() >= q.close(1)), -100)
+
+
+@_pattern(_lookback('BodyShort', 'ShadowLong', 'ShadowVeryShort', offset=1))
+def CDLINVERTEDHAMMER(q):
+    return _signal(q.body_gap_down(0, 1) & (q.body() < q.average('BodyShort')) &
+                   (q.upper_shadow() > q.average('ShadowLong')) &
+                   (q.lower_shadow() < q.average('ShadowVeryShort')), 100)
+
+
+def _kicking(q):
+    very_short1 = q.average('ShadowVeryShort', 1)
+    very_short0 = q.average('ShadowVeryShort')
+    return ((q.color(1) == -q.color()) &
+            (q.body(1) > q.average('BodyLong', 1)) &
+            (q.upper_shadow(1) < very_short1) & (q.lower_shadow(1) < very_short1) &
+            (q.body() > q.average('BodyLong')) &
+            (q.upper_shadow() < very_short0) & (q.lower_shadow() < very_short0) &
+            ((q.black(1) & q.gap_up(0, 1)) | (q.white(1) & q.gap_down(0, 1))))
+
+
+@_pattern(_lookback('ShadowVeryShort', 'BodyLong', offset=1))
+def CDLKICKING(q):
+    return _signal(_kicking(q), q.color() * 100)
+
+
+@_pattern(_lookback('ShadowVeryShort', 'BodyLong', offset=1))
+def CDLKICKINGBYLENGTH(q):
+    return _signal(_kicking(q), np.where(q.body() > q.body(1), q.color(), q.color(1)) * 100)
+
+
+@_pattern(_lookback('ShadowVeryShort', offset=4))
+def CDLLADDERBOTTOM(q):
+    return _signal(q.black(4) & q.black(3) & q.black(2) &
+                   (q.open(4) > q.open(3)) & (q.open(3) > q.open(2)) &
+                   (q.close(4) > q.close(3)) & (q.close(3) > q.close(2)) &
+                   q.black(1) & (q.upper_shadow(1) > q.average('ShadowVeryShort', 1)) &
+                   q.white() & (q.open() > q.open(1)) & (q.close() > q.high(1)), 100)
+
+
+@_pattern(_lookback('BodyDoji', 'ShadowLong'))
+def CDLLONGLEGGEDDOJI(q):
+    shadow_long = q.average('ShadowLong')
+    return _signal((q.body() <= q.average('BodyDoji')) &
+                   ((q.lower_shadow() > shadow_long) | (q.upper_shadow() > shadow_long)), 100)
+
+
+@_pattern(_lookback('BodyLong', 'ShadowShort'))
+def CDLLONGLINE(q):
+    shadow_short = q.average('ShadowShort')
+    condition = ((q.body() > q.average('BodyLong')) &
+                 (q.upper_shadow() < shadow_short) & (q.lower_shadow() < shadow_short))
+    return _signal(condition, q.color() * 100)
+
+
+@_pattern(_lookback('BodyLong', 'ShadowVeryShort'))
+def CDLMARUBOZU(q):
+    very_short = q.average('ShadowVeryShort')
+    condition = ((q.body() > q.average('BodyLong')) &
+                 (q.upper_shadow() < very_short) & (q.lower_shadow() < very_short))
+    return _signal(condition, q.color() * 100)
+
+
+@_pattern(_lookback('Equal', offset=1))
+def CDLMATCHINGLOW(q):
+    equal = q.average('Equal', 1)
+    return _signal(q.black(1) & q.black() &
+                   (q.close() <= q.close(1) + equal) & (q.close() >= q.close(1) - equal), 100)
+
+
+@_pattern(_lookback('BodyShort', 'BodyLong', offset=4))
+def CDLMATHOLD(q, penetration=0.5):
+    floor = q.close(4) - q.body(4) * penetration
+    return _signal(q.white(4) & q.black(3) & q.white() &
+                   q.body_gap_up(3, 4) &
+                   (_min(q.open(2), q.close(2)) < q.close(4)) &
+                   (_min(q.open(1), q.close(1)) < q.close(4)) &
+                   (_min(q.open(2), q.close(2)) > floor) &
+                   (_min(q.open(1), q.close(1)) > floor) &
+                   (_max(q.close(2), q.open(2)) < q.open(3)) &
+                   (_max(q.close(1), q.open(1)) < _max(q.close(2), q.open(2))) &
+                   (q.open() > q.close(1)) &
+                   (q.close() > _max(_max(q.high(3), q.high(2)), q.high(1))) &
+                   (q.body(4) > q.average('BodyLong', 4)) &
+                   (q.body(3) < q.average('BodyShort', 3)) &
+                   (q.body(2) < q.average('BodyShort', 2)) &
+                   (q.body(1) < q.average('BodyShort', 1)), 100)
+
+
+@_pattern(_lookback('BodyDoji', 'BodyLong', 'BodyShort', offset=2))
+def CDLMORNINGDOJISTAR(q, penetration=0.3):
+    return _signal(q.black(2) & q.white() & q.body_gap_down(1, 2) &
+                   _fma_greater(q.close(), q.body(2), penetration, q.close(2)) &
+                   (q.body(2) > q.average('BodyLong', 2)) &
+                   (q.body(1) <= q.average('BodyDoji', 1)) &
+                   (q.body() > q.average('BodyShort')), 100)
+
+
+@_pattern(_lookback('BodyShort', 'BodyLong', offset=2))
+def CDLMORNINGSTAR(q, penetration=0.3):
+    return _signal(q.black(2) & q.white() & q.body_gap_down(1, 2) &
+                   _fma_greater(q.close(), q.body(2), penetration, q.close(2)) &
+                   (q.body(2) > q.average('BodyLong', 2)) &
+                   (q.body(1) <= q.average('BodyShort', 1)) &
+                   (q.body() > q.average('BodyShort')), 100)
+
+
+@_pattern(_lookback('Equal', 'BodyLong', offset=1))
+def CDLONNECK(q):
+    equal = q.average('Equal', 1)
+    return _signal(q.black(1) & (q.body(1) > q.average('BodyLong', 1)) &
+                   q.white() & (q.open() < q.low(1)) &
+                   (q.close() <= q.low(1) + equal) & (q.close() >= q.low(1) - equal), -100)
+
+
+@_pattern(_lookback('BodyLong', offset=1))
+def CDLPIERCING(q):
+    # fma(body, 0.5, close) в TA-Lib: умножение на 0.5 точное, поэтому округление одно и без fma
+    return _signal(q.black(1) & (q.body(1) > q.average('BodyLong', 1)) &
+                   q.white() & (q.body() > q.average('BodyLong')) &
+                   (q.open() < q.low(1)) & (q.close() < q.open(1)) &
+                   (q.close() > q.body(1) * 0.5 + q.close(1)), 100)
+
+
+@_pattern(_lookback('BodyDoji', 'ShadowLong', 'Near'))
+def CDLRICKSHAWMAN(q):
+    shadow_long = q.average('ShadowLong')
+    near = q.average('Near')
+    middle = q.low() + (q.high() - q.low()) / 2
+    return _signal((q.body() <= q.average('BodyDoji')) &
+                   (q.lower_shadow() > shadow_long) & (q.upper_shadow() > shadow_long) &
+                   (_min(q.open(), q.close()) <= middle + near) &
+                   (_max(q.open(), q.close()) >= middle - near), 100)
+
+
+@_pattern(_lookback('BodyShort', 'BodyLong', offset=4))
+def CDLRISEFALL3METHODS(q):
+    trend = q.color(4)
+    condition = ((q.color(4) == -q.color(3)) & (q.color(3) == q.color(2)) &
+                 (q.color(2) == q.color(1)) & (q.color(1) == -q.color()) &
+                 (_min(q.open(3), q.close(3)) < q.high(4)) & (_max(q.open(3), q.close(3)) > q.low(4)) &
+                 (_min(q.open(2), q.close(2)) < q.high(4)) & (_max(q.open(2), q.close(2)) > q.low(4)) &
+                 (_min(q.open(1), q.close(1)) < q.high(4)) & (_max(q.open(1), q.close(1)) > q.low(4)) &
+                 (q.close(2) * trend < q.close(3) * trend) &
+                 (q.close(1) * trend < q.close(2) * trend) &
+                 (q.open() * trend > q.close(1) * trend) &
+                 (q.close() * trend > q.close(4) * trend) &
+                 (q.body(4) > q.average('BodyLong', 4)) &
+                 (q.body(3) < q.average('BodyShort', 3)) &
+                 (q.body(2) < q.average('BodyShort', 2)) &
+                 (q.body(1) < q.average('BodyShort', 1)) &
+                 (q.body() > q.average('BodyLong')))
+    return _signal(condition, trend * 100)
+
+
+@_pattern(_lookback('ShadowVeryShort', 'BodyLong', 'Equal', offset=1))
+def CDLSEPARATINGLINES(q):
+    equal = q.average('Equal', 1)
+    very_short = q.average('ShadowVeryShort')
+    condition = ((q.color(1) == -q.color()) &
+                 (q.open() <= q.open(1) + equal) & (q.open() >= q.open(1) - equal) &
+                 (q.body() > q.average('BodyLong')) &
+                 ((q.white() & (q.lower_shadow() < very_short)) |
+                  (q.black() & (q.upper_shadow() < very_short))))
+    return _signal(condition, q.color() * 100)
+
+
+@_pattern(_lookback('BodyShort', 'ShadowLong', 'ShadowVeryShort', offset=1))
+def CDLSHOOTINGSTAR(q):
+    return _signal(q.body_gap_up(0, 1) & (q.body() < q.average('BodyShort')) &
+                   (q.upper_shadow() > q.average('ShadowLong')) &
+                   (q.lower_shadow() < q.average('ShadowVeryShort')), -100)
+
+
+@_pattern(_lookback('BodyShort', 'ShadowShort'))
+def CDLSHORTLINE(q):
+    shadow_short = q.average('ShadowShort')
+    condition = ((q.body() < q.average('BodyShort')) &
+                 (q.upper_shadow() < shadow_short) & (q.lower_shadow() < shadow_short))
+    return _signal(condition, q.color() * 100)
+
+
+@_pattern(_lookback('BodyShort'))
+def CDLSPINNINGTOP(q):
+    condition = ((q.upper_shadow() > q.body()) & (q.lower_shadow() > q.body()) &
+                 (q.body() < q.average('BodyShort')))
+    return _signal(condition, q.color() * 100)
+
+
+@_pattern(_lookback('BodyLong', 'BodyShort', 'ShadowVeryShort', 'Near', offset=2))
+def CDLSTALLEDPATTERN(q):
+    return _signal(q.white(2) & q.white(1) & q.white() &
+                   (q.close() > q.close(1)) & (q.close(1) > q.close(2)) &
+                   (q.body(2) > q.average('BodyLong', 2)) &
+                   (q.body(1) > q.average('BodyLong', 1)) &
+                   (q.upper_shadow(1) < q.average('ShadowVeryShort', 1)) &
+                   (q.open(1) > q.open(2)) &
+                   (q.open(1) <= q.close(2) + q.average('Near', 2)) &
+                   (q.body() < q.average('BodyShort')) &
+                   (q.open() >= q.close(1) - q.body() - q.average('Near', 1)), -100)
+
+
+@_pattern(_lookback('Equal', offset=2))
+def CDLSTICKSANDWICH(q):
+    equal = q.average('Equal', 2)
+    return _signal(q.black(2) & q.white(1) & q.black() & (q.low(1) > q.close(2)) &
+                   (q.close() <= q.close(2) + equal) & (q.close() >= q.close(2) - equal), 100)
+
+
+@_pattern(_lookback('BodyDoji', 'ShadowVeryShort', 'ShadowVeryLong'))
+def CDLTAKURI(q):
+    return _signal((q.body() <= q.average('BodyDoji')) &
+                   (q.upper_shadow() < q.average('ShadowVeryShort')) &
+                   (q.lower_shadow() > q.average('ShadowVeryLong')), 100)
+
+
+@_pattern(_lookback('Near', offset=2))
+def CDLTASUKIGAP(q):
+    near = q.average('Near', 1)
+    similar_bodies = np.abs(q.body(1) - q.body()) < near
+    condition = ((q.body_gap_up(1, 2) & q.white(1) & q.black() &
+                  (q.open() < q.close(1)) & (q.open() > q.open(1)) &
+                  (q.close() < q.open(1)) & (q.close() > _max(q.close(2), q.open(2))) & similar_bodies) |
+                 (q.body_gap_down(1, 2) & q.black(1) & q.white() &
+                  (q.open() < q.open(1)) & (q.open() > q.close(1)) &
+                  (q.close() > q.open(1)) & (q.close() < _min(q.close(2), q.open(2))) & similar_bodies))
+    return _signal(condition, q.color(1) * 100)
+
+
+@_pattern(_lookback('Equal', 'BodyLong', offset=1))
+def CDLTHRUSTING(q):
+    # Как и в CDLPIERCING, fma с множителем 0.5 совпадает с обычным выражением
+    return _signal(q.black(1) & (q.body(1) > q.average('BodyLong', 1)) &
+                   q.white() & (q.open() < q.low(1)) &
+                   (q.close() > q.close(1) + q.average('Equal', 1)) &
+                   (q.close() <= q.body(1) * 0.5 + q.close(1)), -100)
+
+
+@_pattern(_lookback('BodyDoji', offset=2))
+def CDLTRISTAR(q):
+    doji = q.average('BodyDoji', 2)
+    candidate = (q.body(2) <= doji) & (q.body(1) <= doji) & (q.body() <= doji)
+    signals = np.where(q.body_gap_up(1, 2) & (q.body_top() < q.body_top(1)), -100, 0)
+    signals = np.where(q.body_gap_down(1, 2) & (q.body_bottom() > q.body_bottom(1)), 100, signals)
+    return _signal(candidate, signals)
+
+
+@_pattern(_lookback('BodyShort', 'BodyLong', offset=2))
+def CDLUNIQUE3RIVER(q):
+    return _signal(q.black(2) & q.black(1) & q.white() &
+                   (q.close(1) > q.close(2)) & (q.open(1) <= q.open(2)) & (q.low(1) < q.low(2)) &
+                   (q.open() > q.low(1)) &
+                   (q.body(2) > q.average('BodyLong', 2)) &
+                   (q.body() < q.average('BodyShort')), 100)
+
+
+@_pattern(_lookback('BodyShort', 'BodyLong', offset=2))
+def CDLUPSIDEGAP2CROWS(q):
+    return _signal(q.white(2) & (q.body(2) > q.average('BodyLong', 2)) &
+                   q.black(1) & (q.body(1) <= q.average('BodyShort', 1)) &
+                   q.body_gap_up(1, 2) &
+                   q.black() & (q.open() > q.open(1)) & (q.close() < q.close(1)) & (q.close() > q.close(2)),
+                   -100)
+
+
+@_pattern(2)
+def CDLXSIDEGAP3METHODS(q):
+    condition = ((q.color(2) == q.color(1)) & (q.color(1) == -q.color()) &
+                 (q.open() < _max(q.close(1), q.open(1))) & (q.open() > _min(q.close(1), q.open(1))) &
+                 (q.close() < _max(q.close(2), q.open(2))) & (q.close() > _min(q.close(2), q.open(2))) &
+                 ((q.white(2) & q.body_gap_up(1, 2)) | (q.black(2) & q.body_gap_down(1, 2))))
+    return _signal(condition, q.color(2) * 100)
+
+
+def get_candle_engine(engine='talib', logger=logging.getLogger('numpy_candles')):
+    """
+    Возвращает модуль, в котором ищутся функции паттернов по их имени из exchange_data.get_candle_names.
+    Если TA-Lib не установлен, вместо него используется этот модуль.
+    """
+    if engine not in CANDLE_ENGINES:
+        raise ValueError(f'{engine} - unknown candle engine, expected one of {list(CANDLE_ENGINES)}')
+    if engine == 'talib' and talib is not None:
+        return talib
+    if engine == 'talib':
+        logger.warning('TA-Lib is not installed, candle patterns are evaluated by the NumPy engine')
+    return sys.modules[__name__]
@@ -0,0 +1,137 @@
+import hashlib
+import logging
+import os
+import pickle
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+
+class PatternCache:
+    """
+    Кэш результатов поиска паттернов.
+    Ключ - хэш дат и цен OHLC валюты вместе с набором выбранных паттернов, поэтому при неизменных
+    свечах результат берётся из кэша без повторного поиска. Analyzer хранит в значении найденные
+    сигналы (тройки sparse_signals.SparseSignals) и состояние созданного по ним отчёта.
+    Значения хранятся в памяти (не более max_entries, вытесняются давно не использованные) и, если указан directory,
+    дополнительно на диске (не более disk_entries файлов), чтобы переживать перезапуск программы.
+    Порядок использования файлов на диске сканируется один раз при создании кэша и дальше
+    ведётся в памяти, поэтому put не перебирает каталог.
+    Методы потокобезопасны.
+    """
+
+    def __init__(self, max_entries=256, directory=None, disk_entries=4096, logger=logging.getLogger('pattern_cache')):
+        self._logger = logger
+        self.max_entries = max(1, int(max_entries))
+        self.directory = Path(directory) if directory else None
+        self.disk_entries = max(1, int(disk_entries))
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        # Ключи файлов на диске, от давно не использованных к недавним
+        self._disk_keys = OrderedDict()
+        self._disk_lock = threading.Lock()
+        if self.directory is not None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            self._scan_disk()
+
+    @staticmethod
+    def key(batch, candle_names, *extra) -> str:
+        """
+        :param batch: свечи валюты, data_sources.OhlcBatch
+        :param candle_names: выбранные паттерны
+        :param extra: прочие параметры, от которых зависит результат
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(repr((sorted(candle_names.items()), extra)).encode())
+        digest.update('\n'.join(map(str, batch.dates)).encode())
+        digest.update(batch.ohlc().T.tobytes())
+        return digest.hexdigest()
+
+    def get(self, key):
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+        value = self._load(key)
+        with self._lock:
+            if value is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._remember(key, value)
+        return value
+
+    def put(self, key, value):
+        with self._lock:
+            self._remember(key, value)
+        self._dump(key, value)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {'entries': len(self._entries), 'hits': self.hits, 'misses': self.misses}
+
+    def _remember(self, key, value):
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _path(self, key) -> Path:
+        return self.directory / f'{key}.pkl'
+
+    def _load(self, key):
+        if self.directory is None:
+            return None
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as file:
+                value = pickle.load(file)
+        except FileNotFoundError:
+            return None
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError) as ex:
+            self._logger.warning(f'Не удалось прочитать {path}: {ex}')
+            return None
+        os.utime(path)
+        self._touch_disk(key)
+        return value
+
+    def _dump(self, key, value):
+        if self.directory is None:
+            return
+        path = self._path(key)
+        temp_path = path.with_name(f'{path.name}.{threading.get_ident()}.tmp')
+        try:
+            with open(temp_path, 'wb') as file:
+                pickle.dump(value, file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, path)
+        except OSError as ex:
+            self._logger.warning(f'Не удалось сохранить {path}: {ex}')
+            return
+        for removed in self._touch_disk(key):
+            try:
+                os.remove(self._path(removed))
+            except OSError:
+                pass
+
+    def _touch_disk(self, key) -> list:
+        """Отмечает файл key как недавно использованный и возвращает ключи файлов сверх disk_entries."""
+        with self._disk_lock:
+            self._disk_keys[key] = None
+            self._disk_keys.move_to_end(key)
+            return [self._disk_keys.popitem(last=False)[0] for _ in range(len(self._disk_keys) - self.disk_entries)]
+
+    def _scan_disk(self):
+        files = [entry for entry in os.scandir(self.directory) if entry.name.endswith('.pkl')]
+        files.sort(key=lambda entry: entry.stat().st_mtime_ns)
+        self._disk_keys.update((entry.name[:-len('.pkl')], None) for entry in files)
+
+
+def get_pattern_cache(config):
+    """Создаёт кэш по параметрам pattern_cache_size и pattern_cache_dir конфигурации, 0 - без кэша."""
+    max_entries = config.get('pattern_cache_size', 256)
+    if not max_entries:
+        return None
+    return PatternCache(max_entries, directory=config.get('pattern_cache_dir'))
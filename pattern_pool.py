@@ -0,0 +1,73 @@
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from data_sources import as_batch
+from numpy_candles import get_candle_engine
+from sparse_signals import SparseSignals
+
+_ohlc_columns = ['open', 'high', 'low', 'close']
+
+
+def search_patterns_parallel(row_historical_dict, candle_names, processes, candle_engine='talib'):
+    """
+    Ищет паттерны для всех валют в пуле процессов.
+    Котировки всех валют складываются в один блок разделяемой памяти (4 x свечи),
+    результаты процессы пишут во второй блок (паттерны x свечи), поэтому между
+    процессами передаются только имена блоков и границы валют, а не DataFrame.
+    candle_engine - имя движка паттернов, см. numpy_candles.get_candle_engine.
+    Возвращает итератор пар (валюта, sparse_signals.SparseSignals) в том же виде,
+    что и Analyzer.search_signals: из общего блока по каждой валюте берутся только найденные сигналы.
+    """
+    batches = {currency: as_batch(data) for currency, data in row_historical_dict.items()}
+    bounds = dict()
+    total = 0
+    for currency, batch in batches.items():
+        bounds[currency] = (total, total + len(batch))
+        total += len(batch)
+    candles = list(candle_names)
+
+    ohlc_memory = shared_memory.SharedMemory(create=True, size=max(total, 1) * len(_ohlc_columns) * 8)
+    signals_memory = shared_memory.SharedMemory(create=True, size=max(total, 1) * max(len(candles), 1) * 4)
+    try:
+        ohlc = np.ndarray((len(_ohlc_columns), total), dtype=np.float64, buffer=ohlc_memory.buf)
+        signals = np.ndarray((len(candles), total), dtype=np.int32, buffer=signals_memory.buf)
+        for currency, batch in batches.items():
+            start, stop = bounds[currency]
+            ohlc[:, start:stop] = batch.ohlc()
+
+        chunks = np.array_split(np.array(list(bounds.values()), dtype=np.int64).reshape(-1, 2), processes * 4)
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            futures = [executor.submit(_evaluate_chunk, ohlc_memory.name, signals_memory.name, total, candles,
+                                       chunk.tolist(), candle_engine)
+                       for chunk in chunks if len(chunk)]
+            for future in futures:
+                future.result()
+
+        for currency, batch in batches.items():
+            start, stop = bounds[currency]
+            yield currency, SparseSignals.from_dense(batch, signals[:, start:stop].T)
+    finally:
+        ohlc_memory.close()
+        ohlc_memory.unlink()
+        signals_memory.close()
+        signals_memory.unlink()
+
+
+def _evaluate_chunk(ohlc_name, signals_name, total, candles, bounds, candle_engine):
+    # Блоками владеет родительский процесс, здесь они только подключаются и закрываются.
+    ohlc_memory = shared_memory.SharedMemory(name=ohlc_name)
+    signals_memory = shared_memory.SharedMemory(name=signals_name)
+    engine = get_candle_engine(candle_engine)
+    try:
+        ohlc = np.ndarray((len(_ohlc_columns), total), dtype=np.float64, buffer=ohlc_memory.buf)
+        signals = np.ndarray((len(candles), total), dtype=np.int32, buffer=signals_memory.buf)
+        for start, stop in bounds:
+            quotes = [ohlc[row, start:stop] for row in range(len(_ohlc_columns))]
+            for index, candle in enumerate(candles):
+                signals[index, start:stop] = getattr(engine, candle)(*quotes)
+        del ohlc, signals, quotes
+    finally:
+        ohlc_memory.close()
+        signals_memory.close()
@@ -0,0 +1,91 @@
+from pathlib import PurePath
+
+from openpyxl import Workbook
+
+
+class ReportSink:
+    """
+    Базовый класс способа сохранения отчёта.
+    Наследники задают расширение файла и реализуют метод write,
+    который сохраняет очищенный DataFrame с результатами по указанному пути.
+    """
+
+    extension = None
+
+    def path_for(self, path_without_extension) -> PurePath:
+        return PurePath(f'{path_without_extension}.{self.extension}')
+
+    def write(self, frame, path):
+        raise NotImplementedError
+
+
+class XlsxSink(ReportSink):
+    extension = 'xlsx'
+
+    def write(self, frame, path):
+        frame.to_excel(path)
+
+
+class StreamingXlsxSink(ReportSink):
+    """
+    Запись xlsx через write-only книгу openpyxl: строки сразу уходят в файл,
+    потребление памяти не зависит от размера отчёта.
+    """
+
+    extension = 'xlsx'
+
+    def write(self, frame, path):
+        workbook = Workbook(write_only=True)
+        sheet = workbook.create_sheet()
+        sheet.append([None, *frame.columns])
+        for row in frame.itertuples(name=None):
+            sheet.append(row)
+        workbook.save(path)
+
+
+class CsvSink(ReportSink):
+    extension = 'csv'
+
+    def write(self, frame, path):
+        frame.to_csv(path)
+
+
+class JsonLinesSink(ReportSink):
+    extension = 'jsonl'
+
+    def write(self, frame, path):
+        frame.reset_index().to_json(path, orient='records', lines=True, force_ascii=False)
+
+
+class ParquetSink(ReportSink):
+    """
+    Требует установленного pyarrow. Столбцы паттернов содержат одновременно
+    подписи тренда и числа, поэтому сохраняются как строки.
+    """
+
+    extension = 'parquet'
+
+    def __init__(self):
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError as ex:
+            raise ImportError('Для формата parquet установите pyarrow: pip install pyarrow') from ex
+
+    def write(self, frame, path):
+        frame.astype(str).to_parquet(path)
+
+
+REPORT_SINKS = {
+    'xlsx': XlsxSink,
+    'xlsx_stream': StreamingXlsxSink,
+    'csv': CsvSink,
+    'jsonl': JsonLinesSink,
+    'parquet': ParquetSink,
+}
+
+
+def get_report_sink(report_format='xlsx') -> ReportSink:
+    try:
+        return REPORT_SINKS[report_format]()
+    except KeyError:
+        raise ValueError(f'{report_format} - unknown report format, expected one of {list(REPORT_SINKS)}')
@@ -0,0 +1,31 @@
+import datetime
+
+import pandas as pd
+
+from data_sources import OhlcBatch
+
+
+def resample_quotes(batch, period) -> OhlcBatch:
+    """
+    Собирает свечи старшего таймфрейма из свечей младшего (например, дневные из часовых).
+    Свечи группируются по границам period, отсчитанным от начала эпохи UTC:
+    open - первая цена open в группе, close - последняя close, high и low - максимум и минимум,
+    пропущенные значения не учитываются. Для периода от суток дата записывается
+    без времени, как её возвращает биржа для дневных свечей.
+    :param batch: свечи, data_sources.OhlcBatch, отсортированные по дате
+    :param period: datetime.timedelta
+    :return: data_sources.OhlcBatch
+    """
+    if not len(batch):
+        return batch
+    frame = batch.frame()
+    buckets = pd.to_datetime(frame['date']).dt.floor(pd.Timedelta(period))
+    candles = frame.groupby(buckets.to_numpy(), sort=True).agg(
+        open=('open', 'first'),
+        high=('high', 'max'),
+        low=('low', 'min'),
+        close=('close', 'last'),
+    )
+    date_format = '%Y-%m-%d' if period >= datetime.timedelta(days=1) else '%Y-%m-%d %H:%M:%S'
+    candles.insert(0, 'date', candles.index.strftime(date_format))
+    return OhlcBatch.from_frame(candles)
@@ -0,0 +1,122 @@
+import logging
+import random
+import threading
+import time
+
+
+class FetchError(Exception):
+    """
+    Ошибка запроса к бирже с указанием вида ошибки.
+    kind: timeout, connection, rate_limited, server, auth, client, invalid.
+    retryable - имеет ли смысл повторить запрос, retry_after - пауза, которую просит биржа.
+    """
+
+    retryable_kinds = ('timeout', 'connection', 'rate_limited', 'server', 'invalid')
+    upstream_kinds = ('timeout', 'connection', 'server')
+
+    def __init__(self, kind, message, retry_after=None):
+        super().__init__(f'{kind}: {message}')
+        self.kind = kind
+        self.message = message
+        self.retry_after = retry_after
+
+    @property
+    def retryable(self) -> bool:
+        return self.kind in self.retryable_kinds
+
+    @property
+    def upstream(self) -> bool:
+        """Ошибка говорит о проблемах на стороне биржи и учитывается CircuitBreaker."""
+        return self.kind in self.upstream_kinds
+
+    @classmethod
+    def from_status(cls, status_code, message, retry_after=None):
+        if status_code == 429:
+            return cls('rate_limited', message, retry_after)
+        if status_code in (401, 403):
+            return cls('auth', message)
+        if status_code >= 500:
+            return cls('server', message, retry_after)
+        return cls('client', message)
+
+
+class RetryPolicy:
+    """
+    Количество попыток и паузы между ними: экспоненциальный рост от base_delay до max_delay
+    со случайной паузой в пределах этого значения (full jitter), чтобы потоки не повторяли
+    запросы одновременно. Если биржа передала Retry-After, пауза не меньше него.
+    """
+
+    def __init__(self, attempts=4, base_delay=0.5, max_delay=30.0):
+        self.attempts = max(1, int(attempts))
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    def delay(self, attempt, retry_after=None) -> float:
+        delay = random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+        if retry_after is not None:
+            delay = max(delay, min(self.max_delay, retry_after))
+        return delay
+
+
+class CircuitBreaker:
+    """
+    Отключает запросы к бирже, если она деградировала.
+    После failure_threshold ошибок подряд (таймауты, обрывы соединения, ответы 5xx) цепь
+    размыкается и allow возвращает False в течение reset_timeout секунд. Затем пропускается
+    один пробный запрос: при успехе цепь замыкается, при ошибке снова размыкается.
+    Если пробный запрос так и не был отправлен, поток, получивший его, вызывает release,
+    и пробный запрос разрешается следующему.
+    """
+
+    def __init__(self, failure_threshold=5, reset_timeout=60.0, logger=logging.getLogger('circuit_breaker'),
+                 clock=time.monotonic):
+        self._logger = logger
+        self.failure_threshold = max(1, int(failure_threshold))
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._opened_at = None
+        self._probe = None
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self._opened_at is None:
+                return 'closed'
+            if self._clock() - self._opened_at >= self.reset_timeout:
+                return 'half_open'
+            return 'open'
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            if self._probe is not None or self._clock() - self._opened_at < self.reset_timeout:
+                return False
+            self._probe = threading.get_ident()
+            return True
+
+    def release(self):
+        """Освобождает пробный запрос текущего потока, если по нему не было ни успеха, ни ошибки."""
+        with self._lock:
+            if self._probe == threading.get_ident():
+                self._probe = None
+
+    def record_success(self):
+        with self._lock:
+            if self._opened_at is not None:
+                self._logger.info('Биржа снова отвечает, запросы возобновлены')
+            self._failures = 0
+            self._opened_at = None
+            self._probe = None
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            if self._probe is not None or (self._opened_at is None and self._failures >= self.failure_threshold):
+                self._logger.warning(f'Ошибок подряд: {self._failures}, запросы к бирже приостановлены '
+                                     f'на {self.reset_timeout} сек')
+                self._opened_at = self._clock()
+            self._probe = None
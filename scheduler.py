@@ -0,0 +1,160 @@
+import datetime
+import logging
+import math
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+
+class Scheduler:
+    """
+    Планировщик периодических задач.
+    Запуски выравниваются по границам периода, отсчитанным от начала эпохи UTC (для свечей -
+    по времени закрытия свечи), плюс задержка delay. Следующий запуск считается от границы,
+    а не от конца предыдущего, поэтому расписание не сдвигается на время работы задачи.
+    Если пропущено несколько границ (долгий запуск, сон компьютера), задача выполняется один раз,
+    а пропущенные запуски учитываются в статистике как missed. Если на границе предыдущий запуск
+    задачи ещё не завершился, задача помечается как ожидающая и выполняется один раз сразу после
+    его завершения, не дожидаясь следующей границы; такие границы учитываются как coalesced.
+    Задачи выполняются в пуле потоков размера workers, статистика по задачам - job_stats.
+    """
+
+    def __init__(self, workers=1, logger=logging.getLogger('scheduler'), clock=time.time):
+        self._logger = logger
+        self.workers = max(1, int(workers))
+        self._clock = clock
+        self._jobs = dict()
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        # Будит цикл run при завершении запуска, чтобы сразу выполнить ожидающую задачу
+        self._wakeup = threading.Event()
+
+    def add_job(self, name, period, func, delay=0, run_immediately=False):
+        """
+        :param period: период запуска - datetime.timedelta или секунды
+        :param func: функция без аргументов
+        :param delay: задержка после границы периода, например чтобы биржа успела закрыть свечу
+        :param run_immediately: выполнить задачу сразу при запуске планировщика, не дожидаясь границы
+        """
+        period = self._seconds(period)
+        delay = self._seconds(delay)
+        if period <= 0:
+            raise ValueError(f'{period} - invalid period, expected a positive number of seconds')
+        if name in self._jobs:
+            raise ValueError(f'{name} - job already exists')
+        now = self._clock()
+        self._jobs[name] = {
+            'name': name,
+            'period': period,
+            'delay': delay,
+            'func': func,
+            'next_run': now if run_immediately else self._next_boundary(now, period, delay),
+            'future': None,
+            'pending': False,
+            'stats': {
+                'runs': 0,
+                'failures': 0,
+                'coalesced': 0,
+                'missed': 0,
+                'last_started': None,
+                'last_duration': None,
+                'max_duration': 0.0,
+                'total_duration': 0.0,
+            },
+        }
+
+    def job_stats(self) -> dict:
+        """
+        Возвращает статистику по каждой задаче: количество запусков и ошибок,
+        пропущенные границы (missed), границы, пришедшиеся на незавершённый запуск (coalesced),
+        длительность последнего, максимального и среднего запуска в секундах и время следующего запуска.
+        """
+        stats = dict()
+        with self._lock:
+            for name, job in self._jobs.items():
+                job_stats = dict(job['stats'])
+                job_stats['average_duration'] = job_stats['total_duration'] / job_stats['runs'] \
+                    if job_stats['runs'] else None
+                job_stats['next_run'] = datetime.datetime.utcfromtimestamp(job['next_run'])
+                stats[name] = job_stats
+        return stats
+
+    def run(self):
+        """Выполняет задачи по расписанию до вызова stop. Перед выходом дожидается текущих запусков."""
+        self._stop_event.clear()
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='scheduler') as executor:
+            try:
+                while not self._stop_event.is_set():
+                    self._wakeup.clear()
+                    self._wakeup.wait(self._tick(executor))
+            finally:
+                self._stop_event.set()
+        self._logger.info('Планировщик остановлен')
+
+    def _tick(self, executor):
+        """Запускает задачи, время которых пришло, и возвращает, сколько секунд ждать следующей."""
+        now = self._clock()
+        for job in self._jobs.values():
+            if job['next_run'] <= now:
+                self._dispatch(executor, job, now)
+            elif job['pending'] and job['future'].done():
+                self._logger.info(f'{job["name"]}: предыдущий запуск завершён, выполняется отложенный')
+                self._submit(executor, job)
+        next_run = min((job['next_run'] for job in self._jobs.values()), default=None)
+        return None if next_run is None else max(0.0, next_run - self._clock())
+
+    def stop(self):
+        self._stop_event.set()
+        self._wakeup.set()
+
+    def _dispatch(self, executor, job, now):
+        missed = int((now - job['next_run']) // job['period'])
+        with self._lock:
+            job['next_run'] = self._next_boundary(now, job['period'], job['delay'])
+            job['stats']['missed'] += missed
+        if missed:
+            self._logger.warning(f'{job["name"]}: пропущено запусков - {missed}, выполняется один')
+        if job['future'] is not None and not job['future'].done():
+            with self._lock:
+                job['stats']['coalesced'] += 1
+            job['pending'] = True
+            self._logger.warning(f'{job["name"]}: предыдущий запуск ещё не завершён, '
+                                 f'задача будет выполнена сразу после него')
+            return
+        self._submit(executor, job)
+
+    def _submit(self, executor, job):
+        job['pending'] = False
+        job['future'] = executor.submit(self._run_job, job)
+        job['future'].add_done_callback(lambda future: self._wakeup.set())
+
+    def _run_job(self, job):
+        started = self._clock()
+        start = time.perf_counter()
+        failed = False
+        try:
+            job['func']()
+        except Exception:
+            failed = True
+            self._logger.exception(f'{job["name"]}: ошибка при выполнении')
+        duration = time.perf_counter() - start
+        with self._lock:
+            stats = job['stats']
+            stats['runs'] += 1
+            stats['failures'] += failed
+            stats['last_started'] = datetime.datetime.utcfromtimestamp(started)
+            stats['last_duration'] = duration
+            stats['max_duration'] = max(stats['max_duration'], duration)
+            stats['total_duration'] += duration
+            next_run = datetime.datetime.utcfromtimestamp(job['next_run'])
+        self._logger.info(f'{job["name"]} выполнена за {duration:.2f} сек, следующий запуск {next_run} UTC')
+
+    @staticmethod
+    def _next_boundary(now, period, delay):
+        return (math.floor((now - delay) / period) + 1) * period + delay
+
+    @staticmethod
+    def _seconds(value) -> float:
+        if isinstance(value, datetime.timedelta):
+            return value.total_seconds()
+        return float(value)
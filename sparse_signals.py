@@ -0,0 +1,55 @@
+import numpy as np
+
+
+class SparseSignals:
+    """
+    Результат поиска паттернов по одной валюте в разреженном виде: только найденные сигналы
+    тройками (index - номер свечи в batch, pattern - номер паттерна в candle_names, direction).
+    direction (int8) - сигнал TA-Lib, делённый на scale: знак - направление, модуль - сила
+    (±100 -> ±5, ±80 -> ±4, ±200 -> ±10). Тройки отсортированы по свече, затем по паттерну.
+    batch - свечи (data_sources.OhlcBatch), по которым выполнен поиск, patterns - количество паттернов.
+    Плотная матрица (свечи × паттерны) строится только при необходимости методом to_dense.
+    """
+
+    scale = 20
+
+    def __init__(self, batch, index, pattern, direction, patterns):
+        index = np.asarray(index, dtype=np.int32)
+        pattern = np.asarray(pattern, dtype=np.int16)
+        order = np.lexsort((pattern, index))
+        self.batch = batch
+        self.index = index[order]
+        self.pattern = pattern[order]
+        self.direction = np.asarray(direction, dtype=np.int8)[order]
+        self.patterns = patterns
+
+    @classmethod
+    def encode(cls, values) -> np.ndarray:
+        """Переводит сигналы TA-Lib в direction, ValueError - если сигнал нельзя сохранить без потерь."""
+        values = np.asarray(values)
+        invalid = (values % cls.scale != 0) | (np.abs(values) > np.iinfo(np.int8).max * cls.scale)
+        if invalid.any():
+            raise ValueError(f'{values[invalid][0]} - signal can not be stored as int8 direction')
+        return (values // cls.scale).astype(np.int8)
+
+    @classmethod
+    def from_dense(cls, batch, signals):
+        """:param signals: матрица сигналов (свечи × паттерны)"""
+        index, pattern = np.nonzero(signals)
+        return cls(batch, index, pattern, cls.encode(signals[index, pattern]), signals.shape[1])
+
+    def __len__(self):
+        return len(self.index)
+
+    @property
+    def nbytes(self) -> int:
+        return self.index.nbytes + self.pattern.nbytes + self.direction.nbytes
+
+    def values(self) -> np.ndarray:
+        """Сигналы в значениях TA-Lib (int32)."""
+        return self.direction.astype(np.int32) * self.scale
+
+    def to_dense(self) -> np.ndarray:
+        signals = np.zeros((len(self.batch), self.patterns), dtype=np.int32)
+        signals[self.index, self.pattern] = self.values()
+        return signals
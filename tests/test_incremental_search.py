@@ -0,0 +1,51 @@
+"""Инкрементальный поиск паттернов должен давать тот же результат, что и полный search_signals."""
+import numpy as np
+import pytest
+
+from benchmarks.synthetic import synthetic_market
+from data_sources import as_batch
+from main import Analyzer, Interval
+from report_sinks import get_report_sink
+
+
+@pytest.fixture(params=['talib', 'numpy'])
+def analyzer(request):
+    if request.param == 'talib':
+        pytest.importorskip('talib')
+    return Analyzer(candle_engine=request.param)
+
+
+def test_sliding_window_matches_full_search(analyzer):
+    records = as_batch(synthetic_market(1, 400, doji_probability=0.2)['C00000']).to_records()
+    previous = None
+    for start in range(0, 400 - 168 + 1, 8):
+        window = as_batch({'quotes': records[start:start + 168]})
+        previous = analyzer.search_signals_incremental(window, previous)
+        assert np.array_equal(previous.to_dense(), analyzer.search_signals(window).to_dense()), start
+
+
+def test_changed_last_candle_matches_full_search(analyzer):
+    records = as_batch(synthetic_market(1, 300)['C00000']).to_records()
+    previous = analyzer.search_signals_incremental(as_batch({'quotes': records[:-1]}))
+    records[-2] = {**records[-2], 'close': records[-2]['close'] * 1.001}
+    batch = as_batch({'quotes': records})
+    assert np.array_equal(analyzer.search_signals_incremental(batch, previous).to_dense(),
+                          analyzer.search_signals(batch).to_dense())
+
+
+def test_empty_previous_result(analyzer):
+    batch = as_batch(synthetic_market(1, 200)['C00000'])
+    previous = analyzer.search_signals_incremental({'quotes': []})
+    assert np.array_equal(analyzer.search_signals_incremental(batch, previous).to_dense(),
+                          analyzer.search_signals(batch).to_dense())
+
+
+def test_gen_results_after_empty_cycle(tmp_path):
+    pytest.importorskip('talib')
+    analyzer = Analyzer(report_sink=get_report_sink('csv'), incremental=True)
+    market = synthetic_market(['EURUSD', 'GBPUSD'], 200)
+    analyzer.gen_results({'EURUSD': {'quotes': []}, 'GBPUSD': market['GBPUSD']}, Interval.hourly,
+                         path_to_result=f'{tmp_path}/', simple_name_for_file=True)
+    analyzer.gen_results(market, Interval.hourly, path_to_result=f'{tmp_path}/', simple_name_for_file=True)
+    assert sorted(path.name for path in tmp_path.iterdir()) == ['hourly_EURUSD.csv', 'hourly_GBPUSD.csv']
+    assert len((tmp_path / 'hourly_EURUSD.csv').read_text().splitlines()) > 1
@@ -0,0 +1,137 @@
+import json
+
+import pytest
+
+import key_pool
+from key_pool import KeyPool
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    sleeps = []
+
+    def sleep(seconds):
+        sleeps.append(seconds)
+        clock.sleep(seconds)
+
+    monkeypatch.setattr(key_pool.time, 'sleep', sleep)
+    clock.sleeps = sleeps
+    return clock
+
+
+def test_unknown_strategy():
+    with pytest.raises(ValueError):
+        KeyPool(['k1'], strategy='random')
+
+
+def test_token_bucket(clock):
+    pool = KeyPool(['k1'], rate=2, burst=2, clock=clock)
+    assert [pool.acquire() for _ in range(3)] == ['k1'] * 3
+    assert clock.sleeps == [pytest.approx(0.5)]
+    clock.now += 10
+    pool.acquire()
+    pool.acquire()
+    # Токенов не больше burst, даже после долгого простоя
+    assert len(clock.sleeps) == 1
+    pool.acquire()
+    assert clock.sleeps[1:] == [pytest.approx(0.5)]
+
+
+def test_round_robin(clock):
+    pool = KeyPool(['k1', 'k2', 'k3'], strategy='round_robin', clock=clock)
+    assert [pool.acquire() for _ in range(4)] == ['k1', 'k2', 'k3', 'k1']
+    assert pool.acquire(exclude={'k2'}) == 'k3'
+
+
+def test_least_used_prefers_free_and_less_used_key(clock):
+    pool = KeyPool(['k1', 'k2'], rate=1, burst=1, clock=clock)
+    assert pool.acquire() == 'k1'
+    # k1 ждёт пополнения, k2 свободен
+    assert pool.acquire() == 'k2'
+    clock.now += 5
+    assert pool.acquire() == 'k1'
+    assert pool.usage() == {'k1***': 2, 'k2***': 1}
+    clock.now += 5
+    assert pool.acquire() == 'k2'
+    assert clock.sleeps == []
+
+
+def test_monthly_quota(clock):
+    pool = KeyPool(['k1', 'k2'], monthly_quota=1, clock=clock)
+    assert {pool.acquire(), pool.acquire()} == {'k1', 'k2'}
+    assert pool.acquire() is None
+    assert not pool.available()
+    assert pool.capacity() == 0
+
+
+def test_exclude_and_available(clock):
+    pool = KeyPool(['k1', 'k2'], monthly_quota=5, clock=clock)
+    assert pool.available(exclude={'k1'})
+    assert not pool.available(exclude={'k1', 'k2'})
+    assert pool.acquire(exclude={'k1', 'k2'}) is None
+
+
+def test_month_rollover(clock, monkeypatch, tmp_path):
+    month = ['2026-01']
+    monkeypatch.setattr(KeyPool, '_current_month', staticmethod(lambda: month[0]))
+    state_path = tmp_path / 'state.json'
+    pool = KeyPool(['k1'], monthly_quota=2, state_path=state_path, clock=clock)
+    pool.acquire()
+    pool.acquire()
+    assert pool.acquire() is None
+    month[0] = '2026-02'
+    assert pool.acquire() == 'k1'
+    assert pool.remaining() == {'k1***': 1}
+    pool.flush()
+    assert json.loads(state_path.read_text()) == {'month': '2026-02', 'used': {'k1': 1}}
+
+
+def test_state_survives_restart(clock, tmp_path):
+    state_path = tmp_path / 'state.json'
+    pool = KeyPool(['k1'], monthly_quota=10, state_path=state_path, clock=clock)
+    for _ in range(3):
+        pool.acquire()
+    pool.flush()
+    assert KeyPool(['k1'], monthly_quota=10, state_path=state_path, clock=clock).capacity() == 7
+
+
+def test_processes_sharing_state_keep_each_others_usage(clock, tmp_path):
+    state_path = tmp_path / 'state.json'
+    parser = KeyPool(['k1'], monthly_quota=1000, state_path=state_path, clock=clock)
+    for _ in range(100):
+        parser.acquire()
+    parser.flush()
+    interface = KeyPool(['k1'], monthly_quota=1000, state_path=state_path, clock=clock)
+    for _ in range(50):
+        interface.acquire()
+    interface.flush()
+    parser.acquire()
+    parser.flush()
+    assert json.loads(state_path.read_text())['used'] == {'k1': 151}
+    assert parser.capacity() == 849
+
+
+def test_state_is_saved_in_batches(clock, tmp_path):
+    state_path = tmp_path / 'state.json'
+    pool = KeyPool(['k1'], state_path=state_path, save_interval=60, save_requests=3, clock=clock)
+    pool.acquire()
+    pool.acquire()
+    assert not state_path.exists()
+    pool.acquire()
+    assert json.loads(state_path.read_text())['used'] == {'k1': 3}
+    pool.acquire()
+    clock.now += 60
+    pool.acquire()
+    assert json.loads(state_path.read_text())['used'] == {'k1': 5}
@@ -0,0 +1,67 @@
+"""
+Сверка движка паттернов на NumPy (numpy_candles) с TA-Lib бит в бит для всех паттернов
+на случайных рядах трёх видов (см. benchmarks.candle_engines.random_ohlc), в том числе с NaN
+в начале и в середине ряда, на двумерном массиве из нескольких рядов и на пустых рядах.
+"""
+import numpy as np
+import pytest
+
+import exchange_data
+import numpy_candles
+from benchmarks.candle_engines import REGIMES, random_ohlc
+
+talib = pytest.importorskip('talib')
+
+CANDLE_NAMES = list(exchange_data.get_candle_names())
+CANDLES = 1000
+
+
+def validation_cases(candles=CANDLES):
+    for seed in range(10):
+        for regime in REGIMES:
+            open_, high, low, close = random_ohlc(candles, seed, regime)
+            if seed % 3 == 1:
+                open_ = open_.copy()
+                open_[:seed] = np.nan
+            if seed % 4 == 2:
+                high = high.copy()
+                high[candles // 2] = np.nan
+            yield f'{regime}, seed {seed}', (open_, high, low, close)
+
+
+def assert_same(expected, actual, case):
+    assert actual.dtype == expected.dtype, case
+    index = np.flatnonzero(expected != actual)[:5]
+    assert not len(index), f'{case}: index {index}, TA-Lib {expected[index]}, NumPy {actual[index]}'
+
+
+@pytest.mark.parametrize('candle', CANDLE_NAMES)
+def test_matches_talib(candle):
+    for case, quotes in validation_cases():
+        assert_same(getattr(talib, candle)(*quotes), getattr(numpy_candles, candle)(*quotes), case)
+
+
+@pytest.mark.parametrize('candle', CANDLE_NAMES)
+def test_batch_matches_talib(candle):
+    batch = np.stack([np.stack(quotes) for _, quotes in validation_cases()], axis=1)
+    expected = np.stack([getattr(talib, candle)(*batch[:, row]) for row in range(batch.shape[1])])
+    assert_same(expected, getattr(numpy_candles, candle)(*batch), '2D batch')
+
+
+@pytest.mark.parametrize('candle', CANDLE_NAMES)
+def test_leading_nan(candle):
+    quotes = [series.copy() for series in random_ohlc(300, seed=1, regime='grid')]
+    for series in quotes:
+        series[:120] = np.nan
+    assert_same(getattr(talib, candle)(*quotes), getattr(numpy_candles, candle)(*quotes), 'leading NaN')
+    nan_quotes = [np.full(50, np.nan)] * 4
+    assert_same(getattr(talib, candle)(*nan_quotes), getattr(numpy_candles, candle)(*nan_quotes), 'all NaN')
+
+
+@pytest.mark.parametrize('candle', CANDLE_NAMES)
+def test_empty_input(candle):
+    empty = np.array([], dtype=np.float64)
+    assert_same(getattr(talib, candle)(empty, empty, empty, empty),
+                getattr(numpy_candles, candle)(empty, empty, empty, empty), 'empty series')
+    assert getattr(numpy_candles, candle)(*np.empty((4, 0, 10))).shape == (0, 10)
+    assert getattr(numpy_candles, candle)(*np.empty((4, 3, 0))).shape == (3, 0)
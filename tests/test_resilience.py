@@ -0,0 +1,152 @@
+import pytest
+
+import main
+from data_sources import OhlcBatch
+from main import Exchange, Interval
+from resilience import CircuitBreaker, FetchError, RetryPolicy
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.mark.parametrize('status, kind, retryable', [
+    (429, 'rate_limited', True), (401, 'auth', False), (403, 'auth', False),
+    (503, 'server', True), (400, 'client', False),
+])
+def test_fetch_error_from_status(status, kind, retryable):
+    error = FetchError.from_status(status, 'message')
+    assert (error.kind, error.retryable) == (kind, retryable)
+
+
+def test_retry_delay_respects_bounds_and_retry_after():
+    policy = RetryPolicy(attempts=3, base_delay=1, max_delay=4)
+    assert all(0 <= policy.delay(attempt) <= min(4, 2 ** attempt) for attempt in range(5) for _ in range(20))
+    assert policy.delay(0, retry_after=3) >= 3
+    assert policy.delay(0, retry_after=100) == 4
+
+
+def test_circuit_opens_and_recovers_after_probe():
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=10, clock=clock)
+    breaker.record_failure()
+    assert breaker.allow() and breaker.state == 'closed'
+    breaker.record_failure()
+    assert not breaker.allow() and breaker.state == 'open'
+    clock.now = 10
+    assert breaker.state == 'half_open'
+    assert breaker.allow()
+    # Одновременно выполняется только один пробный запрос
+    assert not breaker.allow()
+    breaker.record_success()
+    assert breaker.allow() and breaker.state == 'closed'
+
+
+def test_failed_probe_opens_circuit_again():
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10, clock=clock)
+    breaker.record_failure()
+    clock.now = 10
+    assert breaker.allow()
+    breaker.record_failure()
+    assert not breaker.allow()
+    clock.now = 20
+    assert breaker.allow()
+
+
+def test_unsent_probe_is_released():
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10, clock=clock)
+    breaker.record_failure()
+    clock.now = 10
+    assert breaker.allow()
+    breaker.release()
+    assert breaker.allow()
+    breaker.record_success()
+    # После успеха release ничего не меняет
+    breaker.release()
+    assert breaker.state == 'closed'
+
+
+class ScriptedExchange(Exchange):
+    """Exchange, у которого _request отвечает по сценарию: FetchError/исключение или свечи."""
+
+    def __init__(self, responses, api_keys=('k1',), **config):
+        super().__init__({'currencies': ['EURUSD'], 'api_keys': list(api_keys), 'retry_attempts': 4, **config})
+        self.responses = list(responses)
+        self.keys_used = []
+
+    def _request(self, interval, currency, api_key, start_date):
+        self.keys_used.append(api_key)
+        response = self.responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(main.time, 'sleep', sleeps.append)
+    return sleeps
+
+
+def rate_limited():
+    return FetchError('rate_limited', 'too many requests', retry_after=1)
+
+
+def candles():
+    return OhlcBatch.from_records([{'date': '2026-01-01 00:00:00', 'open': 1, 'high': 2, 'low': 0.5, 'close': 1.5}])
+
+
+def test_single_key_is_retried_after_429(sleeps):
+    exchange = ScriptedExchange([rate_limited(), rate_limited(), candles()])
+    assert 'EURUSD' in exchange.get_data(Interval.hourly)
+    assert exchange.keys_used == ['k1', 'k1', 'k1']
+    assert len(sleeps) == 2
+    assert exchange.failures['hourly'] == {}
+
+
+def test_429_switches_key_without_waiting_then_backs_off(sleeps):
+    exchange = ScriptedExchange([rate_limited(), rate_limited(), candles()], api_keys=('k1', 'k2'),
+                                api_key_strategy='round_robin')
+    assert 'EURUSD' in exchange.get_data(Interval.hourly)
+    assert exchange.keys_used[:2] == ['k1', 'k2']
+    # Другой ключ пробуется сразу, пауза - только когда ключи закончились
+    assert len(sleeps) == 1
+
+
+def test_auth_error_on_every_key_is_not_retried(sleeps):
+    exchange = ScriptedExchange([FetchError('auth', 'invalid key')] * 2, api_keys=('k1', 'k2'))
+    assert exchange.get_data(Interval.hourly) == {}
+    assert sorted(exchange.keys_used) == ['k1', 'k2']
+    assert exchange.failures['hourly']['EURUSD']['kind'] == 'auth'
+    assert sleeps == []
+
+
+def test_retries_end_after_attempts(sleeps):
+    exchange = ScriptedExchange([rate_limited()] * 4)
+    assert exchange.get_data(Interval.hourly) == {}
+    failure = exchange.failures['hourly']['EURUSD']
+    assert (failure['kind'], failure['attempts']) == ('rate_limited', 4)
+    assert len(sleeps) == 3
+
+
+def test_unexpected_error_is_recorded_per_currency(sleeps):
+    exchange = ScriptedExchange([AttributeError('broken quotes'), candles()])
+    exchange.currencies = ['GBPUSD', 'EURUSD']
+    exchange.concurrency = 1
+    assert list(exchange.get_data(Interval.hourly)) == ['EURUSD']
+    assert exchange.failures['hourly']['GBPUSD']['kind'] == 'unknown'
+
+
+def test_probe_is_released_when_quota_is_exhausted(sleeps):
+    exchange = ScriptedExchange([], api_key_monthly_quota=0, circuit_failures=1, circuit_reset=0)
+    exchange.circuit_breaker.record_failure()
+    assert exchange.get_data(Interval.hourly) == {}
+    assert exchange.failures['hourly']['EURUSD']['kind'] == 'quota'
+    assert exchange.circuit_breaker.allow()
@@ -0,0 +1,138 @@
+import datetime
+import threading
+from concurrent.futures import Future
+
+import pytest
+
+from scheduler import Scheduler
+
+
+class FakeClock:
+    def __init__(self, now=0.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+class ManualExecutor:
+    """Исполнитель, в котором задачи выполняются только по вызову finish."""
+
+    def __init__(self):
+        self.queue = []
+
+    def submit(self, func, *args):
+        future = Future()
+        self.queue.append((future, func, args))
+        return future
+
+    def finish(self):
+        future, func, args = self.queue.pop(0)
+        future.set_result(func(*args))
+
+
+@pytest.fixture
+def clock():
+    return FakeClock(1000.0)
+
+
+def make_scheduler(clock, **job):
+    runs = []
+    scheduler = Scheduler(clock=clock)
+    scheduler.add_job('job', job.pop('period', 60), lambda: runs.append(clock()), **job)
+    return scheduler, runs
+
+
+def test_invalid_jobs(clock):
+    scheduler, _ = make_scheduler(clock)
+    with pytest.raises(ValueError):
+        scheduler.add_job('job', 60, lambda: None)
+    with pytest.raises(ValueError):
+        scheduler.add_job('other', 0, lambda: None)
+
+
+def test_runs_are_aligned_to_period_boundaries(clock):
+    scheduler, _ = make_scheduler(clock, period=datetime.timedelta(minutes=1), delay=5)
+    assert scheduler.job_stats()['job']['next_run'] == datetime.datetime.utcfromtimestamp(1025)
+    scheduler, _ = make_scheduler(clock, run_immediately=True)
+    assert scheduler.job_stats()['job']['next_run'] == datetime.datetime.utcfromtimestamp(1000)
+
+
+def test_tick_runs_due_job_and_waits_for_next_boundary(clock):
+    scheduler, runs = make_scheduler(clock, delay=5)
+    executor = ManualExecutor()
+    assert scheduler._tick(executor) == 25
+    assert executor.queue == []
+    clock.now = 1025
+    assert scheduler._tick(executor) == 60
+    executor.finish()
+    assert runs == [1025]
+    stats = scheduler.job_stats()['job']
+    assert (stats['runs'], stats['missed'], stats['coalesced']) == (1, 0, 0)
+
+
+def test_missed_boundaries_run_once(clock):
+    scheduler, runs = make_scheduler(clock)
+    executor = ManualExecutor()
+    clock.now = 1020 + 60 * 3
+    scheduler._tick(executor)
+    executor.finish()
+    assert len(runs) == 1
+    assert scheduler.job_stats()['job']['missed'] == 3
+    assert scheduler.job_stats()['job']['next_run'] == datetime.datetime.utcfromtimestamp(1260)
+
+
+def test_overrun_is_coalesced_and_runs_right_after(clock):
+    scheduler, runs = make_scheduler(clock)
+    executor = ManualExecutor()
+    clock.now = 1020
+    scheduler._tick(executor)
+    # Запуск не завершился к двум следующим границам
+    for boundary in (1080, 1140):
+        clock.now = boundary
+        scheduler._tick(executor)
+    assert len(executor.queue) == 1
+    assert scheduler.job_stats()['job']['coalesced'] == 2
+
+    clock.now = 1150
+    executor.finish()
+    scheduler._tick(executor)
+    # Отложенный запуск выполняется один раз сразу, а не на следующей границе
+    assert len(executor.queue) == 1
+    executor.finish()
+    scheduler._tick(executor)
+    assert executor.queue == []
+    assert len(runs) == 2
+
+
+def test_failures_are_counted(clock):
+    scheduler = Scheduler(clock=clock)
+    scheduler.add_job('job', 60, lambda: 1 / 0, run_immediately=True)
+    executor = ManualExecutor()
+    scheduler._tick(executor)
+    executor.finish()
+    stats = scheduler.job_stats()['job']
+    assert (stats['runs'], stats['failures']) == (1, 1)
+
+
+def test_run_wakes_up_for_pending_job():
+    scheduler = Scheduler(workers=2)
+    started = []
+    release = threading.Event()
+
+    def job():
+        started.append(1)
+        if len(started) == 1:
+            release.wait(5)
+        else:
+            scheduler.stop()
+
+    scheduler.add_job('job', 0.2, job, run_immediately=True)
+    thread = threading.Thread(target=scheduler.run)
+    thread.start()
+    # Первый запуск держится дольше периода, затем отложенный запуск выполняется сразу после него
+    threading.Timer(0.5, release.set).start()
+    thread.join(5)
+    assert not thread.is_alive()
+    assert len(started) == 2
+    assert scheduler.job_stats()['job']['coalesced'] >= 1